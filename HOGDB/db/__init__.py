@@ -1,5 +1,13 @@
-from .db import Database, Session, Transaction
+from .aggregation import Aggregate
+from .bulk_import import BulkImportGenerator
+from .db import Database, Session, Transaction, UnsupportedOperationError
+from .exporter import ExportStats
+from .importer import ImportStats
+from .in_memory import InMemoryDatabase
 from .label import Label
 from .neo4j import Neo4jDatabase
+from .predicate import Comparison, P, Predicate
+from .profile import PlanOperator, QueryProfile
 from .property import Property
 from .schema import Schema
+from .sqlite import SQLiteDatabase
@@ -0,0 +1,173 @@
+# Copyright (c) 2025 ETH Zurich.
+#                    All rights reserved.
+#
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+from typing import Any, List
+
+
+class Aggregate:
+    """
+    A class representing an aggregation over the rows of a path traversal. Aggregations are
+    evaluated by the database, grouped by the non-aggregated return values.
+    """
+
+    FUNCTIONS = (
+        "count",
+        "sum",
+        "avg",
+        "min",
+        "max",
+        "collect",
+        "percentileCont",
+        "percentileDisc",
+    )
+
+    def __init__(
+        self,
+        function: str,
+        expression: str,
+        alias: str = None,
+        distinct: bool = False,
+        arguments: List[Any] = None,
+    ) -> None:
+        """
+        Initialize the Aggregate instance.
+
+        @param function: Name of the aggregation function.
+        @param expression: Expression to aggregate, for example 'c.clique_features'.
+        @param alias: Name of the result column. Defaults to 'function(expression)'.
+        @param distinct: Aggregate distinct values only. Defaults to False.
+        @param arguments: Additional numeric arguments of the function. Defaults to None.
+        """
+        if function not in self.FUNCTIONS:
+            raise ValueError(f"Unsupported aggregation function: {function}")
+        self.function = function
+        self.expression = expression
+        self.alias = alias if alias else f"{function}({expression})"
+        self.distinct = distinct
+        self.arguments = arguments if arguments is not None else []
+
+    def __repr__(self) -> str:
+        """
+        Return the Cypher representation of the aggregation.
+
+        @return: Cypher aggregation expression including its alias.
+        """
+        distinct_str = "DISTINCT " if self.distinct else ""
+        arguments_str = "".join(f", {argument}" for argument in self.arguments)
+        alias_str = self.alias.replace("`", "``")
+        return f"{self.function}({distinct_str}{self.expression}{arguments_str}) AS `{alias_str}`"
+
+    def __eq__(self, other) -> bool:
+        """
+        Check if two Aggregate instances are equal.
+
+        @param other: The other Aggregate instance to compare.
+        @return: True if the aggregations are equal, False otherwise.
+        """
+        if not isinstance(other, Aggregate):
+            return False
+        return repr(self) == repr(other)
+
+    @staticmethod
+    def count(
+        expression: str = "*", alias: str = None, distinct: bool = False
+    ) -> "Aggregate":
+        """
+        Count the rows or the non-null values of an expression.
+
+        @param expression: Expression to count. Defaults to '*'.
+        @param alias: Name of the result column. Defaults to None.
+        @param distinct: Count distinct values only. Defaults to False.
+        @return: Aggregate instance.
+        """
+        return Aggregate("count", expression, alias, distinct)
+
+    @staticmethod
+    def sum(expression: str, alias: str = None, distinct: bool = False) -> "Aggregate":
+        """
+        Sum the values of an expression.
+
+        @param expression: Expression to sum.
+        @param alias: Name of the result column. Defaults to None.
+        @param distinct: Sum distinct values only. Defaults to False.
+        @return: Aggregate instance.
+        """
+        return Aggregate("sum", expression, alias, distinct)
+
+    @staticmethod
+    def avg(expression: str, alias: str = None, distinct: bool = False) -> "Aggregate":
+        """
+        Average the values of an expression.
+
+        @param expression: Expression to average.
+        @param alias: Name of the result column. Defaults to None.
+        @param distinct: Average distinct values only. Defaults to False.
+        @return: Aggregate instance.
+        """
+        return Aggregate("avg", expression, alias, distinct)
+
+    @staticmethod
+    def min(expression: str, alias: str = None) -> "Aggregate":
+        """
+        Minimum of the values of an expression.
+
+        @param expression: Expression to aggregate.
+        @param alias: Name of the result column. Defaults to None.
+        @return: Aggregate instance.
+        """
+        return Aggregate("min", expression, alias)
+
+    @staticmethod
+    def max(expression: str, alias: str = None) -> "Aggregate":
+        """
+        Maximum of the values of an expression.
+
+        @param expression: Expression to aggregate.
+        @param alias: Name of the result column. Defaults to None.
+        @return: Aggregate instance.
+        """
+        return Aggregate("max", expression, alias)
+
+    @staticmethod
+    def collect(
+        expression: str, alias: str = None, distinct: bool = False
+    ) -> "Aggregate":
+        """
+        Collect the values of an expression into a list.
+
+        @param expression: Expression to collect.
+        @param alias: Name of the result column. Defaults to None.
+        @param distinct: Collect distinct values only. Defaults to False.
+        @return: Aggregate instance.
+        """
+        return Aggregate("collect", expression, alias, distinct)
+
+    @staticmethod
+    def percentile(
+        expression: str,
+        percentile: float,
+        alias: str = None,
+        continuous: bool = True,
+    ) -> "Aggregate":
+        """
+        Percentile of the values of an expression.
+
+        @param expression: Expression to aggregate.
+        @param percentile: Percentile between 0.0 and 1.0.
+        @param alias: Name of the result column. Defaults to None.
+        @param continuous: Interpolate between values (percentileCont) instead of returning the
+                           nearest value (percentileDisc). Defaults to True.
+        @return: Aggregate instance.
+        """
+        if not 0.0 <= percentile <= 1.0:
+            raise ValueError(f"Percentile must be between 0.0 and 1.0: {percentile}")
+        function = "percentileCont" if continuous else "percentileDisc"
+        return Aggregate(
+            function,
+            expression,
+            alias if alias else f"{function}({expression}, {float(percentile)})",
+            arguments=[float(percentile)],
+        )
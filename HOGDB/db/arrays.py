@@ -0,0 +1,143 @@
+# Copyright (c) 2025 ETH Zurich.
+#                    All rights reserved.
+#
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+import numpy as np
+
+OUTPUT_FORMATS = ("pandas", "numpy", "torch")
+
+
+def _to_numpy_dtype(dtype: Any) -> np.dtype:
+    """
+    Convert a dtype specification to a NumPy dtype. Torch dtypes are accepted as well.
+
+    @param dtype: NumPy dtype, dtype string, Python type or torch dtype.
+    @return: NumPy dtype.
+    """
+    if type(dtype).__module__ == "torch":
+        import torch
+
+        return torch.empty(0, dtype=dtype).numpy().dtype
+    return np.dtype(dtype)
+
+
+def _infer_dtype(value: Any) -> np.dtype:
+    """
+    Infer the NumPy dtype of a scalar value returned by the database.
+
+    @param value: Scalar value.
+    @return: NumPy dtype.
+    """
+    if isinstance(value, bool):
+        return np.dtype(np.bool_)
+    if isinstance(value, int):
+        return np.dtype(np.int64)
+    if isinstance(value, float):
+        return np.dtype(np.float64)
+    return np.dtype(object)
+
+
+def _infer_column_dtype(values: Iterable[Any]) -> np.dtype:
+    """
+    Infer the NumPy dtype holding all values of a column, promoting mixed numeric values,
+    for example integers and floats to float64. Columns with any non-numeric value are
+    decoded as objects.
+
+    @param values: Scalar values of the column.
+    @return: NumPy dtype, float64 if there are no values.
+    """
+    dtypes = set()
+    for value in values:
+        dtype = _infer_dtype(value)
+        if dtype == object:
+            return dtype
+        dtypes.add(dtype)
+    return np.result_type(*dtypes) if dtypes else np.dtype(np.float64)
+
+
+def _decode_column(
+    records: Sequence[Sequence], index: int, column: str, dtype: Optional[Any]
+) -> np.ndarray:
+    """
+    Decode a single return column into a contiguous typed array. Scalar columns become
+    one-dimensional arrays, list-valued columns become two-dimensional arrays.
+
+    @param records: Records returned by the database.
+    @param index: Position of the column in each record.
+    @param column: Name of the column.
+    @param dtype: Requested dtype. Inferred from all values if None.
+    @return: Decoded array.
+    """
+    n = len(records)
+    first = records[0][index] if n > 0 else None
+    is_list = isinstance(first, (list, tuple))
+    if dtype is not None:
+        dtype = _to_numpy_dtype(dtype)
+    elif is_list:
+        dtype = _infer_column_dtype(
+            chain.from_iterable(
+                value if isinstance(value, (list, tuple)) else [value]
+                for value in (record[index] for record in records)
+            )
+        )
+    else:
+        dtype = _infer_column_dtype(record[index] for record in records)
+    if not is_list:
+        if dtype == object:
+            array = np.empty(n, dtype=object)
+            array[:] = [record[index] for record in records]
+            return array
+        return np.fromiter((record[index] for record in records), dtype, count=n)
+    width = len(first)
+    lengths = np.fromiter((len(record[index]) for record in records), np.int64, count=n)
+    if not np.all(lengths == width):
+        raise ValueError(
+            f"Column '{column}' contains lists of different lengths and cannot be decoded into a dense array."
+        )
+    values = np.fromiter(
+        chain.from_iterable(record[index] for record in records),
+        dtype,
+        count=n * width,
+    )
+    return values.reshape(n, width)
+
+
+def records_to_arrays(
+    records: Sequence[Sequence],
+    columns: List[str],
+    dtypes: Optional[Dict[str, Any]] = None,
+    output: str = "numpy",
+) -> Dict[str, Any]:
+    """
+    Decode query records directly into typed arrays, one per return column.
+
+    @param records: Records returned by the database (indexable by column position).
+    @param columns: Names of the return columns in the order of the records.
+    @param dtypes: Optional mapping from column name to dtype. Defaults to None.
+    @param output: Either 'numpy' or 'torch'. Defaults to 'numpy'.
+    @return: Dictionary mapping column names to NumPy arrays or torch tensors.
+    """
+    if output not in ("numpy", "torch"):
+        raise ValueError(f"Unsupported output format: {output}")
+    if not columns:
+        raise ValueError(f"Output format '{output}' requires explicit return values.")
+    dtypes = dtypes or {}
+    arrays = {
+        column: _decode_column(records, index, column, dtypes.get(column))
+        for index, column in enumerate(columns)
+    }
+    if output == "numpy":
+        return arrays
+    import torch
+
+    for column, array in arrays.items():
+        if array.dtype == object:
+            raise ValueError(
+                f"Column '{column}' cannot be converted to a tensor; pass a numeric dtype."
+            )
+        arrays[column] = torch.from_numpy(array)
+    return arrays
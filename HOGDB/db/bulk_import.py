@@ -0,0 +1,960 @@
+# Copyright (c) 2025 ETH Zurich.
+#                    All rights reserved.
+#
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+"""
+Offline bulk-load file generator for 'neo4j-admin database import'.
+
+The generator reads the same CSV inputs as the storage import methods, computes the lowering
+of the higher-order elements locally and writes ID-based node and relationship files.
+
+Usage:
+    python -m HOGDB.db.bulk_import generate spec.json output_dir [--workers N]
+    python -m HOGDB.db.bulk_import verify output_dir/manifest.json
+"""
+
+from collections import deque
+from datetime import date, datetime
+from HOGDB.db.db import Database, Session
+from HOGDB.db.label import Label
+from HOGDB.db.schema import Schema
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import sys
+
+# ID space shared by all node files
+ID_SPACE = "HO"
+
+_ADMIN_TYPES = {
+    str: "string",
+    int: "long",
+    float: "double",
+    bool: "boolean",
+    datetime: "datetime",
+    date: "date",
+}
+_TYPE_NAMES = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": bool,
+    "datetime": datetime,
+    "date": date,
+}
+
+# Lookup tables of the generation phase, inherited by the worker processes on fork.
+# _node_lookups maps (labels, property keys) to a dictionary from key values to node IDs,
+# _edge_lookup maps (start ID, end ID) to the IDs of the lowered edges between them.
+_node_lookups: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], Dict[tuple, List[int]]] = {}
+_edge_lookup: Dict[Tuple[int, int], List[int]] = {}
+
+
+def _normalize(value: Optional[str], property_type: type) -> Any:
+    """
+    Normalize a CSV value the way the conversion functions of the Cypher imports do, so that
+    keys compare equal regardless of their formatting.
+
+    @param value: Raw CSV value.
+    @param property_type: Type of the property.
+    @return: Normalized value, None for missing or invalid values.
+    """
+    if value is None or value == "":
+        return None
+    try:
+        if property_type == int:
+            if "." in value or "e" in value.lower():
+                return int(float(value))
+            return int(value)
+        if property_type == float:
+            return float(value)
+        if property_type == bool:
+            lowered = value.strip().lower()
+            return {"true": True, "false": False}.get(lowered)
+    except ValueError:
+        return None
+    return value
+
+
+def _format(value: Any) -> str:
+    """
+    Format a normalized value for neo4j-admin.
+
+    @param value: Normalized value.
+    @return: CSV field.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _properties_header(schema: List[Schema]) -> List[str]:
+    """
+    Header fields of typed property columns.
+
+    @param schema: List of property schemas.
+    @return: List of header fields.
+    """
+    return [f"{s.property_name}:{_ADMIN_TYPES[s.property_type]}" for s in schema]
+
+
+def _properties(row: Dict[str, str], schema: List[Schema]) -> List[str]:
+    """
+    Typed property values of a row.
+
+    @param row: CSV row.
+    @param schema: List of property schemas.
+    @return: List of CSV fields.
+    """
+    return [_format(_normalize(row.get(s.field_name), s.property_type)) for s in schema]
+
+
+def _signature(labels: List[Label], keys: List[Schema]) -> Tuple[tuple, tuple]:
+    """
+    Signature of a node lookup.
+
+    @param labels: Labels the nodes must carry.
+    @param keys: Property schemas matched by the lookup.
+    @return: Tuple of label names and property keys.
+    """
+    return (
+        tuple(sorted(repr(label) for label in labels)),
+        tuple(s.property_name for s in keys),
+    )
+
+
+def _lookup(
+    signature: Tuple[tuple, tuple],
+    member: Optional[str],
+    member_schema: Schema,
+    common: List[Any],
+) -> List[int]:
+    """
+    Resolve a member reference to node IDs.
+
+    @param signature: Signature of the lookup.
+    @param member: Raw member value.
+    @param member_schema: Property schema of the member value.
+    @param common: Normalized values of the common properties.
+    @return: IDs of all matching nodes.
+    """
+    key = (_normalize(member, member_schema.property_type),) + tuple(common)
+    if None in key:
+        return []
+    return _node_lookups.get(signature, {}).get(key, [])
+
+
+def _read_chunks(
+    file_name: str, delimiter: str, chunksize: int
+) -> Iterator[List[Dict[str, str]]]:
+    """
+    Read a CSV file with headers in chunks.
+
+    @param file_name: Name and path of the input file.
+    @param delimiter: Delimiter used in the CSV file.
+    @param chunksize: Number of rows per chunk.
+    @return: Iterator over the chunks.
+    """
+    with open(file_name, newline="") as f:
+        reader = csv.DictReader(f, delimiter=delimiter)
+        while True:
+            chunk = list(islice(reader, chunksize))
+            if not chunk:
+                return
+            yield chunk
+
+
+class _PartWriter:
+    """
+    Writer of the data files produced for a single chunk.
+    """
+
+    def __init__(self, prefix: str) -> None:
+        """
+        Initialize the _PartWriter instance.
+
+        @param prefix: Path prefix of the data files.
+        """
+        self.prefix = prefix
+        self.files = {}
+        self.counts = {}
+
+    def write(self, group: str, fields: List[Any]) -> None:
+        """
+        Append a line to the data file of a group.
+
+        @param group: Name of the group, for example 'nodes' or a relationship type.
+        @param fields: CSV fields.
+        """
+        if group not in self.files:
+            f = open(f"{self.prefix}-{group}.csv", "w", newline="")
+            self.files[group] = (f, csv.writer(f))
+            self.counts[group] = 0
+        self.files[group][1].writerow(fields)
+        self.counts[group] += 1
+
+    def close(self) -> Dict[str, Tuple[str, int]]:
+        """
+        Close all data files.
+
+        @return: Dictionary mapping each group to its file and number of lines.
+        """
+        for f, _ in self.files.values():
+            f.close()
+        return {
+            group: (f.name, self.counts[group]) for group, (f, _) in self.files.items()
+        }
+
+
+def _lower_chunk(task: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Lower a chunk of edge or higher-order element rows into node and relationship lines.
+    Runs in the worker processes.
+
+    @param task: Description of the chunk.
+    @return: Written files, number of unresolved member references and, for lowered edges,
+             the (start ID, end ID, edge ID) triples.
+    """
+    kind, spec, rows = task["kind"], task["spec"], task["rows"]
+    writer = _PartWriter(task["prefix"])
+    unresolved = 0
+    triples = []
+    for offset, row in enumerate(rows):
+        element_id = task["first_id"] + offset
+        if kind == "edges":
+            starts = _lookup(
+                spec["start_signature"],
+                row.get(spec["start_schema"][0].field_name),
+                spec["start_schema"][0],
+                [
+                    _normalize(row.get(s.field_name), s.property_type)
+                    for s in spec["start_schema"][1:]
+                ],
+            )
+            ends = _lookup(
+                spec["end_signature"],
+                row.get(spec["end_schema"][0].field_name),
+                spec["end_schema"][0],
+                [
+                    _normalize(row.get(s.field_name), s.property_type)
+                    for s in spec["end_schema"][1:]
+                ],
+            )
+            if not starts or not ends:
+                unresolved += 1
+                continue
+            properties = _properties(row, spec["edge_schema"])
+            if spec["lowered"]:
+                writer.write("nodes", [element_id] + properties)
+            for start in starts:
+                for end in ends:
+                    if spec["lowered"]:
+                        writer.write("_adjacency", [start, element_id])
+                        writer.write("_adjacency", [element_id, end])
+                        if task["collect_edges"]:
+                            triples.append((start, end, element_id))
+                    else:
+                        writer.write("edges", [start, end] + properties)
+            continue
+
+        common = [
+            _normalize(row.get(s.field_name), s.property_type)
+            for s in spec["common_schema"]
+        ]
+        node_schema = spec["node_schema"]
+        members = row.get(node_schema.field_name) or ""
+        members = members.split(";") if members else []
+        if kind == "hyperedges":
+            # a hyperedge is incident to each member once
+            members = list(dict.fromkeys(members))
+        writer.write("nodes", [element_id] + _properties(row, spec["schema"]))
+        for position, member in enumerate(members):
+            ids = _lookup(spec["node_signature"], member, node_schema, common)
+            unresolved += not ids
+            for node_id in ids:
+                if kind == "hyperedges":
+                    writer.write("_adjacency", [node_id, element_id])
+                    writer.write("_adjacency", [element_id, node_id])
+                elif kind == "node_tuples":
+                    writer.write("_node_membership", [node_id, element_id, position])
+                else:
+                    writer.write("_node_membership", [node_id, element_id])
+        if kind == "subgraphs":
+            edge_schema = spec["edge_schema"]
+            edges = row.get(edge_schema.field_name) or ""
+            edge_ids = set()
+            for edge in edges.split(";") if edges else []:
+                ends = edge.split(":")
+                if len(ends) != 2:
+                    unresolved += 1
+                    continue
+                starts = _lookup(spec["edge_signature"], ends[0], edge_schema, common)
+                stops = _lookup(spec["edge_signature"], ends[1], edge_schema, common)
+                found = [
+                    edge_id
+                    for start in starts
+                    for stop in stops
+                    for edge_id in _edge_lookup.get((start, stop), [])
+                ]
+                unresolved += not found
+                edge_ids.update(found)
+            for edge_id in sorted(edge_ids):
+                writer.write("_edge_membership", [edge_id, element_id])
+    return {"files": writer.close(), "unresolved": unresolved, "triples": triples}
+
+
+class BulkImportGenerator:
+    """
+    Generator of 'neo4j-admin database import' files for a higher-order graph. Inputs are
+    registered with the add_* methods, which mirror the CSV imports of the storage classes,
+    and converted by generate(). Nodes are read first to build the lookup tables, edges and
+    higher-order elements are then lowered in chunks by a pool of worker processes.
+    """
+
+    def __init__(
+        self, output_dir: str, workers: int = None, chunksize: int = 50000
+    ) -> None:
+        """
+        Initialize the BulkImportGenerator instance.
+
+        @param output_dir: Directory the import files are written to.
+        @param workers: Number of worker processes. Defaults to the number of CPUs.
+        @param chunksize: Number of input rows per chunk. Defaults to 50000.
+        """
+        self.output_dir = output_dir
+        self.workers = workers if workers else os.cpu_count() or 1
+        self.chunksize = chunksize
+        self.inputs = []
+
+    def add_nodes(
+        self,
+        file_name: str,
+        labels: List[Label],
+        node_schema: List[Schema],
+        delimiter: str = ",",
+    ) -> None:
+        """
+        Register a node file, see GraphStorage.import_nodes_from_csv.
+
+        @param file_name: Name and path of the input file.
+        @param labels: Labels to assign to the nodes.
+        @param node_schema: Schema of the nodes.
+        @param delimiter: The delimiter used in the CSV file. Defaults to ','.
+        """
+        self.inputs.append(
+            (
+                "nodes",
+                file_name,
+                delimiter,
+                {"labels": [Label("_node")] + labels, "schema": node_schema},
+            )
+        )
+
+    def add_edges(
+        self,
+        file_name: str,
+        start_node_labels: List[Label],
+        start_node_schema: List[Schema],
+        end_node_labels: List[Label],
+        end_node_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+        lowered: bool = True,
+        delimiter: str = ",",
+    ) -> None:
+        """
+        Register an edge file. Lowered edges become '_edge' nodes connected with '_adjacency'
+        relationships as in GraphwithSubgraphStorage.import_edges_from_csv, otherwise they
+        become plain relationships as in GraphStorage.import_edges_from_csv.
+
+        @param file_name: Name and path of the input file.
+        @param start_node_labels: Labels of the start nodes.
+        @param start_node_schema: Schema of the start nodes.
+        @param end_node_labels: Labels of the end nodes.
+        @param end_node_schema: Schema of the end nodes.
+        @param edge_label: Label of the edges.
+        @param edge_schema: Schema of the edges.
+        @param lowered: Lower the edges into '_edge' nodes. Defaults to True.
+        @param delimiter: The delimiter used in the CSV file. Defaults to ','.
+        """
+        if not start_node_schema or not end_node_schema:
+            raise ValueError("Edges need at least one key property for each end.")
+        prefix = [Label("_node")] if lowered else []
+        self.inputs.append(
+            (
+                "edges",
+                file_name,
+                delimiter,
+                {
+                    "start_signature": _signature(
+                        prefix + start_node_labels, start_node_schema
+                    ),
+                    "start_schema": start_node_schema,
+                    "end_signature": _signature(
+                        prefix + end_node_labels, end_node_schema
+                    ),
+                    "end_schema": end_node_schema,
+                    "labels": [Label("_edge"), edge_label],
+                    "edge_label": edge_label,
+                    "edge_schema": edge_schema,
+                    "lowered": lowered,
+                },
+            )
+        )
+
+    def add_hyperedges(
+        self,
+        file_name: str,
+        node_labels: List[Label],
+        node_schema: Schema,
+        common_schema: List[Schema],
+        hyperedge_label: Label,
+        hyperedge_schema: List[Schema],
+        delimiter: str = ",",
+    ) -> None:
+        """
+        Register a hyperedge file, see HyperGraphStorage.import_hyperedges_from_csv.
+
+        @param file_name: Name and path of the input file.
+        @param node_labels: Labels of the nodes in the hyperedges.
+        @param node_schema: Schema of the node list.
+        @param common_schema: Common schema for all nodes in a hyperedge.
+        @param hyperedge_label: Label of the hyperedges.
+        @param hyperedge_schema: Schema of the hyperedges.
+        @param delimiter: The delimiter used in the CSV file. Defaults to ','.
+        """
+        self._add_element(
+            "hyperedges",
+            file_name,
+            delimiter,
+            [Label("_node")] + node_labels,
+            node_schema,
+            common_schema,
+            [Label("_hyperedge"), hyperedge_label],
+            hyperedge_schema,
+        )
+
+    def add_subgraphs(
+        self,
+        file_name: str,
+        node_schema: Schema,
+        node_schema_in_edge: Schema,
+        common_schema: List[Schema],
+        subgraph_labels: List[Label],
+        subgraph_schema: List[Schema],
+        delimiter: str = ",",
+    ) -> None:
+        """
+        Register a subgraph file, see GraphwithSubgraphStorage.import_subgraphs_from_csv.
+
+        @param file_name: Name and path of the input file.
+        @param node_schema: Schema of the node list.
+        @param node_schema_in_edge: Schema of the nodes in the edge list.
+        @param common_schema: Common schema for all nodes with subgraph.
+        @param subgraph_labels: Labels of the subgraphs.
+        @param subgraph_schema: Schema of the subgraphs.
+        @param delimiter: The delimiter used in the CSV file. Defaults to ','.
+        """
+        self._add_element(
+            "subgraphs",
+            file_name,
+            delimiter,
+            [Label("_node")],
+            node_schema,
+            common_schema,
+            [Label("_subgraph")] + subgraph_labels,
+            subgraph_schema,
+        )
+        self.inputs[-1][3]["edge_schema"] = node_schema_in_edge
+        self.inputs[-1][3]["edge_signature"] = _signature(
+            [Label("_node")], [node_schema_in_edge] + common_schema
+        )
+
+    def add_node_tuples(
+        self,
+        file_name: str,
+        node_schema: Schema,
+        common_schema: List[Schema],
+        node_tuple_labels: List[Label],
+        node_tuple_schema: List[Schema],
+        delimiter: str = ",",
+    ) -> None:
+        """
+        Register a node-tuple file, see GraphwithTupleStorage.import_node_tuples_from_csv.
+
+        @param file_name: Name and path of the input file.
+        @param node_schema: Schema of the node list.
+        @param common_schema: Common schema for all nodes with tuple.
+        @param node_tuple_labels: Labels of the node-tuples.
+        @param node_tuple_schema: Schema of the node-tuples.
+        @param delimiter: The delimiter used in the CSV file. Defaults to ','.
+        """
+        self._add_element(
+            "node_tuples",
+            file_name,
+            delimiter,
+            [Label("_node")],
+            node_schema,
+            common_schema,
+            [Label("_node_tuple")] + node_tuple_labels,
+            node_tuple_schema,
+        )
+
+    def _add_element(
+        self,
+        kind: str,
+        file_name: str,
+        delimiter: str,
+        node_labels: List[Label],
+        node_schema: Schema,
+        common_schema: List[Schema],
+        labels: List[Label],
+        schema: List[Schema],
+    ) -> None:
+        """
+        Register a file of higher-order elements with a member list.
+
+        @param kind: Kind of the elements.
+        @param file_name: Name and path of the input file.
+        @param delimiter: The delimiter used in the CSV file.
+        @param node_labels: Labels of the member nodes.
+        @param node_schema: Schema of the member list.
+        @param common_schema: Common schema for all members.
+        @param labels: Labels of the elements.
+        @param schema: Schema of the elements.
+        """
+        self.inputs.append(
+            (
+                kind,
+                file_name,
+                delimiter,
+                {
+                    "node_signature": _signature(
+                        node_labels, [node_schema] + common_schema
+                    ),
+                    "node_schema": node_schema,
+                    "common_schema": common_schema,
+                    "labels": labels,
+                    "schema": schema,
+                },
+            )
+        )
+
+    def _signatures(self) -> List[Tuple[tuple, tuple]]:
+        """
+        Signatures of all node lookups required by the registered inputs.
+
+        @return: List of signatures.
+        """
+        keys = ("start_signature", "end_signature", "node_signature", "edge_signature")
+        return list(
+            {spec[key] for _, _, _, spec in self.inputs for key in keys if key in spec}
+        )
+
+    def _run(self, tasks: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Run lowering tasks on the worker pool, keeping at most two tasks per worker in flight.
+
+        @param tasks: Iterator over the tasks.
+        @return: Iterator over the task results, in task order.
+        """
+        methods = multiprocessing.get_all_start_methods()
+        if self.workers <= 1 or "fork" not in methods:
+            # the lookup tables are only shared with forked workers
+            for task in tasks:
+                yield _lower_chunk(task)
+            return
+        with multiprocessing.get_context("fork").Pool(self.workers) as pool:
+            pending = deque()
+            for task in tasks:
+                pending.append(pool.apply_async(_lower_chunk, (task,)))
+                if len(pending) >= 2 * self.workers:
+                    yield pending.popleft().get()
+            while pending:
+                yield pending.popleft().get()
+
+    def _write_header(self, name: str, fields: List[str]) -> str:
+        """
+        Write a header file.
+
+        @param name: Name of the header file without extension.
+        @param fields: Header fields.
+        @return: Path of the header file.
+        """
+        path = os.path.join(self.output_dir, f"{name}-header.csv")
+        with open(path, "w", newline="") as f:
+            csv.writer(f).writerow(fields)
+        return path
+
+    def generate(self) -> Dict[str, Any]:
+        """
+        Generate the import files and a manifest describing them.
+
+        @return: The manifest, also written to 'manifest.json' in the output directory.
+        """
+        global _node_lookups, _edge_lookup
+        os.makedirs(self.output_dir, exist_ok=True)
+        signatures = self._signatures()
+        _node_lookups = {signature: {} for signature in signatures}
+        _edge_lookup = {}
+        collect_edges = any(kind == "subgraphs" for kind, _, _, _ in self.inputs)
+        manifest = {
+            "id_space": ID_SPACE,
+            "nodes": [],
+            "relationships": [],
+            "unresolved": {},
+            "counts": {"labels": {}, "relationships": {}},
+        }
+        next_id = 0
+
+        # nodes are converted in the main process, which builds the lookup tables
+        for index, (kind, file_name, delimiter, spec) in enumerate(self.inputs):
+            if kind != "nodes":
+                continue
+            labels = [repr(label) for label in spec["labels"]]
+            schema = {s.property_name: s for s in spec["schema"]}
+            tables = [
+                (keys, table)
+                for (signature_labels, keys), table in _node_lookups.items()
+                if set(signature_labels) <= set(labels) and set(keys) <= set(schema)
+            ]
+            path = os.path.join(self.output_dir, f"{index}-nodes.csv")
+            count = 0
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                for chunk in _read_chunks(file_name, delimiter, self.chunksize):
+                    for row in chunk:
+                        node_id = next_id + count
+                        count += 1
+                        writer.writerow([node_id] + _properties(row, spec["schema"]))
+                        for keys, table in tables:
+                            key = tuple(
+                                _normalize(
+                                    row.get(schema[k].field_name),
+                                    schema[k].property_type,
+                                )
+                                for k in keys
+                            )
+                            if None not in key:
+                                table.setdefault(key, []).append(node_id)
+            next_id += count
+            header = self._write_header(
+                f"{index}-nodes",
+                [f":ID({ID_SPACE})"] + _properties_header(spec["schema"]),
+            )
+            self._add_nodes(manifest, labels, header, [path], count)
+
+        # edges first, the subgraphs need the lowered edges to resolve their edge lists
+        for phase in (("edges",), ("hyperedges", "subgraphs", "node_tuples")):
+            for index, (kind, file_name, delimiter, spec) in enumerate(self.inputs):
+                if kind not in phase:
+                    continue
+                chunks = _read_chunks(file_name, delimiter, self.chunksize)
+
+                def tasks():
+                    nonlocal next_id
+                    for number, rows in enumerate(chunks):
+                        yield {
+                            "kind": kind,
+                            "spec": spec,
+                            "rows": rows,
+                            "first_id": next_id,
+                            "prefix": os.path.join(self.output_dir, f"{index}-{number}"),
+                            "collect_edges": collect_edges,
+                        }
+                        next_id += len(rows)
+
+                files, unresolved = {}, 0
+                for result in self._run(tasks()):
+                    unresolved += result["unresolved"]
+                    for group, (path, count) in result["files"].items():
+                        paths, total = files.get(group, ([], 0))
+                        files[group] = (paths + [path], total + count)
+                    for start, end, edge_id in result["triples"]:
+                        _edge_lookup.setdefault((start, end), []).append(edge_id)
+                manifest["unresolved"][file_name] = unresolved
+                self._add_files(manifest, index, kind, spec, files)
+
+        with open(os.path.join(self.output_dir, "manifest.json"), "w") as f:
+            json.dump(manifest, f, indent=2)
+        return manifest
+
+    def _add_nodes(
+        self,
+        manifest: Dict[str, Any],
+        labels: List[str],
+        header: str,
+        paths: List[str],
+        count: int,
+    ) -> None:
+        """
+        Add a group of node files to the manifest.
+
+        @param manifest: Manifest to update.
+        @param labels: Labels of the nodes.
+        @param header: Path of the header file.
+        @param paths: Paths of the data files.
+        @param count: Number of nodes.
+        """
+        manifest["nodes"].append(
+            {"labels": labels, "header": header, "files": paths, "count": count}
+        )
+        for label in set(labels):
+            counts = manifest["counts"]["labels"]
+            counts[label] = counts.get(label, 0) + count
+
+    def _add_files(
+        self,
+        manifest: Dict[str, Any],
+        index: int,
+        kind: str,
+        spec: Dict[str, Any],
+        files: Dict[str, Tuple[List[str], int]],
+    ) -> None:
+        """
+        Write the header files of a lowered input and add its files to the manifest.
+
+        @param manifest: Manifest to update.
+        @param index: Position of the input.
+        @param kind: Kind of the input.
+        @param spec: Specification of the input.
+        @param files: Data files and line counts per group.
+        """
+        relationship = [f":START_ID({ID_SPACE})", f":END_ID({ID_SPACE})"]
+        for group, (paths, count) in sorted(files.items()):
+            if group == "nodes":
+                schema = spec["edge_schema"] if kind == "edges" else spec["schema"]
+                header = self._write_header(
+                    f"{index}-nodes",
+                    [f":ID({ID_SPACE})"] + _properties_header(schema),
+                )
+                labels = [repr(label) for label in spec["labels"]]
+                self._add_nodes(manifest, labels, header, paths, count)
+                continue
+            if group == "edges":
+                relationship_type = repr(spec["edge_label"])
+                fields = relationship + _properties_header(spec["edge_schema"])
+            elif kind == "node_tuples":
+                relationship_type = group
+                fields = relationship + ["position_in_tuple:long"]
+            else:
+                relationship_type = group
+                fields = relationship
+            header = self._write_header(f"{index}-{group}", fields)
+            manifest["relationships"].append(
+                {
+                    "type": relationship_type,
+                    "header": header,
+                    "files": paths,
+                    "count": count,
+                }
+            )
+            counts = manifest["counts"]["relationships"]
+            counts[relationship_type] = counts.get(relationship_type, 0) + count
+
+
+def import_command(manifest: Dict[str, Any], database: str = "neo4j") -> List[str]:
+    """
+    Build the neo4j-admin command importing the generated files.
+
+    @param manifest: Manifest returned by BulkImportGenerator.generate.
+    @param database: Name of the database. Defaults to 'neo4j'.
+    @return: Command line arguments.
+    """
+    command = ["neo4j-admin", "database", "import", "full", database]
+    for nodes in manifest["nodes"]:
+        files = ",".join([nodes["header"]] + nodes["files"])
+        command.append(f"--nodes={':'.join(nodes['labels'])}={files}")
+    for relationships in manifest["relationships"]:
+        files = ",".join([relationships["header"]] + relationships["files"])
+        command.append(f"--relationships={relationships['type']}={files}")
+    command.append("--id-type=INTEGER")
+    return command
+
+
+def verify(
+    db: Database, session: Session, manifest: Dict[str, Any]
+) -> Dict[str, Tuple[int, int]]:
+    """
+    Compare the element counts of a loaded database with the counts of the manifest.
+
+    @param db: Database the files were imported into.
+    @param session: Database session.
+    @param manifest: Manifest returned by BulkImportGenerator.generate.
+    @return: Dictionary mapping each label and relationship type to the expected and actual
+             counts.
+    """
+    counts = {}
+    for label, expected in manifest["counts"]["labels"].items():
+        counts[label] = (expected, db.node_count(session, [Label(label)]))
+    for relationship_type, expected in manifest["counts"]["relationships"].items():
+        counts[f"[{relationship_type}]"] = (
+            expected,
+            db.edge_count(session, Label(relationship_type)),
+        )
+    return counts
+
+
+def _schema(spec: Any) -> Any:
+    """
+    Parse a schema specification of the CLI, either a single schema or a list of schemas.
+
+    @param spec: Dictionary with 'property', 'type' and 'field', or a list of them.
+    @return: Schema or list of schemas.
+    """
+    if isinstance(spec, list):
+        return [_schema(s) for s in spec]
+    return Schema(
+        spec["property"], _TYPE_NAMES[spec.get("type", "str")], spec.get("field")
+    )
+
+
+def _labels(names: List[str]) -> List[Label]:
+    """
+    Parse the labels of the CLI.
+
+    @param names: Label names.
+    @return: List of labels.
+    """
+    return [Label(name) for name in names]
+
+
+def generator_from_spec(
+    spec: Dict[str, Any],
+    output_dir: str,
+    workers: int = None,
+    chunksize: int = 50000,
+    base_dir: str = "",
+) -> BulkImportGenerator:
+    """
+    Create a generator from a JSON specification of the inputs. The keys 'nodes', 'edges',
+    'hyperedges', 'subgraphs' and 'node_tuples' hold lists of inputs whose fields are named
+    after the arguments of the corresponding add_* methods, with 'file' for the input file.
+
+    @param spec: Specification of the inputs.
+    @param output_dir: Directory the import files are written to.
+    @param workers: Number of worker processes. Defaults to None.
+    @param chunksize: Number of input rows per chunk. Defaults to 50000.
+    @param base_dir: Directory relative input paths are resolved against. Defaults to ''.
+    @return: Generator with all inputs registered.
+    """
+    generator = BulkImportGenerator(output_dir, workers, chunksize)
+    for s in spec.get("nodes", []):
+        generator.add_nodes(
+            os.path.join(base_dir, s["file"]),
+            _labels(s["labels"]),
+            _schema(s["node_schema"]),
+            s.get("delimiter", ","),
+        )
+    for s in spec.get("edges", []):
+        generator.add_edges(
+            os.path.join(base_dir, s["file"]),
+            _labels(s["start_node_labels"]),
+            _schema(s["start_node_schema"]),
+            _labels(s["end_node_labels"]),
+            _schema(s["end_node_schema"]),
+            Label(s["edge_label"]),
+            _schema(s.get("edge_schema", [])),
+            s.get("lowered", True),
+            s.get("delimiter", ","),
+        )
+    for s in spec.get("hyperedges", []):
+        generator.add_hyperedges(
+            os.path.join(base_dir, s["file"]),
+            _labels(s["node_labels"]),
+            _schema(s["node_schema"]),
+            _schema(s.get("common_schema", [])),
+            Label(s["hyperedge_label"]),
+            _schema(s.get("hyperedge_schema", [])),
+            s.get("delimiter", ","),
+        )
+    for s in spec.get("subgraphs", []):
+        generator.add_subgraphs(
+            os.path.join(base_dir, s["file"]),
+            _schema(s["node_schema"]),
+            _schema(s["node_schema_in_edge"]),
+            _schema(s.get("common_schema", [])),
+            _labels(s["subgraph_labels"]),
+            _schema(s.get("subgraph_schema", [])),
+            s.get("delimiter", ","),
+        )
+    for s in spec.get("node_tuples", []):
+        generator.add_node_tuples(
+            os.path.join(base_dir, s["file"]),
+            _schema(s["node_schema"]),
+            _schema(s.get("common_schema", [])),
+            _labels(s["node_tuple_labels"]),
+            _schema(s.get("node_tuple_schema", [])),
+            s.get("delimiter", ","),
+        )
+    return generator
+
+
+def main(argv: List[str] = None) -> int:
+    """
+    Command line entry point.
+
+    @param argv: Command line arguments. Defaults to sys.argv.
+    @return: Exit code.
+    """
+    parser = argparse.ArgumentParser(prog="python -m HOGDB.db.bulk_import")
+    commands = parser.add_subparsers(dest="command", required=True)
+    generate = commands.add_parser("generate", help="Generate neo4j-admin import files.")
+    generate.add_argument("spec", help="JSON specification of the CSV inputs.")
+    generate.add_argument("output_dir", help="Output directory.")
+    generate.add_argument("--workers", type=int, default=None)
+    generate.add_argument("--chunksize", type=int, default=50000)
+    generate.add_argument("--database", type=str, default="neo4j")
+    check = commands.add_parser("verify", help="Compare element counts after the load.")
+    check.add_argument("manifest", help="Manifest written by the generate command.")
+    check.add_argument("--db-name", type=str, default=None)
+    args = parser.parse_args(argv)
+
+    if args.command == "generate":
+        with open(args.spec) as f:
+            spec = json.load(f)
+        generator = generator_from_spec(
+            spec,
+            args.output_dir,
+            args.workers,
+            args.chunksize,
+            os.path.dirname(args.spec),
+        )
+        manifest = generator.generate()
+        for file_name, unresolved in manifest["unresolved"].items():
+            if unresolved:
+                print(
+                    f"{file_name}: {unresolved} unresolved references", file=sys.stderr
+                )
+        print(" ".join(import_command(manifest, args.database)))
+        return 0
+
+    from HOGDB.db.neo4j import Neo4jDatabase
+
+    with open(args.manifest) as f:
+        manifest = json.load(f)
+    db = Neo4jDatabase(db_name=args.db_name)
+    session = db.start_session()
+    try:
+        counts = verify(db, session, manifest)
+    finally:
+        db.end_session(session)
+        db.close_driver()
+    mismatches = 0
+    for name, (expected, actual) in counts.items():
+        status = "ok" if expected == actual else "MISMATCH"
+        mismatches += expected != actual
+        print(f"{name}: expected {expected}, found {actual} {status}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,13 +9,25 @@
 # contributions: Jakub Cudak
 
 from abc import ABC, abstractmethod
+from HOGDB.db.aggregation import Aggregate
+from HOGDB.db.exporter import ExportStats
 from HOGDB.db.label import Label
+from HOGDB.db.predicate import Comparison, Predicate
 from HOGDB.db.property import Property
 from HOGDB.db.schema import Schema
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 import pandas as pd
 
 
+class UnsupportedOperationError(NotImplementedError):
+    """
+    Raised by a database for an operation of the interface below that its backend does not
+    support, for example running query strings on a database that has no query language.
+    """
+
+    pass
+
+
 class Session(ABC):
     """
     Abstract base class for a database session. Defines the interface for running queries and managing transactions.
@@ -27,6 +39,14 @@ class Session(ABC):
 
     @abstractmethod
     def run(self, query: str, parameters: Optional[Dict] = None) -> List[Dict]:
+        """
+        Run a query in the query language of the backend.
+
+        @param query: Query string.
+        @param parameters: Query parameters. Defaults to None.
+        @return: List of result records.
+        @raise UnsupportedOperationError: If the backend does not run query strings.
+        """
         pass
 
     @abstractmethod
@@ -49,6 +69,14 @@ class Transaction(ABC):
 
     @abstractmethod
     def run(self, query: str, parameters: Optional[Dict] = None) -> List[Dict]:
+        """
+        Run a query in the query language of the backend within the transaction.
+
+        @param query: Query string.
+        @param parameters: Query parameters. Defaults to None.
+        @return: List of result records.
+        @raise UnsupportedOperationError: If the backend does not run query strings.
+        """
         pass
 
     @abstractmethod
@@ -96,7 +124,10 @@ class Database(ABC):
         file_name: str,
         labels: List[Label],
         node_schema: List[Schema],
-    ) -> None:
+        batch_size: int = 10000,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
         """
         Export nodes to a CSV file.
 
@@ -104,6 +135,11 @@ class Database(ABC):
         @param file_name: Name and path of the output file.
         @param labels: List of node labels to export.
         @param node_schema: List of property schemas for the nodes.
+        @param batch_size: Number of records appended at a time. Defaults to 10000.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version. Defaults to None.
+        @return: Export statistics.
         """
         pass
 
@@ -118,7 +154,10 @@ class Database(ABC):
         end_schema: List[Schema],
         edge_label: Label,
         edge_schema: List[Schema],
-    ) -> None:
+        batch_size: int = 10000,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
         """
         Export edges to a CSV file.
 
@@ -130,6 +169,11 @@ class Database(ABC):
         @param end_schema: List of property schemas for the end nodes.
         @param edge_label: Export edges with that label.
         @param edge_schema: List of property schemas for the edges.
+        @param batch_size: Number of records appended at a time. Defaults to 10000.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version. Defaults to None.
+        @return: Export statistics.
         """
         pass
 
@@ -145,7 +189,10 @@ class Database(ABC):
         node_edge_labels: List[Label],
         node_edge_schema: List[Schema],
         edge_label: Label,
-    ) -> None:
+        batch_size: int = 10000,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
         """
         Export HO edges to a CSV file.
 
@@ -158,6 +205,11 @@ class Database(ABC):
         @param node_edge_labels: List of labels for the HO edges.
         @param node_edge_schema: List of property schemas for the HO edges.
         @param edge_label: Label of the edges to the HO edges.
+        @param batch_size: Number of records appended at a time. Defaults to 10000.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version. Defaults to None.
+        @return: Export statistics.
         """
         pass
 
@@ -170,7 +222,10 @@ class Database(ABC):
         edge_schema: Schema,
         subgraph_labels: List[Label],
         subgraph_schema: List[Schema],
-    ) -> None:
+        batch_size: int = 10000,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
         """
         Export subgraph collections to a CSV file.
 
@@ -180,6 +235,11 @@ class Database(ABC):
         @param edge_schema: Edge schema.
         @param subgraph_labels: List of subgraph collection labels to export.
         @param subgraph_schema: List of property schemas for the subgraph collections.
+        @param batch_size: Number of records appended at a time. Defaults to 10000.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version. Defaults to None.
+        @return: Export statistics.
         """
         pass
 
@@ -192,7 +252,10 @@ class Database(ABC):
         node_schema: Schema,
         hyperedge_labels: List[Label],
         hyperedge_schema: List[Schema],
-    ) -> None:
+        batch_size: int = 10000,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
         """
         Export hyperedges to a CSV file.
 
@@ -202,6 +265,11 @@ class Database(ABC):
         @param node_schema: Property schema for the nodes.
         @param hyperedge_labels: Export hyperedges with those labels.
         @param hyperedge_schema: List of property schemas for the hyperedges.
+        @param batch_size: Number of records appended at a time. Defaults to 10000.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version. Defaults to None.
+        @return: Export statistics.
         """
         pass
 
@@ -213,7 +281,10 @@ class Database(ABC):
         node_schema: Schema,
         tuple_labels: List[Label],
         tuple_schema: List[Schema],
-    ) -> None:
+        batch_size: int = 10000,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
         """
         Export node-tuples to a CSV file.
 
@@ -222,6 +293,11 @@ class Database(ABC):
         @param node_schema: Property schema for the nodes.
         @param tuple_labels: Export node-tuples with those labels.
         @param tuple_schema: List of property schemas for the node-tuples.
+        @param batch_size: Number of records appended at a time. Defaults to 10000.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version. Defaults to None.
+        @return: Export statistics.
         """
         pass
 
@@ -235,6 +311,7 @@ class Database(ABC):
         as_url: bool = False,
         batch_size: int = 10000,
         delimiter: str = ",",
+        checkpoint: str = None,
     ) -> None:
         """
         Import nodes from a CSV file into the graph database.
@@ -246,6 +323,9 @@ class Database(ABC):
         @param as_url: Treat file_name as URL. Defaults to False.
         @param batch_size: Number of nodes to import at a time. Defaults to 10000.
         @param delimiter: Delimiter used in the CSV file. Defaults to ','.
+        @param checkpoint: Name under which the progress of the import is committed together
+                           with the imported rows. A failed import run again with the same
+                           name resumes after the last committed row. Defaults to None.
         """
         pass
 
@@ -263,6 +343,7 @@ class Database(ABC):
         as_url: bool = False,
         batch_size: int = 10000,
         delimiter: str = ",",
+        checkpoint: str = None,
     ) -> None:
         """
         Import edges from a CSV file into the graph databse.
@@ -278,6 +359,9 @@ class Database(ABC):
         @param as_url: Treat file_name as URL. Defaults to False.
         @param batch_size: Number of edges to import at a time. Defaults to 10000.
         @param delimiter: Delimiter used in the CSV file. Defaults to ','.
+        @param checkpoint: Name under which the progress of the import is committed together
+                           with the imported rows. A failed import run again with the same
+                           name resumes after the last committed row. Defaults to None.
         """
         pass
 
@@ -296,6 +380,7 @@ class Database(ABC):
         as_url: bool = False,
         batch_size: int = 10000,
         delimiter: str = ",",
+        checkpoint: str = None,
     ) -> None:
         """
         Import HO edges from a CSV file into the graph database.
@@ -312,6 +397,9 @@ class Database(ABC):
         @param as_url: Treat file_name as URL. Defaults to False.
         @param batch_size: Number of edges to import at a time. Defaults to 10000.
         @param delimiter: Delimiter used in the CSV file. Defaults to ','.
+        @param checkpoint: Name under which the progress of the import is committed together
+                           with the imported rows. A failed import run again with the same
+                           name resumes after the last committed row. Defaults to None.
         """
         pass
 
@@ -328,7 +416,8 @@ class Database(ABC):
         as_url: bool = False,
         batch_size: int = 5000,
         delimiter: str = ",",
-    ) -> None:
+        checkpoint: str = None,
+    ) -> List[Any]:
         """
         Import hyperedges from a CSV file into the graph database.
 
@@ -342,6 +431,10 @@ class Database(ABC):
         @param as_url: Treat file_name as URL. Defaults to False.
         @param batch_size: Number of hyperedges to import at a time. Defaults to 5000.
         @param delimiter: Delimiter used in the CSV file. Defaults to ','.
+        @param checkpoint: Name under which the progress of the import is committed together
+                           with the imported rows. A failed import run again with the same
+                           name resumes after the last committed row. Defaults to None.
+        @return: Member keys that did not match any node.
         """
         pass
 
@@ -357,6 +450,7 @@ class Database(ABC):
         as_url: bool = False,
         batch_size: int = 1000,
         delimiter: str = ",",
+        checkpoint: str = None,
     ) -> None:
         """
         Import node-tuples from a CSV file into the graph database.
@@ -370,6 +464,9 @@ class Database(ABC):
         @param as_url: Treat file_name as URL. Defaults to False.
         @param batch_size: Number of hyperedges to import at a time. Defaults to 1000.
         @param delimiter: Delimiter used in the CSV file. Defaults to ','.
+        @param checkpoint: Name under which the progress of the import is committed together
+                           with the imported rows. A failed import run again with the same
+                           name resumes after the last committed row. Defaults to None.
         """
         pass
 
@@ -386,6 +483,7 @@ class Database(ABC):
         as_url: bool = False,
         batch_size: int = 1000,
         delimiter: str = ",",
+        checkpoint: str = None,
     ) -> None:
         """
         Import subgraph collections from a CSV file into the graph database.
@@ -400,6 +498,9 @@ class Database(ABC):
         @param as_url: Treat file_name as URL. Defaults to False.
         @param batch_size: Number of hyperedges to import at a time. Defaults to 1000.
         @param delimiter: Delimiter used in the CSV file. Defaults to ','.
+        @param checkpoint: Name under which the progress of the import is committed together
+                           with the imported rows. A failed import run again with the same
+                           name resumes after the last committed row. Defaults to None.
         """
         pass
 
@@ -410,6 +511,7 @@ class Database(ABC):
         tx: Transaction,
         labels: List[Label],
         properties: List[Property],
+        track_changes: bool = False,
     ) -> None:
         """
         Add a node to the database.
@@ -418,6 +520,7 @@ class Database(ABC):
         @param tx: Current transaction.
         @param labels: List of labels for the node to be added.
         @param properties: List of properties for the node to be added.
+        @param track_changes: Set the change version of the node. Defaults to False.
         """
         pass
 
@@ -428,6 +531,7 @@ class Database(ABC):
         tx: Transaction,
         labels: List[Label],
         properties: List[Property],
+        track_changes: bool = False,
     ) -> None:
         """
         Delete a node and all its connected edges.
@@ -436,6 +540,7 @@ class Database(ABC):
         @param session: Database session.
         @param labels: List of labels for the node to be deleted.
         @param properties: List of properties for the node to be deleted.
+        @param track_changes: Leave a tombstone for the node. Defaults to False.
         """
         pass
 
@@ -447,6 +552,7 @@ class Database(ABC):
         labels: List[Label],
         properties: List[Property],
         edge_label: Label,
+        track_changes: bool = False,
     ) -> None:
         """
         Delete a node and all its connecting HO edges.
@@ -456,6 +562,7 @@ class Database(ABC):
         @param labels: List of labels for the node to be deleted.
         @param properties: List of properties for the node to be deleted.
         @param edge_label: Label of the edges.
+        @param track_changes: Leave tombstones for the node and its HO edges. Defaults to False.
         """
         pass
 
@@ -470,6 +577,7 @@ class Database(ABC):
         end_node_properties: List[Property],
         edge_label: Label,
         edge_properties: List[Property],
+        track_changes: bool = False,
     ) -> None:
         """
         Add an edge between two nodes.
@@ -482,6 +590,7 @@ class Database(ABC):
         @param end_node_properties: List of properties for the end node.
         @param edge_label: Label of the edge.
         @param edge_properties: List of properties of the edge.
+        @param track_changes: Set the change version of the edge. Defaults to False.
         """
         pass
 
@@ -495,6 +604,7 @@ class Database(ABC):
         end_node_labels: List[Label],
         end_node_properties: List[Property],
         edge_label: Label,
+        track_changes: bool = False,
     ) -> None:
         """
         Delete an edge between two nodes.
@@ -506,6 +616,8 @@ class Database(ABC):
         @param end_node_labels: List of labels for the end node.
         @param end_node_properties: List of properties for the end node.
         @param edge_label: Label of the edge.
+        @param track_changes: Leave a tombstone for the edge, holding the properties the start
+                              and end nodes were matched on. Defaults to False.
         """
         pass
 
@@ -517,6 +629,7 @@ class Database(ABC):
         node_labels: List[Label],
         node_properties: List[Property],
         update_properties: List[Property],
+        track_changes: bool = False,
     ) -> None:
         """
         Update properties of a node.
@@ -526,6 +639,8 @@ class Database(ABC):
         @param node_labels: List of labels of the node.
         @param node_properties: List of original properties of the node.
         @param update_properties: List of new properties for the node.
+        @param track_changes: Set the change version of the node and of the HO elements it is
+                              a member of. Defaults to False.
         """
         pass
 
@@ -537,6 +652,7 @@ class Database(ABC):
         edge_label: Label,
         edge_properties: List[Property],
         update_properties: List[Property],
+        track_changes: bool = False,
     ) -> None:
         """
         Update properties of an edge.
@@ -546,6 +662,7 @@ class Database(ABC):
         @param edge_label: Label of the edge.
         @param edge_properties: List of original properties of the edge.
         @param update_properties: List of new properties for the edge.
+        @param track_changes: Set the change version of the edge. Defaults to False.
         """
         pass
 
@@ -746,11 +863,15 @@ class Database(ABC):
         session: Session,
         variables_list: List[List[str]],
         elements_list: List[List[Tuple[List[Label], List[Property]]]],
-        conditions_list: List[List[str]],
+        conditions_list: List[List[Union[str, Predicate]]],
         return_values: List[str],
         sort: List[str] = None,
         limit: int = None,
-    ) -> pd.DataFrame:
+        output: str = "pandas",
+        dtypes: Optional[Dict[str, Any]] = None,
+        group_by: List[str] = None,
+        aggregates: List[Aggregate] = None,
+    ) -> Union[pd.DataFrame, Dict[str, Any]]:
         """
         Traverse a path in the database.
 
@@ -761,7 +882,12 @@ class Database(ABC):
         @param return_values: TODO.
         @param sort: TODO. Defaults to None.
         @param limit: TODO. Defaults to None.
-        @return: Path information.
+        @param output: Result format: 'pandas', 'numpy' or 'torch'. Defaults to 'pandas'.
+        @param dtypes: Optional mapping from return value to dtype for the 'numpy' and 'torch'
+                       formats. Defaults to None.
+        @param group_by: Grouping keys returned next to the aggregations. Defaults to None.
+        @param aggregates: Aggregations evaluated by the database. Defaults to None.
+        @return: Path information as a dataframe or as a dictionary of arrays.
         """
         pass
 
@@ -788,14 +914,63 @@ class Database(ABC):
         pass
 
     @abstractmethod
-    def start_session(self) -> Session:
+    def start_session(self, bookmarks=None, read_only: bool = False) -> Session:
         """
         Start a new database session.
 
+        @param bookmarks: Bookmarks the session has to be causally consistent with. Defaults to None.
+        @param read_only: Whether the session is only used for reads. Defaults to False.
         @return: Database session.
         """
         pass
 
+    def last_bookmarks(self, session: Session):
+        """
+        Get the bookmarks of the last transaction committed in the given session.
+
+        @param session: Database session.
+        @return: Bookmarks or None if the database does not support them.
+        """
+        return None
+
+    def indexed_predicates(
+        self,
+        session: Session,
+        variables_list: List[List[str]],
+        elements_list: List[List[Tuple[List[Label], List[Property]]]],
+        conditions_list: List[List[Union[str, Predicate]]],
+    ) -> List[Tuple[Comparison, Optional[str]]]:
+        """
+        Determine which structured predicates of a traversal an existing index can serve.
+
+        @param session: Database session.
+        @param variables_list: Variables of the paths.
+        @param elements_list: Labels and properties of the path elements.
+        @param conditions_list: Conditions of the paths.
+        @return: List of comparisons and the name of the index serving each of them, or None
+                 if the database does not report index usage.
+        """
+        return None
+
+    def capture_plans(self, explain: bool = False):
+        """
+        Context manager that captures the query plan of every query run within its scope.
+
+        @param explain: Capture plans without execution statistics. Defaults to False.
+        @return: Context manager yielding a list that is filled with one QueryProfile per
+                 query, or None if the database does not support query plans.
+        """
+        return None
+
+    @property
+    def max_concurrent_sessions(self) -> int:
+        """
+        Maximum number of sessions that can be used concurrently.
+
+        @return: Number of concurrent sessions.
+        """
+        return 1
+
     @abstractmethod
     def end_session(self, session) -> None:
         """
@@ -0,0 +1,3880 @@
+# Copyright (c) 2025 ETH Zurich.
+#                    All rights reserved.
+#
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# Base of the databases running in the Python process, InMemoryDatabase and SQLiteDatabase.
+# Both store the lowered graph of the storage classes as generic nodes and relationships,
+# so the exports, imports, writes, matches and index management are written once here on
+# top of a small set of storage and lookup primitives each backend implements. The
+# primitives receive a handle of the running read or write: the connection of a SQLite
+# session, the undo log of an in-memory transaction.
+
+from HOGDB.db.db import Database, Session, Transaction
+from HOGDB.db.exporter import (
+    ArrowExportWriter,
+    CsvExportWriter,
+    ExportStats,
+    arrow_fields,
+    list_field,
+    pair_list_field,
+)
+from HOGDB.db.expression import FUNCTIONS, sort_key
+from HOGDB.db.importer import (
+    BatchWriter,
+    ImportStats,
+    checkpoint_batches,
+    iter_batches,
+    iter_rows,
+)
+from HOGDB.db.label import Label
+from HOGDB.db.predicate import Comparison, Predicate
+from HOGDB.db.property import Property
+from HOGDB.db.schema import Schema
+from abc import abstractmethod
+from contextlib import contextmanager
+from datetime import date, datetime
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+import pandas as pd, csv
+
+# HO elements whose exported rows list their member nodes or edges
+CONTAINER_LABELS = ("_hyperedge", "_subgraph", "_node_tuple")
+
+
+class StoredNode:
+    """
+    A node as stored by an embedded database.
+    """
+
+    __slots__ = ("id", "labels", "properties")
+
+    def __init__(self, id: int, labels: Tuple[str, ...], properties: Dict[str, Any]):
+        """
+        Initialize the StoredNode instance.
+
+        @param id: Identifier of the node.
+        @param labels: Labels of the node.
+        @param properties: Properties of the node.
+        """
+        self.id = id
+        self.labels = labels
+        self.properties = properties
+
+
+class StoredRelationship:
+    """
+    A directed relationship as stored by an embedded database.
+    """
+
+    __slots__ = ("id", "type", "start", "end", "properties")
+
+    def __init__(
+        self, id: int, type: str, start: int, end: int, properties: Dict[str, Any]
+    ):
+        """
+        Initialize the StoredRelationship instance.
+
+        @param id: Identifier of the relationship.
+        @param type: Type of the relationship.
+        @param start: Identifier of the start node.
+        @param end: Identifier of the end node.
+        @param properties: Properties of the relationship.
+        """
+        self.id = id
+        self.type = type
+        self.start = start
+        self.end = end
+        self.properties = properties
+
+
+class EmbeddedDatabase(Database):
+    """
+    The EmbeddedDatabase class implements the Database interface for the databases running
+    in the Python process, on top of the storage and lookup primitives of a backend.
+
+    Inherits from the Database class. Subclasses implement the abstract primitives below,
+    the traversal, the counts and the session handling.
+    """
+
+    # comparison operators an index can serve, and whether indexes are ordered, so that a
+    # comparison only needs the index keys before its own key to be constrained
+    _INDEX_OPERATORS: Tuple[str, ...] = ("=", "IN")
+    _ORDERED_INDEXES = False
+
+    def _begin_transaction(self, session: Session) -> Transaction:
+        """
+        Begin a transaction in the given session.
+
+        @param session: Database session.
+        @return: Transaction.
+        """
+        return session.begin_transaction()
+
+    def _close_transaction(self, tx: Transaction) -> None:
+        """
+        Commit and close the transaction.
+
+        @param tx: Transaction to commit and close.
+        """
+        tx.commit()
+        tx.close()
+
+    @abstractmethod
+    def _read(self, session: Session) -> ContextManager[Any]:
+        """
+        Context manager running the lookups of a read on a consistent state.
+
+        @param session: Database session.
+        @return: Handle of the read.
+        """
+        pass
+
+    @abstractmethod
+    def _write(self, session: Session) -> ContextManager[Any]:
+        """
+        Context manager running a write atomically, rolled back on errors.
+
+        @param session: Database session.
+        @return: Handle of the write.
+        """
+        pass
+
+    @abstractmethod
+    def _transaction(self, tx: Transaction) -> ContextManager[Any]:
+        """
+        Context manager running a write within a transaction, which the transaction commits
+        or rolls back.
+
+        @param tx: Transaction.
+        @return: Handle of the write.
+        """
+        pass
+
+    @staticmethod
+    def _label_names(labels: Union[None, Label, str, List[Label]]) -> List[str]:
+        """
+        Names of the given labels.
+
+        @param labels: Label, list of labels or None.
+        @return: List of label names.
+        """
+        if labels is None:
+            return []
+        if isinstance(labels, (Label, str)):
+            labels = [labels]
+        return [str(label) for label in labels]
+
+    @staticmethod
+    def _property_dict(properties: Optional[List[Property]]) -> Dict[str, Any]:
+        """
+        Dictionary of the given properties.
+
+        @param properties: List of properties or None.
+        @return: Dictionary mapping the property keys to their values.
+        """
+        return {p.key: p.value for p in properties or []}
+
+    @abstractmethod
+    def _tick(self, handle: Any) -> int:
+        """
+        Advance the change version.
+
+        @param handle: Handle of the running write.
+        @return: New version.
+        """
+        pass
+
+    # Storage. The primitives below write within the running write of the given handle.
+
+    @abstractmethod
+    def _create_node(
+        self, handle: Any, names: Iterable[str], properties: Dict[str, Any]
+    ) -> StoredNode:
+        """
+        Create a node. Properties with null values are not stored.
+
+        @param handle: Handle of the running write.
+        @param names: Label names of the node.
+        @param properties: Properties of the node.
+        @return: Created node.
+        """
+        pass
+
+    @abstractmethod
+    def _delete_node(self, handle: Any, node: StoredNode) -> None:
+        """
+        Delete a node together with its relationships.
+
+        @param handle: Handle of the running write.
+        @param node: Node to delete.
+        """
+        pass
+
+    @abstractmethod
+    def _delete_relationship(
+        self, handle: Any, relationship: StoredRelationship
+    ) -> None:
+        """
+        Delete a relationship.
+
+        @param handle: Handle of the running write.
+        @param relationship: Relationship to delete.
+        """
+        pass
+
+    @abstractmethod
+    def _set_properties(
+        self,
+        handle: Any,
+        element: Union[StoredNode, StoredRelationship],
+        updates: Dict[str, Any],
+    ) -> None:
+        """
+        Set properties of an element, null values remove the property.
+
+        @param handle: Handle of the running write.
+        @param element: Node or relationship.
+        @param updates: Properties to set.
+        """
+        pass
+
+    @abstractmethod
+    def _touch(self, handle: Any, node: StoredNode, version: int) -> None:
+        """
+        Mark the HO elements a node is a member of as changed.
+
+        @param handle: Handle of the running write.
+        @param node: Member node.
+        @param version: Version of the change.
+        """
+        pass
+
+    def _tombstone(
+        self,
+        handle: Any,
+        element: Union[StoredNode, StoredRelationship],
+        version: int,
+        endpoints: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Leave a tombstone for an element about to be deleted. The tombstone holds the
+        properties and labels (or type) of the element and the version of the deletion.
+        The HO elements a deleted node is a member of are marked as changed.
+
+        @param handle: Handle of the running write.
+        @param element: Node or relationship about to be deleted.
+        @param version: Version of the deletion.
+        @param endpoints: Properties of the start and end node of a relationship, as
+                          _start_<key> and _end_<key>. Defaults to None.
+        """
+        relationship = isinstance(element, StoredRelationship)
+        properties = dict(element.properties)
+        properties.update(endpoints or {})
+        properties["_labels"] = [element.type] if relationship else list(element.labels)
+        properties["_version"] = version
+        self._create_node(handle, ["_tombstone"], properties)
+        if not relationship:
+            self._touch(handle, element, version)
+
+    # Lookups
+
+    @abstractmethod
+    def _lookup(
+        self,
+        handle: Any,
+        names: List[str],
+        values: Dict[str, Any],
+        since: Optional[int] = None,
+    ) -> List[StoredNode]:
+        """
+        Nodes with the given label names and property values. Nodes never match a null value.
+
+        @param handle: Handle of the running read or write.
+        @param names: Label names the nodes must have.
+        @param values: Property values the nodes must have.
+        @param since: Only return nodes changed after this version. Defaults to None.
+        @return: List of nodes.
+        """
+        pass
+
+    @abstractmethod
+    def _neighbors(
+        self,
+        handle: Any,
+        node_id: int,
+        type: str,
+        outgoing: bool,
+        labels: Union[None, Label, List[Label]] = None,
+        properties: Optional[List[Property]] = None,
+    ) -> List[Tuple[StoredRelationship, StoredNode]]:
+        """
+        Relationships of a type in one direction and the nodes at their other end, if these
+        have the given labels and properties.
+
+        @param handle: Handle of the running read or write.
+        @param node_id: Identifier of the node to start from.
+        @param type: Relationship type.
+        @param outgoing: Follow the outgoing relationships, otherwise the incoming ones.
+        @param labels: Labels the neighbors must have. Defaults to None.
+        @param properties: Properties the neighbors must have. Defaults to None.
+        @return: List of the relationships and neighbors.
+        """
+        pass
+
+    @abstractmethod
+    def _edges(
+        self,
+        handle: Any,
+        start_labels: List[Label],
+        start_properties: List[Property],
+        end_labels: List[Label],
+        end_properties: List[Property],
+        type: str,
+        properties: List[Property],
+        since: Optional[int] = None,
+    ) -> List[Tuple[StoredNode, StoredNode, StoredRelationship]]:
+        """
+        Relationships of a type with the given properties between nodes with the given
+        labels and properties.
+
+        @param handle: Handle of the running read or write.
+        @param start_labels: List of labels for the start nodes.
+        @param start_properties: List of properties for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_properties: List of properties for the end nodes.
+        @param type: Type of the relationships.
+        @param properties: List of properties for the relationships.
+        @param since: Only return relationships changed after this version.
+                      Defaults to None.
+        @return: List of start nodes, end nodes and relationships.
+        """
+        pass
+
+    @abstractmethod
+    def _find_relationships(
+        self, handle: Any, type: str, properties: List[Property]
+    ) -> List[StoredRelationship]:
+        """
+        Relationships of a type with the given properties.
+
+        @param handle: Handle of the running read or write.
+        @param type: Type of the relationships.
+        @param properties: Properties the relationships must have.
+        @return: List of relationships.
+        """
+        pass
+
+    @abstractmethod
+    def _paths(
+        self,
+        handle: Any,
+        start_labels: List[Label],
+        start_properties: List[Property],
+        type: str,
+        middle_labels: List[Label],
+        middle_properties: List[Property],
+        end_labels: List[Label],
+        end_properties: List[Property],
+        since: Optional[int] = None,
+    ) -> List[Tuple[StoredNode, StoredNode, StoredNode]]:
+        """
+        Paths (start)-[:type]->(middle)-[:type]->(end) of nodes with the given labels and
+        properties, the pattern of HO edges modeled as nodes.
+
+        @param handle: Handle of the running read or write.
+        @param start_labels: List of labels for the start nodes.
+        @param start_properties: List of properties for the start nodes.
+        @param type: Type of both relationships.
+        @param middle_labels: List of labels for the middle nodes.
+        @param middle_properties: List of properties for the middle nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_properties: List of properties for the end nodes.
+        @param since: Only return paths whose middle node changed after this version.
+                      Defaults to None.
+        @return: List of start, middle and end nodes.
+        """
+        pass
+
+    @abstractmethod
+    def _member_edges(
+        self, handle: Any, subgraph: StoredNode
+    ) -> List[Tuple[StoredNode, StoredNode, StoredNode]]:
+        """
+        Member edges of a subgraph collection with their start and end nodes.
+
+        @param handle: Handle of the running read or write.
+        @param subgraph: Subgraph collection.
+        @return: List of start nodes, end nodes and edges.
+        """
+        pass
+
+    def _find_nodes(
+        self,
+        handle: Any,
+        labels: Union[None, Label, List[Label]],
+        properties: Optional[List[Property]] = None,
+    ) -> List[StoredNode]:
+        """
+        Nodes with the given labels and properties.
+
+        @param handle: Handle of the running read or write.
+        @param labels: Labels the nodes must have.
+        @param properties: Properties the nodes must have. Defaults to None.
+        @return: List of nodes.
+        """
+        return self._lookup(
+            handle, self._label_names(labels), self._property_dict(properties)
+        )
+
+    # Export
+
+    @staticmethod
+    def _values(properties: Dict[str, Any], schema: List[Schema]) -> List[Any]:
+        """
+        Values of the schema properties of an element.
+
+        @param properties: Properties of the element.
+        @param schema: List of property schemas.
+        @return: List of property values, None for missing properties.
+        """
+        return [properties.get(s.property_name) for s in schema]
+
+    def _export_to_csv(
+        self,
+        file_name: str,
+        records: List[Sequence],
+        fields: List[str],
+        batch_size: int,
+        progress: Optional[Callable[[ExportStats], None]],
+        transform: Optional[Callable[[Sequence], Sequence]] = None,
+        quoting: int = csv.QUOTE_MINIMAL,
+    ) -> ExportStats:
+        """
+        Write export records into a CSV file in batches.
+
+        @param file_name: Name and path of the output file.
+        @param records: Export records.
+        @param fields: Column titles for the records.
+        @param batch_size: Number of records appended at a time.
+        @param progress: Function called with the export statistics after every batch.
+        @param transform: Function converting a record into the values of a row, for example to
+                          join member lists. Defaults to None.
+        @param quoting: Quoting behaviour of the csv module. Defaults to csv.QUOTE_MINIMAL.
+        @return: Export statistics.
+        """
+        if transform is not None:
+            records = map(transform, records)
+        with CsvExportWriter(file_name, fields, quoting, progress) as writer:
+            for batch in iter_batches(records, batch_size):
+                writer.write(batch)
+        return writer.stats
+
+    def _export_to_arrow(
+        self,
+        file_name: str,
+        records: List[Sequence],
+        fields: List[Any],
+        file_format: str,
+        compression: str,
+        batch_size: int,
+        progress: Optional[Callable[[ExportStats], None]],
+    ) -> ExportStats:
+        """
+        Write export records into a Parquet or Arrow IPC file.
+
+        @param file_name: Name and path of the output file.
+        @param records: Export records.
+        @param fields: Arrow fields of the columns.
+        @param file_format: Either 'parquet' or 'arrow'.
+        @param compression: Compression codec.
+        @param batch_size: Number of records per record batch.
+        @param progress: Function called with the export statistics after every batch.
+        @return: Export statistics.
+        """
+        with ArrowExportWriter(
+            file_name, fields, file_format, compression, progress
+        ) as writer:
+            for batch in iter_batches(records, batch_size):
+                writer.write(batch)
+        return writer.stats
+
+    def _nodes_export_records(
+        self,
+        session: Session,
+        labels: List[Label],
+        node_schema: List[Schema],
+        since: Optional[int] = None,
+    ) -> Tuple[List[List[Any]], List[str]]:
+        """
+        Records of the nodes to export.
+
+        @param session: Database session.
+        @param labels: List of node labels to export.
+        @param node_schema: List of property schemas for the nodes.
+        @param since: Only export elements changed after this version. Defaults to None.
+        @return: Tuple of the records and the names of their columns.
+        """
+        with self._read(session) as handle:
+            records = [
+                self._values(node.properties, node_schema)
+                for node in self._lookup(
+                    handle, self._label_names(labels), {}, since
+                )
+            ]
+        return records, [s.field_name for s in node_schema]
+
+    def export_nodes_to_csv(
+        self,
+        session: Session,
+        file_name: str,
+        labels: List[Label],
+        node_schema: List[Schema],
+        batch_size: int = 10000,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export nodes to a CSV file.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param labels: List of node labels to export.
+        @param node_schema: List of property schemas for the nodes.
+        @param batch_size: Number of records appended at a time. Defaults to 10000.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        records, fields = self._nodes_export_records(session, labels, node_schema, since)
+        return self._export_to_csv(file_name, records, fields, batch_size, progress)
+
+    def export_nodes_to_parquet(
+        self,
+        session: Session,
+        file_name: str,
+        labels: List[Label],
+        node_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export nodes to a Parquet file with typed columns.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param labels: List of node labels to export.
+        @param node_schema: List of property schemas for the nodes.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of nodes per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        records, _ = self._nodes_export_records(session, labels, node_schema, since)
+        return self._export_to_arrow(
+            file_name,
+            records,
+            arrow_fields(node_schema),
+            "parquet",
+            compression,
+            batch_size,
+            progress,
+        )
+
+    def export_nodes_to_arrow(
+        self,
+        session: Session,
+        file_name: str,
+        labels: List[Label],
+        node_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export nodes to an Arrow IPC file with typed columns.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param labels: List of node labels to export.
+        @param node_schema: List of property schemas for the nodes.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of nodes per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        records, _ = self._nodes_export_records(session, labels, node_schema, since)
+        return self._export_to_arrow(
+            file_name,
+            records,
+            arrow_fields(node_schema),
+            "arrow",
+            compression,
+            batch_size,
+            progress,
+        )
+
+    def _edges_export_records(
+        self,
+        session: Session,
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+        since: Optional[int] = None,
+    ) -> Tuple[List[List[Any]], List[str]]:
+        """
+        Records of the edges to export.
+
+        @param session: Database session.
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param edge_label: Export edges with that label.
+        @param edge_schema: List of property schemas for the edges.
+        @param since: Only export elements changed after this version. Defaults to None.
+        @return: Tuple of the records and the names of their columns.
+        """
+        with self._read(session) as handle:
+            records = [
+                self._values(start.properties, start_schema)
+                + self._values(end.properties, end_schema)
+                + self._values(edge.properties, edge_schema)
+                for start, end, edge in self._edges(
+                    handle, start_labels, [], end_labels, [], str(edge_label), [], since
+                )
+            ]
+        fields = [s.field_name for s in start_schema + end_schema + edge_schema]
+        return records, fields
+
+    def export_edges_to_csv(
+        self,
+        session: Session,
+        file_name: str,
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+        batch_size: int = 10000,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export edges to a CSV file.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param edge_label: Export edges with that label.
+        @param edge_schema: List of property schemas for the edges.
+        @param batch_size: Number of records appended at a time. Defaults to 10000.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        records, fields = self._edges_export_records(session, 
+            start_labels,
+            start_schema,
+            end_labels,
+            end_schema,
+            edge_label,
+            edge_schema,
+            since,
+        )
+        return self._export_to_csv(file_name, records, fields, batch_size, progress)
+
+    def export_edges_to_parquet(
+        self,
+        session: Session,
+        file_name: str,
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export edges to a Parquet file with typed columns.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param edge_label: Export edges with that label.
+        @param edge_schema: List of property schemas for the edges.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of edges per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        records, _ = self._edges_export_records(session, 
+            start_labels,
+            start_schema,
+            end_labels,
+            end_schema,
+            edge_label,
+            edge_schema,
+            since,
+        )
+        return self._export_to_arrow(
+            file_name,
+            records,
+            arrow_fields(start_schema + end_schema + edge_schema),
+            "parquet",
+            compression,
+            batch_size,
+            progress,
+        )
+
+    def export_edges_to_arrow(
+        self,
+        session: Session,
+        file_name: str,
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export edges to an Arrow IPC file with typed columns.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param edge_label: Export edges with that label.
+        @param edge_schema: List of property schemas for the edges.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of edges per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        records, _ = self._edges_export_records(session, 
+            start_labels,
+            start_schema,
+            end_labels,
+            end_schema,
+            edge_label,
+            edge_schema,
+            since,
+        )
+        return self._export_to_arrow(
+            file_name,
+            records,
+            arrow_fields(start_schema + end_schema + edge_schema),
+            "arrow",
+            compression,
+            batch_size,
+            progress,
+        )
+
+    def _node_edges_export_records(
+        self,
+        session: Session,
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+        node_edge_labels: List[Label],
+        node_edge_schema: List[Schema],
+        edge_label: Label,
+        since: Optional[int] = None,
+    ) -> Tuple[List[List[Any]], List[str]]:
+        """
+        Records of the HO edges to export.
+
+        @param session: Database session.
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param node_edge_labels: List of labels for the HO edges.
+        @param node_edge_schema: List of property schemas for the HO edges.
+        @param edge_label: Label of the edges to the HO edges.
+        @param since: Only export elements changed after this version. Defaults to None.
+        @return: Tuple of the records and the names of their columns.
+        """
+        with self._read(session) as handle:
+            records = [
+                self._values(start.properties, start_schema)
+                + self._values(end.properties, end_schema)
+                + self._values(edge_node.properties, node_edge_schema)
+                for start, edge_node, end in self._paths(
+                    handle,
+                    start_labels,
+                    [],
+                    str(edge_label),
+                    node_edge_labels,
+                    [],
+                    end_labels,
+                    [],
+                    since,
+                )
+            ]
+        fields = [s.field_name for s in start_schema + end_schema + node_edge_schema]
+        return records, fields
+
+    def export_node_edges_to_csv(
+        self,
+        session: Session,
+        file_name: str,
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+        node_edge_labels: List[Label],
+        node_edge_schema: List[Schema],
+        edge_label: Label,
+        batch_size: int = 10000,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export HO edges to a CSV file.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param node_edge_labels: List of labels for the HO edges.
+        @param node_edge_schema: List of property schemas for the HO edges.
+        @param edge_label: Label of the edges to the HO edges.
+        @param batch_size: Number of records appended at a time. Defaults to 10000.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        records, fields = self._node_edges_export_records(session, 
+            start_labels,
+            start_schema,
+            end_labels,
+            end_schema,
+            node_edge_labels,
+            node_edge_schema,
+            edge_label,
+            since,
+        )
+        return self._export_to_csv(file_name, records, fields, batch_size, progress)
+
+    def export_node_edges_to_parquet(
+        self,
+        session: Session,
+        file_name: str,
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+        node_edge_labels: List[Label],
+        node_edge_schema: List[Schema],
+        edge_label: Label,
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export HO edges to a Parquet file with typed columns.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param node_edge_labels: List of labels for the HO edges.
+        @param node_edge_schema: List of property schemas for the HO edges.
+        @param edge_label: Label of the edges to the HO edges.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of HO edges per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        records, _ = self._node_edges_export_records(session, 
+            start_labels,
+            start_schema,
+            end_labels,
+            end_schema,
+            node_edge_labels,
+            node_edge_schema,
+            edge_label,
+            since,
+        )
+        return self._export_to_arrow(
+            file_name,
+            records,
+            arrow_fields(start_schema + end_schema + node_edge_schema),
+            "parquet",
+            compression,
+            batch_size,
+            progress,
+        )
+
+    def export_node_edges_to_arrow(
+        self,
+        session: Session,
+        file_name: str,
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+        node_edge_labels: List[Label],
+        node_edge_schema: List[Schema],
+        edge_label: Label,
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export HO edges to an Arrow IPC file with typed columns.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param node_edge_labels: List of labels for the HO edges.
+        @param node_edge_schema: List of property schemas for the HO edges.
+        @param edge_label: Label of the edges to the HO edges.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of HO edges per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        records, _ = self._node_edges_export_records(session, 
+            start_labels,
+            start_schema,
+            end_labels,
+            end_schema,
+            node_edge_labels,
+            node_edge_schema,
+            edge_label,
+            since,
+        )
+        return self._export_to_arrow(
+            file_name,
+            records,
+            arrow_fields(start_schema + end_schema + node_edge_schema),
+            "arrow",
+            compression,
+            batch_size,
+            progress,
+        )
+
+    def _hyperedges_export_records(
+        self,
+        session: Session,
+        node_labels: List[Label],
+        node_schema: Schema,
+        hyperedge_labels: List[Label],
+        hyperedge_schema: List[Schema],
+        since: Optional[int] = None,
+    ) -> Tuple[List[List[Any]], List[str]]:
+        """
+        Records of the hyperedges to export, with the member nodes as a list.
+
+        @param session: Database session.
+        @param node_labels: List of node labels.
+        @param node_schema: Property schema for the nodes.
+        @param hyperedge_labels: Export hyperedges with those labels.
+        @param hyperedge_schema: List of property schemas for the hyperedges.
+        @param since: Only export elements changed after this version. Defaults to None.
+        @return: Tuple of the records and the names of their columns.
+        """
+        with self._read(session) as handle:
+            records = [
+                [
+                    [
+                        node.properties.get(node_schema.property_name)
+                        for _, node in self._neighbors(
+                            handle, hyperedge.id, "_adjacency", False, node_labels
+                        )
+                    ]
+                ]
+                + self._values(hyperedge.properties, hyperedge_schema)
+                for hyperedge in self._lookup(
+                    handle, self._label_names(hyperedge_labels), {}, since
+                )
+            ]
+        fields = [node_schema.field_name] + [s.field_name for s in hyperedge_schema]
+        return records, fields
+
+    def export_hyperedges_to_csv(
+        self,
+        session: Session,
+        file_name: str,
+        node_labels: List[Label],
+        node_schema: Schema,
+        hyperedge_labels: List[Label],
+        hyperedge_schema: List[Schema],
+        batch_size: int = 10000,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export hyperedges to a CSV file, with the member nodes joined by ';'.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param node_labels: List of node labels.
+        @param node_schema: Property schema for the nodes.
+        @param hyperedge_labels: Export hyperedges with those labels.
+        @param hyperedge_schema: List of property schemas for the hyperedges.
+        @param batch_size: Number of records appended at a time. Defaults to 10000.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        records, fields = self._hyperedges_export_records(session, 
+            node_labels, node_schema, hyperedge_labels, hyperedge_schema, since
+        )
+        return self._export_to_csv(
+            file_name,
+            records,
+            fields,
+            batch_size,
+            progress,
+            lambda record: [";".join(map(str, record[0]))] + list(record[1:]),
+        )
+
+    def export_hyperedges_to_parquet(
+        self,
+        session: Session,
+        file_name: str,
+        node_labels: List[Label],
+        node_schema: Schema,
+        hyperedge_labels: List[Label],
+        hyperedge_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export hyperedges to a Parquet file, with the member nodes in a list column.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param node_labels: List of node labels.
+        @param node_schema: Property schema for the nodes.
+        @param hyperedge_labels: Export hyperedges with those labels.
+        @param hyperedge_schema: List of property schemas for the hyperedges.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of hyperedges per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        records, _ = self._hyperedges_export_records(session, 
+            node_labels, node_schema, hyperedge_labels, hyperedge_schema, since
+        )
+        return self._export_to_arrow(
+            file_name,
+            records,
+            [list_field(node_schema)] + arrow_fields(hyperedge_schema),
+            "parquet",
+            compression,
+            batch_size,
+            progress,
+        )
+
+    def export_hyperedges_to_arrow(
+        self,
+        session: Session,
+        file_name: str,
+        node_labels: List[Label],
+        node_schema: Schema,
+        hyperedge_labels: List[Label],
+        hyperedge_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export hyperedges to an Arrow IPC file, with the member nodes in a list column.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param node_labels: List of node labels.
+        @param node_schema: Property schema for the nodes.
+        @param hyperedge_labels: Export hyperedges with those labels.
+        @param hyperedge_schema: List of property schemas for the hyperedges.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of hyperedges per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        records, _ = self._hyperedges_export_records(session, 
+            node_labels, node_schema, hyperedge_labels, hyperedge_schema, since
+        )
+        return self._export_to_arrow(
+            file_name,
+            records,
+            [list_field(node_schema)] + arrow_fields(hyperedge_schema),
+            "arrow",
+            compression,
+            batch_size,
+            progress,
+        )
+
+    def _subgraphs_export_records(
+        self,
+        session: Session,
+        node_schema: Schema,
+        edge_schema: Schema,
+        subgraph_labels: List[Label],
+        subgraph_schema: List[Schema],
+        since: Optional[int] = None,
+    ) -> Tuple[List[List[Any]], List[str]]:
+        """
+        Records of the subgraph collections to export, with the member nodes as a list and
+        the member edges as a list of {start, end} dictionaries.
+
+        @param session: Database session.
+        @param node_schema: Node schema.
+        @param edge_schema: Edge schema.
+        @param subgraph_labels: List of subgraph collection labels to export.
+        @param subgraph_schema: List of property schemas for the subgraph collections.
+        @param since: Only export elements changed after this version. Defaults to None.
+        @return: Tuple of the records and the names of their columns.
+        """
+        key = edge_schema.property_name
+        records = []
+        with self._read(session) as handle:
+            for subgraph in self._lookup(
+                handle, self._label_names(subgraph_labels), {}, since
+            ):
+                node_list = [
+                    node.properties.get(node_schema.property_name)
+                    for _, node in self._neighbors(
+                        handle, subgraph.id, "_node_membership", False, "_node"
+                    )
+                ]
+                edge_list = [
+                    {"start": start.properties.get(key), "end": end.properties.get(key)}
+                    for start, end, _ in self._member_edges(handle, subgraph)
+                ]
+                records.append(
+                    [node_list, edge_list]
+                    + self._values(subgraph.properties, subgraph_schema)
+                )
+        fields = [node_schema.field_name, edge_schema.field_name] + [
+            s.field_name for s in subgraph_schema
+        ]
+        return records, fields
+
+    def export_subgraphs_to_csv(
+        self,
+        session: Session,
+        file_name: str,
+        node_schema: Schema,
+        edge_schema: Schema,
+        subgraph_labels: List[Label],
+        subgraph_schema: List[Schema],
+        batch_size: int = 10000,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export subgraph collections to a CSV file, with the member nodes joined by ';' and
+        the member edges as ';'-joined 'start:end' pairs.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param node_schema: Node schema.
+        @param edge_schema: Edge schema.
+        @param subgraph_labels: List of subgraph collection labels to export.
+        @param subgraph_schema: List of property schemas for the subgraph collections.
+        @param batch_size: Number of records appended at a time. Defaults to 10000.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        records, fields = self._subgraphs_export_records(session, 
+            node_schema, edge_schema, subgraph_labels, subgraph_schema, since
+        )
+        return self._export_to_csv(
+            file_name,
+            records,
+            fields,
+            batch_size,
+            progress,
+            lambda record: [
+                ";".join(map(str, record[0])),
+                ";".join(f"{e['start']}:{e['end']}" for e in record[1]),
+            ]
+            + list(record[2:]),
+            csv.QUOTE_NONE,
+        )
+
+    def export_subgraphs_to_parquet(
+        self,
+        session: Session,
+        file_name: str,
+        node_schema: Schema,
+        edge_schema: Schema,
+        subgraph_labels: List[Label],
+        subgraph_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export subgraph collections to a Parquet file, with the member nodes in a list column
+        and the member edges in a list of start/end structs.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param node_schema: Node schema.
+        @param edge_schema: Edge schema.
+        @param subgraph_labels: List of subgraph collection labels to export.
+        @param subgraph_schema: List of property schemas for the subgraph collections.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of subgraph collections per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        records, _ = self._subgraphs_export_records(session, 
+            node_schema, edge_schema, subgraph_labels, subgraph_schema, since
+        )
+        return self._export_to_arrow(
+            file_name,
+            records,
+            [list_field(node_schema), pair_list_field(edge_schema)]
+            + arrow_fields(subgraph_schema),
+            "parquet",
+            compression,
+            batch_size,
+            progress,
+        )
+
+    def export_subgraphs_to_arrow(
+        self,
+        session: Session,
+        file_name: str,
+        node_schema: Schema,
+        edge_schema: Schema,
+        subgraph_labels: List[Label],
+        subgraph_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export subgraph collections to an Arrow IPC file, with the member nodes in a list
+        column and the member edges in a list of start/end structs.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param node_schema: Node schema.
+        @param edge_schema: Edge schema.
+        @param subgraph_labels: List of subgraph collection labels to export.
+        @param subgraph_schema: List of property schemas for the subgraph collections.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of subgraph collections per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        records, _ = self._subgraphs_export_records(session, 
+            node_schema, edge_schema, subgraph_labels, subgraph_schema, since
+        )
+        return self._export_to_arrow(
+            file_name,
+            records,
+            [list_field(node_schema), pair_list_field(edge_schema)]
+            + arrow_fields(subgraph_schema),
+            "arrow",
+            compression,
+            batch_size,
+            progress,
+        )
+
+    def _node_tuples_export_records(
+        self,
+        session: Session,
+        node_schema: Schema,
+        tuple_labels: List[Label],
+        tuple_schema: List[Schema],
+        since: Optional[int] = None,
+    ) -> Tuple[List[List[Any]], List[str]]:
+        """
+        Records of the node-tuples to export, with the member nodes and their positions as
+        lists ordered by position.
+
+        @param session: Database session.
+        @param node_schema: Property schema for the nodes.
+        @param tuple_labels: Export node-tuples with those labels.
+        @param tuple_schema: List of property schemas for the node-tuples.
+        @param since: Only export elements changed after this version. Defaults to None.
+        @return: Tuple of the records and the names of their columns.
+        """
+        records = []
+        with self._read(session) as handle:
+            for tuple_node in self._lookup(
+                handle, ["_node_tuple"] + self._label_names(tuple_labels), {}, since
+            ):
+                members = sorted(
+                    (
+                        (
+                            membership.properties.get("position_in_tuple"),
+                            node.properties.get(node_schema.property_name),
+                        )
+                        for membership, node in self._neighbors(
+                            handle, tuple_node.id, "_node_membership", False, "_node"
+                        )
+                    ),
+                    key=lambda member: sort_key(member[0]),
+                )
+                records.append(
+                    [[value for _, value in members], [pos for pos, _ in members]]
+                    + self._values(tuple_node.properties, tuple_schema)
+                )
+        positions = f"{node_schema.field_name}_position"
+        fields = [node_schema.field_name, positions] + [
+            s.field_name for s in tuple_schema
+        ]
+        return records, fields
+
+    def export_node_tuples_to_csv(
+        self,
+        session: Session,
+        file_name: str,
+        node_schema: Schema,
+        tuple_labels: List[Label],
+        tuple_schema: List[Schema],
+        batch_size: int = 10000,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export node-tuples to a CSV file, with the member nodes joined by ';' in the order of
+        their positions.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param node_schema: Property schema for the nodes.
+        @param tuple_labels: Export node-tuples with those labels.
+        @param tuple_schema: List of property schemas for the node-tuples.
+        @param batch_size: Number of records appended at a time. Defaults to 10000.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        records, fields = self._node_tuples_export_records(session, 
+            node_schema, tuple_labels, tuple_schema, since
+        )
+        # the positions are implied by the order of the joined nodes
+        return self._export_to_csv(
+            file_name,
+            records,
+            [fields[0]] + fields[2:],
+            batch_size,
+            progress,
+            lambda record: [";".join(map(str, record[0]))] + list(record[2:]),
+            csv.QUOTE_NONE,
+        )
+
+    def export_node_tuples_to_parquet(
+        self,
+        session: Session,
+        file_name: str,
+        node_schema: Schema,
+        tuple_labels: List[Label],
+        tuple_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export node-tuples to a Parquet file, with the member nodes and their positions in
+        list columns.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param node_schema: Property schema for the nodes.
+        @param tuple_labels: Export node-tuples with those labels.
+        @param tuple_schema: List of property schemas for the node-tuples.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of node-tuples per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        records, fields = self._node_tuples_export_records(session, 
+            node_schema, tuple_labels, tuple_schema, since
+        )
+        return self._export_to_arrow(
+            file_name,
+            records,
+            [list_field(node_schema), list_field(Schema(fields[1], int))]
+            + arrow_fields(tuple_schema),
+            "parquet",
+            compression,
+            batch_size,
+            progress,
+        )
+
+    def export_node_tuples_to_arrow(
+        self,
+        session: Session,
+        file_name: str,
+        node_schema: Schema,
+        tuple_labels: List[Label],
+        tuple_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export node-tuples to an Arrow IPC file, with the member nodes and their positions in
+        list columns.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param node_schema: Property schema for the nodes.
+        @param tuple_labels: Export node-tuples with those labels.
+        @param tuple_schema: List of property schemas for the node-tuples.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of node-tuples per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        records, fields = self._node_tuples_export_records(session, 
+            node_schema, tuple_labels, tuple_schema, since
+        )
+        return self._export_to_arrow(
+            file_name,
+            records,
+            [list_field(node_schema), list_field(Schema(fields[1], int))]
+            + arrow_fields(tuple_schema),
+            "arrow",
+            compression,
+            batch_size,
+            progress,
+        )
+
+    def _tombstones_export_records(
+        self,
+        session: Session,
+        labels: List[Label],
+        schema: List[Schema],
+        since: Optional[int] = None,
+    ) -> Tuple[List[List[Any]], List[str]]:
+        """
+        Records of the tombstones of deleted elements.
+
+        @param session: Database session.
+        @param labels: Export tombstones of elements with all of those labels (or that type).
+        @param schema: List of property schemas of the deleted elements.
+        @param since: Only export elements deleted after this version. Defaults to None.
+        @return: Tuple of the records and the names of their columns.
+        """
+        names = self._label_names(labels)
+        with self._read(session) as handle:
+            records = [
+                self._values(tombstone.properties, schema)
+                + [tombstone.properties.get("_version")]
+                for tombstone in self._lookup(handle, ["_tombstone"], {}, since)
+                if all(name in tombstone.properties.get("_labels", ()) for name in names)
+            ]
+        return records, [s.field_name for s in schema] + ["_version"]
+
+    def export_tombstones_to_csv(
+        self,
+        session: Session,
+        file_name: str,
+        labels: List[Label],
+        schema: List[Schema],
+        since: Optional[int] = None,
+        batch_size: int = 10000,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+    ) -> ExportStats:
+        """
+        Export the tombstones of deleted elements to a CSV file, with the version of the
+        deletion in the '_version' column.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param labels: Export tombstones of elements with all of those labels (or that type).
+        @param schema: List of property schemas of the deleted elements.
+        @param since: Only export elements deleted after this version. Defaults to None.
+        @param batch_size: Number of records appended at a time. Defaults to 10000.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @return: Export statistics.
+        """
+        records, fields = self._tombstones_export_records(session, labels, schema, since)
+        return self._export_to_csv(file_name, records, fields, batch_size, progress)
+
+    def export_tombstones_to_parquet(
+        self,
+        session: Session,
+        file_name: str,
+        labels: List[Label],
+        schema: List[Schema],
+        since: Optional[int] = None,
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+    ) -> ExportStats:
+        """
+        Export the tombstones of deleted elements to a Parquet file, with the version of the
+        deletion in the '_version' column.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param labels: Export tombstones of elements with all of those labels (or that type).
+        @param schema: List of property schemas of the deleted elements.
+        @param since: Only export elements deleted after this version. Defaults to None.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of tombstones per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @return: Export statistics.
+        """
+        records, _ = self._tombstones_export_records(session, labels, schema, since)
+        return self._export_to_arrow(
+            file_name,
+            records,
+            arrow_fields(schema + [Schema("_version", int)]),
+            "parquet",
+            compression,
+            batch_size,
+            progress,
+        )
+
+    def export_tombstones_to_arrow(
+        self,
+        session: Session,
+        file_name: str,
+        labels: List[Label],
+        schema: List[Schema],
+        since: Optional[int] = None,
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+    ) -> ExportStats:
+        """
+        Export the tombstones of deleted elements to an Arrow IPC file, with the version of the
+        deletion in the '_version' column.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param labels: Export tombstones of elements with all of those labels (or that type).
+        @param schema: List of property schemas of the deleted elements.
+        @param since: Only export elements deleted after this version. Defaults to None.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of tombstones per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @return: Export statistics.
+        """
+        records, _ = self._tombstones_export_records(session, labels, schema, since)
+        return self._export_to_arrow(
+            file_name,
+            records,
+            arrow_fields(schema + [Schema("_version", int)]),
+            "arrow",
+            compression,
+            batch_size,
+            progress,
+        )
+
+    # Import
+
+    @staticmethod
+    def _field_value(schema: Schema, value: Any) -> Any:
+        """
+        Convert the value of an input field to the type of its property, as the Cypher
+        conversion functions do.
+
+        @param schema: Property schema of the field.
+        @param value: Value of the field.
+        @return: Property value, None for a missing or unconvertible value.
+        """
+        if value is None:
+            return None
+        if schema.property_type == str:
+            return value
+        elif schema.property_type == int:
+            return FUNCTIONS["tointeger"](value)
+        elif schema.property_type == float:
+            return FUNCTIONS["tofloat"](value)
+        elif schema.property_type == bool:
+            return FUNCTIONS["toboolean"](value)
+        elif schema.property_type == datetime:
+            return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+        elif schema.property_type == date:
+            if isinstance(value, datetime):
+                return value.date()
+            return value if isinstance(value, date) else date.fromisoformat(value)
+        else:
+            raise ValueError(f"Unsupported property type: {schema.property_type}")
+
+    def _row_properties(
+        self, schema: List[Schema], row: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Properties given by the fields of an input row.
+
+        @param schema: List of property schemas.
+        @param row: Input row.
+        @return: Dictionary mapping the property keys to the converted field values.
+        """
+        return {
+            s.property_name: self._field_value(s, row.get(s.field_name)) for s in schema
+        }
+
+    @abstractmethod
+    def _committed_batches(self, handle: Any, checkpoint: str) -> Set[int]:
+        """
+        Numbers of the batches an import checkpoint recorded as written.
+
+        @param handle: Handle of the running read.
+        @param checkpoint: Name of the import checkpoint.
+        @return: Set of batch numbers.
+        """
+        pass
+
+    @abstractmethod
+    def _record_batch(self, handle: Any, checkpoint: str, number: int) -> None:
+        """
+        Record a batch as written by an import, together with the batch.
+
+        @param handle: Handle of the write of the batch.
+        @param checkpoint: Name of the import checkpoint.
+        @param number: Number of the batch.
+        """
+        pass
+
+    def _import_rows(
+        self,
+        session: Session,
+        write_batch: Callable[[List[Dict[str, Any]], Any], Any],
+        rows: Iterable[Dict[str, Any]],
+        batch_size: int,
+        partitions: int = None,
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import rows in batches, each written atomically in a write of its own. The embedded
+        databases admit a single writer at a time, so concurrent writer sessions would not
+        speed the import up and a single writer is used. With a checkpoint, the numbers of the
+        written batches are recorded together with the batches and batches written by an
+        earlier run are skipped.
+
+        @param session: Database session.
+        @param write_batch: Function writing a batch of rows on the given handle, returning
+                            the member keys it could not resolve.
+        @param rows: Rows to import.
+        @param batch_size: Number of rows per batch.
+        @param partitions: Number of node partitions requested by the caller, only checked
+                           against the checkpoint. Defaults to None.
+        @param checkpoint: Name of the import checkpoint. Defaults to None.
+        @return: Import statistics.
+        """
+        if checkpoint is not None and partitions:
+            raise ValueError("Partitioned imports cannot be resumed from a checkpoint.")
+        batches = iter_batches(rows, batch_size)
+        if checkpoint is not None:
+            with self._read(session) as handle:
+                committed = self._committed_batches(handle, checkpoint)
+            batches = checkpoint_batches(batches, committed)
+
+        def execute(writer_session, batch):
+            with self._write(writer_session) as handle:
+                unresolved = write_batch(batch, handle)
+                if checkpoint is not None:
+                    self._record_batch(handle, checkpoint, batch.number)
+            return unresolved
+
+        writer = BatchWriter(execute, self.start_session, self.end_session, 1)
+        stats = writer.write(batches, session)
+        if checkpoint is not None:
+            self.delete_import_checkpoint(session, checkpoint)
+        return stats
+
+    @abstractmethod
+    def _nodes_import_writer(
+        self, labels: List[Label], node_schema: List[Schema]
+    ) -> Callable[[List[Dict[str, Any]], Any], None]:
+        """
+        Build the function that writes a batch of nodes with the handle of a write.
+
+        @param labels: List of labels for the nodes.
+        @param node_schema: List of property schemas for the nodes.
+        @return: Function writing a batch.
+        """
+        pass
+
+    @abstractmethod
+    def _edges_import_writer(
+        self,
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+    ) -> Callable[[List[Dict[str, Any]], Any], None]:
+        """
+        Build the function that writes a batch of edges with the handle of a write.
+
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param edge_label: Label to be used for the edges.
+        @param edge_schema: List of property schemas for the edges.
+        @return: Function writing a batch.
+        """
+        pass
+
+    @abstractmethod
+    def _node_edges_import_writer(
+        self,
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+        node_edge_labels: List[Label],
+        node_edge_schema: List[Schema],
+        edge_label: Label,
+    ) -> Callable[[List[Dict[str, Any]], Any], None]:
+        """
+        Build the function that writes a batch of HO edges with the handle of a write.
+
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param node_edge_labels: List of labels to be used for the HO edges.
+        @param node_edge_schema: List of property schemas for the HO edges.
+        @param edge_label: Label for the edges to the HO edges.
+        @return: Function writing a batch.
+        """
+        pass
+
+    @abstractmethod
+    def _hyperedges_import_writer(
+        self,
+        node_labels: List[Label],
+        node_schema: Schema,
+        common_schema: List[Schema],
+        hyperedge_labels: List[Label],
+        hyperedge_schema: List[Schema],
+    ) -> Callable[[List[Dict[str, Any]], Any], List[Any]]:
+        """
+        Build the function that writes a batch of hyperedges with the handle of a write,
+        returning the member keys that did not match any node.
+
+        @param node_labels: List of labels for the nodes.
+        @param node_schema: Property schema for the nodes.
+        @param common_schema: List of property schemas common to the nodes.
+        @param hyperedge_labels: List of labels to be used for the hyperedges.
+        @param hyperedge_schema: List of property schemas for the hyperedges.
+        @return: Function writing a batch.
+        """
+        pass
+
+    @abstractmethod
+    def _subgraphs_import_writer(
+        self,
+        node_schema: Schema,
+        edge_schema: Schema,
+        common_schema: List[Schema],
+        subgraph_labels: List[Label],
+        subgraph_schema: List[Schema],
+    ) -> Callable[[List[Dict[str, Any]], Any], None]:
+        """
+        Build the function that writes a batch of subgraphs with the handle of a write,
+        returning the member keys that did not match any node.
+
+        @param node_schema: Property schema for the nodes.
+        @param edge_schema: Property schema for the edges.
+        @param common_schema: List of property schemas common to the nodes.
+        @param subgraph_labels: List of labels to be used for the subgraph collections.
+        @param subgraph_schema: List of property schemas for the subgraph collections.
+        @return: Function writing a batch.
+        """
+        pass
+
+    @abstractmethod
+    def _node_tuples_import_writer(
+        self,
+        node_schema: Schema,
+        common_schema: List[Schema],
+        tuple_labels: List[Label],
+        tuple_properties: List[Schema],
+    ) -> Callable[[List[Dict[str, Any]], Any], None]:
+        """
+        Build the function that writes a batch of node tuples with the handle of a write,
+        returning the member keys that did not match any node.
+
+        @param node_schema: Property schema for the nodes.
+        @param common_schema: List of property schemas common to the nodes.
+        @param tuple_labels: List of labels to be used for the node-tuples.
+        @param tuple_properties: List of property schemas for the node-tuples.
+        @return: Function writing a batch.
+        """
+        pass
+
+    @abstractmethod
+    def _subgraph_edges_import_writer(
+        self,
+        start_subgraph_label: Label,
+        start_subgraph_schema: List[Schema],
+        end_subgraph_label: Label,
+        end_subgraph_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+    ) -> Callable[[List[Dict[str, Any]], Any], None]:
+        """
+        Build the function that writes a batch of subgraph edges with the handle of a write.
+
+        @param start_subgraph_label: Label of the start subgraphs.
+        @param start_subgraph_schema: List of property schemas for the start subgraphs.
+        @param end_subgraph_label: Label of the end subgraphs.
+        @param end_subgraph_schema: List of property schemas for the end subgraphs.
+        @param edge_label: Label of the subgraph edges.
+        @param edge_schema: List of property schemas for the subgraph edges.
+        @return: Function writing a batch.
+        """
+        pass
+
+    def import_nodes_from_csv(
+        self,
+        session: Session,
+        file_name: str,
+        labels: List[Label],
+        node_schema: List[Schema],
+        as_url: bool = False,
+        batch_size: int = 10000,
+        delimiter: str = ",",
+        checkpoint: str = None,
+    ) -> None:
+        """
+        Import nodes from a CSV file, which is read by this process.
+
+        @param session: Database session.
+        @param file_name: Name and path of the input file.
+        @param labels: List of labels for the nodes.
+        @param node_schema: List of property schemas for the nodes.
+        @param as_url: Treat file_name as URL. Defaults to False.
+        @param batch_size: Number of nodes to import at a time. Defaults to 10000.
+        @param delimiter: Delimiter used in the CSV file. Defaults to ','.
+        @param checkpoint: Name under which the progress of the import is recorded. A failed
+                           import run again with the same name resumes after the last
+                           written batch. Defaults to None.
+        """
+        self.import_nodes_from_iter(
+            session,
+            iter_rows(file_name, batch_size, delimiter),
+            labels,
+            node_schema,
+            batch_size,
+            checkpoint=checkpoint,
+        )
+
+    def import_nodes_from_iter(
+        self,
+        session: Session,
+        rows: Iterable[Dict[str, Any]],
+        labels: List[Label],
+        node_schema: List[Schema],
+        batch_size: int = 10000,
+        concurrency: int = 4,
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import nodes from an iterable of rows.
+
+        @param session: Database session.
+        @param rows: Dictionaries with the same fields as the columns of the CSV file.
+        @param labels: List of labels for the nodes.
+        @param node_schema: List of property schemas for the nodes.
+        @param batch_size: Number of nodes to import at a time. Defaults to 10000.
+        @param concurrency: Accepted for compatibility, batches are written one at a time.
+                            Defaults to 4.
+        @param checkpoint: Name under which the written batches are recorded. A failed import
+                           run again with the same name and the same rows and batch size skips
+                           the written batches. Defaults to None.
+        @return: Import statistics.
+        """
+        return self._import_rows(
+            session,
+            self._nodes_import_writer(labels, node_schema),
+            rows,
+            batch_size,
+            checkpoint=checkpoint,
+        )
+
+    def import_nodes_from_frame(
+        self,
+        session: Session,
+        data: Any,
+        labels: List[Label],
+        node_schema: List[Schema],
+        batch_size: int = 10000,
+        concurrency: int = 4,
+        delimiter: str = ",",
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import nodes from a pandas DataFrame, Arrow data or a local CSV file, read in chunks.
+
+        @param session: Database session.
+        @param data: DataFrame, Arrow table or record batches, path of a local CSV (optionally
+                     gzip, bz2 or zstd compressed), Parquet or Arrow IPC file, or an iterable of
+                     DataFrames or dictionaries, with the same columns as the CSV file.
+        @param labels: List of labels for the nodes.
+        @param node_schema: List of property schemas for the nodes.
+        @param batch_size: Number of nodes to import at a time. Defaults to 10000.
+        @param concurrency: Accepted for compatibility, batches are written one at a time.
+                            Defaults to 4.
+        @param delimiter: Delimiter used in a local CSV file. Defaults to ','.
+        @param checkpoint: Name under which the written batches are recorded. A failed import
+                           run again with the same name and the same rows and batch size skips
+                           the written batches. Defaults to None.
+        @return: Import statistics.
+        """
+        return self.import_nodes_from_iter(
+            session,
+            iter_rows(data, batch_size, delimiter),
+            labels,
+            node_schema,
+            batch_size,
+            concurrency,
+            checkpoint=checkpoint,
+        )
+
+    def _edges_import_lookups(
+        self,
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+    ) -> List[Tuple[List[Label], List[str]]]:
+        """
+        Labels and property keys the edges import matches for each row.
+
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @return: List of labels and property keys.
+        """
+        return [
+            (start_labels, [s.property_name for s in start_schema]),
+            (end_labels, [s.property_name for s in end_schema]),
+        ]
+
+    def import_edges_from_csv(
+        self,
+        session: Session,
+        file_name: str,
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+        as_url: bool = False,
+        batch_size: int = 10000,
+        delimiter: str = ",",
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
+    ):
+        """
+        Import edges from a CSV file, which is read by this process.
+
+        @param session: Database session.
+        @param file_name: Name and path of the input file.
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param edge_label: Label to be used for the edges.
+        @param edge_schema: List of property schemas for the edges.
+        @param as_url: Treat file_name as URL. Defaults to False.
+        @param batch_size: Number of edges to import at a time. Defaults to 10000.
+        @param delimiter: Delimiter used in the CSV file. Defaults to ','.
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              connected nodes before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the progress of the import is recorded. A failed
+                           import run again with the same name resumes after the last
+                           written batch. Defaults to None.
+        """
+        self.import_edges_from_iter(
+            session,
+            iter_rows(file_name, batch_size, delimiter),
+            start_labels,
+            start_schema,
+            end_labels,
+            end_schema,
+            edge_label,
+            edge_schema,
+            batch_size,
+            index_lookups=index_lookups,
+            drop_indexes=drop_indexes,
+            checkpoint=checkpoint,
+        )
+
+    def import_edges_from_iter(
+        self,
+        session: Session,
+        rows: Iterable[Dict[str, Any]],
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+        batch_size: int = 10000,
+        concurrency: int = 4,
+        partitions: int = None,
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import edges from an iterable of rows.
+
+        @param session: Database session.
+        @param rows: Dictionaries with the same fields as the columns of the CSV file.
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param edge_label: Label to be used for the edges.
+        @param edge_schema: List of property schemas for the edges.
+        @param batch_size: Number of edges to import at a time. Defaults to 10000.
+        @param concurrency: Accepted for compatibility, batches are written one at a time.
+                            Defaults to 4.
+        @param partitions: Accepted for compatibility, batches are written one at a time.
+                           Defaults to None.
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              connected nodes before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the written batches are recorded. A failed import
+                           run again with the same name and the same rows and batch size skips
+                           the written batches. Defaults to None.
+        @return: Import statistics.
+        """
+        write_batch = self._edges_import_writer(
+            start_labels,
+            start_schema,
+            end_labels,
+            end_schema,
+            edge_label,
+            edge_schema,
+        )
+        lookups = self._edges_import_lookups(
+            start_labels,
+            start_schema,
+            end_labels,
+            end_schema,
+        )
+        with self._lookup_indexes(session, lookups, index_lookups, drop_indexes):
+            return self._import_rows(
+                session, write_batch, rows, batch_size, partitions, checkpoint
+            )
+
+    def import_edges_from_frame(
+        self,
+        session: Session,
+        data: Any,
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+        batch_size: int = 10000,
+        concurrency: int = 4,
+        partitions: int = None,
+        delimiter: str = ",",
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import edges from a pandas DataFrame, Arrow data or a local CSV file, read in chunks.
+
+        @param session: Database session.
+        @param data: DataFrame, Arrow table or record batches, path of a local CSV (optionally
+                     gzip, bz2 or zstd compressed), Parquet or Arrow IPC file, or an iterable of
+                     DataFrames or dictionaries, with the same columns as the CSV file.
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param edge_label: Label to be used for the edges.
+        @param edge_schema: List of property schemas for the edges.
+        @param batch_size: Number of edges to import at a time. Defaults to 10000.
+        @param concurrency: Accepted for compatibility, batches are written one at a time.
+                            Defaults to 4.
+        @param partitions: Accepted for compatibility, batches are written one at a time.
+                           Defaults to None.
+        @param delimiter: Delimiter used in a local CSV file. Defaults to ','.
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              connected nodes before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the written batches are recorded. A failed import
+                           run again with the same name and the same rows and batch size skips
+                           the written batches. Defaults to None.
+        @return: Import statistics.
+        """
+        return self.import_edges_from_iter(
+            session,
+            iter_rows(data, batch_size, delimiter),
+            start_labels,
+            start_schema,
+            end_labels,
+            end_schema,
+            edge_label,
+            edge_schema,
+            batch_size,
+            concurrency,
+            partitions,
+            index_lookups=index_lookups,
+            drop_indexes=drop_indexes,
+            checkpoint=checkpoint,
+        )
+
+    def import_node_edges_from_csv(
+        self,
+        session: Session,
+        file_name: str,
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+        node_edge_labels: List[Label],
+        node_edge_schema: List[Schema],
+        edge_label: Label,
+        as_url: bool = False,
+        batch_size: int = 10000,
+        delimiter: str = ",",
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
+    ):
+        """
+        Import HO edges from a CSV file, which is read by this process.
+
+        @param session: Database session.
+        @param file_name: Name and path of the input file.
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param node_edge_labels: List of labels to be used for the HO edges.
+        @param node_edge_schema: List of property schemas for the HO edges.
+        @param edge_label: Label for the edges to the HO edges.
+        @param as_url: Treat file_name as URL. Defaults to False.
+        @param batch_size: Number of HO edges to import at a time. Defaults to 10000.
+        @param delimiter: Delimiter used in the CSV file. Defaults to ','.
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              connected nodes before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the progress of the import is recorded. A failed
+                           import run again with the same name resumes after the last
+                           written batch. Defaults to None.
+        """
+        self.import_node_edges_from_iter(
+            session,
+            iter_rows(file_name, batch_size, delimiter),
+            start_labels,
+            start_schema,
+            end_labels,
+            end_schema,
+            node_edge_labels,
+            node_edge_schema,
+            edge_label,
+            batch_size,
+            index_lookups=index_lookups,
+            drop_indexes=drop_indexes,
+            checkpoint=checkpoint,
+        )
+
+    def import_node_edges_from_iter(
+        self,
+        session: Session,
+        rows: Iterable[Dict[str, Any]],
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+        node_edge_labels: List[Label],
+        node_edge_schema: List[Schema],
+        edge_label: Label,
+        batch_size: int = 10000,
+        concurrency: int = 4,
+        partitions: int = None,
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import HO edges from an iterable of rows.
+
+        @param session: Database session.
+        @param rows: Dictionaries with the same fields as the columns of the CSV file.
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param node_edge_labels: List of labels to be used for the HO edges.
+        @param node_edge_schema: List of property schemas for the HO edges.
+        @param edge_label: Label for the edges to the HO edges.
+        @param batch_size: Number of HO edges to import at a time. Defaults to 10000.
+        @param concurrency: Accepted for compatibility, batches are written one at a time.
+                            Defaults to 4.
+        @param partitions: Accepted for compatibility, batches are written one at a time.
+                           Defaults to None.
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              connected nodes before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the written batches are recorded. A failed import
+                           run again with the same name and the same rows and batch size skips
+                           the written batches. Defaults to None.
+        @return: Import statistics.
+        """
+        write_batch = self._node_edges_import_writer(
+            start_labels,
+            start_schema,
+            end_labels,
+            end_schema,
+            node_edge_labels,
+            node_edge_schema,
+            edge_label,
+        )
+        lookups = self._edges_import_lookups(
+            start_labels,
+            start_schema,
+            end_labels,
+            end_schema,
+        )
+        with self._lookup_indexes(session, lookups, index_lookups, drop_indexes):
+            return self._import_rows(
+                session, write_batch, rows, batch_size, partitions, checkpoint
+            )
+
+    def import_node_edges_from_frame(
+        self,
+        session: Session,
+        data: Any,
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+        node_edge_labels: List[Label],
+        node_edge_schema: List[Schema],
+        edge_label: Label,
+        batch_size: int = 10000,
+        concurrency: int = 4,
+        partitions: int = None,
+        delimiter: str = ",",
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import HO edges from a pandas DataFrame, Arrow data or a local CSV file, read in
+        chunks.
+
+        @param session: Database session.
+        @param data: DataFrame, Arrow table or record batches, path of a local CSV (optionally
+                     gzip, bz2 or zstd compressed), Parquet or Arrow IPC file, or an iterable of
+                     DataFrames or dictionaries, with the same columns as the CSV file.
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param node_edge_labels: List of labels to be used for the HO edges.
+        @param node_edge_schema: List of property schemas for the HO edges.
+        @param edge_label: Label for the edges to the HO edges.
+        @param batch_size: Number of HO edges to import at a time. Defaults to 10000.
+        @param concurrency: Accepted for compatibility, batches are written one at a time.
+                            Defaults to 4.
+        @param partitions: Accepted for compatibility, batches are written one at a time.
+                           Defaults to None.
+        @param delimiter: Delimiter used in a local CSV file. Defaults to ','.
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              connected nodes before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the written batches are recorded. A failed import
+                           run again with the same name and the same rows and batch size skips
+                           the written batches. Defaults to None.
+        @return: Import statistics.
+        """
+        return self.import_node_edges_from_iter(
+            session,
+            iter_rows(data, batch_size, delimiter),
+            start_labels,
+            start_schema,
+            end_labels,
+            end_schema,
+            node_edge_labels,
+            node_edge_schema,
+            edge_label,
+            batch_size,
+            concurrency,
+            partitions,
+            index_lookups=index_lookups,
+            drop_indexes=drop_indexes,
+            checkpoint=checkpoint,
+        )
+
+    def _hyperedges_import_lookups(
+        self,
+        node_labels: List[Label],
+        node_schema: Schema,
+        common_schema: List[Schema],
+    ) -> List[Tuple[List[Label], List[str]]]:
+        """
+        Labels and property keys the hyperedges import matches for each row.
+
+        @param node_labels: List of labels for the nodes.
+        @param node_schema: Property schema for the nodes.
+        @param common_schema: List of property schemas common to the nodes.
+        @return: List of labels and property keys.
+        """
+        return [
+            (
+                node_labels,
+                [node_schema.property_name] + [s.property_name for s in common_schema],
+            )
+        ]
+
+    def import_hyperedges_from_csv(
+        self,
+        session: Session,
+        file_name: str,
+        node_labels: List[Label],
+        node_schema: Schema,
+        common_schema: List[Schema],
+        hyperedge_labels: List[Label],
+        hyperedge_schema: List[Schema],
+        as_url: bool = False,
+        batch_size: int = 5000,
+        delimiter: str = ",",
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
+    ) -> List[Any]:
+        """
+        Import hyperedges from a CSV file, which is read by this process. Members are
+        deduplicated per hyperedge and member keys that do not match any node are reported
+        instead of silently dropped.
+
+        @param session: Database session.
+        @param file_name: Name and path of the input file.
+        @param node_labels: List of labels for the nodes.
+        @param node_schema: Property schema for the nodes.
+        @param common_schema: List of property schemas common to the nodes.
+        @param hyperedge_labels: List of labels to be used for the hyperedges.
+        @param hyperedge_schema: List of property schemas for the hyperedges.
+        @param as_url: Treat file_name as URL. Defaults to False.
+        @param batch_size: Number of hyperedges to import at a time. Defaults to 5000.
+        @param delimiter: Delimiter used in the CSV file. Defaults to ','.
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              connected nodes before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the progress of the import is recorded. A failed
+                           import run again with the same name resumes after the last
+                           written batch. Defaults to None.
+        @return: Member keys that did not match any node.
+        """
+        stats = self.import_hyperedges_from_iter(
+            session,
+            iter_rows(file_name, batch_size, delimiter),
+            node_labels,
+            node_schema,
+            common_schema,
+            hyperedge_labels,
+            hyperedge_schema,
+            batch_size,
+            index_lookups=index_lookups,
+            drop_indexes=drop_indexes,
+            checkpoint=checkpoint,
+        )
+        return list(stats.unresolved)
+
+    def import_hyperedges_from_iter(
+        self,
+        session: Session,
+        rows: Iterable[Dict[str, Any]],
+        node_labels: List[Label],
+        node_schema: Schema,
+        common_schema: List[Schema],
+        hyperedge_labels: List[Label],
+        hyperedge_schema: List[Schema],
+        batch_size: int = 5000,
+        concurrency: int = 4,
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import hyperedges from an iterable of rows. Member keys that do not match any node
+        are collected in the unresolved set of the statistics.
+
+        @param session: Database session.
+        @param rows: Dictionaries with the same fields as the columns of the CSV file.
+        @param node_labels: List of labels for the nodes.
+        @param node_schema: Property schema for the nodes.
+        @param common_schema: List of property schemas common to the nodes.
+        @param hyperedge_labels: List of labels to be used for the hyperedges.
+        @param hyperedge_schema: List of property schemas for the hyperedges.
+        @param batch_size: Number of hyperedges to import at a time. Defaults to 5000.
+        @param concurrency: Accepted for compatibility, batches are written one at a time.
+                            Defaults to 4.
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              connected nodes before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the written batches are recorded. A failed import
+                           run again with the same name and the same rows and batch size skips
+                           the written batches. Defaults to None.
+        @return: Import statistics.
+        """
+        write_batch = self._hyperedges_import_writer(
+            node_labels,
+            node_schema,
+            common_schema,
+            hyperedge_labels,
+            hyperedge_schema,
+        )
+        lookups = self._hyperedges_import_lookups(
+            node_labels,
+            node_schema,
+            common_schema,
+        )
+        with self._lookup_indexes(session, lookups, index_lookups, drop_indexes):
+            return self._import_rows(
+                session, write_batch, rows, batch_size, checkpoint=checkpoint
+            )
+
+    def import_hyperedges_from_frame(
+        self,
+        session: Session,
+        data: Any,
+        node_labels: List[Label],
+        node_schema: Schema,
+        common_schema: List[Schema],
+        hyperedge_labels: List[Label],
+        hyperedge_schema: List[Schema],
+        batch_size: int = 5000,
+        concurrency: int = 4,
+        delimiter: str = ",",
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import hyperedges from a pandas DataFrame, Arrow data or a local CSV file, read in
+        chunks. Member keys that do not match any node are collected in the unresolved set
+        of the statistics.
+
+        @param session: Database session.
+        @param data: DataFrame, Arrow table or record batches, path of a local CSV (optionally
+                     gzip, bz2 or zstd compressed), Parquet or Arrow IPC file, or an iterable of
+                     DataFrames or dictionaries, with the same columns as the CSV file.
+        @param node_labels: List of labels for the nodes.
+        @param node_schema: Property schema for the nodes.
+        @param common_schema: List of property schemas common to the nodes.
+        @param hyperedge_labels: List of labels to be used for the hyperedges.
+        @param hyperedge_schema: List of property schemas for the hyperedges.
+        @param batch_size: Number of hyperedges to import at a time. Defaults to 5000.
+        @param concurrency: Accepted for compatibility, batches are written one at a time.
+                            Defaults to 4.
+        @param delimiter: Delimiter used in a local CSV file. Defaults to ','.
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              connected nodes before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the written batches are recorded. A failed import
+                           run again with the same name and the same rows and batch size skips
+                           the written batches. Defaults to None.
+        @return: Import statistics.
+        """
+        return self.import_hyperedges_from_iter(
+            session,
+            iter_rows(data, batch_size, delimiter),
+            node_labels,
+            node_schema,
+            common_schema,
+            hyperedge_labels,
+            hyperedge_schema,
+            batch_size,
+            concurrency,
+            index_lookups=index_lookups,
+            drop_indexes=drop_indexes,
+            checkpoint=checkpoint,
+        )
+
+    def _subgraphs_import_lookups(
+        self,
+        node_schema: Schema,
+        edge_schema: Schema,
+        common_schema: List[Schema],
+    ) -> List[Tuple[List[Label], List[str]]]:
+        """
+        Labels and property keys the subgraph collections import matches for each row.
+
+        @param node_schema: Property schema for the nodes.
+        @param edge_schema: Property schema for the edges.
+        @param common_schema: List of property schemas common to the nodes.
+        @return: List of labels and property keys.
+        """
+        common_keys = [s.property_name for s in common_schema]
+        return [
+            ([Label("_node")], [node_schema.property_name] + common_keys),
+            ([Label("_node")], [edge_schema.property_name] + common_keys),
+        ]
+
+    def import_subgraphs_from_csv(
+        self,
+        session: Session,
+        file_name: str,
+        node_schema: Schema,
+        edge_schema: Schema,
+        common_schema: List[Schema],
+        subgraph_labels: List[Label],
+        subgraph_schema: List[Schema],
+        as_url: bool = False,
+        batch_size: int = 1000,
+        delimiter: str = ",",
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
+    ) -> None:
+        """
+        Import subgraph collections from a CSV file, which is read by this process.
+
+        @param session: Database session.
+        @param file_name: Name and path of the input file.
+        @param node_schema: Property schema for the nodes.
+        @param edge_schema: Property schema for the edges.
+        @param common_schema: List of property schemas common to the nodes.
+        @param subgraph_labels: List of labels to be used for the subgraph collections.
+        @param subgraph_schema: List of property schemas for the subgraph collections.
+        @param as_url: Treat file_name as URL. Defaults to False.
+        @param batch_size: Number of subgraph collections to import at a time. Defaults to 1000.
+        @param delimiter: Delimiter used in the CSV file. Defaults to ','.
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              member nodes before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the progress of the import is recorded. A failed
+                           import run again with the same name resumes after the last
+                           written batch. Defaults to None.
+        """
+        self.import_subgraphs_from_iter(
+            session,
+            iter_rows(file_name, batch_size, delimiter),
+            node_schema,
+            edge_schema,
+            common_schema,
+            subgraph_labels,
+            subgraph_schema,
+            batch_size,
+            index_lookups=index_lookups,
+            drop_indexes=drop_indexes,
+            checkpoint=checkpoint,
+        )
+
+    def import_subgraphs_from_iter(
+        self,
+        session: Session,
+        rows: Iterable[Dict[str, Any]],
+        node_schema: Schema,
+        edge_schema: Schema,
+        common_schema: List[Schema],
+        subgraph_labels: List[Label],
+        subgraph_schema: List[Schema],
+        batch_size: int = 1000,
+        concurrency: int = 4,
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import subgraph collections from an iterable of rows.
+
+        @param session: Database session.
+        @param rows: Dictionaries with the same fields as the columns of the CSV file.
+        @param node_schema: Property schema for the nodes.
+        @param edge_schema: Property schema for the edges.
+        @param common_schema: List of property schemas common to the nodes.
+        @param subgraph_labels: List of labels to be used for the subgraph collections.
+        @param subgraph_schema: List of property schemas for the subgraph collections.
+        @param batch_size: Number of subgraph collections to import at a time. Defaults to 1000.
+        @param concurrency: Accepted for compatibility, batches are written one at a time.
+                            Defaults to 4.
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              member nodes before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the written batches are recorded. A failed import
+                           run again with the same name and the same rows and batch size skips
+                           the written batches. Defaults to None.
+        @return: Import statistics.
+        """
+        write_batch = self._subgraphs_import_writer(
+            node_schema,
+            edge_schema,
+            common_schema,
+            subgraph_labels,
+            subgraph_schema,
+        )
+        lookups = self._subgraphs_import_lookups(node_schema, edge_schema, common_schema)
+        with self._lookup_indexes(session, lookups, index_lookups, drop_indexes):
+            return self._import_rows(
+                session, write_batch, rows, batch_size, checkpoint=checkpoint
+            )
+
+    def import_subgraphs_from_frame(
+        self,
+        session: Session,
+        data: Any,
+        node_schema: Schema,
+        edge_schema: Schema,
+        common_schema: List[Schema],
+        subgraph_labels: List[Label],
+        subgraph_schema: List[Schema],
+        batch_size: int = 1000,
+        concurrency: int = 4,
+        delimiter: str = ",",
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import subgraph collections from a pandas DataFrame, Arrow data or a local CSV file,
+        read in chunks.
+
+        @param session: Database session.
+        @param data: DataFrame, Arrow table or record batches, path of a local CSV (optionally
+                     gzip, bz2 or zstd compressed), Parquet or Arrow IPC file, or an iterable of
+                     DataFrames or dictionaries, with the same columns as the CSV file.
+        @param node_schema: Property schema for the nodes.
+        @param edge_schema: Property schema for the edges.
+        @param common_schema: List of property schemas common to the nodes.
+        @param subgraph_labels: List of labels to be used for the subgraph collections.
+        @param subgraph_schema: List of property schemas for the subgraph collections.
+        @param batch_size: Number of subgraph collections to import at a time. Defaults to 1000.
+        @param concurrency: Accepted for compatibility, batches are written one at a time.
+                            Defaults to 4.
+        @param delimiter: Delimiter used in a local CSV file. Defaults to ','.
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              member nodes before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the written batches are recorded. A failed import
+                           run again with the same name and the same rows and batch size skips
+                           the written batches. Defaults to None.
+        @return: Import statistics.
+        """
+        return self.import_subgraphs_from_iter(
+            session,
+            iter_rows(data, batch_size, delimiter),
+            node_schema,
+            edge_schema,
+            common_schema,
+            subgraph_labels,
+            subgraph_schema,
+            batch_size,
+            concurrency,
+            index_lookups=index_lookups,
+            drop_indexes=drop_indexes,
+            checkpoint=checkpoint,
+        )
+
+    def _node_tuples_import_lookups(
+        self,
+        node_schema: Schema,
+        common_schema: List[Schema],
+    ) -> List[Tuple[List[Label], List[str]]]:
+        """
+        Labels and property keys the node tuples import matches for each row.
+
+        @param node_schema: Property schema for the nodes.
+        @param common_schema: List of property schemas common to the nodes.
+        @return: List of labels and property keys.
+        """
+        return [
+            (
+                [Label("_node")],
+                [node_schema.property_name] + [s.property_name for s in common_schema],
+            )
+        ]
+
+    def import_node_tuples_from_csv(
+        self,
+        session: Session,
+        file_name: str,
+        node_schema: Schema,
+        common_schema: List[Schema],
+        tuple_labels: List[Label],
+        tuple_properties: List[Schema],
+        as_url: bool = False,
+        batch_size: int = 1000,
+        delimiter: str = ",",
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
+    ) -> None:
+        """
+        Import node-tuples from a CSV file, which is read by this process.
+
+        @param session: Database session.
+        @param file_name: Name and path of the input file.
+        @param node_schema: Property schema for the nodes.
+        @param common_schema: List of property schemas common to the nodes.
+        @param tuple_labels: List of labels to be used for the node-tuples.
+        @param tuple_properties: List of property schemas for the node-tuples.
+        @param as_url: Treat file_name as URL. Defaults to False.
+        @param batch_size: Number of node-tuples to import at a time. Defaults to 1000.
+        @param delimiter: Delimiter used in the CSV file. Defaults to ','.
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              member nodes before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the progress of the import is recorded. A failed
+                           import run again with the same name resumes after the last
+                           written batch. Defaults to None.
+        """
+        self.import_node_tuples_from_iter(
+            session,
+            iter_rows(file_name, batch_size, delimiter),
+            node_schema,
+            common_schema,
+            tuple_labels,
+            tuple_properties,
+            batch_size,
+            index_lookups=index_lookups,
+            drop_indexes=drop_indexes,
+            checkpoint=checkpoint,
+        )
+
+    def import_node_tuples_from_iter(
+        self,
+        session: Session,
+        rows: Iterable[Dict[str, Any]],
+        node_schema: Schema,
+        common_schema: List[Schema],
+        tuple_labels: List[Label],
+        tuple_properties: List[Schema],
+        batch_size: int = 1000,
+        concurrency: int = 4,
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import node-tuples from an iterable of rows.
+
+        @param session: Database session.
+        @param rows: Dictionaries with the same fields as the columns of the CSV file.
+        @param node_schema: Property schema for the nodes.
+        @param common_schema: List of property schemas common to the nodes.
+        @param tuple_labels: List of labels to be used for the node-tuples.
+        @param tuple_properties: List of property schemas for the node-tuples.
+        @param batch_size: Number of node-tuples to import at a time. Defaults to 1000.
+        @param concurrency: Accepted for compatibility, batches are written one at a time.
+                            Defaults to 4.
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              member nodes before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the written batches are recorded. A failed import
+                           run again with the same name and the same rows and batch size skips
+                           the written batches. Defaults to None.
+        @return: Import statistics.
+        """
+        write_batch = self._node_tuples_import_writer(
+            node_schema,
+            common_schema,
+            tuple_labels,
+            tuple_properties,
+        )
+        lookups = self._node_tuples_import_lookups(node_schema, common_schema)
+        with self._lookup_indexes(session, lookups, index_lookups, drop_indexes):
+            return self._import_rows(
+                session, write_batch, rows, batch_size, checkpoint=checkpoint
+            )
+
+    def import_node_tuples_from_frame(
+        self,
+        session: Session,
+        data: Any,
+        node_schema: Schema,
+        common_schema: List[Schema],
+        tuple_labels: List[Label],
+        tuple_properties: List[Schema],
+        batch_size: int = 1000,
+        concurrency: int = 4,
+        delimiter: str = ",",
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import node-tuples from a pandas DataFrame, Arrow data or a local CSV file, read in
+        chunks.
+
+        @param session: Database session.
+        @param data: DataFrame, Arrow table or record batches, path of a local CSV (optionally
+                     gzip, bz2 or zstd compressed), Parquet or Arrow IPC file, or an iterable of
+                     DataFrames or dictionaries, with the same columns as the CSV file.
+        @param node_schema: Property schema for the nodes.
+        @param common_schema: List of property schemas common to the nodes.
+        @param tuple_labels: List of labels to be used for the node-tuples.
+        @param tuple_properties: List of property schemas for the node-tuples.
+        @param batch_size: Number of node-tuples to import at a time. Defaults to 1000.
+        @param concurrency: Accepted for compatibility, batches are written one at a time.
+                            Defaults to 4.
+        @param delimiter: Delimiter used in a local CSV file. Defaults to ','.
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              member nodes before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the written batches are recorded. A failed import
+                           run again with the same name and the same rows and batch size skips
+                           the written batches. Defaults to None.
+        @return: Import statistics.
+        """
+        return self.import_node_tuples_from_iter(
+            session,
+            iter_rows(data, batch_size, delimiter),
+            node_schema,
+            common_schema,
+            tuple_labels,
+            tuple_properties,
+            batch_size,
+            concurrency,
+            index_lookups=index_lookups,
+            drop_indexes=drop_indexes,
+            checkpoint=checkpoint,
+        )
+
+    def _subgraph_edges_import_lookups(
+        self,
+        start_subgraph_label: Label,
+        start_subgraph_schema: List[Schema],
+        end_subgraph_label: Label,
+        end_subgraph_schema: List[Schema],
+    ) -> List[Tuple[List[Label], List[str]]]:
+        """
+        Labels and property keys the subgraph edges import matches for each row.
+
+        @param start_subgraph_label: Label of the start subgraphs.
+        @param start_subgraph_schema: List of property schemas for the start subgraphs.
+        @param end_subgraph_label: Label of the end subgraphs.
+        @param end_subgraph_schema: List of property schemas for the end subgraphs.
+        @return: List of labels and property keys.
+        """
+        return [
+            (
+                [Label("_subgraph"), start_subgraph_label],
+                [s.property_name for s in start_subgraph_schema],
+            ),
+            (
+                [Label("_subgraph"), end_subgraph_label],
+                [s.property_name for s in end_subgraph_schema],
+            ),
+        ]
+
+    def import_subgraph_edges_from_csv(
+        self,
+        session: Session,
+        file_name: str,
+        start_subgraph_label: Label,
+        start_subgraph_schema: List[Schema],
+        end_subgraph_label: Label,
+        end_subgraph_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+        as_url: bool = False,
+        batch_size: int = 1000,
+        delimiter: str = ",",
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
+    ) -> None:
+        """
+        Import subgraph edges from a CSV file, which is read by this process.
+
+        @param session: Database session.
+        @param file_name: Name and path of the input file.
+        @param start_subgraph_label: Label of the start subgraphs.
+        @param start_subgraph_schema: List of property schemas for the start subgraphs.
+        @param end_subgraph_label: Label of the end subgraphs.
+        @param end_subgraph_schema: List of property schemas for the end subgraphs.
+        @param edge_label: Label of the subgraph edges.
+        @param edge_schema: List of property schemas for the subgraph edges.
+        @param as_url: Treat file_name as URL. Defaults to False.
+        @param batch_size: Number of subgraph edges to import at a time. Defaults to 1000.
+        @param delimiter: Delimiter used in the CSV file. Defaults to ','.
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              start and end subgraphs before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the progress of the import is recorded. A failed
+                           import run again with the same name resumes after the last
+                           written batch. Defaults to None.
+        """
+        self.import_subgraph_edges_from_iter(
+            session,
+            iter_rows(file_name, batch_size, delimiter),
+            start_subgraph_label,
+            start_subgraph_schema,
+            end_subgraph_label,
+            end_subgraph_schema,
+            edge_label,
+            edge_schema,
+            batch_size,
+            index_lookups=index_lookups,
+            drop_indexes=drop_indexes,
+            checkpoint=checkpoint,
+        )
+
+    def import_subgraph_edges_from_iter(
+        self,
+        session: Session,
+        rows: Iterable[Dict[str, Any]],
+        start_subgraph_label: Label,
+        start_subgraph_schema: List[Schema],
+        end_subgraph_label: Label,
+        end_subgraph_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+        batch_size: int = 1000,
+        concurrency: int = 4,
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import subgraph edges from an iterable of rows.
+
+        @param session: Database session.
+        @param rows: Dictionaries with the same fields as the columns of the CSV file.
+        @param start_subgraph_label: Label of the start subgraphs.
+        @param start_subgraph_schema: List of property schemas for the start subgraphs.
+        @param end_subgraph_label: Label of the end subgraphs.
+        @param end_subgraph_schema: List of property schemas for the end subgraphs.
+        @param edge_label: Label of the subgraph edges.
+        @param edge_schema: List of property schemas for the subgraph edges.
+        @param batch_size: Number of subgraph edges to import at a time. Defaults to 1000.
+        @param concurrency: Accepted for compatibility, batches are written one at a time.
+                            Defaults to 4.
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              start and end subgraphs before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the written batches are recorded. A failed import
+                           run again with the same name and the same rows and batch size skips
+                           the written batches. Defaults to None.
+        @return: Import statistics.
+        """
+        write_batch = self._subgraph_edges_import_writer(
+            start_subgraph_label,
+            start_subgraph_schema,
+            end_subgraph_label,
+            end_subgraph_schema,
+            edge_label,
+            edge_schema,
+        )
+        lookups = self._subgraph_edges_import_lookups(
+            start_subgraph_label,
+            start_subgraph_schema,
+            end_subgraph_label,
+            end_subgraph_schema,
+        )
+        with self._lookup_indexes(session, lookups, index_lookups, drop_indexes):
+            return self._import_rows(
+                session, write_batch, rows, batch_size, checkpoint=checkpoint
+            )
+
+    def import_subgraph_edges_from_frame(
+        self,
+        session: Session,
+        data: Any,
+        start_subgraph_label: Label,
+        start_subgraph_schema: List[Schema],
+        end_subgraph_label: Label,
+        end_subgraph_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+        batch_size: int = 1000,
+        concurrency: int = 4,
+        delimiter: str = ",",
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import subgraph edges from a pandas DataFrame, Arrow data or a local CSV file, read in
+        chunks.
+
+        @param session: Database session.
+        @param data: DataFrame, Arrow table or record batches, path of a local CSV (optionally
+                     gzip, bz2 or zstd compressed), Parquet or Arrow IPC file, or an iterable of
+                     DataFrames or dictionaries, with the same columns as the CSV file.
+        @param start_subgraph_label: Label of the start subgraphs.
+        @param start_subgraph_schema: List of property schemas for the start subgraphs.
+        @param end_subgraph_label: Label of the end subgraphs.
+        @param end_subgraph_schema: List of property schemas for the end subgraphs.
+        @param edge_label: Label of the subgraph edges.
+        @param edge_schema: List of property schemas for the subgraph edges.
+        @param batch_size: Number of subgraph edges to import at a time. Defaults to 1000.
+        @param concurrency: Accepted for compatibility, batches are written one at a time.
+                            Defaults to 4.
+        @param delimiter: Delimiter used in a local CSV file. Defaults to ','.
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              start and end subgraphs before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the written batches are recorded. A failed import
+                           run again with the same name and the same rows and batch size skips
+                           the written batches. Defaults to None.
+        @return: Import statistics.
+        """
+        return self.import_subgraph_edges_from_iter(
+            session,
+            iter_rows(data, batch_size, delimiter),
+            start_subgraph_label,
+            start_subgraph_schema,
+            end_subgraph_label,
+            end_subgraph_schema,
+            edge_label,
+            edge_schema,
+            batch_size,
+            concurrency,
+            index_lookups=index_lookups,
+            drop_indexes=drop_indexes,
+            checkpoint=checkpoint,
+        )
+
+    # Changes
+
+    def add_node(
+        self,
+        session: Session,
+        tx: Transaction,
+        labels: List[Label],
+        properties: List[Property],
+        track_changes: bool = False,
+    ) -> None:
+        """
+        Add a node to the database within a transaction.
+
+        @param session: Database session.
+        @param tx: Current transaction.
+        @param labels: List of labels for the node to be added.
+        @param properties: List of properties for the node to be added.
+        @param track_changes: Set the change version of the node. Defaults to False.
+        """
+        properties = self._property_dict(properties)
+        with self._transaction(tx) as handle:
+            if track_changes:
+                properties["_version"] = self._tick(handle)
+            self._create_node(handle, self._label_names(labels), properties)
+
+    def delete_node(
+        self,
+        session: Session,
+        tx: Transaction,
+        labels: List[Label],
+        properties: List[Property],
+        track_changes: bool = False,
+    ) -> None:
+        """
+        Delete a node and all its connected edges within a transaction.
+
+        @param session: Database session.
+        @param tx: Current transaction.
+        @param labels: List of labels for the node to be deleted.
+        @param properties: List of properties for the node to be deleted.
+        @param track_changes: Leave a tombstone for the node. Defaults to False.
+        """
+        with self._transaction(tx) as handle:
+            version = self._tick(handle) if track_changes else None
+            for node in self._find_nodes(handle, labels, properties):
+                if track_changes:
+                    self._tombstone(handle, node, version)
+                self._delete_node(handle, node)
+
+    def delete_node_with_node_edges(
+        self,
+        session: Session,
+        tx: Transaction,
+        labels: List[Label],
+        properties: List[Property],
+        edge_label: Label,
+        track_changes: bool = False,
+    ) -> None:
+        """
+        Delete a node and all its connecting HO edges. A HO edge is modeled as a node on the LPG
+        level and therefore has to be deleted explicitely.
+
+        @param session: Database session.
+        @param tx: Current transaction.
+        @param labels: List of labels for the node to be deleted.
+        @param properties: List of properties for the node to be deleted.
+        @param edge_label: Label of the edges.
+        @param track_changes: Leave tombstones for the node and its HO edges. Defaults to False.
+        """
+        with self._transaction(tx) as handle:
+            type = str(edge_label)
+            version = self._tick(handle) if track_changes else None
+            deleted = set()
+            for node in self._find_nodes(handle, labels, properties):
+                for outgoing in (True, False):
+                    for _, edge in self._neighbors(handle, node.id, type, outgoing):
+                        if edge.id in deleted:
+                            continue
+                        if track_changes:
+                            self._tombstone(handle, edge, version)
+                        self._delete_node(handle, edge)
+                        deleted.add(edge.id)
+                if node.id not in deleted:
+                    if track_changes:
+                        self._tombstone(handle, node, version)
+                    self._delete_node(handle, node)
+                    deleted.add(node.id)
+
+    def delete_edge(
+        self,
+        session: Session,
+        tx: Transaction,
+        start_node_labels: List[Label],
+        start_node_properties: List[Property],
+        end_node_labels: List[Label],
+        end_node_properties: List[Property],
+        edge_label: Label,
+        track_changes: bool = False,
+    ) -> None:
+        """
+        Delete the edges between the matching start and end nodes.
+
+        @param session: Database session.
+        @param tx: Current transaction.
+        @param start_node_labels: List of labels for the start node.
+        @param start_node_properties: List of properties for the start node.
+        @param end_node_labels: List of labels for the end node.
+        @param end_node_properties: List of properties for the end node.
+        @param edge_label: Label of the edge.
+        @param track_changes: Leave a tombstone for the edge, holding the properties the start
+                              and end nodes were matched on. Defaults to False.
+        """
+        with self._transaction(tx) as handle:
+            version = self._tick(handle) if track_changes else None
+            for start in self._find_nodes(
+                handle, start_node_labels, start_node_properties
+            ):
+                for relationship, end in self._neighbors(
+                    handle,
+                    start.id,
+                    str(edge_label),
+                    True,
+                    end_node_labels,
+                    end_node_properties,
+                ):
+                    if track_changes:
+                        endpoints = {
+                            f"_start_{p.key}": start.properties.get(p.key)
+                            for p in start_node_properties
+                        }
+                        endpoints.update(
+                            (f"_end_{p.key}", end.properties.get(p.key))
+                            for p in end_node_properties
+                        )
+                        self._tombstone(handle, relationship, version, endpoints)
+                    self._delete_relationship(handle, relationship)
+
+    def update_node(
+        self,
+        session: Session,
+        tx: Transaction,
+        node_labels: List[Label],
+        node_properties: List[Property],
+        update_properties: List[Property],
+        track_changes: bool = False,
+    ) -> None:
+        """
+        Update properties of a node.
+
+        @param session: Database session.
+        @param tx: Current transaction.
+        @param node_labels: List of labels of the node.
+        @param node_properties: List of original properties of the node.
+        @param update_properties: List of new properties for the node.
+        @param track_changes: Set the change version of the node and of the HO elements it is
+                              a member of. Defaults to False.
+        """
+        with self._transaction(tx) as handle:
+            updates = self._property_dict(update_properties)
+            version = self._tick(handle) if track_changes else None
+            if track_changes:
+                updates["_version"] = version
+            for node in self._find_nodes(handle, node_labels, node_properties):
+                self._set_properties(handle, node, updates)
+                if track_changes:
+                    self._touch(handle, node, version)
+
+    def update_edge(
+        self,
+        session: Session,
+        tx: Transaction,
+        edge_label: Label,
+        edge_properties: List[Property],
+        update_properties: List[Property],
+        track_changes: bool = False,
+    ) -> None:
+        """
+        Update properties of an edge.
+
+        @param session: Database session.
+        @param tx: Current transaction.
+        @param edge_label: Label of the edge.
+        @param edge_properties: List of original properties of the edge.
+        @param update_properties: List of new properties for the edge.
+        @param track_changes: Set the change version of the edge. Defaults to False.
+        """
+        with self._transaction(tx) as handle:
+            updates = self._property_dict(update_properties)
+            if track_changes:
+                updates["_version"] = self._tick(handle)
+            for relationship in self._find_relationships(
+                handle, str(edge_label), edge_properties
+            ):
+                self._set_properties(handle, relationship, updates)
+
+    # Matching
+
+    @staticmethod
+    def _element_record(element: Union[StoredNode, StoredRelationship]) -> List[Any]:
+        """
+        Labels (or type) and properties of an element, as returned by the match methods.
+
+        @param element: Node or relationship.
+        @return: List of the labels and a copy of the properties.
+        """
+        if isinstance(element, StoredRelationship):
+            return [element.type, dict(element.properties)]
+        return [list(element.labels), dict(element.properties)]
+
+    def match_nodes(
+        self,
+        session: Session,
+        node_labels: List[Label],
+        node_properties: List[Property],
+    ) -> pd.DataFrame:
+        """
+        Match nodes by labels and properties.
+
+        @param session: Database session.
+        @param node_labels: List of labels of the nodes.
+        @param node_properties: List of properties of the nodes.
+        @return: Dataframe containing the matched nodes.
+        """
+        with self._read(session) as handle:
+            records = [
+                self._element_record(node)
+                for node in self._find_nodes(handle, node_labels, node_properties)
+            ]
+        return pd.DataFrame(records, columns=["labels", "properties"])
+
+    def match_edges(
+        self,
+        session: Session,
+        start_node_labels: List[Label],
+        start_node_properties: List[Property],
+        end_node_labels: List[Label],
+        end_node_properties: List[Property],
+        edge_label: Label,
+        edge_properties: List[Property],
+    ) -> pd.DataFrame:
+        """
+        Match edges by label and properties.
+
+        @param session: Database session.
+        @param start_node_labels: List of labels for the start nodes.
+        @param start_node_properties: List of properties for the start nodes.
+        @param end_node_labels: List of labels for the end nodes.
+        @param end_node_properties: List of properties for the end nodes.
+        @param edge_label: Label of the edges.
+        @param edge_properties: List of properties of the edges.
+        @return: Dataframe containing the matched edges with their start and end nodes.
+        """
+        with self._read(session) as handle:
+            records = [
+                self._element_record(start)
+                + self._element_record(end)
+                + self._element_record(edge)
+                for start, end, edge in self._edges(
+                    handle,
+                    start_node_labels,
+                    start_node_properties,
+                    end_node_labels,
+                    end_node_properties,
+                    str(edge_label),
+                    edge_properties,
+                )
+            ]
+        return pd.DataFrame(
+            records,
+            columns=[
+                "start_node_labels",
+                "start_node_properties",
+                "end_node_labels",
+                "end_node_properties",
+                "edge_type",
+                "edge_properties",
+            ],
+        )
+
+    def match_node_edges(
+        self,
+        session: Session,
+        start_node_labels: List[Label],
+        start_node_properties: List[Property],
+        end_node_labels: List[Label],
+        end_node_properties: List[Property],
+        node_edge_labels: List[Label],
+        node_edge_properties: List[Property],
+        edge_label: Label,
+    ) -> pd.DataFrame:
+        """
+        Match HO edges by label and properties.
+
+        @param session: Database session.
+        @param start_node_labels: List of labels for the start nodes.
+        @param start_node_properties: List of properties for the start nodes.
+        @param end_node_labels: List of labels for the end nodes.
+        @param end_node_properties: List of properties for the end nodes.
+        @param node_edge_labels: List of label of the HO edges.
+        @param node_edge_properties: List of properties of the HO edges.
+        @param edge_label: Label of the edges.
+        @return: Dataframe containing the matched HO edges with their start and end nodes.
+        """
+        with self._read(session) as handle:
+            records = [
+                self._element_record(start)
+                + self._element_record(end)
+                + self._element_record(edge)
+                for start, edge, end in self._paths(
+                    handle,
+                    start_node_labels,
+                    start_node_properties,
+                    str(edge_label),
+                    node_edge_labels,
+                    node_edge_properties,
+                    end_node_labels,
+                    end_node_properties,
+                )
+            ]
+        return pd.DataFrame(
+            records,
+            columns=[
+                "start_labels",
+                "start_properties",
+                "end_labels",
+                "end_properties",
+                "edge_labels",
+                "edge_properties",
+            ],
+        )
+
+    def match_subgraph(
+        self,
+        session: Session,
+        subgraph_labels: List[Label],
+        subgraph_properties: List[Property],
+    ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        """
+        Match a subgraph by labels and properties.
+
+        @param session: Database session.
+        @param subgraph_labels: List of labels of the subgraph.
+        @param subgraph_properties: List of properties of the subgraph.
+        @return: Triple of dataframes containing subgraph, node and edge information respectively.
+        """
+        with self._read(session) as handle:
+            subgraphs = self._find_nodes(handle, subgraph_labels, subgraph_properties)
+            assert len(subgraphs) <= 1
+            subgraph_records = [self._element_record(s) for s in subgraphs]
+            node_records = [
+                self._element_record(node)
+                for subgraph in subgraphs
+                for _, node in self._neighbors(
+                    handle, subgraph.id, "_node_membership", False, "_node"
+                )
+            ]
+            edge_records = [
+                self._element_record(start)
+                + self._element_record(end)
+                + self._element_record(edge)
+                for subgraph in subgraphs
+                for start, end, edge in self._member_edges(handle, subgraph)
+            ]
+        subgraph_df = pd.DataFrame(subgraph_records, columns=["labels", "properties"])
+        node_df = pd.DataFrame(node_records, columns=["labels", "properties"])
+        edge_df = pd.DataFrame(
+            edge_records,
+            columns=[
+                "start_labels",
+                "start_properties",
+                "end_labels",
+                "end_properties",
+                "edge_labels",
+                "edge_properties",
+            ],
+        )
+        return (subgraph_df, node_df, edge_df)
+
+    def match_subgraph_edges(
+        self,
+        session: Session,
+        start_subgraph_labels: List[Label],
+        start_subgraph_properties: List[Property],
+        end_subgraph_labels: List[Label],
+        end_subgraph_properties: List[Property],
+        edge_label: Label,
+        edge_properties: List[Property],
+    ) -> pd.DataFrame:
+        """
+        Match subgraph edges by label and properties.
+
+        @param session: Database session.
+        @param start_subgraph_labels: List of labels for the start subgraphs.
+        @param start_subgraph_properties: List of properties for the start subgraphs.
+        @param end_subgraph_labels: List of labels for the end subgraphs.
+        @param end_subgraph_properties: List of properties for the end subgraphs.
+        @param edge_label: Label of the subgraph edges.
+        @param edge_properties: List of properties of the subgraph edges.
+        @return: Dataframe containing the matched subgraph edges with their start and end subgraphs.
+        """
+        with self._read(session) as handle:
+            records = [
+                self._element_record(start)
+                + self._element_record(end)
+                + self._element_record(edge)
+                for start, edge, end in self._paths(
+                    handle,
+                    start_subgraph_labels,
+                    start_subgraph_properties,
+                    "_subgraph_adjacency",
+                    [Label("_subgraph_edge"), edge_label],
+                    edge_properties,
+                    end_subgraph_labels,
+                    end_subgraph_properties,
+                )
+            ]
+        return pd.DataFrame(
+            records,
+            columns=[
+                "start_labels",
+                "start_properties",
+                "end_labels",
+                "end_properties",
+                "edge_labels",
+                "edge_properties",
+            ],
+        )
+
+    def match_hyperedge(
+        self,
+        session: Session,
+        node_labels: List[Label],
+        hyperedge_labels: List[Label],
+        hyperedge_properties: List[Property],
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Match a hyperedge by labels and properties.
+
+        @param session: Database session.
+        @param node_labels: List of labels for the nodes.
+        @param hyperedge_labels: List of labels of the hyperedge.
+        @param hyperedge_properties: List of properties of the hyperedge.
+        @return: Tuple of dataframes containing the matched node information as well as the related
+                 edge information.
+        """
+        with self._read(session) as handle:
+            edges = self._find_nodes(handle, hyperedge_labels, hyperedge_properties)
+            assert len(edges) <= 1
+            edge_records = [self._element_record(edge) for edge in edges]
+            node_records = [
+                self._element_record(node)
+                for edge in edges
+                for _, node in self._neighbors(
+                    handle, edge.id, "_adjacency", False, node_labels
+                )
+            ]
+        node_df = pd.DataFrame(node_records, columns=["labels", "properties"])
+        edge_df = pd.DataFrame(edge_records, columns=["labels", "properties"])
+        return (node_df, edge_df)
+
+    def match_node_tuple(
+        self,
+        session: Session,
+        tuple_labels: List[Label],
+        tuple_properties: List[Property],
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Match a node-tuple by labels and properties.
+
+        @param session: Database session.
+        @param tuple_labels: List of labels of the node-tuple.
+        @param tuple_properties: List of properties of the node-tuple.
+        @return: Tuple of dataframes containing the matched node-tuple information as well as the
+                 related node information.
+        """
+        with self._read(session) as handle:
+            tuples = self._find_nodes(handle, tuple_labels, tuple_properties)
+            assert len(tuples) <= 1
+            tuple_records = [self._element_record(t) for t in tuples]
+            node_records = [
+                self._element_record(node)
+                + [relationship.properties.get("position_in_tuple")]
+                for t in tuples
+                for relationship, node in self._neighbors(
+                    handle, t.id, "_node_membership", False, "_node"
+                )
+            ]
+        tuple_df = pd.DataFrame(tuple_records, columns=["labels", "properties"])
+        node_df = pd.DataFrame(
+            node_records, columns=["labels", "properties", "position"]
+        )
+        return (tuple_df, node_df)
+
+    # Indexes
+
+    @abstractmethod
+    def _index_definitions(self, handle: Any) -> List[Tuple[str, str, List[str], bool]]:
+        """
+        Property indexes of the database.
+
+        @param handle: Handle of the running read or write.
+        @return: List of the name, label, property keys and uniqueness of every index.
+        """
+        pass
+
+    @abstractmethod
+    def _add_index(
+        self,
+        handle: Any,
+        name: str,
+        label: str,
+        properties: List[str],
+        unique: bool = False,
+    ) -> None:
+        """
+        Create a property index on the nodes with a label.
+
+        @param handle: Handle of the running write.
+        @param name: Name of the index.
+        @param label: Label of the indexed nodes.
+        @param properties: Indexed property keys.
+        @param unique: Enforce a uniqueness constraint. Defaults to False.
+        """
+        pass
+
+    @abstractmethod
+    def _drop_index(self, handle: Any, name: str) -> None:
+        """
+        Drop a property index, if it exists.
+
+        @param handle: Handle of the running write.
+        @param name: Name of the index.
+        """
+        pass
+
+    def create_index(
+        self, session: Session, label: Label, properties: List[str]
+    ) -> None:
+        """
+        Create an index on property keys and a label.
+
+        @param session: Database session.
+        @param label: Label used for indexing.
+        @param properties: List of property keys to be indexed.
+        """
+        name = f"{label}_{'_'.join(properties)}_index"
+        with self._write(session) as handle:
+            if any(name == d[0] for d in self._index_definitions(handle)):
+                raise ValueError(f"An index named {name} already exists.")
+            self._add_index(handle, name, str(label), properties)
+
+    def drop_index(self, session: Session, index_name: str) -> None:
+        """
+        Drop an index by name.
+
+        @param session: Database session.
+        @param index_name: Name of the index to be deleted.
+        """
+        with self._write(session) as handle:
+            self._drop_index(handle, index_name)
+
+    def ensure_indexes(
+        self,
+        session: Session,
+        lookups: List[Tuple[List[Label], List[str]]],
+        unique: bool = False,
+        timeout: int = 300,
+    ) -> List[str]:
+        """
+        Create indexes for node lookups that no existing index serves. A lookup is served if
+        one of its labels has an index whose properties are all matched by the lookup. New
+        indexes are created on the last, most specific label of a lookup.
+
+        @param session: Database session.
+        @param lookups: List of labels and the property keys matched on them.
+        @param unique: Create uniqueness constraints instead of plain indexes. Defaults to False.
+        @param timeout: Accepted for compatibility, indexes are built before returning.
+                        Defaults to 300.
+        @return: Names of the created indexes or constraints.
+        """
+        created = []
+        with self._write(session) as handle:
+            for labels, properties in lookups:
+                names = self._label_names(labels)
+                if not properties or any(
+                    label in names and set(keys) <= set(properties)
+                    for _, label, keys, _ in self._index_definitions(handle)
+                ):
+                    continue
+                label = names[-1]
+                suffix = "unique" if unique else "index"
+                name = f"{label}_{'_'.join(properties)}_{suffix}"
+                self._add_index(handle, name, label, properties, unique)
+                created.append(name)
+        return created
+
+    @contextmanager
+    def _lookup_indexes(
+        self,
+        session: Session,
+        lookups: List[Tuple[List[Label], List[str]]],
+        create: bool,
+        drop: bool,
+    ) -> Iterator[List[str]]:
+        """
+        Context manager providing indexes for the node lookups of an import.
+
+        @param session: Database session.
+        @param lookups: List of labels and the property keys matched on them.
+        @param create: Create the missing indexes.
+        @param drop: Drop the created indexes when leaving the context.
+        @return: Names of the created indexes.
+        """
+        created = self.ensure_indexes(session, lookups) if create else []
+        try:
+            yield created
+        finally:
+            if drop:
+                for name in created:
+                    self.drop_index(session, name)
+
+    def show_indexes(self, session: Session) -> List[Tuple[str, List[str]]]:
+        """
+        Show all indexes in the database.
+
+        @param session: Database session.
+        @return: List of labels and property keys.
+        """
+        with self._read(session) as handle:
+            return [
+                (label, keys) for _, label, keys, _ in self._index_definitions(handle)
+            ]
+
+    def show_index_names(self, session: Session) -> List[str]:
+        """
+        Show all index names in the database.
+
+        @param session: Database session.
+        @return: List of the names of indices in the database.
+        """
+        with self._read(session) as handle:
+            return [name for name, _, _, _ in self._index_definitions(handle)]
+
+    def indexed_predicates(
+        self,
+        session: Session,
+        variables_list: List[List[str]],
+        elements_list: List[List[Tuple[List[Label], List[Property]]]],
+        conditions_list: List[List[Union[str, Predicate]]],
+    ) -> List[Tuple[Comparison, Optional[str]]]:
+        """
+        Determine which structured predicates of a traversal an existing index can serve. A
+        comparison is served if it is one of the _INDEX_OPERATORS and tests a property of a
+        variable whose label carries an index on that property, and the indexed properties
+        are tested for equality or list membership: those before the compared one for
+        ordered indexes, all of them otherwise. Raw string conditions are ignored.
+
+        @param session: Database session.
+        @param variables_list: Variables of the paths.
+        @param elements_list: Labels and properties of the path elements.
+        @param conditions_list: Conditions of the paths.
+        @return: List of comparisons and the name of the index serving each of them, or None.
+        """
+        variable_labels = {}
+        for variables, elements in zip(variables_list, elements_list):
+            for variable, (labels, _) in zip(variables, elements):
+                if variable is not None:
+                    variable_labels.setdefault(variable, set()).update(
+                        self._label_names(labels)
+                    )
+        comparisons = [
+            comparison
+            for conditions in conditions_list
+            for condition in conditions
+            if isinstance(condition, Predicate)
+            for comparison in condition.conjuncts()
+        ]
+        constrained = {
+            c.property_access
+            for c in comparisons
+            if c.sargable and c.operator in ("=", "IN")
+        }
+        with self._read(session) as handle:
+            indexes = self._index_definitions(handle)
+        served = []
+        for comparison in comparisons:
+            index_name = None
+            if comparison.sargable and comparison.operator in self._INDEX_OPERATORS:
+                variable, key = comparison.property_access
+                index_name = next(
+                    (
+                        name
+                        for name, label, keys, _ in indexes
+                        if label in variable_labels.get(variable, ())
+                        and key in keys
+                        and all(
+                            (variable, k) in constrained
+                            for k in (
+                                keys[: keys.index(key)]
+                                if self._ORDERED_INDEXES
+                                else keys
+                            )
+                        )
+                    ),
+                    None,
+                )
+            served.append((comparison, index_name))
+        return served
+
+    def end_session(self, session: Session) -> None:
+        """
+        Close the database session.
+
+        @param session: Database session.
+        """
+        session.close()
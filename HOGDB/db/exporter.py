@@ -0,0 +1,323 @@
+# Copyright (c) 2025 ETH Zurich.
+#                    All rights reserved.
+#
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+from datetime import date, datetime
+from typing import Any, Callable, List, Optional, Sequence
+from HOGDB.db.schema import Schema
+import csv
+import time
+
+EXPORT_FORMATS = ("parquet", "arrow")
+
+
+class ExportStats:
+    """
+    A class holding the progress of an export.
+    """
+
+    def __init__(self, rows: int = 0, elapsed: float = 0.0) -> None:
+        """
+        Initialize the ExportStats instance.
+
+        @param rows: Number of written rows. Defaults to 0.
+        @param elapsed: Wall-clock time of the export in seconds. Defaults to 0.0.
+        """
+        self.rows = rows
+        self.elapsed = elapsed
+
+    @property
+    def rows_per_second(self) -> float:
+        """
+        Export throughput.
+
+        @return: Number of written rows per second.
+        """
+        return self.rows / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the ExportStats instance.
+
+        @return: A string representation of the statistics.
+        """
+        return f"ExportStats(rows={self.rows}, rows/s={self.rows_per_second:.1f})"
+
+
+def _pyarrow() -> Any:
+    """
+    Import pyarrow, which is only required for the Parquet and Arrow exports.
+
+    @return: The pyarrow module.
+    """
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "Parquet and Arrow exports require pyarrow, install it with 'pip install pyarrow'."
+        ) from e
+    return pyarrow
+
+
+def arrow_type(property_type: type) -> Any:
+    """
+    Convert the type of a property schema to an Arrow data type.
+
+    @param property_type: Property type of a schema.
+    @return: Arrow data type.
+    """
+    pa = _pyarrow()
+    if property_type == str:
+        return pa.string()
+    elif property_type == int:
+        return pa.int64()
+    elif property_type == float:
+        return pa.float64()
+    elif property_type == bool:
+        return pa.bool_()
+    elif property_type == datetime:
+        return pa.timestamp("us", tz="UTC")
+    elif property_type == date:
+        return pa.date32()
+    else:
+        raise ValueError(f"Unsupported property type: {property_type}")
+
+
+def arrow_fields(schema: List[Schema]) -> List[Any]:
+    """
+    Arrow fields of scalar property columns.
+
+    @param schema: List of property schemas.
+    @return: List of Arrow fields named after the field names of the schemas.
+    """
+    pa = _pyarrow()
+    return [pa.field(s.field_name, arrow_type(s.property_type)) for s in schema]
+
+
+def list_field(schema: Schema, name: str = None) -> Any:
+    """
+    Arrow field of a member list column, for example the nodes of a hyperedge.
+
+    @param schema: Property schema of the members.
+    @param name: Name of the column. Defaults to the field name of the schema.
+    @return: Arrow field of type list.
+    """
+    pa = _pyarrow()
+    return pa.field(
+        schema.field_name if name is None else name,
+        pa.list_(arrow_type(schema.property_type)),
+    )
+
+
+def pair_list_field(schema: Schema) -> Any:
+    """
+    Arrow field of a list of node pairs, for example the edges of a subgraph.
+
+    @param schema: Property schema of the start and end nodes.
+    @return: Arrow field of type list of structs with 'start' and 'end' members.
+    """
+    pa = _pyarrow()
+    node_type = arrow_type(schema.property_type)
+    return pa.field(
+        schema.field_name,
+        pa.list_(pa.struct([("start", node_type), ("end", node_type)])),
+    )
+
+
+def _to_native(value: Any) -> Any:
+    """
+    Convert driver temporal values, also nested in lists and maps, to native Python values.
+
+    @param value: Value returned by the database.
+    @return: Value Arrow can convert.
+    """
+    if isinstance(value, list):
+        return [_to_native(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _to_native(v) for k, v in value.items()}
+    if hasattr(value, "to_native"):
+        return value.to_native()
+    return value
+
+
+class ExportWriter:
+    """
+    Base class of the export writers. Records are written batch by batch, so an export never
+    holds more than one batch in memory. The progress callback is invoked after every batch.
+    """
+
+    def __init__(
+        self, progress: Optional[Callable[[ExportStats], None]] = None
+    ) -> None:
+        """
+        Initialize the ExportWriter instance.
+
+        @param progress: Function called with the export statistics after every written batch.
+                         Defaults to None.
+        """
+        self.stats = ExportStats()
+        self.progress = progress
+        self._start = time.perf_counter()
+
+    def _write(self, records: List[Sequence]) -> None:
+        """
+        Write a non-empty batch of records to the file.
+
+        @param records: Records, each a sequence of values in column order.
+        """
+        raise NotImplementedError
+
+    def write(self, records: List[Sequence]) -> None:
+        """
+        Write a batch of records and report the progress.
+
+        @param records: Records, each a sequence of values in column order.
+        """
+        if not records:
+            return
+        self._write(records)
+        self.stats.rows += len(records)
+        self.stats.elapsed = time.perf_counter() - self._start
+        if self.progress is not None:
+            self.progress(self.stats)
+
+    def close(self) -> None:
+        """
+        Finish and close the file.
+        """
+        raise NotImplementedError
+
+    def __enter__(self) -> "ExportWriter":
+        """
+        Enter the runtime context.
+
+        @return: The writer.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Close the file when leaving the runtime context.
+        """
+        self.close()
+        self.stats.elapsed = time.perf_counter() - self._start
+
+
+class CsvExportWriter(ExportWriter):
+    """
+    Append records to a CSV file.
+    """
+
+    def __init__(
+        self,
+        file_name: str,
+        fields: List[str],
+        quoting: int = csv.QUOTE_MINIMAL,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+    ) -> None:
+        """
+        Initialize the CsvExportWriter instance and write the header.
+
+        @param file_name: Name and path of the output file.
+        @param fields: Column titles.
+        @param quoting: Quoting behaviour of the csv module. Defaults to csv.QUOTE_MINIMAL.
+        @param progress: Function called with the export statistics after every written batch.
+                         Defaults to None.
+        """
+        super().__init__(progress)
+        self._file = open(file_name, "w", newline="")
+        self._writer = csv.writer(self._file, quoting=quoting, lineterminator="\n")
+        self._writer.writerow(fields)
+
+    def _write(self, records: List[Sequence]) -> None:
+        """
+        Append a batch of records.
+
+        @param records: Records, each a sequence of values in column order.
+        """
+        self._writer.writerows(records)
+
+    def close(self) -> None:
+        """
+        Close the file.
+        """
+        self._file.close()
+
+
+class ArrowExportWriter(ExportWriter):
+    """
+    Write records as compressed Arrow record batches to a Parquet or Arrow IPC file.
+    """
+
+    def __init__(
+        self,
+        file_name: str,
+        fields: List[Any],
+        file_format: str = "parquet",
+        compression: str = "zstd",
+        progress: Optional[Callable[[ExportStats], None]] = None,
+    ) -> None:
+        """
+        Initialize the ArrowExportWriter instance.
+
+        @param file_name: Name and path of the output file.
+        @param fields: Arrow fields of the columns, in the order of the record values.
+        @param file_format: Either 'parquet' or 'arrow' (Arrow IPC file). Defaults to 'parquet'.
+        @param compression: Compression codec, for example 'zstd', 'lz4' or None.
+                            Defaults to 'zstd'.
+        @param progress: Function called with the export statistics after every written batch.
+                         Defaults to None.
+        """
+        super().__init__(progress)
+        if file_format not in EXPORT_FORMATS:
+            raise ValueError(
+                f"Unsupported export format '{file_format}', expected one of {EXPORT_FORMATS}."
+            )
+        pa = _pyarrow()
+        self.schema = pa.schema(fields)
+        # only convert the columns that can hold driver temporal values
+        self._temporal = [
+            i
+            for i, field in enumerate(self.schema)
+            if any(t in str(field.type) for t in ("timestamp", "date"))
+        ]
+        if file_format == "parquet":
+            import pyarrow.parquet as pq
+
+            self._writer = pq.ParquetWriter(
+                file_name, self.schema, compression=compression or "none"
+            )
+        else:
+            self._writer = pa.ipc.new_file(
+                file_name,
+                self.schema,
+                options=pa.ipc.IpcWriteOptions(compression=compression),
+            )
+
+    def _write(self, records: List[Sequence]) -> None:
+        """
+        Write a batch of records as a record batch.
+
+        @param records: Records, each a sequence of values in column order.
+        """
+        pa = _pyarrow()
+        columns = [list(column) for column in zip(*records)]
+        for i in self._temporal:
+            columns[i] = _to_native(columns[i])
+        self._writer.write_batch(
+            pa.RecordBatch.from_arrays(
+                [
+                    pa.array(column, type=field.type)
+                    for column, field in zip(columns, self.schema)
+                ],
+                schema=self.schema,
+            )
+        )
+
+    def close(self) -> None:
+        """
+        Finish and close the file.
+        """
+        self._writer.close()
@@ -0,0 +1,912 @@
+# Copyright (c) 2025 ETH Zurich.
+#                    All rights reserved.
+#
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# Parser and evaluator for the subset of Cypher expressions used in path traversals
+# (conditions, return values, sort keys and aggregations), for the databases that evaluate
+# traversals themselves instead of running Cypher. Expressions are parsed into nested tuples
+# whose first item names the kind of the node:
+#   ("literal", value), ("parameter", name), ("variable", name), ("property", base, key),
+#   ("index", base, index), ("list", items), ("function", name, arguments),
+#   ("binary", operator, left, right), ("is_null", operand, negated), ("not", operand),
+#   ("and", left, right), ("or", left, right), ("xor", left, right)
+# Evaluation follows the Cypher semantics for null: comparisons with null are null and
+# WHERE only keeps rows for which a condition is true.
+
+from datetime import date, datetime, time as datetime_time
+from HOGDB.db.aggregation import Aggregate
+from HOGDB.db.predicate import And, Comparison, Not, Or, Predicate
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
+import math
+import re
+
+_TOKEN = re.compile(
+    r"""\s*(?:
+    (?P<number>(?:\d+\.\d*|\.\d+|\d+)(?:[eE][-+]?\d+)?)
+    |(?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+    |(?P<name>`[^`]+`|[A-Za-z_]\w*)
+    |(?P<parameter>\$\w+)
+    |(?P<operator><>|!=|<=|>=|[-+*/%^=<>(),.\[\]])
+    )""",
+    re.VERBOSE,
+)
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f"}
+_SORT_DIRECTION = re.compile(r"\s+(ASC|ASCENDING|DESC|DESCENDING)\s*$", re.IGNORECASE)
+_ALIAS = re.compile(r"^(.*?)\s+AS\s+(`[^`]+`|\w+)\s*$", re.IGNORECASE | re.DOTALL)
+COMPARISON_OPERATORS = ("=", "<>", "<", "<=", ">", ">=")
+STRING_OPERATORS = ("STARTS WITH", "ENDS WITH", "CONTAINS")
+
+
+class _Parser:
+    """
+    Recursive descent parser over the tokens of an expression.
+    """
+
+    def __init__(self, text: str) -> None:
+        """
+        Initialize the parser by tokenizing the expression.
+
+        @param text: Cypher expression.
+        """
+        self.text = text
+        self.tokens = []
+        position = 0
+        text = text.rstrip()
+        while position < len(text):
+            match = _TOKEN.match(text, position)
+            if match is None or match.end() == position:
+                raise ValueError(
+                    f"Unsupported syntax at position {position} of expression: {self.text}"
+                )
+            kind = match.lastgroup
+            self.tokens.append((kind, match.group(kind)))
+            position = match.end()
+        self.position = 0
+
+    def _peek(self, offset: int = 0) -> Tuple[Optional[str], Optional[str]]:
+        index = self.position + offset
+        return self.tokens[index] if index < len(self.tokens) else (None, None)
+
+    def _keyword(self, *words: str) -> bool:
+        # consume the keywords if the next tokens are exactly those words
+        for offset, word in enumerate(words):
+            kind, value = self._peek(offset)
+            if kind != "name" or value.upper() != word:
+                return False
+        self.position += len(words)
+        return True
+
+    def _operator(self, *operators: str) -> Optional[str]:
+        kind, value = self._peek()
+        if kind == "operator" and value in operators:
+            self.position += 1
+            return value
+        return None
+
+    def _expect(self, operator: str) -> None:
+        if self._operator(operator) is None:
+            raise ValueError(f"Expected '{operator}' in expression: {self.text}")
+
+    def parse(self) -> Tuple:
+        expression = self._or()
+        if self.position != len(self.tokens):
+            raise ValueError(
+                f"Unexpected '{self._peek()[1]}' in expression: {self.text}"
+            )
+        return expression
+
+    def _or(self) -> Tuple:
+        left = self._xor()
+        while self._keyword("OR"):
+            left = ("or", left, self._xor())
+        return left
+
+    def _xor(self) -> Tuple:
+        left = self._and()
+        while self._keyword("XOR"):
+            left = ("xor", left, self._and())
+        return left
+
+    def _and(self) -> Tuple:
+        left = self._not()
+        while self._keyword("AND"):
+            left = ("and", left, self._not())
+        return left
+
+    def _not(self) -> Tuple:
+        if self._keyword("NOT"):
+            return ("not", self._not())
+        return self._comparison()
+
+    def _comparison(self) -> Tuple:
+        left = self._additive()
+        result = None
+        while True:
+            operator = self._operator(*COMPARISON_OPERATORS, "!=")
+            if operator is not None:
+                operator = "<>" if operator == "!=" else operator
+                right = self._additive()
+                # chained comparisons such as a < b < c hold if every pair holds
+                comparison = ("binary", operator, left, right)
+                result = comparison if result is None else ("and", result, comparison)
+                left = right
+                continue
+            if self._keyword("IS", "NOT", "NULL"):
+                left = ("is_null", left, True)
+            elif self._keyword("IS", "NULL"):
+                left = ("is_null", left, False)
+            elif self._keyword("IN"):
+                left = ("binary", "IN", left, self._additive())
+            elif self._keyword("STARTS", "WITH"):
+                left = ("binary", "STARTS WITH", left, self._additive())
+            elif self._keyword("ENDS", "WITH"):
+                left = ("binary", "ENDS WITH", left, self._additive())
+            elif self._keyword("CONTAINS"):
+                left = ("binary", "CONTAINS", left, self._additive())
+            else:
+                break
+        return left if result is None else result
+
+    def _additive(self) -> Tuple:
+        left = self._multiplicative()
+        while (operator := self._operator("+", "-")) is not None:
+            left = ("binary", operator, left, self._multiplicative())
+        return left
+
+    def _multiplicative(self) -> Tuple:
+        left = self._power()
+        while (operator := self._operator("*", "/", "%")) is not None:
+            left = ("binary", operator, left, self._power())
+        return left
+
+    def _power(self) -> Tuple:
+        left = self._unary()
+        while self._operator("^") is not None:
+            left = ("binary", "^", left, self._unary())
+        return left
+
+    def _unary(self) -> Tuple:
+        if self._operator("-") is not None:
+            return ("binary", "-", ("literal", 0), self._unary())
+        if self._operator("+") is not None:
+            return self._unary()
+        return self._postfix()
+
+    def _postfix(self) -> Tuple:
+        expression = self._atom()
+        while True:
+            if self._operator(".") is not None:
+                kind, value = self._peek()
+                if kind != "name":
+                    raise ValueError(f"Expected a property key in expression: {self.text}")
+                self.position += 1
+                expression = ("property", expression, value.strip("`"))
+            elif self._operator("[") is not None:
+                index = self._or()
+                self._expect("]")
+                expression = ("index", expression, index)
+            else:
+                return expression
+
+    def _atom(self) -> Tuple:
+        kind, value = self._peek()
+        if kind is None:
+            raise ValueError(f"Unexpected end of expression: {self.text}")
+        self.position += 1
+        if kind == "number":
+            is_float = any(c in value for c in ".eE")
+            return ("literal", float(value) if is_float else int(value))
+        if kind == "string":
+            body = re.sub(
+                r"\\(.)", lambda m: _ESCAPES.get(m.group(1), m.group(1)), value[1:-1]
+            )
+            return ("literal", body)
+        if kind == "parameter":
+            return ("parameter", value[1:])
+        if kind == "operator":
+            if value == "(":
+                expression = self._or()
+                self._expect(")")
+                return expression
+            if value == "[":
+                items = []
+                if self._operator("]") is None:
+                    items.append(self._or())
+                    while self._operator(",") is not None:
+                        items.append(self._or())
+                    self._expect("]")
+                return ("list", items)
+            raise ValueError(f"Unexpected '{value}' in expression: {self.text}")
+        upper = value.upper()
+        if upper in ("TRUE", "FALSE"):
+            return ("literal", upper == "TRUE")
+        if upper == "NULL":
+            return ("literal", None)
+        if self._operator("(") is not None:
+            arguments = []
+            if self._operator(")") is None:
+                arguments.append(self._or())
+                while self._operator(",") is not None:
+                    arguments.append(self._or())
+                self._expect(")")
+            return ("function", value.lower(), arguments)
+        return ("variable", value.strip("`"))
+
+
+def parse_expression(text: str) -> Tuple:
+    """
+    Parse a Cypher expression.
+
+    @param text: Cypher expression, for example "a.graph_id = 5 AND b.name STARTS WITH 'C'".
+    @return: Expression tree.
+    """
+    return _Parser(text).parse()
+
+
+def parse_sort_item(text: str) -> Tuple[str, bool]:
+    """
+    Split a sort item into its expression and direction.
+
+    @param text: Sort item, for example 'a.graph_id DESC'.
+    @return: Tuple of the expression text and whether the order is descending.
+    """
+    match = _SORT_DIRECTION.search(text)
+    if match is None:
+        return text.strip(), False
+    return text[: match.start()].strip(), match.group(1).upper().startswith("DESC")
+
+
+def parse_return_item(text: str) -> Tuple[str, Optional[str]]:
+    """
+    Split a return item into its expression and alias.
+
+    @param text: Return item, for example 'a.graph_id AS graph'.
+    @return: Tuple of the expression text and the alias, or None.
+    """
+    match = _ALIAS.match(text)
+    if match is None:
+        return text.strip(), None
+    return match.group(1).strip(), match.group(2).strip("`")
+
+
+def predicate_expression(predicate: Predicate) -> Tuple:
+    """
+    Convert a structured predicate into an expression tree.
+
+    @param predicate: Structured predicate.
+    @return: Expression tree.
+    """
+    if isinstance(predicate, Comparison):
+        operand = parse_expression(predicate.expression)
+        if predicate.operator in Comparison.UNARY_OPERATORS:
+            return ("is_null", operand, predicate.operator == "IS NOT NULL")
+        return ("binary", predicate.operator, operand, ("literal", predicate.value))
+    if isinstance(predicate, And):
+        return _fold("and", [predicate_expression(p) for p in predicate.predicates])
+    if isinstance(predicate, Or):
+        return _fold("or", [predicate_expression(p) for p in predicate.predicates])
+    if isinstance(predicate, Not):
+        return ("not", predicate_expression(predicate.predicate))
+    raise ValueError(f"Unsupported predicate: {predicate!r}")
+
+
+def condition_expression(condition: Union[str, Predicate]) -> Tuple:
+    """
+    Expression tree of a path condition.
+
+    @param condition: Cypher string or structured predicate.
+    @return: Expression tree.
+    """
+    if isinstance(condition, Predicate):
+        return predicate_expression(condition)
+    return parse_expression(condition)
+
+
+def _fold(kind: str, operands: List[Tuple]) -> Tuple:
+    if not operands:
+        return ("literal", kind == "and")
+    result = operands[0]
+    for operand in operands[1:]:
+        result = (kind, result, operand)
+    return result
+
+
+def expression_variables(expression: Tuple) -> Set[str]:
+    """
+    Variables an expression refers to.
+
+    @param expression: Expression tree.
+    @return: Set of variable names.
+    """
+    kind = expression[0]
+    if kind == "variable":
+        return {expression[1]}
+    if kind in ("literal", "parameter"):
+        return set()
+    if kind == "list":
+        children = expression[1]
+    elif kind == "function":
+        children = expression[2]
+    elif kind == "binary":
+        children = expression[2:]
+    else:
+        children = [part for part in expression[1:] if isinstance(part, tuple)]
+    return set().union(*(expression_variables(child) for child in children))
+
+
+def conjuncts(expression: Tuple) -> List[Tuple]:
+    """
+    Operands of the top-level conjunction of an expression.
+
+    @param expression: Expression tree.
+    @return: List of expressions that must all be true.
+    """
+    if expression[0] == "and":
+        return conjuncts(expression[1]) + conjuncts(expression[2])
+    return [expression]
+
+
+def equality_constraints(
+    expression: Tuple, variable: str, parameters: Optional[Dict[str, Any]] = None
+) -> Dict[str, List[Any]]:
+    """
+    Property values of a variable that an expression requires, from the conjuncts comparing a
+    property with a constant by equality or list membership. These can be served by an index.
+
+    @param expression: Expression tree.
+    @param variable: Variable name.
+    @param parameters: Query parameters. Defaults to None.
+    @return: Dictionary mapping property keys to the allowed values.
+    """
+    constraints = {}
+    for conjunct in conjuncts(expression):
+        if conjunct[0] != "binary" or conjunct[1] not in ("=", "IN"):
+            continue
+        _, operator, left, right = conjunct
+        if operator == "=" and _is_property_of(right, variable):
+            left, right = right, left
+        if not _is_property_of(left, variable) or expression_variables(right):
+            continue
+        value = evaluate(right, {}, parameters)
+        if operator == "IN":
+            if not isinstance(value, (list, tuple)):
+                continue
+            values = [v for v in value if v is not None]
+        else:
+            values = [] if value is None else [value]
+        key = left[2]
+        if key in constraints:
+            # both constraints hold, keep the values allowed by both
+            values = [v for v in values if any(equal(v, w) for w in constraints[key])]
+        constraints[key] = values
+    return constraints
+
+
+def _is_property_of(expression: Tuple, variable: str) -> bool:
+    return (
+        expression[0] == "property"
+        and expression[1][0] == "variable"
+        and expression[1][1] == variable
+    )
+
+
+def properties_of(value: Any) -> Optional[Dict[str, Any]]:
+    """
+    Properties of a graph element or map value.
+
+    @param value: Graph element (with a 'properties' attribute) or dictionary.
+    @return: Dictionary of properties, or None for other values.
+    """
+    if isinstance(value, dict):
+        return value
+    return getattr(value, "properties", None)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def equal(a: Any, b: Any) -> Optional[bool]:
+    """
+    Cypher equality: null if either value is null, false for values of different types.
+
+    @param a: First value.
+    @param b: Second value.
+    @return: True, False or None.
+    """
+    if a is None or b is None:
+        return None
+    if _is_number(a) and _is_number(b):
+        return a == b
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        if len(a) != len(b):
+            return False
+        result = True
+        for x, y in zip(a, b):
+            item = equal(x, y)
+            if item is False:
+                return False
+            if item is None:
+                result = None
+        return result
+    if type(a) != type(b) and not (isinstance(a, dict) and isinstance(b, dict)):
+        return False
+    return a == b
+
+
+def _ordered(a: Any, b: Any) -> bool:
+    # values of these kinds have a defined order among each other
+    if _is_number(a) and _is_number(b):
+        return not (isinstance(a, float) and math.isnan(a)) and not (
+            isinstance(b, float) and math.isnan(b)
+        )
+    for kind in (str, bool, datetime, date, datetime_time):
+        if isinstance(a, kind) and isinstance(b, kind):
+            return type(a) == type(b)
+    return False
+
+
+def compare(operator: str, a: Any, b: Any) -> Optional[bool]:
+    """
+    Evaluate a comparison with the Cypher semantics for null and incomparable values.
+
+    @param operator: Comparison, membership or string operator.
+    @param a: Left-hand value.
+    @param b: Right-hand value.
+    @return: True, False or None.
+    """
+    if operator == "IN":
+        if b is None:
+            return None
+        if not isinstance(b, (list, tuple)):
+            raise ValueError("The right-hand side of IN must be a list.")
+        result = False
+        for item in b:
+            found = equal(a, item)
+            if found:
+                return True
+            if found is None:
+                result = None
+        return result
+    if a is None or b is None:
+        return None
+    if operator == "=":
+        return equal(a, b)
+    if operator == "<>":
+        result = equal(a, b)
+        return None if result is None else not result
+    if operator in STRING_OPERATORS:
+        if not isinstance(a, str) or not isinstance(b, str):
+            return None
+        if operator == "STARTS WITH":
+            return a.startswith(b)
+        if operator == "ENDS WITH":
+            return a.endswith(b)
+        return b in a
+    if not _ordered(a, b):
+        return None
+    if operator == "<":
+        return a < b
+    if operator == "<=":
+        return a <= b
+    if operator == ">":
+        return a > b
+    return a >= b
+
+
+def _arithmetic(operator: str, a: Any, b: Any) -> Any:
+    if a is None or b is None:
+        return None
+    if operator == "+":
+        if isinstance(a, list) or isinstance(b, list):
+            return (a if isinstance(a, list) else [a]) + (
+                b if isinstance(b, list) else [b]
+            )
+        if isinstance(a, str) or isinstance(b, str):
+            return f"{a}{b}"
+        return a + b
+    if operator == "-":
+        return a - b
+    if operator == "*":
+        return a * b
+    if operator == "^":
+        return float(a) ** float(b)
+    if isinstance(a, int) and isinstance(b, int):
+        if b == 0:
+            raise ZeroDivisionError("/ by zero")
+        # integer division and remainder truncate towards zero
+        quotient = abs(a) // abs(b) * (1 if (a >= 0) == (b >= 0) else -1)
+        return quotient if operator == "/" else a - b * quotient
+    if operator == "/":
+        return a / b if b != 0 else (math.nan if a == 0 else math.copysign(math.inf, a))
+    return math.fmod(a, b)
+
+
+def _to_integer(value: Any) -> Optional[int]:
+    if value is None or isinstance(value, bool):
+        return None if value is None else int(value)
+    if isinstance(value, (int, float)):
+        return int(value)
+    try:
+        return int(str(value).strip())
+    except ValueError:
+        try:
+            return int(float(str(value).strip()))
+        except ValueError:
+            return None
+
+
+def _to_float(value: Any) -> Optional[float]:
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_boolean(value: Any) -> Optional[bool]:
+    if value is None or isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return {"true": True, "false": False}.get(value.strip().lower())
+    if isinstance(value, int):
+        return value != 0
+    return None
+
+
+def _to_string(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def _size(value: Any) -> Optional[int]:
+    return None if value is None else len(value)
+
+
+def _coalesce(*values: Any) -> Any:
+    return next((value for value in values if value is not None), None)
+
+
+def _null_safe(function: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    return lambda value: None if value is None else function(value)
+
+
+FUNCTIONS: Dict[str, Callable[..., Any]] = {
+    "labels": _null_safe(lambda element: list(element.labels)),
+    "type": _null_safe(lambda element: element.type),
+    "id": _null_safe(lambda element: element.id),
+    "elementid": _null_safe(lambda element: str(element.id)),
+    "properties": _null_safe(lambda element: dict(properties_of(element))),
+    "keys": _null_safe(lambda element: list(properties_of(element))),
+    "size": _size,
+    "tointeger": _to_integer,
+    "tofloat": _to_float,
+    "toboolean": _to_boolean,
+    "tostring": _to_string,
+    "tolower": _null_safe(str.lower),
+    "toupper": _null_safe(str.upper),
+    "trim": _null_safe(str.strip),
+    "abs": _null_safe(abs),
+    "sqrt": _null_safe(math.sqrt),
+    "floor": _null_safe(lambda value: float(math.floor(value))),
+    "ceil": _null_safe(lambda value: float(math.ceil(value))),
+    "round": _null_safe(lambda value: float(math.floor(value + 0.5))),
+    "coalesce": _coalesce,
+    "head": _null_safe(lambda values: values[0] if values else None),
+    "last": _null_safe(lambda values: values[-1] if values else None),
+}
+
+
+def evaluate(
+    expression: Tuple,
+    scope: Dict[str, Any],
+    parameters: Optional[Dict[str, Any]] = None,
+) -> Any:
+    """
+    Evaluate an expression tree.
+
+    @param expression: Expression tree.
+    @param scope: Values of the variables, for example the bound graph elements.
+    @param parameters: Query parameters. Defaults to None.
+    @return: Value of the expression.
+    """
+    kind = expression[0]
+    if kind == "literal":
+        return expression[1]
+    if kind == "property":
+        properties = properties_of(evaluate(expression[1], scope, parameters))
+        return None if properties is None else properties.get(expression[2])
+    if kind == "variable":
+        if expression[1] not in scope:
+            raise ValueError(f"Variable `{expression[1]}` not defined.")
+        return scope[expression[1]]
+    if kind == "binary":
+        operator = expression[1]
+        a = evaluate(expression[2], scope, parameters)
+        b = evaluate(expression[3], scope, parameters)
+        if operator in COMPARISON_OPERATORS or operator == "IN":
+            return compare(operator, a, b)
+        if operator in STRING_OPERATORS:
+            return compare(operator, a, b)
+        return _arithmetic(operator, a, b)
+    if kind == "and":
+        a = evaluate(expression[1], scope, parameters)
+        if a is False:
+            return False
+        b = evaluate(expression[2], scope, parameters)
+        if b is False:
+            return False
+        return None if a is None or b is None else True
+    if kind == "or":
+        a = evaluate(expression[1], scope, parameters)
+        if a is True:
+            return True
+        b = evaluate(expression[2], scope, parameters)
+        if b is True:
+            return True
+        return None if a is None or b is None else False
+    if kind == "xor":
+        a = evaluate(expression[1], scope, parameters)
+        b = evaluate(expression[2], scope, parameters)
+        return None if a is None or b is None else a != b
+    if kind == "not":
+        a = evaluate(expression[1], scope, parameters)
+        return None if a is None else not a
+    if kind == "is_null":
+        value = evaluate(expression[1], scope, parameters)
+        return (value is not None) if expression[2] else (value is None)
+    if kind == "list":
+        return [evaluate(item, scope, parameters) for item in expression[1]]
+    if kind == "index":
+        value = evaluate(expression[1], scope, parameters)
+        index = evaluate(expression[2], scope, parameters)
+        if value is None or index is None:
+            return None
+        if isinstance(value, dict) or properties_of(value) is not None:
+            return properties_of(value).get(index)
+        return value[index] if -len(value) <= index < len(value) else None
+    if kind == "parameter":
+        if parameters is None or expression[1] not in parameters:
+            raise ValueError(f"Expected parameter: ${expression[1]}")
+        return parameters[expression[1]]
+    if kind == "function":
+        function = FUNCTIONS.get(expression[1])
+        if function is None:
+            raise ValueError(f"Unsupported function: {expression[1]}")
+        return function(*(evaluate(a, scope, parameters) for a in expression[2]))
+    raise ValueError(f"Unsupported expression: {expression!r}")
+
+
+def holds(
+    expression: Tuple,
+    scope: Dict[str, Any],
+    parameters: Optional[Dict[str, Any]] = None,
+) -> bool:
+    """
+    Whether a condition is true; null counts as false, as in a WHERE clause.
+
+    @param expression: Expression tree of the condition.
+    @param scope: Values of the variables.
+    @param parameters: Query parameters. Defaults to None.
+    @return: True if the condition is true.
+    """
+    return evaluate(expression, scope, parameters) is True
+
+
+# ranks of the kinds of values in the Cypher sort order, null sorts last
+def _sort_rank(value: Any) -> int:
+    if value is None:
+        return 7
+    if _is_number(value):
+        return 6
+    if isinstance(value, bool):
+        return 5
+    if isinstance(value, str):
+        return 4
+    if isinstance(value, (datetime, date, datetime_time)):
+        return 3
+    if isinstance(value, (list, tuple)):
+        return 2
+    if isinstance(value, dict):
+        return 0
+    return 1
+
+
+def sort_key(value: Any) -> Tuple:
+    """
+    Key ordering values as ORDER BY does: by kind, with null last, then by value.
+
+    @param value: Value.
+    @return: Sort key.
+    """
+    rank = _sort_rank(value)
+    if rank == 6:
+        return (rank, 1, 0) if isinstance(value, float) and math.isnan(value) else (
+            rank,
+            0,
+            value,
+        )
+    if rank in (4, 5):
+        return (rank, value)
+    if rank == 3:
+        return (rank, type(value).__name__, value)
+    if rank == 2:
+        return (rank, tuple(sort_key(item) for item in value))
+    if rank in (0, 1):
+        return (rank, str(value))
+    return (rank,)
+
+
+def hashable(value: Any) -> Any:
+    """
+    Hashable representation of a value, for grouping and hash indexes. Booleans are kept
+    apart from the numbers they would be equal to in Python.
+
+    @param value: Value.
+    @return: Hashable value.
+    """
+    if isinstance(value, bool):
+        return ("bool", value)
+    if isinstance(value, (list, tuple)):
+        return ("list", tuple(hashable(item) for item in value))
+    if isinstance(value, dict):
+        return ("map", tuple(sorted((k, hashable(v)) for k, v in value.items())))
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def aggregate(function: str, values: Sequence[Any], arguments: Sequence[Any] = ()) -> Any:
+    """
+    Evaluate an aggregation function over the values of a group. Null values are skipped.
+
+    @param function: Name of the aggregation function, see Aggregate.FUNCTIONS.
+    @param values: Values of the aggregated expression in the group.
+    @param arguments: Additional numeric arguments of the function. Defaults to ().
+    @return: Aggregated value.
+    """
+    values = [value for value in values if value is not None]
+    if function == "count":
+        return len(values)
+    if function == "collect":
+        return list(values)
+    if function == "sum":
+        return sum(values) if values else 0
+    if function == "avg":
+        return sum(values) / len(values) if values else None
+    if function in ("min", "max"):
+        if not values:
+            return None
+        chosen = min if function == "min" else max
+        return chosen(values, key=sort_key)
+    if function in ("percentileCont", "percentileDisc"):
+        if not values:
+            return None
+        percentile = float(arguments[0]) if arguments else 0.5
+        values = sorted(values)
+        if function == "percentileDisc":
+            index = max(0, math.ceil(percentile * len(values)) - 1)
+            return values[index]
+        position = percentile * (len(values) - 1)
+        lower = math.floor(position)
+        upper = min(lower + 1, len(values) - 1)
+        return float(values[lower] + (values[upper] - values[lower]) * (position - lower))
+    raise ValueError(f"Unsupported aggregation function: {function}")
+
+
+def aggregate_rows(
+    aggregation: Aggregate,
+    rows: Sequence[Any],
+    evaluate_row: Callable[[Tuple, Any], Any],
+) -> Any:
+    """
+    Evaluate an aggregation over the rows of a group.
+
+    @param aggregation: Aggregation.
+    @param rows: Rows of the group.
+    @param evaluate_row: Function evaluating an expression tree on a row.
+    @return: Aggregated value.
+    """
+    if aggregation.expression.strip() == "*":
+        if aggregation.function != "count":
+            raise ValueError(f"{aggregation.function}(*) is not supported.")
+        return len(rows)
+    expression = parse_expression(aggregation.expression)
+    values = [evaluate_row(expression, row) for row in rows]
+    if aggregation.distinct:
+        seen, distinct = set(), []
+        for value in values:
+            key = hashable(value)
+            if value is not None and key not in seen:
+                seen.add(key)
+                distinct.append(value)
+        values = distinct
+    return aggregate(aggregation.function, values, aggregation.arguments)
+
+
+def output_value(value: Any) -> Any:
+    """
+    Value of a return column, graph elements are returned as their properties.
+
+    @param value: Evaluated return value.
+    @return: Output value.
+    """
+    if isinstance(value, list):
+        return [output_value(item) for item in value]
+    if not isinstance(value, dict) and hasattr(value, "properties"):
+        return dict(value.properties)
+    return value
+
+
+def project(
+    bindings: List[Dict[str, Any]],
+    visible: List[str],
+    items: List[str],
+    aggregates: List[Aggregate],
+    sort: Optional[List[str]],
+) -> List[List[Any]]:
+    """
+    Evaluate the return items of matched bindings, grouping them if there are aggregations,
+    and sort the records. A sort item refers to a return column by its text or alias,
+    otherwise it is evaluated on the bindings.
+
+    @param bindings: Matched bindings, mapping the variables to their values.
+    @param visible: Named variables, returned if there are no return items.
+    @param items: Return values and grouping keys, optionally with an alias.
+    @param aggregates: Aggregations.
+    @param sort: Sort items, optionally followed by ASC or DESC.
+    @return: Records.
+    """
+    if not items and not aggregates:
+        items = sorted(visible)
+    parsed = [parse_return_item(item) for item in items]
+    expressions = [parse_expression(text) for text, _ in parsed]
+    # names a sort item may use to refer to a return column
+    references = {}
+    for position, (item, (text, alias)) in enumerate(zip(items, parsed)):
+        references.setdefault(item.strip(), position)
+        references.setdefault(alias or text, position)
+    for position, aggregation in enumerate(aggregates, len(items)):
+        references.setdefault(aggregation.alias, position)
+        references.setdefault(repr(aggregation), position)
+
+    if aggregates:
+        groups: Dict[Tuple, Tuple[List[Any], List[Dict[str, Any]]]] = {}
+        for binding in bindings:
+            values = [evaluate(e, binding) for e in expressions]
+            key = tuple(hashable(value) for value in values)
+            groups.setdefault(key, (values, []))[1].append(binding)
+        if not groups and not items:
+            groups[()] = ([], [])
+        rows = [
+            (
+                group[0] if group else {},
+                values + [aggregate_rows(a, group, evaluate) for a in aggregates],
+            )
+            for values, group in groups.values()
+        ]
+    else:
+        rows = [
+            (binding, [evaluate(e, binding) for e in expressions])
+            for binding in bindings
+        ]
+    for item in reversed(sort or []):
+        text, descending = parse_sort_item(item)
+        position = references.get(text)
+        if position is None:
+            expression = parse_expression(text)
+            rows.sort(
+                key=lambda row: sort_key(evaluate(expression, row[0])),
+                reverse=descending,
+            )
+        else:
+            rows.sort(key=lambda row: sort_key(row[1][position]), reverse=descending)
+    return [[output_value(value) for value in values] for _, values in rows]
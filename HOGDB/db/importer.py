@@ -0,0 +1,619 @@
+# Copyright (c) 2025 ETH Zurich.
+#                    All rights reserved.
+#
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from neo4j.exceptions import TransientError
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from HOGDB.db.schema import Schema
+import os
+import queue
+import threading
+import time
+import pandas as pd
+
+
+class ImportStats:
+    """
+    A class holding the statistics of a client-side import.
+    """
+
+    def __init__(
+        self, rows: int = 0, batches: int = 0, retries: int = 0, elapsed: float = 0.0
+    ) -> None:
+        """
+        Initialize the ImportStats instance.
+
+        @param rows: Number of imported rows. Defaults to 0.
+        @param batches: Number of written batches. Defaults to 0.
+        @param retries: Number of batches retried after a transient error. Defaults to 0.
+        @param elapsed: Wall-clock time of the import in seconds. Defaults to 0.0.
+        """
+        self.rows = rows
+        self.batches = batches
+        self.retries = retries
+        self.elapsed = elapsed
+        # member keys that did not match any node
+        self.unresolved: Set[Any] = set()
+        # statistics per writer, elapsed is the time the writer spent writing
+        self.workers: Dict[str, "ImportStats"] = {}
+        self._lock = threading.Lock()
+
+    def _record(
+        self,
+        worker: str,
+        rows: int,
+        retries: int,
+        elapsed: float,
+        unresolved: Iterable[Any] = (),
+    ) -> None:
+        """
+        Record a written batch.
+
+        @param worker: Name of the writer.
+        @param rows: Number of rows in the batch.
+        @param retries: Number of retries of the batch.
+        @param elapsed: Time spent writing the batch in seconds.
+        @param unresolved: Member keys of the batch that did not match any node. Defaults to ().
+        """
+        with self._lock:
+            self.unresolved.update(unresolved)
+            self.rows += rows
+            self.batches += 1
+            self.retries += retries
+            stats = self.workers.setdefault(worker, ImportStats())
+            stats.rows += rows
+            stats.batches += 1
+            stats.retries += retries
+            stats.elapsed += elapsed
+
+    @property
+    def rows_per_second(self) -> float:
+        """
+        Import throughput.
+
+        @return: Number of imported rows per second.
+        """
+        return self.rows / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the ImportStats instance.
+
+        @return: A string representation of the statistics.
+        """
+        return f"ImportStats(rows={self.rows}, batches={self.batches}, retries={self.retries}, rows/s={self.rows_per_second:.1f}, workers={len(self.workers)}, unresolved={len(self.unresolved)})"
+
+
+def _frame_rows(frame: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Convert a DataFrame into rows of native Python values, with missing values as None.
+
+    @param frame: DataFrame to convert.
+    @return: List of dictionaries.
+    """
+    return frame.astype(object).where(frame.notna(), None).to_dict("records")
+
+
+# Extensions of the columnar files read with pyarrow instead of as CSV
+PARQUET_EXTENSIONS = (".parquet", ".parq")
+ARROW_EXTENSIONS = (".arrow", ".feather", ".ipc")
+
+
+def _arrow_value(value: Any) -> Any:
+    """
+    Convert a list value of an Arrow column to the string a CSV column would hold, for example
+    the member nodes of a hyperedge to 'a;b' and the edges of a subgraph to 'a:b;c:d'.
+
+    @param value: Value of an Arrow column.
+    @return: Value of the row, None for an empty list.
+    """
+    if not isinstance(value, list):
+        return value
+    return (
+        ";".join(
+            (
+                f"{_arrow_value(v['start'])}:{_arrow_value(v['end'])}"
+                if isinstance(v, dict)
+                else v.isoformat() if hasattr(v, "isoformat") else str(v)
+            )
+            for v in value
+            if v is not None
+        )
+        or None
+    )
+
+
+def _arrow_rows(batch: Any) -> List[Dict[str, Any]]:
+    """
+    Convert an Arrow record batch into rows, with list columns serialized as in the CSV files.
+
+    @param batch: Arrow record batch.
+    @return: List of dictionaries.
+    """
+    return [{k: _arrow_value(v) for k, v in row.items()} for row in batch.to_pylist()]
+
+
+def _file_chunks(
+    path: str, chunksize: int, delimiter: str
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Read a local file in chunks of rows. Parquet and Arrow IPC files are read batch by batch
+    with pyarrow. CSV files can be gzip, bz2, xz or zstd compressed, detected by the file
+    extension, and are read as strings with empty fields as None, matching the values LOAD
+    CSV would produce.
+
+    @param path: Path of the file.
+    @param chunksize: Number of rows per chunk.
+    @param delimiter: Delimiter used in a CSV file.
+    @return: Iterator over the chunks.
+    """
+    extension = os.path.splitext(str(path))[1].lower()
+    if extension in PARQUET_EXTENSIONS + ARROW_EXTENSIONS:
+        try:
+            import pyarrow.ipc
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError(
+                "Parquet and Arrow imports require pyarrow, install it with 'pip install pyarrow'."
+            ) from e
+        if extension in PARQUET_EXTENSIONS:
+            for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+                yield _arrow_rows(batch)
+        else:
+            with pyarrow.ipc.open_file(path) as reader:
+                for i in range(reader.num_record_batches):
+                    batch = reader.get_batch(i)
+                    for start in range(0, batch.num_rows, chunksize):
+                        yield _arrow_rows(batch.slice(start, chunksize))
+        return
+    with pd.read_csv(
+        path,
+        sep=delimiter,
+        dtype=str,
+        keep_default_na=False,
+        na_values=[""],
+        chunksize=chunksize,
+        compression="infer",
+    ) as reader:
+        for chunk in reader:
+            yield _frame_rows(chunk)
+
+
+def prefetch(items: Iterable[Any], depth: int = 2) -> Iterator[Any]:
+    """
+    Produce items in a background thread, for example to read and decompress the next chunks
+    of a file while the current chunk is written. At most depth items are read ahead.
+
+    @param items: Items to produce.
+    @param depth: Maximum number of items read ahead. Defaults to 2.
+    @return: Iterator over the items.
+    """
+    buffer = queue.Queue(maxsize=max(1, depth))
+    stop = threading.Event()
+    done = object()
+
+    def put(entry):
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for item in items:
+                if not put((item, None)):
+                    return
+            put((done, None))
+        except BaseException as e:
+            put((done, e))
+        finally:
+            if hasattr(items, "close"):
+                items.close()
+
+    producer = threading.Thread(target=produce, name="prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if item is done:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        # the consumer stopped early, let the producer finish
+        stop.set()
+
+
+def iter_rows(
+    data: Any, chunksize: int = 10000, delimiter: str = ",", read_ahead: int = 2
+) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over the rows of a tabular data source in chunks. Local files are read and
+    decompressed in a background thread, read_ahead chunks ahead of the consumer.
+
+    @param data: DataFrame, Arrow table, record batch or record batch reader, path of a local
+                 CSV (optionally compressed), Parquet or Arrow IPC file, or an iterable of any
+                 of these or of dictionaries.
+    @param chunksize: Number of rows converted at a time. Defaults to 10000.
+    @param delimiter: Delimiter used in a local CSV file. Defaults to ','.
+    @param read_ahead: Number of chunks of a local file read ahead, 0 reads the file in the
+                       calling thread. Defaults to 2.
+    @return: Iterator over the rows as dictionaries.
+    """
+    if isinstance(data, (str, os.PathLike)):
+        chunks = _file_chunks(data, chunksize, delimiter)
+        if read_ahead > 0:
+            chunks = prefetch(chunks, read_ahead)
+        for chunk in chunks:
+            yield from chunk
+    elif isinstance(data, pd.DataFrame):
+        for start in range(0, len(data), chunksize):
+            yield from _frame_rows(data.iloc[start : start + chunksize])
+    elif hasattr(data, "to_batches"):
+        # pyarrow.Table
+        for batch in data.to_batches(max_chunksize=chunksize):
+            yield from _arrow_rows(batch)
+    elif hasattr(data, "to_pylist"):
+        # pyarrow.RecordBatch
+        yield from _arrow_rows(data)
+    elif isinstance(data, dict):
+        yield data
+    else:
+        for item in data:
+            yield from iter_rows(item, chunksize, delimiter, read_ahead)
+
+
+def iter_batches(
+    rows: Iterable[Dict[str, Any]], batch_size: int
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Group rows into batches.
+
+    @param rows: Rows to group.
+    @param batch_size: Maximum number of rows per batch.
+    @return: Iterator over the batches.
+    """
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+class CheckpointBatch(list):
+    """
+    A batch of rows carrying its sequence number, recorded in the checkpoint of a resumable
+    import together with the rows.
+    """
+
+    def __init__(self, rows: List[Dict[str, Any]], number: int) -> None:
+        """
+        Initialize the CheckpointBatch instance.
+
+        @param rows: Rows of the batch.
+        @param number: Sequence number of the batch in the import.
+        """
+        super().__init__(rows)
+        self.number = number
+
+
+def checkpoint_batches(
+    batches: Iterable[List[Dict[str, Any]]], committed: Set[int]
+) -> Iterator[CheckpointBatch]:
+    """
+    Number batches and skip those already committed by an earlier run of the import. The
+    numbers only match across runs if the rows are read in the same order with the same
+    batch size.
+
+    @param batches: Batches of rows.
+    @param committed: Sequence numbers of the committed batches.
+    @return: Iterator over the remaining batches.
+    """
+    for number, batch in enumerate(batches):
+        if number not in committed:
+            yield CheckpointBatch(batch, number)
+
+
+def _node_keys(
+    row: Dict[str, Any], schema: List[Schema]
+) -> Tuple[Tuple[str, str], ...]:
+    """
+    Identity of the node an edge row refers to: its key properties and their values.
+
+    @param row: Edge row.
+    @param schema: Schema of the properties identifying the node.
+    @return: Sorted tuple of property names and values.
+    """
+    return tuple(
+        sorted((s.property_name, str(row.get(s.field_name))) for s in schema)
+    )
+
+
+def check_partition_schemas(start_schema: List[Schema], end_schema: List[Schema]) -> None:
+    """
+    Check that the start and end nodes of partitioned edge rows are identified by the same
+    properties. Otherwise a node referenced as start node by one row and as end node by
+    another could be hashed into two partitions, and concurrent batches could lock it.
+
+    @param start_schema: Schema of the properties identifying the start node.
+    @param end_schema: Schema of the properties identifying the end node.
+    """
+    start_keys = sorted(s.property_name for s in start_schema)
+    end_keys = sorted(s.property_name for s in end_schema)
+    if start_keys != end_keys:
+        raise ValueError(
+            f"Partitioned imports require the start and end nodes to be identified by the same properties, got {start_keys} and {end_keys}."
+        )
+
+
+def partition_rows(
+    rows: Iterable[Dict[str, Any]],
+    start_schema: List[Schema],
+    end_schema: List[Schema],
+    partitions: int,
+) -> Dict[Tuple[int, int], List[Dict[str, Any]]]:
+    """
+    Distribute edge rows into cells by hashing the identities of their start and end nodes
+    into partitions. A node falls into the same partition whether it is the start or the
+    end node of a row, so two cells whose partitions are disjoint never lock the same node.
+
+    @param rows: Edge rows.
+    @param start_schema: Schema of the properties identifying the start node.
+    @param end_schema: Schema of the properties identifying the end node.
+    @param partitions: Number of node partitions.
+    @return: Dictionary mapping (start partition, end partition) to the rows of the cell.
+    """
+    check_partition_schemas(start_schema, end_schema)
+    cells = {}
+    for row in rows:
+        start = hash(_node_keys(row, start_schema)) % partitions
+        end = hash(_node_keys(row, end_schema)) % partitions
+        cells.setdefault((start, end), []).append(row)
+    return cells
+
+
+def partition_chunks(
+    rows: Iterable[Dict[str, Any]],
+    start_schema: List[Schema],
+    end_schema: List[Schema],
+    partitions: int,
+    chunk_size: int,
+) -> Iterator[Dict[Tuple[int, int], List[Dict[str, Any]]]]:
+    """
+    Read edge rows in chunks and distribute each chunk into cells, so that only one chunk of
+    the input is held in memory at a time.
+
+    @param rows: Edge rows.
+    @param start_schema: Schema of the properties identifying the start node.
+    @param end_schema: Schema of the properties identifying the end node.
+    @param partitions: Number of node partitions.
+    @param chunk_size: Maximum number of rows per chunk.
+    @return: Iterator over the cells of each chunk.
+    """
+    # checked before the first chunk is read
+    check_partition_schemas(start_schema, end_schema)
+    return (
+        partition_rows(chunk, start_schema, end_schema, partitions)
+        for chunk in iter_batches(rows, chunk_size)
+    )
+
+
+def partition_rounds(partitions: int) -> List[List[List[Tuple[int, int]]]]:
+    """
+    Schedule the cells of a partitioned import in rounds. Within a round, the groups touch
+    pairwise disjoint partitions and can be written concurrently. The first round holds the
+    diagonal cells, the remaining rounds pair the partitions with the circle method, so every
+    cell is scheduled exactly once in 1 + (partitions - 1) rounds (one more if odd).
+
+    @param partitions: Number of node partitions.
+    @return: List of rounds, each a list of groups of cells.
+    """
+    rounds = [[[(i, i)] for i in range(partitions)]]
+    players = list(range(partitions)) + ([None] if partitions % 2 else [])
+    n = len(players)
+    for _ in range(n - 1):
+        groups = []
+        for k in range(n // 2):
+            a, b = players[k], players[n - 1 - k]
+            if a is not None and b is not None:
+                groups.append([(a, b), (b, a)])
+        rounds.append(groups)
+        players = [players[0], players[-1]] + players[1:-1]
+    return rounds
+
+
+class BatchWriter:
+    """
+    Write batches of rows with a pool of concurrent sessions. At most max_pending batches are
+    held in memory at a time, so reading the source is throttled to the write throughput.
+    Batches failing with a transient error, for example a deadlock, are retried.
+    """
+
+    def __init__(
+        self,
+        execute: Callable[[Any, List[Dict[str, Any]]], Any],
+        start_session: Callable[[], Any],
+        end_session: Callable[[Any], None],
+        concurrency: int = 4,
+        max_pending: int = None,
+        max_retries: int = 5,
+    ) -> None:
+        """
+        Initialize the BatchWriter instance.
+
+        @param execute: Function writing a batch in the given session, returning the member
+                        keys of the batch that did not match any node.
+        @param start_session: Function opening a writer session.
+        @param end_session: Function closing a writer session.
+        @param concurrency: Number of concurrent writer sessions. Defaults to 4.
+        @param max_pending: Maximum number of batches submitted but not yet written. Defaults
+                            to twice the concurrency.
+        @param max_retries: Maximum number of retries of a batch. Defaults to 5.
+        """
+        self.execute = execute
+        self.start_session = start_session
+        self.end_session = end_session
+        self.concurrency = max(1, concurrency)
+        self.max_pending = max_pending if max_pending else 2 * self.concurrency
+        self.max_retries = max_retries
+
+    def _write_batch(
+        self, session: Any, batch: List[Dict[str, Any]], stats: ImportStats
+    ) -> None:
+        """
+        Write a single batch, retrying transient errors with exponential backoff.
+
+        @param session: Writer session.
+        @param batch: Rows to write.
+        @param stats: Statistics the batch is recorded in.
+        """
+        start = time.perf_counter()
+        for attempt in range(self.max_retries + 1):
+            try:
+                unresolved = self.execute(session, batch)
+                break
+            except TransientError:
+                if attempt == self.max_retries:
+                    raise
+                time.sleep(0.1 * 2**attempt)
+        stats._record(
+            threading.current_thread().name,
+            len(batch),
+            attempt,
+            time.perf_counter() - start,
+            unresolved or (),
+        )
+
+    def write(
+        self, batches: Iterable[List[Dict[str, Any]]], session: Optional[Any] = None
+    ) -> ImportStats:
+        """
+        Write all batches.
+
+        @param batches: Batches of rows.
+        @param session: Session used if the writer is not concurrent. Defaults to None.
+        @return: Import statistics.
+        """
+        stats = ImportStats()
+        start = time.perf_counter()
+        if self.concurrency == 1:
+            own_session = session is None
+            session = self.start_session() if own_session else session
+            try:
+                for batch in batches:
+                    self._write_batch(session, batch, stats)
+            finally:
+                if own_session:
+                    self.end_session(session)
+            stats.elapsed = time.perf_counter() - start
+            return stats
+
+        local = threading.local()
+        sessions = []
+        pending = threading.BoundedSemaphore(self.max_pending)
+        errors = []
+
+        def run(batch):
+            try:
+                self._write_batch(self._local_session(local, sessions), batch, stats)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                pending.release()
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                for batch in batches:
+                    pending.acquire()
+                    if errors:
+                        pending.release()
+                        break
+                    executor.submit(run, batch)
+        finally:
+            for writer_session in sessions:
+                self.end_session(writer_session)
+        if errors:
+            raise errors[0]
+        stats.elapsed = time.perf_counter() - start
+        return stats
+
+    def write_partitioned(
+        self,
+        chunks: Iterable[Dict[Tuple[int, int], List[Dict[str, Any]]]],
+        partitions: int,
+        batch_size: int,
+        session: Optional[Any] = None,
+    ) -> ImportStats:
+        """
+        Write partitioned edge rows chunk by chunk and, within a chunk, round by round. The
+        groups of a round touch disjoint node partitions, so the concurrent transactions never
+        wait for each other's locks. A chunk is released once all its rounds are written.
+
+        @param chunks: Rows per (start partition, end partition) cell, for each chunk of the
+                       input.
+        @param partitions: Number of node partitions.
+        @param batch_size: Number of rows per batch.
+        @param session: Session used if the writer is not concurrent. Defaults to None.
+        @return: Import statistics.
+        """
+        rounds = partition_rounds(partitions)
+        if self.concurrency == 1:
+            return self.write(
+                (
+                    batch
+                    for cells in chunks
+                    for groups in rounds
+                    for group in groups
+                    for cell in group
+                    for batch in iter_batches(cells.get(cell, []), batch_size)
+                ),
+                session,
+            )
+
+        stats = ImportStats()
+        start = time.perf_counter()
+        local = threading.local()
+        sessions = []
+
+        def run(cells, group):
+            writer_session = self._local_session(local, sessions)
+            for cell in group:
+                for batch in iter_batches(cells.get(cell, []), batch_size):
+                    self._write_batch(writer_session, batch, stats)
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                for cells in chunks:
+                    for groups in rounds:
+                        # wait for the round to finish before starting the next one
+                        for future in [
+                            executor.submit(run, cells, group) for group in groups
+                        ]:
+                            future.result()
+        finally:
+            for writer_session in sessions:
+                self.end_session(writer_session)
+        stats.elapsed = time.perf_counter() - start
+        return stats
+
+    def _local_session(self, local: threading.local, sessions: List[Any]) -> Any:
+        """
+        Get the session of the current writer thread, opening it on first use.
+
+        @param local: Thread-local storage of the sessions.
+        @param sessions: List of all opened sessions.
+        @return: Writer session.
+        """
+        if not hasattr(local, "session"):
+            local.session = self.start_session()
+            sessions.append(local.session)
+        return local.session
@@ -0,0 +1,1386 @@
+# Copyright (c) 2025 ETH Zurich.
+#                    All rights reserved.
+#
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# Database held in process memory, for tests, notebooks and benchmarks that should not
+# depend on a running Neo4j server. It stores the same lowered graph as Neo4jDatabase
+# (_node, _edge, _hyperedge, ... nodes connected by _adjacency and membership relationships)
+# in adjacency dictionaries, keeps hash indexes for property lookups and evaluates path
+# traversals with the expression module instead of running Cypher.
+
+from HOGDB.db.arrays import OUTPUT_FORMATS, records_to_arrays
+from HOGDB.db.db import Session, Transaction, UnsupportedOperationError
+from HOGDB.db.embedded import (
+    CONTAINER_LABELS,
+    EmbeddedDatabase,
+    StoredNode,
+    StoredRelationship,
+)
+from HOGDB.db.expression import (
+    condition_expression,
+    conjuncts,
+    equal,
+    equality_constraints,
+    expression_variables,
+    hashable,
+    holds,
+    project,
+)
+from HOGDB.db.aggregation import Aggregate
+from HOGDB.db.label import Label
+from HOGDB.db.predicate import Predicate
+from HOGDB.db.property import Property
+from HOGDB.db.schema import Schema
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+import itertools
+import threading
+import time
+import pandas as pd
+
+
+class InMemorySession(Session):
+    """
+    A session of the in-memory database. It only exists to satisfy the session arguments of
+    the Database interface; the database does not run query strings, run raises an
+    UnsupportedOperationError.
+    """
+
+    def __init__(self, db: "InMemoryDatabase", read_only: bool = False):
+        """
+        Initialize the InMemorySession instance.
+
+        @param db: Database of the session.
+        @param read_only: Whether the session is only used for reads. Defaults to False.
+        """
+        self.db = db
+        self.read_only = read_only
+
+    def run(self, query: str, parameters: Optional[Dict] = None) -> List[Dict]:
+        raise UnsupportedOperationError(
+            "The in-memory database does not run query strings, use the Database methods."
+        )
+
+    def begin_transaction(self) -> "InMemoryTransaction":
+        return InMemoryTransaction(self)
+
+    def close(self):
+        pass
+
+
+class InMemoryTransaction(Transaction):
+    """
+    A transaction of the in-memory database. Writes are applied immediately and recorded in
+    an undo log, so that closing the transaction without committing it rolls them back.
+    Other sessions see the writes before the commit.
+    """
+
+    def __init__(self, session: InMemorySession):
+        """
+        Initialize the InMemoryTransaction instance.
+
+        @param session: Session of the transaction.
+        """
+        self.session = session
+        self.undo: List[Callable[[], None]] = []
+
+    def run(self, query: str, parameters: Optional[Dict] = None) -> List[Dict]:
+        raise UnsupportedOperationError(
+            "The in-memory database does not run query strings, use the Database methods."
+        )
+
+    def commit(self):
+        self.undo = []
+
+    def rollback(self):
+        with self.session.db._lock:
+            while self.undo:
+                self.undo.pop()()
+
+    def close(self):
+        self.rollback()
+
+
+class InMemoryDatabase(EmbeddedDatabase):
+    """
+    The InMemoryDatabase class stores the graph in the memory of the Python process.
+
+    Inherits from the EmbeddedDatabase class and implements its storage primitives on
+    dictionaries. Nodes and relationships are kept in dictionaries with per-label and
+    per-type sets, adjacency lists in both directions and hash indexes on node properties.
+    The data is lost when the process exits; forked processes work on their own copy.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty InMemoryDatabase instance.
+        """
+        self._lock = threading.RLock()
+        self._ids = itertools.count()
+        self._nodes: Dict[int, StoredNode] = {}
+        self._relationships: Dict[int, StoredRelationship] = {}
+        # identifiers per label and relationship type, dictionaries keep insertion order
+        self._labels: Dict[str, Dict[int, None]] = {}
+        self._types: Dict[str, Dict[int, None]] = {}
+        # relationships per node and type, in both directions
+        self._out: Dict[int, Dict[str, Dict[int, None]]] = {}
+        self._in: Dict[int, Dict[str, Dict[int, None]]] = {}
+        # index name -> (label, property keys, unique), and the indexed node identifiers
+        self._indexes: Dict[str, Tuple[str, Tuple[str, ...], bool]] = {}
+        self._index_entries: Dict[str, Dict[Tuple, Dict[int, None]]] = {}
+        # batch numbers committed per import checkpoint
+        self._checkpoints: Dict[str, set] = {}
+        self._version = 0
+
+    def close_driver(self) -> None:
+        """
+        Close the database driver. The in-memory database keeps its data until it is garbage
+        collected.
+        """
+        pass
+
+    @contextmanager
+    def _read(self, session: InMemorySession) -> Iterator[None]:
+        """
+        Context manager holding the lock of the database for a read.
+
+        @param session: Database session.
+        @return: No handle, reads need none.
+        """
+        with self._lock:
+            yield None
+
+    @contextmanager
+    def _write(self, session: InMemorySession) -> Iterator[List[Callable[[], None]]]:
+        """
+        Context manager holding the lock of the database for a write, which is rolled back
+        if it fails.
+
+        @param session: Database session.
+        @return: Undo log of the write.
+        """
+        with self._lock:
+            undo = []
+            try:
+                yield undo
+            except BaseException:
+                while undo:
+                    undo.pop()()
+                raise
+
+    @contextmanager
+    def _transaction(
+        self, tx: InMemoryTransaction
+    ) -> Iterator[List[Callable[[], None]]]:
+        """
+        Context manager holding the lock of the database for a write in a transaction.
+
+        @param tx: Transaction.
+        @return: Undo log of the transaction.
+        """
+        with self._lock:
+            yield tx.undo
+
+    def _tick(self, undo: Optional[List[Callable[[], None]]] = None) -> int:
+        """
+        Advance the change version, the time in milliseconds made strictly increasing.
+
+        @param undo: Undo log of the running write, versions are not rolled back.
+                     Defaults to None.
+        @return: New version.
+        """
+        self._version = max(self._version + 1, int(time.time() * 1000))
+        return self._version
+
+    def current_version(self, session: InMemorySession) -> int:
+        """
+        Current change version. Note it before an export and pass it as 'since' to the next
+        export to only export the elements changed in between.
+
+        @param session: Database session.
+        @return: Current version.
+        """
+        with self._lock:
+            # later changes get a strictly greater version than the one returned here
+            self._version = max(self._version, int(time.time() * 1000))
+            return self._version
+
+    # Storage. The methods below change the dictionaries of the graph and assume the caller
+    # holds the lock; the methods taking an undo log record how to revert their change in it.
+
+    @staticmethod
+    def _index_key(properties: Dict[str, Any], keys: Tuple[str, ...]) -> Optional[Tuple]:
+        """
+        Key of a node in an index, None if the node lacks one of the indexed properties.
+
+        @param properties: Properties of the node.
+        @param keys: Indexed property keys.
+        @return: Index key or None.
+        """
+        values = [properties.get(key) for key in keys]
+        if any(value is None for value in values):
+            return None
+        return tuple(hashable(value) for value in values)
+
+    def _index_node(self, node: StoredNode) -> None:
+        for name, (label, keys, _) in self._indexes.items():
+            if label in node.labels:
+                key = self._index_key(node.properties, keys)
+                if key is not None:
+                    self._index_entries[name].setdefault(key, {})[node.id] = None
+
+    def _unindex_node(self, node: StoredNode) -> None:
+        for name, (label, keys, _) in self._indexes.items():
+            if label in node.labels:
+                key = self._index_key(node.properties, keys)
+                entries = self._index_entries[name].get(key)
+                if entries is not None:
+                    entries.pop(node.id, None)
+                    if not entries:
+                        del self._index_entries[name][key]
+
+    def _check_unique(
+        self, node: StoredNode, properties: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Check that a node with the given properties violates no uniqueness constraint.
+
+        @param node: Node to check.
+        @param properties: Properties to check instead of those of the node. Defaults to None.
+        """
+        properties = node.properties if properties is None else properties
+        for name, (label, keys, unique) in self._indexes.items():
+            if not unique or label not in node.labels:
+                continue
+            entries = self._index_entries[name].get(self._index_key(properties, keys), {})
+            if any(other != node.id for other in entries):
+                raise ValueError(
+                    f"Node with label {label} violates the uniqueness constraint {name}."
+                )
+
+    def _store_node(self, node: StoredNode) -> None:
+        self._check_unique(node)
+        self._nodes[node.id] = node
+        for label in node.labels:
+            self._labels.setdefault(label, {})[node.id] = None
+        self._out[node.id] = {}
+        self._in[node.id] = {}
+        self._index_node(node)
+
+    def _remove_node(self, node: StoredNode) -> None:
+        # the node must not have relationships
+        self._unindex_node(node)
+        del self._nodes[node.id]
+        for label in node.labels:
+            del self._labels[label][node.id]
+        del self._out[node.id]
+        del self._in[node.id]
+
+    def _store_relationship(self, relationship: StoredRelationship) -> None:
+        self._relationships[relationship.id] = relationship
+        self._types.setdefault(relationship.type, {})[relationship.id] = None
+        self._out[relationship.start].setdefault(relationship.type, {})[
+            relationship.id
+        ] = None
+        self._in[relationship.end].setdefault(relationship.type, {})[
+            relationship.id
+        ] = None
+
+    def _remove_relationship(self, relationship: StoredRelationship) -> None:
+        del self._relationships[relationship.id]
+        del self._types[relationship.type][relationship.id]
+        del self._out[relationship.start][relationship.type][relationship.id]
+        del self._in[relationship.end][relationship.type][relationship.id]
+
+    def _create_node(
+        self,
+        undo: List[Callable[[], None]],
+        labels: Iterable[str],
+        properties: Dict[str, Any],
+    ) -> StoredNode:
+        """
+        Create a node. Properties with null values are not stored.
+
+        @param undo: Undo log of the running write.
+        @param labels: Label names of the node.
+        @param properties: Properties of the node.
+        @return: Created node.
+        """
+        properties = {k: v for k, v in properties.items() if v is not None}
+        node = StoredNode(next(self._ids), tuple(dict.fromkeys(labels)), properties)
+        self._store_node(node)
+        undo.append(lambda: self._remove_node(node))
+        return node
+
+    def _create_relationship(
+        self,
+        undo: List[Callable[[], None]],
+        type: str,
+        start: StoredNode,
+        end: StoredNode,
+        properties: Dict[str, Any],
+    ) -> StoredRelationship:
+        """
+        Create a relationship. Properties with null values are not stored.
+
+        @param undo: Undo log of the running write.
+        @param type: Type of the relationship.
+        @param start: Start node.
+        @param end: End node.
+        @param properties: Properties of the relationship.
+        @return: Created relationship.
+        """
+        properties = {k: v for k, v in properties.items() if v is not None}
+        relationship = StoredRelationship(
+            next(self._ids), type, start.id, end.id, properties
+        )
+        self._store_relationship(relationship)
+        undo.append(lambda: self._remove_relationship(relationship))
+        return relationship
+
+    def _delete_relationship(
+        self, undo: List[Callable[[], None]], relationship: StoredRelationship
+    ) -> None:
+        """
+        Delete a relationship, if it still exists.
+
+        @param undo: Undo log of the running write.
+        @param relationship: Relationship to delete.
+        """
+        if relationship.id not in self._relationships:
+            return
+        self._remove_relationship(relationship)
+        undo.append(lambda: self._store_relationship(relationship))
+
+    def _delete_node(self, undo: List[Callable[[], None]], node: StoredNode) -> None:
+        """
+        Delete a node together with its relationships, if it still exists.
+
+        @param undo: Undo log of the running write.
+        @param node: Node to delete.
+        """
+        if node.id not in self._nodes:
+            return
+        for relationship in list(self._relationships_of(node.id, self._out)) + list(
+            self._relationships_of(node.id, self._in)
+        ):
+            self._delete_relationship(undo, relationship)
+        self._remove_node(node)
+        undo.append(lambda: self._store_node(node))
+
+    def _replace_properties(
+        self,
+        element: Union[StoredNode, StoredRelationship],
+        properties: Dict[str, Any],
+    ) -> None:
+        if isinstance(element, StoredNode):
+            self._check_unique(element, properties)
+            self._unindex_node(element)
+            element.properties = properties
+            self._index_node(element)
+        else:
+            element.properties = properties
+
+    def _set_properties(
+        self,
+        undo: List[Callable[[], None]],
+        element: Union[StoredNode, StoredRelationship],
+        updates: Dict[str, Any],
+    ) -> None:
+        """
+        Set properties of an element, null values remove the property.
+
+        @param undo: Undo log of the running write.
+        @param element: Node or relationship.
+        @param updates: Properties to set.
+        """
+        previous = element.properties
+        properties = dict(previous)
+        for key, value in updates.items():
+            if value is None:
+                properties.pop(key, None)
+            else:
+                properties[key] = value
+        self._replace_properties(element, properties)
+        undo.append(lambda: self._replace_properties(element, previous))
+
+    def _touch(
+        self, undo: List[Callable[[], None]], node: StoredNode, version: int
+    ) -> None:
+        """
+        Mark the HO elements a node is a member of as changed.
+
+        @param undo: Undo log of the running write.
+        @param node: Member node.
+        @param version: Version of the change.
+        """
+        for relationship in list(self._relationships_of(node.id, self._out)):
+            container = self._nodes[relationship.end]
+            if any(label in CONTAINER_LABELS for label in container.labels):
+                self._set_properties(undo, container, {"_version": version})
+
+    # Lookups. The lookups need no handle, they assume the caller holds the lock.
+
+    def _relationships_of(
+        self,
+        node_id: int,
+        adjacency: Dict[int, Dict[str, Dict[int, None]]],
+        types: Optional[Iterable[str]] = None,
+    ) -> Iterator[StoredRelationship]:
+        """
+        Relationships of a node in one direction.
+
+        @param node_id: Identifier of the node.
+        @param adjacency: Either the outgoing or the incoming adjacency dictionary.
+        @param types: Relationship types to follow. Defaults to None (all types).
+        @return: Iterator over the relationships.
+        """
+        relationships = adjacency[node_id]
+        for type in relationships if types is None else types:
+            for relationship_id in relationships.get(type, ()):
+                yield self._relationships[relationship_id]
+
+    def _candidates(
+        self, names: List[str], constraints: Dict[str, List[Any]]
+    ) -> Iterable[int]:
+        """
+        Identifiers of the nodes that may have the given labels and property values, from
+        the most selective index seek or label, or all nodes.
+
+        @param names: Label names the nodes must have.
+        @param constraints: Property keys and the values allowed for them.
+        @return: Candidate node identifiers.
+        """
+        best = None
+        for name, (label, keys, _) in self._indexes.items():
+            if label not in names or not all(key in constraints for key in keys):
+                continue
+            found = {}
+            entries = self._index_entries[name]
+            for values in itertools.product(*(constraints[key] for key in keys)):
+                found.update(entries.get(tuple(hashable(v) for v in values), {}))
+            if best is None or len(found) < len(best):
+                best = found
+        if best is None:
+            for name in names:
+                found = self._labels.get(name, {})
+                if best is None or len(found) < len(best):
+                    best = found
+        return self._nodes if best is None else best
+
+    @staticmethod
+    def _matches(
+        element: Union[StoredNode, StoredRelationship],
+        names: List[str],
+        properties: Dict[str, Any],
+    ) -> bool:
+        """
+        Whether an element has the given labels (or type) and property values.
+
+        @param element: Node or relationship.
+        @param names: Label names of a node, or allowed types of a relationship.
+        @param properties: Property values the element must have.
+        @return: True if the element matches.
+        """
+        if isinstance(element, StoredRelationship):
+            if names and element.type not in names:
+                return False
+        elif not all(name in element.labels for name in names):
+            return False
+        return all(
+            equal(element.properties.get(key), value) is True
+            for key, value in properties.items()
+        )
+
+    @staticmethod
+    def _changed(
+        element: Union[StoredNode, StoredRelationship], since: Optional[int]
+    ) -> bool:
+        """
+        Whether an element changed after a version.
+
+        @param element: Node or relationship.
+        @param since: Version, or None to accept all elements.
+        @return: True if the element changed.
+        """
+        if since is None:
+            return True
+        version = element.properties.get("_version")
+        return version is not None and version > int(since)
+
+    def _lookup(
+        self,
+        handle: Any,
+        names: List[str],
+        values: Dict[str, Any],
+        since: Optional[int] = None,
+    ) -> List[StoredNode]:
+        """
+        Nodes with the given label names and property values. Nodes never match a null value.
+
+        @param handle: Handle of the running read or write, unused.
+        @param names: Label names the nodes must have.
+        @param values: Property values the nodes must have.
+        @param since: Only return nodes changed after this version. Defaults to None.
+        @return: List of nodes.
+        """
+        constraints = {k: [v] for k, v in values.items() if v is not None}
+        return [
+            node
+            for node in map(self._nodes.get, list(self._candidates(names, constraints)))
+            if self._matches(node, names, values) and self._changed(node, since)
+        ]
+
+    def _neighbors(
+        self,
+        handle: Any,
+        node_id: int,
+        type: str,
+        outgoing: bool,
+        labels: Union[None, Label, List[Label]] = None,
+        properties: Optional[List[Property]] = None,
+    ) -> List[Tuple[StoredRelationship, StoredNode]]:
+        """
+        Relationships of a type in one direction and the nodes at their other end, if these
+        have the given labels and properties.
+
+        @param handle: Handle of the running read or write, unused.
+        @param node_id: Identifier of the node to start from.
+        @param type: Relationship type.
+        @param outgoing: Follow the outgoing relationships, otherwise the incoming ones.
+        @param labels: Labels the neighbors must have. Defaults to None.
+        @param properties: Properties the neighbors must have. Defaults to None.
+        @return: List of the relationships and neighbors.
+        """
+        names = self._label_names(labels)
+        values = self._property_dict(properties)
+        neighbors = []
+        adjacency = self._out if outgoing else self._in
+        for relationship in self._relationships_of(node_id, adjacency, [type]):
+            neighbor = self._nodes[relationship.end if outgoing else relationship.start]
+            if self._matches(neighbor, names, values):
+                neighbors.append((relationship, neighbor))
+        return neighbors
+
+    def _edges(
+        self,
+        handle: Any,
+        start_labels: List[Label],
+        start_properties: List[Property],
+        end_labels: List[Label],
+        end_properties: List[Property],
+        type: str,
+        properties: List[Property],
+        since: Optional[int] = None,
+    ) -> List[Tuple[StoredNode, StoredNode, StoredRelationship]]:
+        """
+        Relationships of a type with the given properties between nodes with the given
+        labels and properties.
+
+        @param handle: Handle of the running read or write, unused.
+        @param start_labels: List of labels for the start nodes.
+        @param start_properties: List of properties for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_properties: List of properties for the end nodes.
+        @param type: Type of the relationships.
+        @param properties: List of properties for the relationships.
+        @param since: Only return relationships changed after this version.
+                      Defaults to None.
+        @return: List of start nodes, end nodes and relationships.
+        """
+        values = self._property_dict(properties)
+        return [
+            (start, end, relationship)
+            for start in self._find_nodes(handle, start_labels, start_properties)
+            for relationship, end in self._neighbors(
+                handle, start.id, type, True, end_labels, end_properties
+            )
+            if self._matches(relationship, [], values)
+            and self._changed(relationship, since)
+        ]
+
+    def _find_relationships(
+        self, handle: Any, type: str, properties: List[Property]
+    ) -> List[StoredRelationship]:
+        """
+        Relationships of a type with the given properties.
+
+        @param handle: Handle of the running read or write, unused.
+        @param type: Type of the relationships.
+        @param properties: Properties the relationships must have.
+        @return: List of relationships.
+        """
+        values = self._property_dict(properties)
+        return [
+            relationship
+            for relationship in map(
+                self._relationships.get, list(self._types.get(type, {}))
+            )
+            if self._matches(relationship, [], values)
+        ]
+
+    def _paths(
+        self,
+        handle: Any,
+        start_labels: List[Label],
+        start_properties: List[Property],
+        type: str,
+        middle_labels: List[Label],
+        middle_properties: List[Property],
+        end_labels: List[Label],
+        end_properties: List[Property],
+        since: Optional[int] = None,
+    ) -> List[Tuple[StoredNode, StoredNode, StoredNode]]:
+        """
+        Paths (start)-[:type]->(middle)-[:type]->(end) of nodes with the given labels and
+        properties, the pattern of HO edges modeled as nodes.
+
+        @param handle: Handle of the running read or write, unused.
+        @param start_labels: List of labels for the start nodes.
+        @param start_properties: List of properties for the start nodes.
+        @param type: Type of both relationships.
+        @param middle_labels: List of labels for the middle nodes.
+        @param middle_properties: List of properties for the middle nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_properties: List of properties for the end nodes.
+        @param since: Only return paths whose middle node changed after this version.
+                      Defaults to None.
+        @return: List of start, middle and end nodes.
+        """
+        paths = []
+        for start in self._find_nodes(handle, start_labels, start_properties):
+            for _, middle in self._neighbors(
+                handle, start.id, type, True, middle_labels, middle_properties
+            ):
+                if not self._changed(middle, since):
+                    continue
+                for _, end in self._neighbors(
+                    handle, middle.id, type, True, end_labels, end_properties
+                ):
+                    paths.append((start, middle, end))
+        return paths
+
+    def _member_edges(
+        self, handle: Any, subgraph: StoredNode
+    ) -> List[Tuple[StoredNode, StoredNode, StoredNode]]:
+        """
+        Member edges of a subgraph collection with their start and end nodes.
+
+        @param handle: Handle of the running read or write, unused.
+        @param subgraph: Subgraph collection.
+        @return: List of start nodes, end nodes and edges.
+        """
+        return [
+            (start, end, edge)
+            for _, edge in self._neighbors(
+                handle, subgraph.id, "_edge_membership", False, "_edge"
+            )
+            for _, start in self._neighbors(handle, edge.id, "_adjacency", False, "_node")
+            for _, end in self._neighbors(handle, edge.id, "_adjacency", True, "_node")
+        ]
+
+    # Import
+
+    def delete_import_checkpoint(
+        self, session: InMemorySession, checkpoint: str
+    ) -> None:
+        """
+        Delete the progress recorded for a resumable import, so that it starts over when run
+        again. Completed imports delete their checkpoint themselves.
+
+        @param session: Database session.
+        @param checkpoint: Name of the import checkpoint.
+        """
+        with self._lock:
+            self._checkpoints.pop(checkpoint, None)
+
+    def _committed_batches(self, handle: Any, checkpoint: str) -> Set[int]:
+        """
+        Numbers of the batches an import has written under a checkpoint.
+
+        @param handle: Handle of the running read, unused.
+        @param checkpoint: Name of the import checkpoint.
+        @return: Set of batch numbers.
+        """
+        return set(self._checkpoints.get(checkpoint, ()))
+
+    def _record_batch(
+        self, undo: List[Callable[[], None]], checkpoint: str, number: int
+    ) -> None:
+        """
+        Record a batch as written under a checkpoint. The batch is only recorded once its
+        write succeeded, so the record needs no undo.
+
+        @param undo: Undo log of the write of the batch.
+        @param checkpoint: Name of the import checkpoint.
+        @param number: Number of the batch.
+        """
+        self._checkpoints.setdefault(checkpoint, set()).add(number)
+
+    def _nodes_import_writer(
+        self, labels: List[Label], node_schema: List[Schema]
+    ) -> Callable[[List[Dict[str, Any]], List[Callable[[], None]]], None]:
+        """
+        Build the function that imports a batch of nodes.
+
+        @param labels: List of labels for the nodes.
+        @param node_schema: List of property schemas for the nodes.
+        @return: Function writing a batch.
+        """
+        names = self._label_names(labels)
+
+        def write(batch, undo):
+            for row in batch:
+                self._create_node(undo, names, self._row_properties(node_schema, row))
+
+        return write
+
+    def _edges_import_writer(
+        self,
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+    ) -> Callable[[List[Dict[str, Any]], List[Callable[[], None]]], None]:
+        """
+        Build the function that imports a batch of edges, connecting every matching start
+        node of a row with every matching end node.
+
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param edge_label: Label to be used for the edges.
+        @param edge_schema: List of property schemas for the edges.
+        @return: Function writing a batch.
+        """
+        start_names = self._label_names(start_labels)
+        end_names = self._label_names(end_labels)
+        type = str(edge_label)
+
+        def write(batch, undo):
+            for row in batch:
+                starts = self._lookup(
+                    undo, start_names, self._row_properties(start_schema, row)
+                )
+                ends = self._lookup(undo, end_names, self._row_properties(end_schema, row))
+                properties = self._row_properties(edge_schema, row)
+                for start, end in itertools.product(starts, ends):
+                    self._create_relationship(undo, type, start, end, properties)
+
+        return write
+
+    def _node_edges_import_writer(
+        self,
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+        node_edge_labels: List[Label],
+        node_edge_schema: List[Schema],
+        edge_label: Label,
+    ) -> Callable[[List[Dict[str, Any]], List[Callable[[], None]]], None]:
+        """
+        Build the function that imports a batch of HO edges. The HO edge node of a row is
+        created and connected from every matching start node and to every matching end node.
+
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param node_edge_labels: List of labels to be used for the HO edges.
+        @param node_edge_schema: List of property schemas for the HO edges.
+        @param edge_label: Label for the edges to the HO edges.
+        @return: Function writing a batch.
+        """
+        start_names = self._label_names(start_labels)
+        end_names = self._label_names(end_labels)
+        node_edge_names = self._label_names(node_edge_labels)
+        type = str(edge_label)
+
+        def write(batch, undo):
+            for row in batch:
+                edge_node = self._create_node(
+                    undo, node_edge_names, self._row_properties(node_edge_schema, row)
+                )
+                starts = self._lookup(
+                    undo, start_names, self._row_properties(start_schema, row)
+                )
+                ends = self._lookup(undo, end_names, self._row_properties(end_schema, row))
+                for start, end in itertools.product(starts, ends):
+                    self._create_relationship(undo, type, start, edge_node, {})
+                    self._create_relationship(undo, type, edge_node, end, {})
+
+        return write
+
+    def _hyperedges_import_writer(
+        self,
+        node_labels: List[Label],
+        node_schema: Schema,
+        common_schema: List[Schema],
+        hyperedge_labels: List[Label],
+        hyperedge_schema: List[Schema],
+    ) -> Callable[[List[Dict[str, Any]], List[Callable[[], None]]], List[Any]]:
+        """
+        Build the function that imports a batch of hyperedges. The distinct member keys of a
+        row are resolved with a single index seek and each member is connected once. The
+        function returns the member keys that did not match any node.
+
+        @param node_labels: List of labels for the nodes.
+        @param node_schema: Property schema for the nodes.
+        @param common_schema: List of property schemas common to the nodes.
+        @param hyperedge_labels: List of labels to be used for the hyperedges.
+        @param hyperedge_schema: List of property schemas for the hyperedges.
+        @return: Function writing a batch.
+        """
+        node_names = self._label_names(node_labels)
+        hyperedge_names = self._label_names(hyperedge_labels)
+        key_name = node_schema.property_name
+
+        def write(batch, undo):
+            unresolved = []
+            for row in batch:
+                value = row.get(node_schema.field_name)
+                keys = {}
+                if value is not None:
+                    for key in str(value).split(";"):
+                        key = self._field_value(node_schema, key)
+                        if key is not None:
+                            keys.setdefault(hashable(key), key)
+                hyperedge = self._create_node(
+                    undo, hyperedge_names, self._row_properties(hyperedge_schema, row)
+                )
+                common = self._row_properties(common_schema, row)
+                constraints = {k: [v] for k, v in common.items() if v is not None}
+                constraints[key_name] = list(keys.values())
+                resolved = set()
+                for node in map(
+                    self._nodes.get, list(self._candidates(node_names, constraints))
+                ):
+                    key = hashable(node.properties.get(key_name))
+                    if key in keys and self._matches(node, node_names, common):
+                        self._create_relationship(undo, "_adjacency", node, hyperedge, {})
+                        self._create_relationship(undo, "_adjacency", hyperedge, node, {})
+                        resolved.add(key)
+                unresolved += [k for hashed, k in keys.items() if hashed not in resolved]
+            return unresolved
+
+        return write
+
+    def _subgraphs_import_writer(
+        self,
+        node_schema: Schema,
+        edge_schema: Schema,
+        common_schema: List[Schema],
+        subgraph_labels: List[Label],
+        subgraph_schema: List[Schema],
+    ) -> Callable[[List[Dict[str, Any]], List[Callable[[], None]]], None]:
+        """
+        Build the function that imports a batch of subgraph collections. As in the Cypher
+        import, the member edges are only added if at least one member node matched.
+
+        @param node_schema: Property schema for the nodes.
+        @param edge_schema: Property schema for the edges.
+        @param common_schema: List of property schemas common to the nodes.
+        @param subgraph_labels: List of labels to be used for the subgraph collections.
+        @param subgraph_schema: List of property schemas for the subgraph collections.
+        @return: Function writing a batch.
+        """
+        subgraph_names = self._label_names(subgraph_labels)
+        node_key = node_schema.property_name
+        edge_key = edge_schema.property_name
+
+        def write(batch, undo):
+            for row in batch:
+                subgraph = self._create_node(
+                    undo, subgraph_names, self._row_properties(subgraph_schema, row)
+                )
+                common = self._row_properties(common_schema, row)
+                nodes = row.get(node_schema.field_name)
+                matched = False
+                for value in [] if nodes is None else str(nodes).split(";"):
+                    values = {node_key: self._field_value(node_schema, value), **common}
+                    for node in self._lookup(undo, ["_node"], values):
+                        self._create_relationship(
+                            undo, "_node_membership", node, subgraph, {}
+                        )
+                        matched = True
+                edges = row.get(edge_schema.field_name)
+                if not matched or edges is None:
+                    continue
+                members = set()
+                for value in str(edges).split(";"):
+                    edge_nodes = value.split(":")
+                    if len(edge_nodes) < 2:
+                        continue
+                    end_values = {
+                        edge_key: self._field_value(edge_schema, edge_nodes[1]),
+                        **common,
+                    }
+                    end_properties = [Property(k, value=v) for k, v in end_values.items()]
+                    start_values = {
+                        edge_key: self._field_value(edge_schema, edge_nodes[0]),
+                        **common,
+                    }
+                    for start in self._lookup(undo, ["_node"], start_values):
+                        for _, edge in self._neighbors(
+                            undo, start.id, "_adjacency", True, "_edge"
+                        ):
+                            if edge.id not in members and self._neighbors(
+                                undo, edge.id, "_adjacency", True, "_node", end_properties
+                            ):
+                                members.add(edge.id)
+                                self._create_relationship(
+                                    undo, "_edge_membership", edge, subgraph, {}
+                                )
+
+        return write
+
+    def _node_tuples_import_writer(
+        self,
+        node_schema: Schema,
+        common_schema: List[Schema],
+        tuple_labels: List[Label],
+        tuple_properties: List[Schema],
+    ) -> Callable[[List[Dict[str, Any]], List[Callable[[], None]]], None]:
+        """
+        Build the function that imports a batch of node tuples, recording the position of
+        every member on its membership relationship.
+
+        @param node_schema: Property schema for the nodes.
+        @param common_schema: List of property schemas common to the nodes.
+        @param tuple_labels: List of labels to be used for the node-tuples.
+        @param tuple_properties: List of property schemas for the node-tuples.
+        @return: Function writing a batch.
+        """
+        tuple_names = ["_node_tuple"] + self._label_names(tuple_labels)
+        node_key = node_schema.property_name
+
+        def write(batch, undo):
+            for row in batch:
+                tuple_node = self._create_node(
+                    undo, tuple_names, self._row_properties(tuple_properties, row)
+                )
+                common = self._row_properties(common_schema, row)
+                nodes = row.get(node_schema.field_name)
+                for position, value in enumerate(
+                    [] if nodes is None else str(nodes).split(";")
+                ):
+                    values = {node_key: self._field_value(node_schema, value), **common}
+                    for node in self._lookup(undo, ["_node"], values):
+                        self._create_relationship(
+                            undo,
+                            "_node_membership",
+                            node,
+                            tuple_node,
+                            {"position_in_tuple": position},
+                        )
+
+        return write
+
+    def _subgraph_edges_import_writer(
+        self,
+        start_subgraph_label: Label,
+        start_subgraph_schema: List[Schema],
+        end_subgraph_label: Label,
+        end_subgraph_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+    ) -> Callable[[List[Dict[str, Any]], List[Callable[[], None]]], None]:
+        """
+        Build the function that imports a batch of subgraph edges.
+
+        @param start_subgraph_label: Label of the start subgraphs.
+        @param start_subgraph_schema: List of property schemas for the start subgraphs.
+        @param end_subgraph_label: Label of the end subgraphs.
+        @param end_subgraph_schema: List of property schemas for the end subgraphs.
+        @param edge_label: Label of the subgraph edges.
+        @param edge_schema: List of property schemas for the subgraph edges.
+        @return: Function writing a batch.
+        """
+        edge_names = ["_subgraph_edge"] + self._label_names(edge_label)
+        start_names = ["_subgraph"] + self._label_names(start_subgraph_label)
+        end_names = ["_subgraph"] + self._label_names(end_subgraph_label)
+
+        def write(batch, undo):
+            for row in batch:
+                edge_node = self._create_node(
+                    undo, edge_names, self._row_properties(edge_schema, row)
+                )
+                starts = self._lookup(
+                    undo, start_names, self._row_properties(start_subgraph_schema, row)
+                )
+                ends = self._lookup(
+                    undo, end_names, self._row_properties(end_subgraph_schema, row)
+                )
+                for start, end in itertools.product(starts, ends):
+                    self._create_relationship(
+                        undo, "_subgraph_adjacency", start, edge_node, {}
+                    )
+                    self._create_relationship(
+                        undo, "_subgraph_adjacency", edge_node, end, {}
+                    )
+
+        return write
+
+    # Changes
+
+    def add_edge(
+        self,
+        session: InMemorySession,
+        tx: InMemoryTransaction,
+        start_node_labels: List[Label],
+        start_node_properties: List[Property],
+        end_node_labels: List[Label],
+        end_node_properties: List[Property],
+        edge_label: Label,
+        edge_properties: List[Property],
+        track_changes: bool = False,
+    ) -> None:
+        """
+        Add an edge between every pair of matching start and end nodes.
+
+        @param session: Database session.
+        @param tx: Current transaction.
+        @param start_node_labels: List of labels for the start node.
+        @param start_node_properties: List of properties for the start node.
+        @param end_node_labels: List of labels for the end node.
+        @param end_node_properties: List of properties for the end node.
+        @param edge_label: Label of the edge.
+        @param edge_properties: List of properties of the edge.
+        @param track_changes: Set the change version of the edge. Defaults to False.
+        """
+        with self._transaction(tx) as undo:
+            properties = self._property_dict(edge_properties)
+            if track_changes:
+                properties["_version"] = self._tick(undo)
+            starts = self._find_nodes(undo, start_node_labels, start_node_properties)
+            ends = self._find_nodes(undo, end_node_labels, end_node_properties)
+            for start, end in itertools.product(starts, ends):
+                self._create_relationship(undo, str(edge_label), start, end, properties)
+
+    def node_count(
+        self, session: InMemorySession, node_labels: List[Label] = None
+    ) -> int:
+        """
+        Get number of nodes in the database that have the given list of labels.
+
+        @param session: Database session.
+        @param node_labels: List of node labels. Defaults to None.
+        @return: Number of nodes with the given labels.
+        """
+        with self._lock:
+            names = self._label_names(node_labels)
+            if not names:
+                return len(self._nodes)
+            return sum(
+                1
+                for node_id in self._candidates(names, {})
+                if self._matches(self._nodes[node_id], names, {})
+            )
+
+    def edge_count(self, session: InMemorySession, edge_label: Label = None) -> int:
+        """
+        Get number of edges in the database that have the given label.
+
+        @param session: Database session.
+        @param edge_label: Edge label. Defaults to None.
+        @return: Number of edges with the given label.
+        """
+        with self._lock:
+            if not edge_label:
+                return len(self._relationships)
+            return len(self._types.get(str(edge_label), {}))
+
+    # Indexes
+
+    def _index_definitions(
+        self, handle: Any
+    ) -> List[Tuple[str, str, List[str], bool]]:
+        """
+        Definitions of the hash indexes.
+
+        @param handle: Handle of the running read or write, unused.
+        @return: List of the names, labels, property keys and uniqueness of the indexes.
+        """
+        return [
+            (name, label, list(keys), unique)
+            for name, (label, keys, unique) in self._indexes.items()
+        ]
+
+    def _add_index(
+        self,
+        undo: List[Callable[[], None]],
+        name: str,
+        label: str,
+        properties: List[str],
+        unique: bool = False,
+    ) -> None:
+        """
+        Build a hash index over the nodes with a label.
+
+        @param undo: Undo log of the running write.
+        @param name: Name of the index.
+        @param label: Name of the indexed label.
+        @param properties: Indexed property keys.
+        @param unique: Reject nodes with the same indexed values. Defaults to False.
+        """
+        keys = tuple(properties)
+        entries: Dict[Tuple, Dict[int, None]] = {}
+        for node_id in self._labels.get(label, {}):
+            key = self._index_key(self._nodes[node_id].properties, keys)
+            if key is None:
+                continue
+            if unique and key in entries:
+                raise ValueError(
+                    f"Cannot create the uniqueness constraint {name}, nodes with label "
+                    f"{label} share the values {key} of {list(keys)}."
+                )
+            entries.setdefault(key, {})[node_id] = None
+        self._indexes[name] = (label, keys, unique)
+        self._index_entries[name] = entries
+        undo.append(lambda: self._drop_index(None, name))
+
+    def _drop_index(self, undo: Optional[List[Callable[[], None]]], name: str) -> None:
+        """
+        Drop a hash index, if it exists. Dropped indexes are not restored by a rollback.
+
+        @param undo: Undo log of the running write, unused.
+        @param name: Name of the index.
+        """
+        self._indexes.pop(name, None)
+        self._index_entries.pop(name, None)
+
+    # Traversal
+
+    def _match_path(
+        self,
+        binding: Dict[str, Any],
+        names: List[str],
+        elements: List[Tuple[List[Label], List[Property]]],
+        expressions: List[Tuple],
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Extend a binding with the matches of a directed path pattern. The path is matched
+        from its bound end if it has one, otherwise from the end with fewer candidates, and
+        every condition is checked as soon as its variables are bound. A relationship is
+        used at most once per path. The caller holds the lock.
+
+        @param binding: Variables bound by the previous patterns.
+        @param names: Variables of the path elements, alternating nodes and relationships.
+        @param elements: Labels (or relationship types) and properties of the path elements.
+        @param expressions: Conjuncts of the conditions of the path.
+        @return: Iterator over the extended bindings.
+        """
+        labels = [self._label_names(element_labels) for element_labels, _ in elements]
+        values = [self._property_dict(properties) for _, properties in elements]
+
+        def start_candidates(position):
+            if names[position] in binding:
+                return [binding[names[position]]]
+            constraints = {k: [v] for k, v in values[position].items()}
+            for expression in expressions:
+                if expression_variables(expression) == {names[position]}:
+                    for key, allowed in equality_constraints(
+                        expression, names[position]
+                    ).items():
+                        if key in constraints:
+                            allowed = [
+                                v
+                                for v in allowed
+                                if any(equal(v, w) for w in constraints[key])
+                            ]
+                        constraints[key] = allowed
+            return [self._nodes[i] for i in self._candidates(labels[position], constraints)]
+
+        last = len(names) - 1
+        if names[0] in binding or names[last] not in binding:
+            order = list(range(len(names)))
+            candidates = start_candidates(0)
+            if names[0] not in binding and last > 0:
+                reverse_candidates = start_candidates(last)
+                if len(reverse_candidates) < len(candidates):
+                    order.reverse()
+                    candidates = reverse_candidates
+        else:
+            order = list(range(last, -1, -1))
+            candidates = start_candidates(last)
+        step_of = {names[position]: step for step, position in enumerate(order)}
+        # conditions are checked at the step binding the last of their variables, those on
+        # variables bound by previous patterns filter the binding up front
+        checks: List[List[Tuple]] = [[] for _ in order]
+        for expression in expressions:
+            steps = [step_of[v] for v in expression_variables(expression) if v in step_of]
+            if not steps:
+                if not holds(expression, binding):
+                    return
+                continue
+            checks[max(steps)].append(expression)
+        scope = dict(binding)
+        # whether the variable of a step was bound by that step, and is unbound after it
+        fresh = [False] * len(order)
+
+        def admit(step, element):
+            name = names[order[step]]
+            if name in scope and scope[name] is not element:
+                return False
+            if not self._matches(element, labels[order[step]], values[order[step]]):
+                return False
+            fresh[step] = name not in scope
+            scope[name] = element
+            if all(holds(expression, scope) for expression in checks[step]):
+                return True
+            release(step)
+            return False
+
+        def release(step):
+            if fresh[step]:
+                del scope[names[order[step]]]
+                fresh[step] = False
+
+        def extend(step, node, used):
+            if step == len(order):
+                yield dict(scope)
+                return
+            forward = order[step] > order[step - 1]
+            adjacency = self._out if forward else self._in
+            types = labels[order[step]] or None
+            for relationship in list(self._relationships_of(node.id, adjacency, types)):
+                if relationship.id in used or not admit(step, relationship):
+                    continue
+                neighbor = self._nodes[relationship.end if forward else relationship.start]
+                if admit(step + 1, neighbor):
+                    used.add(relationship.id)
+                    yield from extend(step + 2, neighbor, used)
+                    used.discard(relationship.id)
+                    release(step + 1)
+                release(step)
+
+        for node in candidates:
+            if admit(0, node):
+                yield from extend(1, node, set())
+                release(0)
+
+    def traverse_path(
+        self,
+        session: InMemorySession,
+        variables_list: List[List[str]],
+        elements_list: List[List[Tuple[List[Label], List[Property]]]],
+        conditions_list: List[List[Union[str, Predicate]]],
+        return_values: List[str],
+        sort: List[str] = None,
+        limit: int = None,
+        output: str = "pandas",
+        dtypes: Optional[Dict[str, Any]] = None,
+        group_by: List[str] = None,
+        aggregates: List[Aggregate] = None,
+    ) -> Union[pd.DataFrame, Dict[str, Any]]:
+        """
+        Traverse a path in the database. Conditions, return values and sort items are
+        evaluated with the expression module, which supports the subset of Cypher used by the
+        storages; graph elements are returned as their properties.
+
+        @param session: Database session.
+        @param variables_list: Variables of the elements of each path, None for anonymous
+                               elements.
+        @param elements_list: Labels and properties of the elements of each path, alternating
+                              nodes and relationships.
+        @param conditions_list: Conditions of each path, Cypher strings or structured
+                                predicates.
+        @param return_values: Expressions to return, optionally with an alias.
+        @param sort: Sort items, optionally followed by ASC or DESC. Defaults to None.
+        @param limit: Maximum number of returned rows. Defaults to None.
+        @param output: Result format: 'pandas', 'numpy' or 'torch'. Defaults to 'pandas'.
+        @param dtypes: Optional mapping from return value to dtype for the 'numpy' and 'torch'
+                       formats. Defaults to None.
+        @param group_by: Grouping keys returned next to the aggregations. Defaults to None.
+        @param aggregates: Aggregations evaluated by the database. Defaults to None.
+        @return: Path information as a dataframe or as a dictionary of arrays.
+        """
+        if output not in OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output format: {output}")
+        group_by = group_by if group_by else []
+        aggregates = aggregates if aggregates else []
+        items = return_values + group_by
+        columns = items + [a.alias for a in aggregates]
+        with self._lock:
+            bindings = [{}]
+            visible: List[str] = []
+            anonymous = itertools.count()
+            for variables, elements, conditions in zip(
+                variables_list, elements_list, conditions_list
+            ):
+                names = [
+                    f"  anonymous{next(anonymous)}" if v is None else v for v in variables
+                ]
+                visible += [v for v in variables if v is not None and v not in visible]
+                expressions = [
+                    expression
+                    for condition in conditions
+                    for expression in conjuncts(condition_expression(condition))
+                ]
+                for expression in expressions:
+                    for variable in expression_variables(expression):
+                        if variable not in visible:
+                            raise ValueError(f"Variable `{variable}` not defined.")
+                bindings = [
+                    extended
+                    for binding in bindings
+                    for extended in self._match_path(
+                        binding, names, elements, expressions
+                    )
+                ]
+            records = project(bindings, visible, items, aggregates, sort)
+        if limit:
+            records = records[:limit]
+        if output != "pandas":
+            return records_to_arrays(records, columns, dtypes, output)
+        if not columns:
+            columns = sorted(visible)
+        return pd.DataFrame(records, columns=columns)
+
+    def clear_data(self, session: InMemorySession) -> None:
+        """
+        Remove all data from the database. Index definitions are kept.
+
+        @param session: Database session.
+        """
+        with self._lock:
+            self._nodes.clear()
+            self._relationships.clear()
+            self._labels.clear()
+            self._types.clear()
+            self._out.clear()
+            self._in.clear()
+            self._checkpoints.clear()
+            for entries in self._index_entries.values():
+                entries.clear()
+
+    def start_session(
+        self, bookmarks=None, read_only: bool = False
+    ) -> InMemorySession:
+        """
+        Start a new database session.
+
+        @param bookmarks: Accepted for compatibility, all sessions see the same data.
+                          Defaults to None.
+        @param read_only: Whether the session is only used for reads. Defaults to False.
+        @return: Database session.
+        """
+        return InMemorySession(self, read_only)
+
@@ -9,22 +9,92 @@
 
 from neo4j import (
     GraphDatabase,
+    READ_ACCESS,
+    WRITE_ACCESS,
     Session as Neo4jSession,
     Transaction as Neo4jTransaction,
 )
 from dotenv import load_dotenv
+from HOGDB.db.arrays import OUTPUT_FORMATS, records_to_arrays
 from HOGDB.db.db import Database
+from HOGDB.db.exporter import (
+    ArrowExportWriter,
+    CsvExportWriter,
+    ExportStats,
+    arrow_fields,
+    list_field,
+    pair_list_field,
+)
+from HOGDB.db.importer import (
+    BatchWriter,
+    ImportStats,
+    checkpoint_batches,
+    iter_batches,
+    iter_rows,
+    partition_chunks,
+)
+from HOGDB.db.aggregation import Aggregate
 from HOGDB.db.label import Label
+from HOGDB.db.predicate import Comparison, Predicate
+from HOGDB.db.profile import PlanOperator, QueryProfile
 from HOGDB.db.property import Property
 from HOGDB.db.schema import Schema
 from HOGDB.proxy.proxy import ProxyDriver
-from typing import Dict, List, Optional, Tuple
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 import os
+import re
+import threading
+import time
 import pandas as pd, csv
 
 # Load environment variables from the .env file
 load_dotenv("HOGDB/.env")
 
+# Schema and administration commands cannot be prefixed with PROFILE or EXPLAIN.
+_UNPLANNABLE_QUERY = re.compile(
+    r"\s*(SHOW|CREATE\s+(INDEX|CONSTRAINT)|DROP\s+(INDEX|CONSTRAINT))", re.IGNORECASE
+)
+
+# HO elements whose exported rows list their member nodes or edges
+_CONTAINER_LABELS = "_hyperedge|_subgraph|_node_tuple"
+
+# Advance the change version stored on the _version_counter node and bind it to 'version'.
+# Writes serialize on the counter node, so every tracked write gets a greater version
+# than all versions returned before it, regardless of the clock resolution.
+_NEXT_VERSION = """
+        MERGE (version_counter:_version_counter)
+        SET version_counter.value = coalesce(version_counter.value, 0) + 1
+        WITH version_counter.value AS version"""
+
+# Collect the member keys an import could not resolve to a node
+_UNRESOLVED_KEYS = "UNWIND unresolved AS key RETURN DISTINCT key"
+
+# Index types that can serve a comparison operator, IS NULL and <> are served by none
+_INDEX_TYPES = {
+    "=": ("RANGE",),
+    "<": ("RANGE",),
+    "<=": ("RANGE",),
+    ">": ("RANGE",),
+    ">=": ("RANGE",),
+    "IN": ("RANGE",),
+    "IS NOT NULL": ("RANGE",),
+    "STARTS WITH": ("RANGE", "TEXT"),
+    "ENDS WITH": ("TEXT",),
+    "CONTAINS": ("TEXT",),
+}
+
 
 class Neo4jDatabase(Database):
     """
@@ -44,6 +114,8 @@ class Neo4jDatabase(Database):
         max_connection_lifetime: int = 300,
         max_connection_pool_size: int = 50,
         connection_timeout: int = 30,
+        proxy_encoding: str = "json",
+        proxy_compression: str = None,
     ) -> None:
         """
         Initialize the Neo4jDatabase instance. Takes into account the environmental variables if
@@ -55,8 +127,13 @@ class Neo4jDatabase(Database):
         @param db_password: Password of the database credentials. Defaults to None.
         @param proxy_url: URL to access the database. Defaults to None.
         @param max_connection_lifetime: Maximum lifetime in seconds for a given connection. Defaults to 300.
-        @param max_connection_pool_size: TODO. Defaults to 50.
-        @param connection_timeout: Connection timeout in seconds. Defaults to 30.
+        @param max_connection_pool_size: Maximum number of connections held by the driver, also
+                                         to the proxy. Defaults to 50.
+        @param connection_timeout: Connection timeout in seconds, also to the proxy. Defaults to 30.
+        @param proxy_encoding: Encoding of the proxy requests and responses, either 'json' or
+                               'msgpack' (requires msgpack). Defaults to 'json'.
+        @param proxy_compression: Compression of large proxy payloads, either 'gzip' or 'zstd'
+                                  (requires zstandard). Defaults to None.
         """
         self._db_name = "neo4j" if db_name is None else db_name
         self._db_uri = os.getenv("DB_URI") if db_uri is None else db_uri
@@ -66,9 +143,21 @@ class Neo4jDatabase(Database):
         self._db_password = (
             os.getenv("DB_PASSWORD") if db_password is None else db_password
         )
+        self._max_connection_pool_size = max_connection_pool_size
+        # plans are captured per thread, so that queries of other threads sharing the
+        # database, such as traverse_many workers, are not added to the caller's list
+        self._plan_capture = threading.local()
+        self._proxy = bool(proxy_url)
         if proxy_url:
             self._driver = ProxyDriver(
-                self._db_uri, self._db_username, self._db_password, proxy_url
+                self._db_uri,
+                self._db_username,
+                self._db_password,
+                proxy_url,
+                pool_size=max_connection_pool_size,
+                connect_timeout=connection_timeout,
+                encoding=proxy_encoding,
+                compression=proxy_compression,
             )
         else:
             self._driver = GraphDatabase.driver(
@@ -87,25 +176,116 @@ class Neo4jDatabase(Database):
         self._driver.close()
 
     def _execute_query(
-        self, session: Neo4jSession, query: str, parameters: Optional[Dict] = None
-    ) -> List[Dict]:
+        self,
+        session: Neo4jSession,
+        query: str,
+        parameters: Optional[Dict] = None,
+        profile: bool = False,
+        explain: bool = False,
+        read_only: bool = False,
+    ) -> Union[List[Dict], Tuple[List[Dict], QueryProfile]]:
         """
         Execute a non-transactional query in the given session and return the results.
 
         @param session: Database session.
         @param query: Query to run.
         @param parameters: Parameters for the query.
-        @return: Results of the query.
+        @param profile: Run the query with PROFILE and return its profile next to the results.
+                        Defaults to False.
+        @param explain: Plan the query with EXPLAIN without running it and return the plan next
+                        to the (empty) results. Defaults to False.
+        @param read_only: The query only reads, so through the proxy its results may be served
+                          from the proxy's result cache. Defaults to False.
+        @return: Results of the query, or a tuple of the results and the query profile.
+        """
+        if profile or explain:
+            return self._run_with_plan(
+                session, query, parameters, "PROFILE" if profile else "EXPLAIN"
+            )
+        capture = getattr(self._plan_capture, "value", None)
+        if capture is None or _UNPLANNABLE_QUERY.match(query):
+            if self._proxy and read_only:
+                return session.run(query, parameters or {}, read_only=True)
+            return [record for record in session.run(query, parameters or {})]
+        mode, profiles = capture
+        # EXPLAIN does not run the query, but the caller needs its results, so the query is
+        # run once with PROFILE and the statistics are dropped from its plan
+        records, query_profile = self._run_with_plan(
+            session, query, parameters, "PROFILE"
+        )
+        if mode == "EXPLAIN":
+            query_profile.mode = mode
+            if query_profile.plan is not None:
+                query_profile.plan = query_profile.plan.without_statistics()
+        profiles.append(query_profile)
+        return records
+
+    def _run_with_plan(
+        self,
+        session: Neo4jSession,
+        query: str,
+        parameters: Optional[Dict],
+        mode: str,
+    ) -> Tuple[List[Dict], QueryProfile]:
         """
-        return [record for record in session.run(query, parameters or {})]
+        Run a query prefixed with PROFILE or EXPLAIN and collect its plan.
+
+        @param session: Database session or transaction.
+        @param query: Query to run.
+        @param parameters: Parameters for the query.
+        @param mode: Either 'PROFILE' or 'EXPLAIN'.
+        @return: Tuple of the results and the query profile.
+        """
+        if self._proxy:
+            raise ValueError("Query plans cannot be captured through the proxy.")
+        start = time.perf_counter()
+        result = session.run(f"{mode} {query}", parameters or {})
+        records = [record for record in result]
+        summary = result.consume()
+        elapsed = time.perf_counter() - start
+        plan = summary.profile or summary.plan
+        return records, QueryProfile(
+            query,
+            parameters,
+            mode,
+            PlanOperator.from_summary(plan) if plan else None,
+            elapsed,
+            summary.result_available_after,
+            summary.result_consumed_after,
+        )
+
+    @contextmanager
+    def capture_plans(self, explain: bool = False) -> Iterator[List[QueryProfile]]:
+        """
+        Context manager that captures the query plan of every query run within its scope.
+        Every query is run once with PROFILE, so the callers still receive their results;
+        EXPLAIN mode keeps the plans without their rows and database hits. Only the
+        queries of the thread entering the context are captured; queries run by other
+        threads, for example the workers of traverse_many or a BatchWriter, are not.
+
+        @param explain: Capture EXPLAIN plans instead of profiles. Defaults to False.
+        @return: List that is filled with one QueryProfile per query.
+        """
+        if self._proxy:
+            raise ValueError("Query plans cannot be captured through the proxy.")
+        profiles = []
+        previous = getattr(self._plan_capture, "value", None)
+        self._plan_capture.value = ("EXPLAIN" if explain else "PROFILE", profiles)
+        try:
+            yield profiles
+        finally:
+            self._plan_capture.value = previous
 
     def _begin_transaction(self, session: Neo4jSession) -> Neo4jTransaction:
         """
-        Begin a transaction in the given session.
+        Begin a transaction in the given session. Through the proxy, the transaction is only
+        opened once its queries are sent.
 
         @param session: Database session.
         @return: Transaction.
         """
+        if self._proxy:
+            return session.begin_transaction(lazy=True)
         return session.begin_transaction()
 
     def _close_transaction(self, tx: Neo4jTransaction) -> None:
@@ -135,6 +315,28 @@ class Neo4jDatabase(Database):
         """
         return self._execute_query(tx, query, parameters)
 
+    def _write_in_transaction(
+        self,
+        session: Neo4jSession,
+        tx: Neo4jTransaction,
+        query: str,
+        parameters: Optional[Dict] = None,
+    ) -> None:
+        """
+        Execute a write query, whose results are not needed, in the given transaction.
+        Through the proxy, the query is queued and sent in one batch request with the other
+        queries of the transaction when it is committed.
+
+        @param session: Database session.
+        @param tx: Current transaction.
+        @param query: Query to run.
+        @param parameters: Parameters for the query.
+        """
+        if self._proxy:
+            tx.queue(query, parameters)
+        else:
+            self._execute_query(tx, query, parameters)
+
     def _generate_query_strings(
         self, alias: str, schema: List[Schema]
     ) -> Tuple[str, List[str]]:
@@ -152,79 +354,417 @@ class Neo4jDatabase(Database):
         fields = [s.field_name for s in schema]
         return properties_str, fields
 
-    def _write_to_csv(
-        self, file_name: str, records: List[Dict], fields: List[str]
-    ) -> None:
-        """
-        Utility method to write records to a CSV file.
+    def _export_to_csv(
+        self,
+        session: Neo4jSession,
+        file_name: str,
+        query: str,
+        fields: List[str],
+        batch_size: int,
+        progress: Optional[Callable[[ExportStats], None]],
+        transform: Optional[Callable[[Sequence], Sequence]] = None,
+        quoting: int = csv.QUOTE_MINIMAL,
+    ) -> ExportStats:
+        """
+        Stream the results of an export query into a CSV file. The records are appended in
+        batches while they are fetched, so the memory use does not depend on the result size.
 
+        @param session: Database session.
         @param file_name: Name and path of the output file.
-        @param records: Records to be written.
+        @param query: Export query.
         @param fields: Column titles for the records.
+        @param batch_size: Number of records appended at a time.
+        @param progress: Function called with the export statistics after every batch.
+        @param transform: Function converting a record into the values of a row, for example to
+                          join member lists. Defaults to None.
+        @param quoting: Quoting behaviour of the csv module. Defaults to csv.QUOTE_MINIMAL.
+        @return: Export statistics.
+        """
+        records = self._stream_query(session, query)
+        if transform is not None:
+            records = map(transform, records)
+        with CsvExportWriter(file_name, fields, quoting, progress) as writer:
+            for batch in iter_batches(records, batch_size):
+                writer.write(batch)
+        return writer.stats
+
+    def _stream_query(
+        self, session: Neo4jSession, query: str, parameters: Optional[Dict] = None
+    ) -> Iterator[Any]:
         """
-        df = pd.DataFrame(records, columns=fields)
-        df.to_csv(file_name, index=False, header=True)
+        Run a read query and iterate over its records while they are fetched, instead of
+        materializing the full result. Through the proxy, the records are streamed as NDJSON.
 
-    def export_nodes_to_csv(
+        @param session: Database session.
+        @param query: Query to run.
+        @param parameters: Parameters for the query.
+        @return: Iterator over the records.
+        """
+        if self._proxy:
+            yield from session.stream(query, parameters)
+        else:
+            yield from session.run(query, parameters or {})
+
+    @staticmethod
+    def _since_clause(var: str, since: Optional[int]) -> str:
+        """
+        WHERE clause restricting an export to the elements changed after a version.
+
+        @param var: Variable of the exported element.
+        @param since: Version, or None to export all elements.
+        @return: WHERE clause, or an empty string.
+        """
+        return "" if since is None else f" WHERE {var}._version > {int(since)}"
+
+    @staticmethod
+    def _tombstone_clause(
+        var: str,
+        relationship: bool = False,
+        start_keys: List[str] = (),
+        end_keys: List[str] = (),
+    ) -> str:
+        """
+        Clauses leaving a tombstone for an element about to be deleted. The tombstone holds
+        the properties and labels (or type) of the element and the version of the deletion,
+        which the query binds to 'version'. The tombstone of a relationship also holds the
+        given properties of its start and end nodes as _start_<key> and _end_<key>. The HO
+        elements the deleted element is a member of are marked as changed.
+
+        @param var: Variable of the deleted element, which may be null.
+        @param relationship: Whether the element is a relationship. Defaults to False.
+        @param start_keys: Property keys of the start node to keep. Defaults to none.
+        @param end_keys: Property keys of the end node to keep. Defaults to none.
+        @return: Cypher clauses.
+        """
+        labels = "[type(x)]" if relationship else "labels(x)"
+        endpoints = "".join(
+            f", t.`_start_{key}` = startNode(x).`{key}`" for key in start_keys
+        ) + "".join(f", t.`_end_{key}` = endNode(x).`{key}`" for key in end_keys)
+        clauses = f"""
+        FOREACH (x IN CASE WHEN {var} IS NULL THEN [] ELSE [{var}] END |
+            CREATE (t:_tombstone) SET t = properties(x), t._labels = {labels}, t._version = version{endpoints}
+        )"""
+        if not relationship:
+            clauses += Neo4jDatabase._touch_clause(var)
+        return clauses
+
+    @staticmethod
+    def _touch_clause(var: str) -> str:
+        """
+        Clause marking the HO elements a node is a member of as changed, with the version
+        the query binds to 'version'.
+
+        @param var: Variable of the member node, which may be null.
+        @return: Cypher clause.
+        """
+        return f"""
+        FOREACH (c IN CASE WHEN {var} IS NULL THEN [] ELSE [({var})-->(c:{_CONTAINER_LABELS}) | c] END |
+            SET c._version = version
+        )"""
+
+    def current_version(self, session: Neo4jSession) -> int:
+        """
+        Current change version, the value of the counter every tracked write advances. Note it
+        before an export and pass it as 'since' to the next export to only export the elements
+        changed in between.
+
+        @param session: Database session.
+        @return: Current version, 0 before the first tracked write.
+        """
+        records = self._execute_query(
+            session,
+            "OPTIONAL MATCH (c:_version_counter) RETURN coalesce(max(c.value), 0) AS version",
+        )
+        return records[0][0]
+
+    def _export_to_arrow(
         self,
         session: Neo4jSession,
         file_name: str,
+        query: str,
+        fields: List[Any],
+        file_format: str,
+        compression: str,
+        batch_size: int,
+        progress: Optional[Callable[[ExportStats], None]],
+    ) -> ExportStats:
+        """
+        Stream the results of an export query into a Parquet or Arrow IPC file.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param query: Export query.
+        @param fields: Arrow fields of the returned columns.
+        @param file_format: Either 'parquet' or 'arrow'.
+        @param compression: Compression codec.
+        @param batch_size: Number of records per record batch.
+        @param progress: Function called with the export statistics after every batch.
+        @return: Export statistics.
+        """
+        with ArrowExportWriter(
+            file_name, fields, file_format, compression, progress
+        ) as writer:
+            for batch in iter_batches(self._stream_query(session, query), batch_size):
+                writer.write(batch)
+        return writer.stats
+
+    def _nodes_export_query(
+        self,
         labels: List[Label],
         node_schema: List[Schema],
-    ) -> None:
+        since: Optional[int] = None,
+    ) -> Tuple[str, List[str]]:
         """
-        Export nodes to a CSV file.
+        Query returning the nodes to export.
 
-        @param session: Database session.
-        @param file_name: Name and path of the output file.
         @param labels: List of node labels to export.
         @param node_schema: List of property schemas for the nodes.
+        @param since: Only export elements changed after this version. Defaults to None.
+        @return: Tuple of the query and the names of the returned columns.
         """
-        labels_str = self.format_labels(labels)
         properties_str, fields = self._generate_query_strings("n", node_schema)
         query = f"""
-        MATCH (n{labels_str})
+        MATCH (n{self.format_labels(labels)}){self._since_clause("n", since)}
         RETURN {properties_str}
         """
-        self._write_to_csv(file_name, self._execute_query(session, query), fields)
+        return query, fields
 
-    def export_edges_to_csv(
+    def export_nodes_to_csv(
+        self,
+        session: Neo4jSession,
+        file_name: str,
+        labels: List[Label],
+        node_schema: List[Schema],
+        batch_size: int = 10000,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export nodes to a CSV file.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param labels: List of node labels to export.
+        @param node_schema: List of property schemas for the nodes.
+        @param batch_size: Number of records appended at a time. Defaults to 10000.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        query, fields = self._nodes_export_query(labels, node_schema, since)
+        return self._export_to_csv(
+            session, file_name, query, fields, batch_size, progress
+        )
+
+    def export_nodes_to_parquet(
+        self,
+        session: Neo4jSession,
+        file_name: str,
+        labels: List[Label],
+        node_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export nodes to a Parquet file with typed columns.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param labels: List of node labels to export.
+        @param node_schema: List of property schemas for the nodes.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of nodes per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        query, _ = self._nodes_export_query(labels, node_schema, since)
+        return self._export_to_arrow(
+            session,
+            file_name,
+            query,
+            arrow_fields(node_schema),
+            "parquet",
+            compression,
+            batch_size,
+            progress,
+        )
+
+    def export_nodes_to_arrow(
         self,
         session: Neo4jSession,
         file_name: str,
+        labels: List[Label],
+        node_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export nodes to an Arrow IPC file with typed columns.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param labels: List of node labels to export.
+        @param node_schema: List of property schemas for the nodes.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of nodes per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        query, _ = self._nodes_export_query(labels, node_schema, since)
+        return self._export_to_arrow(
+            session,
+            file_name,
+            query,
+            arrow_fields(node_schema),
+            "arrow",
+            compression,
+            batch_size,
+            progress,
+        )
+
+    def _edges_export_query(
+        self,
         start_labels: List[Label],
         start_schema: List[Schema],
         end_labels: List[Label],
         end_schema: List[Schema],
         edge_label: Label,
         edge_schema: List[Schema],
-    ) -> None:
+        since: Optional[int] = None,
+    ) -> Tuple[str, List[str]]:
         """
-        Export edges to a CSV file.
+        Query returning the edges to export.
 
-        @param session: Database session.
-        @param file_name: Name and path of the output file.
         @param start_labels: List of labels for the start nodes.
         @param start_schema: List of property schemas for the start nodes.
         @param end_labels: List of labels for the end nodes.
         @param end_schema: List of property schemas for the end nodes.
         @param edge_label: Export edges with that label.
         @param edge_schema: List of property schemas for the edges.
+        @param since: Only export elements changed after this version. Defaults to None.
+        @return: Tuple of the query and the names of the returned columns.
         """
         start_str, start_fields = self._generate_query_strings("s", start_schema)
         end_str, end_fields = self._generate_query_strings("e", end_schema)
         edge_str, edge_fields = self._generate_query_strings("r", edge_schema)
         query = f"""
-        MATCH (s{self.format_labels(start_labels)})-[r:{edge_label}]->(e{self.format_labels(end_labels)})
+        MATCH (s{self.format_labels(start_labels)})-[r:{edge_label}]->(e{self.format_labels(end_labels)}){self._since_clause("r", since)}
         RETURN {start_str}, {end_str}, {edge_str}
         """
-        self._write_to_csv(
+        return query, start_fields + end_fields + edge_fields
+
+    def export_edges_to_csv(
+        self,
+        session: Neo4jSession,
+        file_name: str,
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+        batch_size: int = 10000,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export edges to a CSV file.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param edge_label: Export edges with that label.
+        @param edge_schema: List of property schemas for the edges.
+        @param batch_size: Number of records appended at a time. Defaults to 10000.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        query, fields = self._edges_export_query(
+            start_labels,
+            start_schema,
+            end_labels,
+            end_schema,
+            edge_label,
+            edge_schema,
+            since,
+        )
+        return self._export_to_csv(
+            session, file_name, query, fields, batch_size, progress
+        )
+
+    def export_edges_to_parquet(
+        self,
+        session: Neo4jSession,
+        file_name: str,
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export edges to a Parquet file with typed columns.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param edge_label: Export edges with that label.
+        @param edge_schema: List of property schemas for the edges.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of edges per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        query, _ = self._edges_export_query(
+            start_labels,
+            start_schema,
+            end_labels,
+            end_schema,
+            edge_label,
+            edge_schema,
+            since,
+        )
+        return self._export_to_arrow(
+            session,
             file_name,
-            self._execute_query(session, query),
-            start_fields + end_fields + edge_fields,
+            query,
+            arrow_fields(start_schema + end_schema + edge_schema),
+            "parquet",
+            compression,
+            batch_size,
+            progress,
         )
 
-    def export_node_edges_to_csv(
+    def export_edges_to_arrow(
         self,
         session: Neo4jSession,
         file_name: str,
@@ -232,15 +772,66 @@ class Neo4jDatabase(Database):
         start_schema: List[Schema],
         end_labels: List[Label],
         end_schema: List[Schema],
-        node_edge_labels: List[Label],
-        node_edge_schema: List[Schema],
         edge_label: Label,
-    ) -> None:
+        edge_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
         """
-        Export HO edges to a CSV file.
+        Export edges to an Arrow IPC file with typed columns.
 
         @param session: Database session.
         @param file_name: Name and path of the output file.
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param edge_label: Export edges with that label.
+        @param edge_schema: List of property schemas for the edges.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of edges per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        query, _ = self._edges_export_query(
+            start_labels,
+            start_schema,
+            end_labels,
+            end_schema,
+            edge_label,
+            edge_schema,
+            since,
+        )
+        return self._export_to_arrow(
+            session,
+            file_name,
+            query,
+            arrow_fields(start_schema + end_schema + edge_schema),
+            "arrow",
+            compression,
+            batch_size,
+            progress,
+        )
+
+    def _node_edges_export_query(
+        self,
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+        node_edge_labels: List[Label],
+        node_edge_schema: List[Schema],
+        edge_label: Label,
+        since: Optional[int] = None,
+    ) -> Tuple[str, List[str]]:
+        """
+        Query returning the HO edges to export.
+
         @param start_labels: List of labels for the start nodes.
         @param start_schema: List of property schemas for the start nodes.
         @param end_labels: List of labels for the end nodes.
@@ -248,6 +839,8 @@ class Neo4jDatabase(Database):
         @param node_edge_labels: List of labels for the HO edges.
         @param node_edge_schema: List of property schemas for the HO edges.
         @param edge_label: Label of the edges to the HO edges.
+        @param since: Only export elements changed after this version. Defaults to None.
+        @return: Tuple of the query and the names of the returned columns.
         """
         start_properties_str, start_fields = self._generate_query_strings(
             "s", start_schema
@@ -257,176 +850,1392 @@ class Neo4jDatabase(Database):
             "edge_node", node_edge_schema
         )
         query = f"""
-        MATCH (edge_node{self.format_labels(node_edge_labels)})
+        MATCH (edge_node{self.format_labels(node_edge_labels)}){self._since_clause("edge_node", since)}
         MATCH (s{self.format_labels(start_labels)})-[:{edge_label}]->(edge_node)-[:{edge_label}]->(e{self.format_labels(end_labels)})
         RETURN {start_properties_str}, {end_properties_str}, {edge_properties_str}
         """
-        self._write_to_csv(
-            file_name,
-            self._execute_query(session, query),
-            start_fields + end_fields + edge_fields,
-        )
+        return query, start_fields + end_fields + edge_fields
 
-    def export_hyperedges_to_csv(
+    def export_node_edges_to_csv(
         self,
         session: Neo4jSession,
         file_name: str,
-        node_labels: List[Label],
-        node_schema: Schema,
-        hyperedge_labels: List[Label],
-        hyperedge_schema: List[Schema],
-    ) -> None:
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+        node_edge_labels: List[Label],
+        node_edge_schema: List[Schema],
+        edge_label: Label,
+        batch_size: int = 10000,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
         """
-        Export hyperedges to a CSV file, which are modeled as nodes in our Neo4j implementation.
+        Export HO edges to a CSV file.
 
         @param session: Database session.
         @param file_name: Name and path of the output file.
-        @param node_labels: List of node labels.
-        @param node_schema: Property schema for the nodes.
-        @param hyperedge_labels: Export hyperedges with those labels.
-        @param hyperedge_schema: List of property schemas for the hyperedges.
-        """
-        _, node_fields = self._generate_query_strings("e", [node_schema])
-        hyperedge_properties_str, hyperedge_fields = self._generate_query_strings(
-            "hyperedge_node", hyperedge_schema
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param node_edge_labels: List of labels for the HO edges.
+        @param node_edge_schema: List of property schemas for the HO edges.
+        @param edge_label: Label of the edges to the HO edges.
+        @param batch_size: Number of records appended at a time. Defaults to 10000.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        query, fields = self._node_edges_export_query(
+            start_labels,
+            start_schema,
+            end_labels,
+            end_schema,
+            node_edge_labels,
+            node_edge_schema,
+            edge_label,
+            since,
         )
-        hyperedge_labels_str = self.format_labels(hyperedge_labels)
-        query = f"""
-        MATCH (hyperedge_node{hyperedge_labels_str})
-        WITH hyperedge_node, [(n{self.format_labels(node_labels)})-[r:_adjacency]->(hyperedge_node) | n.{node_schema.property_name}] AS node_list
-        WITH hyperedge_node, REDUCE(s = "", name IN node_list | 
-                CASE 
-                    WHEN s = "" THEN name 
-                    ELSE s + ";" + name 
-                END) AS {node_schema.field_name},{hyperedge_properties_str}
-        RETURN {node_schema.field_name}, {hyperedge_properties_str}
-        """
-        self._write_to_csv(
-            file_name,
-            self._execute_query(session, query),
-            node_fields + hyperedge_fields,
+        return self._export_to_csv(
+            session, file_name, query, fields, batch_size, progress
         )
 
-    def export_subgraphs_to_csv(
+    def export_node_edges_to_parquet(
         self,
         session: Neo4jSession,
         file_name: str,
-        node_schema: Schema,
-        edge_schema: Schema,
-        subgraph_labels: List[Label],
-        subgraph_schema: List[Schema],
-    ) -> None:
-        """
-        Export subgraph collections to a CSV file, which are modeled as nodes in our Neo4j
-        implementation.
-
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+        node_edge_labels: List[Label],
+        node_edge_schema: List[Schema],
+        edge_label: Label,
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export HO edges to a Parquet file with typed columns.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param node_edge_labels: List of labels for the HO edges.
+        @param node_edge_schema: List of property schemas for the HO edges.
+        @param edge_label: Label of the edges to the HO edges.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of HO edges per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        query, _ = self._node_edges_export_query(
+            start_labels,
+            start_schema,
+            end_labels,
+            end_schema,
+            node_edge_labels,
+            node_edge_schema,
+            edge_label,
+            since,
+        )
+        return self._export_to_arrow(
+            session,
+            file_name,
+            query,
+            arrow_fields(start_schema + end_schema + node_edge_schema),
+            "parquet",
+            compression,
+            batch_size,
+            progress,
+        )
+
+    def export_node_edges_to_arrow(
+        self,
+        session: Neo4jSession,
+        file_name: str,
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+        node_edge_labels: List[Label],
+        node_edge_schema: List[Schema],
+        edge_label: Label,
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export HO edges to an Arrow IPC file with typed columns.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param node_edge_labels: List of labels for the HO edges.
+        @param node_edge_schema: List of property schemas for the HO edges.
+        @param edge_label: Label of the edges to the HO edges.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of HO edges per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        query, _ = self._node_edges_export_query(
+            start_labels,
+            start_schema,
+            end_labels,
+            end_schema,
+            node_edge_labels,
+            node_edge_schema,
+            edge_label,
+            since,
+        )
+        return self._export_to_arrow(
+            session,
+            file_name,
+            query,
+            arrow_fields(start_schema + end_schema + node_edge_schema),
+            "arrow",
+            compression,
+            batch_size,
+            progress,
+        )
+
+    def _hyperedges_export_query(
+        self,
+        node_labels: List[Label],
+        node_schema: Schema,
+        hyperedge_labels: List[Label],
+        hyperedge_schema: List[Schema],
+        since: Optional[int] = None,
+    ) -> Tuple[str, List[str]]:
+        """
+        Query returning the hyperedges to export, with the member nodes as a list.
+
+        @param node_labels: List of node labels.
+        @param node_schema: Property schema for the nodes.
+        @param hyperedge_labels: Export hyperedges with those labels.
+        @param hyperedge_schema: List of property schemas for the hyperedges.
+        @param since: Only export elements changed after this version. Defaults to None.
+        @return: Tuple of the query and the names of the returned columns.
+        """
+        hyperedge_properties_str, hyperedge_fields = self._generate_query_strings(
+            "hyperedge_node", hyperedge_schema
+        )
+        query = f"""
+        MATCH (hyperedge_node{self.format_labels(hyperedge_labels)}){self._since_clause("hyperedge_node", since)}
+        WITH hyperedge_node, [(n{self.format_labels(node_labels)})-[r:_adjacency]->(hyperedge_node) | n.{node_schema.property_name}] AS node_list
+        RETURN node_list AS {node_schema.field_name}, {hyperedge_properties_str}
+        """
+        return query, [node_schema.field_name] + hyperedge_fields
+
+    def export_hyperedges_to_csv(
+        self,
+        session: Neo4jSession,
+        file_name: str,
+        node_labels: List[Label],
+        node_schema: Schema,
+        hyperedge_labels: List[Label],
+        hyperedge_schema: List[Schema],
+        batch_size: int = 10000,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export hyperedges to a CSV file, which are modeled as nodes in our Neo4j implementation.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param node_labels: List of node labels.
+        @param node_schema: Property schema for the nodes.
+        @param hyperedge_labels: Export hyperedges with those labels.
+        @param hyperedge_schema: List of property schemas for the hyperedges.
+        @param batch_size: Number of records appended at a time. Defaults to 10000.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        query, fields = self._hyperedges_export_query(
+            node_labels, node_schema, hyperedge_labels, hyperedge_schema, since
+        )
+        return self._export_to_csv(
+            session,
+            file_name,
+            query,
+            fields,
+            batch_size,
+            progress,
+            lambda record: [";".join(map(str, record[0]))] + list(record[1:]),
+        )
+
+    def export_hyperedges_to_parquet(
+        self,
+        session: Neo4jSession,
+        file_name: str,
+        node_labels: List[Label],
+        node_schema: Schema,
+        hyperedge_labels: List[Label],
+        hyperedge_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export hyperedges to a Parquet file. The member nodes are stored as a list column.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param node_labels: List of node labels.
+        @param node_schema: Property schema for the nodes.
+        @param hyperedge_labels: Export hyperedges with those labels.
+        @param hyperedge_schema: List of property schemas for the hyperedges.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of hyperedges per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        query, _ = self._hyperedges_export_query(
+            node_labels, node_schema, hyperedge_labels, hyperedge_schema, since
+        )
+        return self._export_to_arrow(
+            session,
+            file_name,
+            query,
+            [list_field(node_schema)] + arrow_fields(hyperedge_schema),
+            "parquet",
+            compression,
+            batch_size,
+            progress,
+        )
+
+    def export_hyperedges_to_arrow(
+        self,
+        session: Neo4jSession,
+        file_name: str,
+        node_labels: List[Label],
+        node_schema: Schema,
+        hyperedge_labels: List[Label],
+        hyperedge_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export hyperedges to an Arrow IPC file. The member nodes are stored as a list column.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param node_labels: List of node labels.
+        @param node_schema: Property schema for the nodes.
+        @param hyperedge_labels: Export hyperedges with those labels.
+        @param hyperedge_schema: List of property schemas for the hyperedges.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of hyperedges per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        query, _ = self._hyperedges_export_query(
+            node_labels, node_schema, hyperedge_labels, hyperedge_schema, since
+        )
+        return self._export_to_arrow(
+            session,
+            file_name,
+            query,
+            [list_field(node_schema)] + arrow_fields(hyperedge_schema),
+            "arrow",
+            compression,
+            batch_size,
+            progress,
+        )
+
+    def _subgraphs_export_query(
+        self,
+        node_schema: Schema,
+        edge_schema: Schema,
+        subgraph_labels: List[Label],
+        subgraph_schema: List[Schema],
+        since: Optional[int] = None,
+    ) -> Tuple[str, List[str]]:
+        """
+        Query returning the subgraph collections to export, with the member nodes as a list
+        and the member edges as a list of {start, end} maps.
+
+        @param node_schema: Node schema.
+        @param edge_schema: Edge schema.
+        @param subgraph_labels: List of subgraph collection labels to export.
+        @param subgraph_schema: List of property schemas for the subgraph collections.
+        @param since: Only export elements changed after this version. Defaults to None.
+        @return: Tuple of the query and the names of the returned columns.
+        """
+        subgraph_properties_str, subgraph_fields = self._generate_query_strings(
+            "subgraph_node", subgraph_schema
+        )
+        query = f"""
+        MATCH (subgraph_node{self.format_labels(subgraph_labels)}){self._since_clause("subgraph_node", since)}
+        WITH subgraph_node, [(n:_node)-[:_node_membership]->(subgraph_node) | n.{node_schema.property_name}] AS node_list, [(s:_node)-[:_adjacency]->(edge:_edge)-[:_adjacency]->(e:_node) WHERE (edge)-[:_edge_membership]->(subgraph_node) | {{start: s.{edge_schema.property_name}, end: e.{edge_schema.property_name}}}] AS edge_list
+        RETURN node_list AS {node_schema.field_name}, edge_list AS {edge_schema.field_name}, {subgraph_properties_str}
+        """
+        return query, [node_schema.field_name, edge_schema.field_name] + subgraph_fields
+
+    def export_subgraphs_to_csv(
+        self,
+        session: Neo4jSession,
+        file_name: str,
+        node_schema: Schema,
+        edge_schema: Schema,
+        subgraph_labels: List[Label],
+        subgraph_schema: List[Schema],
+        batch_size: int = 10000,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export subgraph collections to a CSV file, which are modeled as nodes in our Neo4j
+        implementation.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param node_schema: Node schema.
+        @param edge_schema: Edge schema.
+        @param subgraph_labels: List of subgraph collection labels to export.
+        @param subgraph_schema: List of property schemas for the subgraph collections.
+        @param batch_size: Number of records appended at a time. Defaults to 10000.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        query, fields = self._subgraphs_export_query(
+            node_schema, edge_schema, subgraph_labels, subgraph_schema, since
+        )
+        return self._export_to_csv(
+            session,
+            file_name,
+            query,
+            fields,
+            batch_size,
+            progress,
+            lambda record: [
+                ";".join(map(str, record[0])),
+                ";".join(f"{e['start']}:{e['end']}" for e in record[1]),
+            ]
+            + list(record[2:]),
+            csv.QUOTE_NONE,
+        )
+
+    def export_subgraphs_to_parquet(
+        self,
+        session: Neo4jSession,
+        file_name: str,
+        node_schema: Schema,
+        edge_schema: Schema,
+        subgraph_labels: List[Label],
+        subgraph_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export subgraph collections to a Parquet file. The member nodes are stored as a list
+        column, the member edges as a list of (start, end) structs.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param node_schema: Node schema.
+        @param edge_schema: Edge schema.
+        @param subgraph_labels: List of subgraph collection labels to export.
+        @param subgraph_schema: List of property schemas for the subgraph collections.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of subgraphs per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        query, _ = self._subgraphs_export_query(
+            node_schema, edge_schema, subgraph_labels, subgraph_schema, since
+        )
+        return self._export_to_arrow(
+            session,
+            file_name,
+            query,
+            [list_field(node_schema), pair_list_field(edge_schema)]
+            + arrow_fields(subgraph_schema),
+            "parquet",
+            compression,
+            batch_size,
+            progress,
+        )
+
+    def export_subgraphs_to_arrow(
+        self,
+        session: Neo4jSession,
+        file_name: str,
+        node_schema: Schema,
+        edge_schema: Schema,
+        subgraph_labels: List[Label],
+        subgraph_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export subgraph collections to an Arrow IPC file. The member nodes are stored as a list
+        column, the member edges as a list of (start, end) structs.
+
         @param session: Database session.
         @param file_name: Name and path of the output file.
         @param node_schema: Node schema.
         @param edge_schema: Edge schema.
         @param subgraph_labels: List of subgraph collection labels to export.
         @param subgraph_schema: List of property schemas for the subgraph collections.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of subgraphs per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        query, _ = self._subgraphs_export_query(
+            node_schema, edge_schema, subgraph_labels, subgraph_schema, since
+        )
+        return self._export_to_arrow(
+            session,
+            file_name,
+            query,
+            [list_field(node_schema), pair_list_field(edge_schema)]
+            + arrow_fields(subgraph_schema),
+            "arrow",
+            compression,
+            batch_size,
+            progress,
+        )
+
+    def _node_tuples_export_query(
+        self,
+        node_schema: Schema,
+        tuple_labels: List[Label],
+        tuple_schema: List[Schema],
+        since: Optional[int] = None,
+    ) -> Tuple[str, List[str]]:
+        """
+        Query returning the node-tuples to export, with the member nodes as a list ordered by
+        their position and the positions as a second list.
+
+        @param node_schema: Property schema for the nodes.
+        @param tuple_labels: Export node-tuples with those labels.
+        @param tuple_schema: List of property schemas for the node-tuples.
+        @param since: Only export elements changed after this version. Defaults to None.
+        @return: Tuple of the query and the names of the returned columns.
+        """
+        tuple_properties_str, tuple_fields = self._generate_query_strings(
+            "tuple_node", tuple_schema
+        )
+        positions = f"{node_schema.field_name}_position"
+        query = f"""
+        MATCH (tuple_node:_node_tuple{self.format_labels(tuple_labels)}){self._since_clause("tuple_node", since)}
+        WITH tuple_node, COLLECT {{
+            MATCH (n:_node)-[r:_node_membership]->(tuple_node)
+            RETURN {{prop: n.{node_schema.property_name}, pos: r.position_in_tuple}}
+            ORDER BY r.position_in_tuple
+        }} AS node_list
+        RETURN [x IN node_list | x.prop] AS {node_schema.field_name}, [x IN node_list | x.pos] AS {positions}, {tuple_properties_str}
+        """
+        return query, [node_schema.field_name, positions] + tuple_fields
+
+    def export_node_tuples_to_csv(
+        self,
+        session: Neo4jSession,
+        file_name: str,
+        node_schema: Schema,
+        tuple_labels: List[Label],
+        tuple_schema: List[Schema],
+        batch_size: int = 10000,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export node-tuples to a CSV file, which are modeled as nodes in our Neo4j implementation.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param node_schema: Property schema for the nodes.
+        @param tuple_labels: Export node-tuples with those labels.
+        @param tuple_schema: List of property schemas for the node-tuples.
+        @param batch_size: Number of records appended at a time. Defaults to 10000.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        query, fields = self._node_tuples_export_query(
+            node_schema, tuple_labels, tuple_schema, since
+        )
+        # the positions are implied by the order of the joined nodes
+        return self._export_to_csv(
+            session,
+            file_name,
+            query,
+            [fields[0]] + fields[2:],
+            batch_size,
+            progress,
+            lambda record: [";".join(map(str, record[0]))] + list(record[2:]),
+            csv.QUOTE_NONE,
+        )
+
+    def export_node_tuples_to_parquet(
+        self,
+        session: Neo4jSession,
+        file_name: str,
+        node_schema: Schema,
+        tuple_labels: List[Label],
+        tuple_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export node-tuples to a Parquet file. The member nodes are stored as a list column in
+        tuple order, next to a '<field>_position' list column holding their positions.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param node_schema: Property schema for the nodes.
+        @param tuple_labels: Export node-tuples with those labels.
+        @param tuple_schema: List of property schemas for the node-tuples.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of node-tuples per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        query, fields = self._node_tuples_export_query(
+            node_schema, tuple_labels, tuple_schema, since
+        )
+        return self._export_to_arrow(
+            session,
+            file_name,
+            query,
+            [list_field(node_schema), list_field(Schema(fields[1], int))]
+            + arrow_fields(tuple_schema),
+            "parquet",
+            compression,
+            batch_size,
+            progress,
+        )
+
+    def export_node_tuples_to_arrow(
+        self,
+        session: Neo4jSession,
+        file_name: str,
+        node_schema: Schema,
+        tuple_labels: List[Label],
+        tuple_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export node-tuples to an Arrow IPC file. The member nodes are stored as a list column in
+        tuple order, next to a '<field>_position' list column holding their positions.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param node_schema: Property schema for the nodes.
+        @param tuple_labels: Export node-tuples with those labels.
+        @param tuple_schema: List of property schemas for the node-tuples.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of node-tuples per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        query, fields = self._node_tuples_export_query(
+            node_schema, tuple_labels, tuple_schema, since
+        )
+        return self._export_to_arrow(
+            session,
+            file_name,
+            query,
+            [list_field(node_schema), list_field(Schema(fields[1], int))]
+            + arrow_fields(tuple_schema),
+            "arrow",
+            compression,
+            batch_size,
+            progress,
+        )
+
+    def _tombstones_export_query(
+        self, labels: List[Label], schema: List[Schema], since: Optional[int] = None
+    ) -> Tuple[str, List[str]]:
+        """
+        Query returning the tombstones of deleted elements.
+
+        @param labels: Export tombstones of elements with all of those labels (or that type).
+        @param schema: List of property schemas of the deleted elements.
+        @param since: Only export elements deleted after this version. Defaults to None.
+        @return: Tuple of the query and the names of the returned columns.
+        """
+        properties_str, fields = self._generate_query_strings("t", schema)
+        labels_str = ", ".join(f"'{label}'" for label in labels)
+        since_str = "" if since is None else f" AND t._version > {int(since)}"
+        query = f"""
+        MATCH (t:_tombstone)
+        WHERE all(label IN [{labels_str}] WHERE label IN t._labels){since_str}
+        RETURN {properties_str}, t._version AS _version
+        """
+        return query, fields + ["_version"]
+
+    def export_tombstones_to_csv(
+        self,
+        session: Neo4jSession,
+        file_name: str,
+        labels: List[Label],
+        schema: List[Schema],
+        since: Optional[int] = None,
+        batch_size: int = 10000,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+    ) -> ExportStats:
+        """
+        Export the tombstones of deleted elements to a CSV file, with the version of the
+        deletion in the '_version' column.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param labels: Export tombstones of elements with all of those labels (or that type).
+        @param schema: List of property schemas of the deleted elements.
+        @param since: Only export elements deleted after this version. Defaults to None.
+        @param batch_size: Number of records appended at a time. Defaults to 10000.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @return: Export statistics.
+        """
+        query, fields = self._tombstones_export_query(labels, schema, since)
+        return self._export_to_csv(
+            session, file_name, query, fields, batch_size, progress
+        )
+
+    def export_tombstones_to_parquet(
+        self,
+        session: Neo4jSession,
+        file_name: str,
+        labels: List[Label],
+        schema: List[Schema],
+        since: Optional[int] = None,
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+    ) -> ExportStats:
+        """
+        Export the tombstones of deleted elements to a Parquet file, with the version of the
+        deletion in the '_version' column.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param labels: Export tombstones of elements with all of those labels (or that type).
+        @param schema: List of property schemas of the deleted elements.
+        @param since: Only export elements deleted after this version. Defaults to None.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of tombstones per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @return: Export statistics.
+        """
+        query, _ = self._tombstones_export_query(labels, schema, since)
+        return self._export_to_arrow(
+            session,
+            file_name,
+            query,
+            arrow_fields(schema + [Schema("_version", int)]),
+            "parquet",
+            compression,
+            batch_size,
+            progress,
+        )
+
+    def export_tombstones_to_arrow(
+        self,
+        session: Neo4jSession,
+        file_name: str,
+        labels: List[Label],
+        schema: List[Schema],
+        since: Optional[int] = None,
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+    ) -> ExportStats:
+        """
+        Export the tombstones of deleted elements to an Arrow IPC file, with the version of the
+        deletion in the '_version' column.
+
+        @param session: Database session.
+        @param file_name: Name and path of the output file.
+        @param labels: Export tombstones of elements with all of those labels (or that type).
+        @param schema: List of property schemas of the deleted elements.
+        @param since: Only export elements deleted after this version. Defaults to None.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of tombstones per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @return: Export statistics.
+        """
+        query, _ = self._tombstones_export_query(labels, schema, since)
+        return self._export_to_arrow(
+            session,
+            file_name,
+            query,
+            arrow_fields(schema + [Schema("_version", int)]),
+            "arrow",
+            compression,
+            batch_size,
+            progress,
+        )
+
+    def _load_csv_query(
+        self,
+        file_name: str,
+        body: str,
+        as_url: bool,
+        batch_size: int,
+        delimiter: str,
+        returns: str = "",
+        checkpoint: str = None,
+    ) -> str:
+        """
+        Build a LOAD CSV query that runs the given per-row statements in batched transactions.
+        With a checkpoint, each transaction also records the line number of its last row and
+        rows up to the line number in the $line parameter are skipped.
+
+        @param file_name: Name and path of the input file.
+        @param body: Cypher statements run for each row.
+        @param as_url: Treat file_name as URL.
+        @param batch_size: Number of rows per transaction.
+        @param delimiter: Delimiter used in the CSV file.
+        @param returns: Clauses returning the unresolved member keys of the per-row statements.
+                        Defaults to ''.
+        @param checkpoint: Name of the import checkpoint. Defaults to None.
+        @return: LOAD CSV query.
+        """
+        file_path = file_name if as_url else f"file:///{file_name}"
+        if checkpoint is None:
+            return f"""
+        LOAD CSV WITH HEADERS FROM '{file_path}'
+        AS row
+        FIELDTERMINATOR '{delimiter}'
+        CALL(row) {{{body}}} IN TRANSACTIONS OF {batch_size} ROWS
+        {returns}
+        """
+        return f"""
+        LOAD CSV WITH HEADERS FROM '{file_path}'
+        AS row
+        FIELDTERMINATOR '{delimiter}'
+        WITH row, linenumber() AS line_number
+        WHERE line_number > $line
+        CALL(row, line_number) {{
+          CALL(row) {{{body}}}
+          MERGE (checkpoint:_import_checkpoint {{name: $checkpoint}})
+          SET checkpoint.line = line_number
+          {"RETURN unresolved" if returns else ""}
+        }} IN TRANSACTIONS OF {batch_size} ROWS
+        {returns}
+        """
+
+    def _run_load_csv(
+        self, session: Neo4jSession, query: str, checkpoint: str = None
+    ) -> List[Any]:
+        """
+        Run a LOAD CSV import, resuming after the last line committed under its checkpoint.
+        The checkpoint is deleted once the import completes.
+
+        @param session: Database session.
+        @param query: LOAD CSV query.
+        @param checkpoint: Name of the import checkpoint. Defaults to None.
+        @return: Values of the first column returned by the query.
+        """
+        if checkpoint is None:
+            return [record[0] for record in self._execute_query(session, query)]
+        committed = self._execute_query(
+            session,
+            "MATCH (c:_import_checkpoint {name: $checkpoint}) RETURN max(c.line)",
+            {"checkpoint": checkpoint},
+        )
+        line = committed[0][0] if committed and committed[0][0] is not None else 0
+        results = self._execute_query(
+            session, query, {"checkpoint": checkpoint, "line": line}
+        )
+        self.delete_import_checkpoint(session, checkpoint)
+        return [record[0] for record in results]
+
+    def delete_import_checkpoint(self, session: Neo4jSession, checkpoint: str) -> None:
+        """
+        Delete the progress recorded for a resumable import, so that it starts over when run
+        again. Completed imports delete their checkpoint themselves.
+
+        @param session: Database session.
+        @param checkpoint: Name of the import checkpoint.
+        """
+        self._execute_query(
+            session,
+            "MATCH (c:_import_checkpoint {name: $checkpoint}) DELETE c",
+            {"checkpoint": checkpoint},
+        )
+
+    def _import_rows(
+        self,
+        session: Neo4jSession,
+        body: str,
+        rows: Iterable[Dict[str, Any]],
+        batch_size: int,
+        concurrency: int,
+        partitions: int = None,
+        start_schema: List[Schema] = None,
+        end_schema: List[Schema] = None,
+        returns: str = "",
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import rows with parameterized UNWIND batches, written by a pool of concurrent sessions.
+        In partitioned mode, the rows are read in chunks of partitions * partitions *
+        batch_size rows, about one batch per cell. The rows of a chunk are distributed by the
+        keys of the nodes they connect and written such that concurrent batches never touch
+        the same nodes, before the next chunk is read.
+        With a checkpoint, every batch records its sequence number in the transaction writing
+        it, and batches committed by an earlier run are skipped.
+
+        @param session: Database session. Used directly if only one writer is available.
+        @param body: Cypher statements run for each row.
+        @param rows: Rows to import.
+        @param batch_size: Number of rows per batch.
+        @param concurrency: Number of concurrent writer sessions.
+        @param partitions: Number of node partitions. Defaults to None (not partitioned).
+        @param start_schema: Properties identifying the start node of an edge row. Defaults to
+                             None.
+        @param end_schema: Properties identifying the end node of an edge row. Defaults to
+                           None.
+        @param returns: Clauses returning the member keys the per-row statements could not
+                        resolve. Defaults to ''.
+        @param checkpoint: Name of the import checkpoint. Defaults to None.
+        @return: Import statistics.
+        """
+        if checkpoint is not None and partitions:
+            raise ValueError("Partitioned imports cannot be resumed from a checkpoint.")
+        query = f"""
+        UNWIND $rows AS row
+        CALL(row) {{{body}}}
+        {returns}
+        """
+        batches = iter_batches(rows, batch_size)
+        if checkpoint is not None:
+            query = (
+                "CALL () { CREATE (:_import_checkpoint {name: $checkpoint, batch: $batch}) }"
+                + query
+            )
+            committed = self._execute_query(
+                session,
+                "MATCH (c:_import_checkpoint {name: $checkpoint}) RETURN c.batch",
+                {"checkpoint": checkpoint},
+            )
+            batches = checkpoint_batches(batches, {record[0] for record in committed})
+
+        def parameters(batch):
+            if checkpoint is None:
+                return {"rows": batch}
+            return {"rows": batch, "checkpoint": checkpoint, "batch": batch.number}
+
+        writer = BatchWriter(
+            lambda writer_session, batch: [
+                record[0]
+                for record in self._execute_query(
+                    writer_session, query, parameters(batch)
+                )
+            ],
+            self.start_session,
+            self.end_session,
+            min(concurrency, self.max_concurrent_sessions),
+        )
+        if partitions:
+            chunks = partition_chunks(
+                rows, start_schema, end_schema, partitions, partitions**2 * batch_size
+            )
+            return writer.write_partitioned(chunks, partitions, batch_size, session)
+        stats = writer.write(batches, session)
+        if checkpoint is not None:
+            self.delete_import_checkpoint(session, checkpoint)
+        return stats
+
+    def _nodes_import_body(
+        self,
+        labels: List[Label],
+        node_schema: List[Schema],
+    ) -> str:
+        """
+        Build the statements that import a single row of nodes.
+
+        @param labels: List of labels for the nodes.
+        @param node_schema: List of property schemas for the nodes.
+        @return: Cypher statements run for each row.
+        """
+        labels_str = self.format_labels(labels)
+        properties_str = (
+            "{" + ", ".join([s._field_to_property("row") for s in node_schema]) + "}"
+        )
+        return f"""
+          WITH row
+          CREATE ({labels_str} {properties_str})
+        """
+
+    def import_nodes_from_csv(
+        self,
+        session: Neo4jSession,
+        file_name: str,
+        labels: List[Label],
+        node_schema: List[Schema],
+        as_url: bool = False,
+        batch_size: int = 10000,
+        delimiter: str = ",",
+        checkpoint: str = None,
+    ) -> None:
+        """
+        Import nodes from a CSV file into Neo4j.
+
+        @param session: Database session.
+        @param file_name: Name and path of the input file.
+        @param labels: List of labels for the nodes.
+        @param node_schema: List of property schemas for the nodes.
+        @param as_url: Treat file_name as URL. Defaults to False.
+        @param batch_size: Number of nodes to import at a time. Defaults to 10000.
+        @param delimiter: Delimiter used in the CSV file. Defaults to ','.
+        @param checkpoint: Name under which the progress of the import is committed together
+                           with the imported rows. A failed import run again with the same
+                           name resumes after the last committed row. Defaults to None.
+        """
+        body = self._nodes_import_body(labels, node_schema)
+        query = self._load_csv_query(
+            file_name,
+            body,
+            as_url,
+            batch_size,
+            delimiter,
+            checkpoint=checkpoint,
+        )
+        self._run_load_csv(session, query, checkpoint)
+
+    def import_nodes_from_iter(
+        self,
+        session: Neo4jSession,
+        rows: Iterable[Dict[str, Any]],
+        labels: List[Label],
+        node_schema: List[Schema],
+        batch_size: int = 10000,
+        concurrency: int = 4,
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import nodes from an iterable of rows into Neo4j. The rows are sent in parameterized
+        batches over the connection, so the server does not need access to any file.
+
+        @param session: Database session.
+        @param rows: Dictionaries with the same fields as the columns of the CSV file.
+        @param labels: List of labels for the nodes.
+        @param node_schema: List of property schemas for the nodes.
+        @param batch_size: Number of nodes to import at a time. Defaults to 10000.
+        @param concurrency: Number of concurrent writer sessions. Defaults to 4.
+        @param checkpoint: Name under which the committed batches are recorded together with
+                           the imported rows. A failed import run again with the same name and
+                           the same rows and batch size skips the committed batches. Defaults
+                           to None.
+        @return: Import statistics.
+        """
+        body = self._nodes_import_body(labels, node_schema)
+        return self._import_rows(
+            session,
+            body,
+            rows,
+            batch_size,
+            concurrency,
+            checkpoint=checkpoint,
+        )
+
+    def import_nodes_from_frame(
+        self,
+        session: Neo4jSession,
+        data: Any,
+        labels: List[Label],
+        node_schema: List[Schema],
+        batch_size: int = 10000,
+        concurrency: int = 4,
+        delimiter: str = ",",
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import nodes from a pandas DataFrame, Arrow data or a local CSV file into Neo4j.
+        The data is read in chunks and sent in parameterized batches over the connection.
+
+        @param session: Database session.
+        @param data: DataFrame, Arrow table or record batches, path of a local CSV (optionally
+                     gzip, bz2 or zstd compressed), Parquet or Arrow IPC file, or an iterable of
+                     DataFrames or dictionaries, with the same columns as the CSV file.
+        @param labels: List of labels for the nodes.
+        @param node_schema: List of property schemas for the nodes.
+        @param batch_size: Number of nodes to import at a time. Defaults to 10000.
+        @param concurrency: Number of concurrent writer sessions. Defaults to 4.
+        @param delimiter: Delimiter used in a local CSV file. Defaults to ','.
+        @param checkpoint: Name under which the committed batches are recorded together with
+                           the imported rows. A failed import run again with the same name and
+                           the same rows and batch size skips the committed batches. Defaults
+                           to None.
+        @return: Import statistics.
+        """
+        return self.import_nodes_from_iter(
+            session,
+            iter_rows(data, batch_size, delimiter),
+            labels,
+            node_schema,
+            batch_size,
+            concurrency,
+            checkpoint=checkpoint,
+        )
+
+    def _edges_import_body(
+        self,
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+    ) -> str:
+        """
+        Build the statements that import a single row of edges.
+
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param edge_label: Label to be used for the edges.
+        @param edge_schema: List of property schemas for the edges.
+        @return: Cypher statements run for each row.
+        """
+        start_properties = (
+            "{" + ", ".join([s._field_to_property("row") for s in start_schema]) + "}"
+        )
+        end_properties = (
+            "{" + ", ".join([s._field_to_property("row") for s in end_schema]) + "}"
+        )
+        edge_properties = (
+            "{" + ", ".join([s._field_to_property("row") for s in edge_schema]) + "}"
+        )
+        return f"""
+          WITH row
+          MATCH (start{self.format_labels(start_labels)} {start_properties})
+          MATCH (end{self.format_labels(end_labels)} {end_properties})
+          CREATE (start)-[r:{edge_label} {edge_properties}]->(end)
+        """
+
+    def _edges_import_lookups(
+        self,
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+    ) -> List[Tuple[List[Label], List[str]]]:
+        """
+        Labels and property keys the edges and HO edges imports match for each row.
+
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @return: List of labels and property keys.
         """
-        subgraph_labels_str = self.format_labels(subgraph_labels)
-        subgraph_properties_str, subgraph_fields = self._generate_query_strings(
-            "subgraph_node", subgraph_schema
-        )
-        query = f"""
-        MATCH (subgraph_node{subgraph_labels_str})
-        WITH subgraph_node, [(n:_node)-[:_node_membership]->(subgraph_node) | n.{node_schema.property_name}] AS node_list, [(s:_node)-[:_adjacency]->(edge:_edge)-[:_adjacency]->(e:_node) WHERE (edge)-[:_edge_membership]->(subgraph_node) | [s.{edge_schema.property_name},e.{edge_schema.property_name}]] AS edge_list
-        RETURN node_list AS {node_schema.field_name}, edge_list AS {edge_schema.field_name}, {subgraph_properties_str}
+        return [
+            (start_labels, [s.property_name for s in start_schema]),
+            (end_labels, [s.property_name for s in end_schema]),
+        ]
+
+    def import_edges_from_csv(
+        self,
+        session: Neo4jSession,
+        file_name: str,
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+        as_url: bool = False,
+        batch_size: int = 10000,
+        delimiter: str = ",",
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
+    ):
         """
-        records = self._execute_query(session, query)
-        nodes, edges = node_schema.field_name, edge_schema.field_name
-        df = pd.DataFrame(
-            records,
-            columns=[nodes, edges] + subgraph_fields,
+        Import edges from a CSV file into Neo4j.
+
+        @param session: Database session.
+        @param file_name: Name and path of the input file.
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param edge_label: Label to be used for the edges.
+        @param edge_schema: List of property schemas for the edges.
+        @param as_url: Treat file_name as URL. Defaults to False.
+        @param batch_size: Number of edges to import at a time. Defaults to 10000.
+        @param delimiter: Delimiter used in the CSV file. Defaults to ','.
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              connected nodes before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the progress of the import is committed together
+                           with the imported rows. A failed import run again with the same
+                           name resumes after the last committed row. Defaults to None.
+        """
+        body = self._edges_import_body(
+            start_labels,
+            start_schema,
+            end_labels,
+            end_schema,
+            edge_label,
+            edge_schema,
+        )
+        query = self._load_csv_query(
+            file_name,
+            body,
+            as_url,
+            batch_size,
+            delimiter,
+            checkpoint=checkpoint,
         )
-        df[nodes] = df[nodes].apply(lambda node: ";".join(map(str, node)))
-        df[edges] = df[edges].apply(
-            lambda edge: ";".join(map(lambda node: ":".join(map(str, node)), edge))
+        lookups = self._edges_import_lookups(
+            start_labels,
+            start_schema,
+            end_labels,
+            end_schema,
         )
-        df.to_csv(file_name, index=False, header=True, quoting=csv.QUOTE_NONE)
+        with self._lookup_indexes(session, lookups, index_lookups, drop_indexes):
+            self._run_load_csv(session, query, checkpoint)
 
-    def export_node_tuples_to_csv(
+    def import_edges_from_iter(
         self,
         session: Neo4jSession,
-        file_name: str,
-        node_schema: Schema,
-        tuple_labels: List[Label],
-        tuple_schema: List[Schema],
-    ) -> None:
-        """
-        Export node-tuples to a CSV file, which are modeled as nodes in our Neo4j implementation.
+        rows: Iterable[Dict[str, Any]],
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+        batch_size: int = 10000,
+        concurrency: int = 4,
+        partitions: int = None,
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import edges from an iterable of rows into Neo4j. The rows are sent in parameterized
+        batches over the connection, so the server does not need access to any file.
 
         @param session: Database session.
-        @param file_name: Name and path of the output file.
-        @param node_schema: Property schema for the nodes.
-        @param tuple_labels: Export node-tuples with those labels.
-        @param tuple_schema: List of property schemas for the node-tuples.
-        """
-        tuple_labels_str = self.format_labels(tuple_labels)
-        tuple_properties_str, subgraph_fields = self._generate_query_strings(
-            "tuple_node", tuple_schema
+        @param rows: Dictionaries with the same fields as the columns of the CSV file.
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param edge_label: Label to be used for the edges.
+        @param edge_schema: List of property schemas for the edges.
+        @param batch_size: Number of edges to import at a time. Defaults to 10000.
+        @param concurrency: Number of concurrent writer sessions. Defaults to 4.
+        @param partitions: Number of node partitions for a parallel import in which concurrent
+                           batches touch disjoint nodes. The start and end nodes must be
+                           identified by the same properties. Defaults to None (not
+                           partitioned).
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              connected nodes before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the committed batches are recorded together with
+                           the imported rows. A failed import run again with the same name and
+                           the same rows and batch size skips the committed batches. Not
+                           supported for partitioned imports. Defaults to None.
+        @return: Import statistics.
+        """
+        body = self._edges_import_body(
+            start_labels,
+            start_schema,
+            end_labels,
+            end_schema,
+            edge_label,
+            edge_schema,
         )
-        query = f"""
-        MATCH (tuple_node:_node_tuple{tuple_labels_str})
-        WITH tuple_node, [(n:_node)-[r:_node_membership]->(tuple_node) | {{prop: n.{node_schema.property_name}, pos: r.position_in_tuple}}] AS node_list
-        RETURN node_list AS {node_schema.field_name}, {tuple_properties_str}
-        """
-        records = self._execute_query(session, query)
-        nodes = node_schema.field_name
-        df = pd.DataFrame(
-            records,
-            columns=[nodes] + subgraph_fields,
+        lookups = self._edges_import_lookups(
+            start_labels,
+            start_schema,
+            end_labels,
+            end_schema,
         )
-        df[nodes] = df[nodes].apply(
-            lambda node: ";".join(
-                map(
-                    lambda x: str(x["prop"]),
-                    sorted(node, key=lambda x: x["pos"]),
-                )
+        with self._lookup_indexes(session, lookups, index_lookups, drop_indexes):
+            return self._import_rows(
+                session,
+                body,
+                rows,
+                batch_size,
+                concurrency,
+                partitions,
+                start_schema,
+                end_schema,
+                checkpoint=checkpoint,
             )
-        )
-        df.to_csv(file_name, index=False, header=True, quoting=csv.QUOTE_NONE)
 
-    def import_nodes_from_csv(
+    def import_edges_from_frame(
         self,
         session: Neo4jSession,
-        file_name: str,
-        labels: List[Label],
-        node_schema: List[Schema],
-        as_url: bool = False,
+        data: Any,
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
         batch_size: int = 10000,
+        concurrency: int = 4,
+        partitions: int = None,
         delimiter: str = ",",
-    ) -> None:
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
+    ) -> ImportStats:
         """
-        Import nodes from a CSV file into Neo4j.
+        Import edges from a pandas DataFrame, Arrow data or a local CSV file into Neo4j.
+        The data is read in chunks and sent in parameterized batches over the connection.
 
         @param session: Database session.
-        @param file_name: Name and path of the input file.
-        @param labels: List of labels for the nodes.
-        @param node_schema: List of property schemas for the nodes.
-        @param as_url: Treat file_name as URL. Defaults to False.
-        @param batch_size: Number of nodes to import at a time. Defaults to 10000.
-        @param delimiter: Delimiter used in the CSV file. Defaults to ','.
+        @param data: DataFrame, Arrow table or record batches, path of a local CSV (optionally
+                     gzip, bz2 or zstd compressed), Parquet or Arrow IPC file, or an iterable of
+                     DataFrames or dictionaries, with the same columns as the CSV file.
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param edge_label: Label to be used for the edges.
+        @param edge_schema: List of property schemas for the edges.
+        @param batch_size: Number of edges to import at a time. Defaults to 10000.
+        @param concurrency: Number of concurrent writer sessions. Defaults to 4.
+        @param partitions: Number of node partitions for a parallel import in which concurrent
+                           batches touch disjoint nodes. The start and end nodes must be
+                           identified by the same properties. Defaults to None (not
+                           partitioned).
+        @param delimiter: Delimiter used in a local CSV file. Defaults to ','.
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              connected nodes before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the committed batches are recorded together with
+                           the imported rows. A failed import run again with the same name and
+                           the same rows and batch size skips the committed batches. Not
+                           supported for partitioned imports. Defaults to None.
+        @return: Import statistics.
+        """
+        return self.import_edges_from_iter(
+            session,
+            iter_rows(data, batch_size, delimiter),
+            start_labels,
+            start_schema,
+            end_labels,
+            end_schema,
+            edge_label,
+            edge_schema,
+            batch_size,
+            concurrency,
+            partitions,
+            index_lookups=index_lookups,
+            drop_indexes=drop_indexes,
+            checkpoint=checkpoint,
+        )
+
+    def _node_edges_import_body(
+        self,
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+        node_edge_labels: List[Label],
+        node_edge_schema: List[Schema],
+        edge_label: Label,
+    ) -> str:
         """
-        labels_str = self.format_labels(labels)
-        properties_str = (
-            "{" + ", ".join([s._field_to_property("row") for s in node_schema]) + "}"
+        Build the statements that import a single row of HO edges.
+
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param node_edge_label: Label to be used for the HO edges.
+        @param node_edge_schema: List of property schemas for the HO edges.
+        @param edge_label: Label for the edges to the HO edges.
+        @return: Cypher statements run for each row.
+        """
+        start_properties_str = (
+            "{" + ", ".join([s._field_to_property("row") for s in start_schema]) + "}"
         )
-        file_path = file_name if as_url else f"file:///{file_name}"
-        query = f"""
-        LOAD CSV WITH HEADERS FROM '{file_path}'
-        AS row
-        FIELDTERMINATOR '{delimiter}'
-        CALL(row) {{
+        end_properties_str = (
+            "{" + ", ".join([s._field_to_property("row") for s in end_schema]) + "}"
+        )
+        edge_properties_str = (
+            "{"
+            + ", ".join([s._field_to_property("row") for s in node_edge_schema])
+            + "}"
+        )
+        return f"""
           WITH row
-          CREATE ({labels_str} {properties_str})
-        }} IN TRANSACTIONS OF {batch_size} ROWS"""
-        self._execute_query(session, query)
+          CREATE (edge_node{self.format_labels(node_edge_labels)} {edge_properties_str})
+          WITH edge_node, row
+          MATCH (start{self.format_labels(start_labels)} {start_properties_str}), (end{self.format_labels(end_labels)} {end_properties_str})
+          CREATE (start)-[:{edge_label}]->(edge_node)-[:{edge_label}]->(end)
+        """
 
-    def import_edges_from_csv(
+    def import_node_edges_from_csv(
         self,
         session: Neo4jSession,
         file_name: str,
@@ -434,14 +2243,19 @@ class Neo4jDatabase(Database):
         start_schema: List[Schema],
         end_labels: List[Label],
         end_schema: List[Schema],
+        node_edge_labels: List[Label],
+        node_edge_schema: List[Schema],
         edge_label: Label,
-        edge_schema: List[Schema],
         as_url: bool = False,
         batch_size: int = 10000,
         delimiter: str = ",",
-    ):
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
+    ) -> None:
         """
-        Import edges from a CSV file into Neo4j.
+        Import HO edges from a CSV file into Neo4j, which are modeled as nodes in our Neo4j
+        implementation.
 
         @param session: Database session.
         @param file_name: Name and path of the input file.
@@ -449,128 +2263,468 @@ class Neo4jDatabase(Database):
         @param start_schema: List of property schemas for the start nodes.
         @param end_labels: List of labels for the end nodes.
         @param end_schema: List of property schemas for the end nodes.
-        @param edge_label: Label to be used for the edges.
-        @param edge_schema: List of property schemas for the edges.
+        @param node_edge_label: Label to be used for the HO edges.
+        @param node_edge_schema: List of property schemas for the HO edges.
+        @param edge_label: Label for the edges to the HO edges.
         @param as_url: Treat file_name as URL. Defaults to False.
         @param batch_size: Number of edges to import at a time. Defaults to 10000.
         @param delimiter: Delimiter used in the CSV file. Defaults to ','.
-        """
-        start_properties = (
-            "{" + ", ".join([s._field_to_property("row") for s in start_schema]) + "}"
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              connected nodes before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the progress of the import is committed together
+                           with the imported rows. A failed import run again with the same
+                           name resumes after the last committed row. Defaults to None.
+        """
+        body = self._node_edges_import_body(
+            start_labels,
+            start_schema,
+            end_labels,
+            end_schema,
+            node_edge_labels,
+            node_edge_schema,
+            edge_label,
         )
-        end_properties = (
-            "{" + ", ".join([s._field_to_property("row") for s in end_schema]) + "}"
+        query = self._load_csv_query(
+            file_name,
+            body,
+            as_url,
+            batch_size,
+            delimiter,
+            checkpoint=checkpoint,
         )
-        edge_properties = (
-            "{" + ", ".join([s._field_to_property("row") for s in edge_schema]) + "}"
+        lookups = self._edges_import_lookups(
+            start_labels,
+            start_schema,
+            end_labels,
+            end_schema,
         )
-        file_path = file_name if as_url else f"file:///{file_name}"
-        query = f"""
-        LOAD CSV WITH HEADERS FROM '{file_path}'
-        AS row
-        FIELDTERMINATOR '{delimiter}'
-        CALL(row) {{
-          WITH row
-          MATCH (start{self.format_labels(start_labels)} {start_properties})
-          MATCH (end{self.format_labels(end_labels)} {end_properties})
-          CREATE (start)-[r:{edge_label} {edge_properties}]->(end)
-        }} IN TRANSACTIONS OF {batch_size} ROWS
+        with self._lookup_indexes(session, lookups, index_lookups, drop_indexes):
+            self._run_load_csv(session, query, checkpoint)
+
+    def import_node_edges_from_iter(
+        self,
+        session: Neo4jSession,
+        rows: Iterable[Dict[str, Any]],
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+        node_edge_labels: List[Label],
+        node_edge_schema: List[Schema],
+        edge_label: Label,
+        batch_size: int = 10000,
+        concurrency: int = 4,
+        partitions: int = None,
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import HO edges from an iterable of rows into Neo4j. The rows are sent in parameterized
+        batches over the connection, so the server does not need access to any file.
+
+        @param session: Database session.
+        @param rows: Dictionaries with the same fields as the columns of the CSV file.
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param node_edge_label: Label to be used for the HO edges.
+        @param node_edge_schema: List of property schemas for the HO edges.
+        @param edge_label: Label for the edges to the HO edges.
+        @param batch_size: Number of edges to import at a time. Defaults to 10000.
+        @param concurrency: Number of concurrent writer sessions. Defaults to 4.
+        @param partitions: Number of node partitions for a parallel import in which concurrent
+                           batches touch disjoint nodes. The start and end nodes must be
+                           identified by the same properties. Defaults to None (not
+                           partitioned).
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              connected nodes before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the committed batches are recorded together with
+                           the imported rows. A failed import run again with the same name and
+                           the same rows and batch size skips the committed batches. Not
+                           supported for partitioned imports. Defaults to None.
+        @return: Import statistics.
+        """
+        body = self._node_edges_import_body(
+            start_labels,
+            start_schema,
+            end_labels,
+            end_schema,
+            node_edge_labels,
+            node_edge_schema,
+            edge_label,
+        )
+        lookups = self._edges_import_lookups(
+            start_labels,
+            start_schema,
+            end_labels,
+            end_schema,
+        )
+        with self._lookup_indexes(session, lookups, index_lookups, drop_indexes):
+            return self._import_rows(
+                session,
+                body,
+                rows,
+                batch_size,
+                concurrency,
+                partitions,
+                start_schema,
+                end_schema,
+                checkpoint=checkpoint,
+            )
+
+    def import_node_edges_from_frame(
+        self,
+        session: Neo4jSession,
+        data: Any,
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+        node_edge_labels: List[Label],
+        node_edge_schema: List[Schema],
+        edge_label: Label,
+        batch_size: int = 10000,
+        concurrency: int = 4,
+        partitions: int = None,
+        delimiter: str = ",",
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import HO edges from a pandas DataFrame, Arrow data or a local CSV file into Neo4j.
+        The data is read in chunks and sent in parameterized batches over the connection.
+
+        @param session: Database session.
+        @param data: DataFrame, Arrow table or record batches, path of a local CSV (optionally
+                     gzip, bz2 or zstd compressed), Parquet or Arrow IPC file, or an iterable of
+                     DataFrames or dictionaries, with the same columns as the CSV file.
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param node_edge_label: Label to be used for the HO edges.
+        @param node_edge_schema: List of property schemas for the HO edges.
+        @param edge_label: Label for the edges to the HO edges.
+        @param batch_size: Number of edges to import at a time. Defaults to 10000.
+        @param concurrency: Number of concurrent writer sessions. Defaults to 4.
+        @param partitions: Number of node partitions for a parallel import in which concurrent
+                           batches touch disjoint nodes. The start and end nodes must be
+                           identified by the same properties. Defaults to None (not
+                           partitioned).
+        @param delimiter: Delimiter used in a local CSV file. Defaults to ','.
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              connected nodes before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the committed batches are recorded together with
+                           the imported rows. A failed import run again with the same name and
+                           the same rows and batch size skips the committed batches. Not
+                           supported for partitioned imports. Defaults to None.
+        @return: Import statistics.
+        """
+        return self.import_node_edges_from_iter(
+            session,
+            iter_rows(data, batch_size, delimiter),
+            start_labels,
+            start_schema,
+            end_labels,
+            end_schema,
+            node_edge_labels,
+            node_edge_schema,
+            edge_label,
+            batch_size,
+            concurrency,
+            partitions,
+            index_lookups=index_lookups,
+            drop_indexes=drop_indexes,
+            checkpoint=checkpoint,
+        )
+
+    def _hyperedges_import_body(
+        self,
+        node_labels: List[Label],
+        node_schema: Schema,
+        common_schema: List[Schema],
+        hyperedge_labels: List[Label],
+        hyperedge_schema: List[Schema],
+    ) -> str:
+        """
+        Build the statements that import a single row of hyperedges. The distinct member keys
+        of a row are resolved with a single index seek and each member is connected once.
+        The statements return the member keys that did not match any node.
+
+        @param node_labels: List of labels for the nodes.
+        @param node_schema: Property schema for the nodes.
+        @param common_schema: List of property schemas common to the nodes.
+        @param hyperedge_labels: List of labels to be used for the hyperedges.
+        @param hyperedge_schema: List of property schemas for the hyperedges.
+        @return: Cypher statements run for each row.
+        """
+        hyperedge_labels_str = self.format_labels(hyperedge_labels)
+        hyperedge_schema_str = (
+            "{"
+            + ", ".join([s._field_to_property("row") for s in hyperedge_schema])
+            + "}"
+        )
+        common_schema_str = (
+            " {" + ", ".join([s._field_to_property("row") for s in common_schema]) + "}"
+            if common_schema != []
+            else ""
+        )
+        key_str = node_schema.set_field("key")._field_to_value()
+        return f"""
+          WITH row, COLLECT {{
+            UNWIND split(row.{node_schema.field_name}, ';') AS key
+            RETURN DISTINCT {key_str} AS key
+          }} AS keys
+          CREATE (hyperedge_node{hyperedge_labels_str}{hyperedge_schema_str})
+          WITH row, hyperedge_node, keys
+          CALL (row, hyperedge_node, keys) {{
+            MATCH (n{self.format_labels(node_labels)}{common_schema_str})
+            WHERE n.{node_schema.property_name} IN keys
+            CREATE (n)-[:_adjacency]->(hyperedge_node), (hyperedge_node)-[:_adjacency]->(n)
+            RETURN collect(n.{node_schema.property_name}) AS resolved
+          }}
+          RETURN [key IN keys WHERE NOT key IN resolved] AS unresolved
         """
-        self._execute_query(session, query)
 
-    def import_node_edges_from_csv(
+    def _hyperedges_import_lookups(
+        self,
+        node_labels: List[Label],
+        node_schema: Schema,
+        common_schema: List[Schema],
+    ) -> List[Tuple[List[Label], List[str]]]:
+        """
+        Labels and property keys the hyperedges import matches for each row.
+
+        @param node_labels: List of labels for the nodes.
+        @param node_schema: Property schema for the nodes.
+        @param common_schema: List of property schemas common to the nodes.
+        @return: List of labels and property keys.
+        """
+        return [
+            (
+                node_labels,
+                [node_schema.property_name] + [s.property_name for s in common_schema],
+            )
+        ]
+
+    def import_hyperedges_from_csv(
         self,
         session: Neo4jSession,
         file_name: str,
-        start_labels: List[Label],
-        start_schema: List[Schema],
-        end_labels: List[Label],
-        end_schema: List[Schema],
-        node_edge_labels: List[Label],
-        node_edge_schema: List[Schema],
-        edge_label: Label,
+        node_labels: List[Label],
+        node_schema: Schema,
+        common_schema: List[Schema],
+        hyperedge_labels: List[Label],
+        hyperedge_schema: List[Schema],
         as_url: bool = False,
-        batch_size: int = 10000,
+        batch_size: int = 5000,
         delimiter: str = ",",
-    ) -> None:
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
+    ) -> List[Any]:
         """
-        Import HO edges from a CSV file into Neo4j, which are modeled as nodes in our Neo4j
-        implementation.
+        Import hyperedges from a CSV file into Neo4j. Members are deduplicated per hyperedge and
+        member keys that do not match any node are reported instead of silently dropped.
 
         @param session: Database session.
         @param file_name: Name and path of the input file.
-        @param start_labels: List of labels for the start nodes.
-        @param start_schema: List of property schemas for the start nodes.
-        @param end_labels: List of labels for the end nodes.
-        @param end_schema: List of property schemas for the end nodes.
-        @param node_edge_label: Label to be used for the HO edges.
-        @param node_edge_schema: List of property schemas for the HO edges.
-        @param edge_label: Label for the edges to the HO edges.
+        @param node_labels: List of labels for the nodes.
+        @param node_schema: Property schema for the nodes.
+        @param common_schema: List of property schemas common to the nodes.
+        @param hyperedge_labels: List of labels to be used for the hyperedges.
+        @param hyperedge_schema: List of property schemas for the hyperedges.
         @param as_url: Treat file_name as URL. Defaults to False.
-        @param batch_size: Number of edges to import at a time. Defaults to 10000.
+        @param batch_size: Number of hyperedges to import at a time. Defaults to 5000.
         @param delimiter: Delimiter used in the CSV file. Defaults to ','.
-        """
-        start_properties_str = (
-            "{" + ", ".join([s._field_to_property("row") for s in start_schema]) + "}"
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              connected nodes before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the progress of the import is committed together
+                           with the imported rows. A failed import run again with the same
+                           name resumes after the last committed row. Defaults to None.
+        @return: Member keys that did not match any node.
+        """
+        body = self._hyperedges_import_body(
+            node_labels,
+            node_schema,
+            common_schema,
+            hyperedge_labels,
+            hyperedge_schema,
         )
-        end_properties_str = (
-            "{" + ", ".join([s._field_to_property("row") for s in end_schema]) + "}"
+        query = self._load_csv_query(
+            file_name,
+            body,
+            as_url,
+            batch_size,
+            delimiter,
+            _UNRESOLVED_KEYS,
+            checkpoint=checkpoint,
         )
-        edge_properties_str = (
-            "{"
-            + ", ".join([s._field_to_property("row") for s in node_edge_schema])
-            + "}"
+        lookups = self._hyperedges_import_lookups(
+            node_labels,
+            node_schema,
+            common_schema,
         )
-        file_path = file_name if as_url else f"file:///{file_name}"
-        query = f"""
-        LOAD CSV WITH HEADERS FROM '{file_path}'
-        AS row
-        FIELDTERMINATOR '{delimiter}'
-        CALL(row) {{
-          WITH row
-          CREATE (edge_node{self.format_labels(node_edge_labels)} {edge_properties_str})
-          WITH edge_node, row
-          MATCH (start{self.format_labels(start_labels)} {start_properties_str}), (end{self.format_labels(end_labels)} {end_properties_str})
-          CREATE (start)-[:{edge_label}]->(edge_node)-[:{edge_label}]->(end)
-        }} IN TRANSACTIONS OF {batch_size} ROWS
-        """
-        self._execute_query(session, query)
+        with self._lookup_indexes(session, lookups, index_lookups, drop_indexes):
+            return self._run_load_csv(session, query, checkpoint)
 
-    def import_hyperedges_from_csv(
+    def import_hyperedges_from_iter(
         self,
         session: Neo4jSession,
-        file_name: str,
+        rows: Iterable[Dict[str, Any]],
+        node_labels: List[Label],
+        node_schema: Schema,
+        common_schema: List[Schema],
+        hyperedge_labels: List[Label],
+        hyperedge_schema: List[Schema],
+        batch_size: int = 5000,
+        concurrency: int = 4,
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import hyperedges from an iterable of rows into Neo4j. The rows are sent in parameterized
+        batches over the connection, so the server does not need access to any file.
+
+        @param session: Database session.
+        @param rows: Dictionaries with the same fields as the columns of the CSV file.
+        @param node_labels: List of labels for the nodes.
+        @param node_schema: Property schema for the nodes.
+        @param common_schema: List of property schemas common to the nodes.
+        @param hyperedge_labels: List of labels to be used for the hyperedges.
+        @param hyperedge_schema: List of property schemas for the hyperedges.
+        @param batch_size: Number of hyperedges to import at a time. Defaults to 5000.
+        @param concurrency: Number of concurrent writer sessions. Defaults to 4.
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              connected nodes before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the committed batches are recorded together with
+                           the imported rows. A failed import run again with the same name and
+                           the same rows and batch size skips the committed batches. Defaults
+                           to None.
+        @return: Import statistics, including the member keys that did not match any node.
+        """
+        body = self._hyperedges_import_body(
+            node_labels,
+            node_schema,
+            common_schema,
+            hyperedge_labels,
+            hyperedge_schema,
+        )
+        lookups = self._hyperedges_import_lookups(
+            node_labels,
+            node_schema,
+            common_schema,
+        )
+        with self._lookup_indexes(session, lookups, index_lookups, drop_indexes):
+            return self._import_rows(
+                session,
+                body,
+                rows,
+                batch_size,
+                concurrency,
+                returns=_UNRESOLVED_KEYS,
+                checkpoint=checkpoint,
+            )
+
+    def import_hyperedges_from_frame(
+        self,
+        session: Neo4jSession,
+        data: Any,
         node_labels: List[Label],
         node_schema: Schema,
         common_schema: List[Schema],
         hyperedge_labels: List[Label],
         hyperedge_schema: List[Schema],
-        as_url: bool = False,
         batch_size: int = 5000,
+        concurrency: int = 4,
         delimiter: str = ",",
-    ) -> None:
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
+    ) -> ImportStats:
         """
-        Import hyperedges from a CSV file into Neo4j.
+        Import hyperedges from a pandas DataFrame, Arrow data or a local CSV file into Neo4j.
+        The data is read in chunks and sent in parameterized batches over the connection.
 
         @param session: Database session.
-        @param file_name: Name and path of the input file.
+        @param data: DataFrame, Arrow table or record batches, path of a local CSV (optionally
+                     gzip, bz2 or zstd compressed), Parquet or Arrow IPC file, or an iterable of
+                     DataFrames or dictionaries, with the same columns as the CSV file.
         @param node_labels: List of labels for the nodes.
         @param node_schema: Property schema for the nodes.
         @param common_schema: List of property schemas common to the nodes.
         @param hyperedge_labels: List of labels to be used for the hyperedges.
         @param hyperedge_schema: List of property schemas for the hyperedges.
-        @param as_url: Treat file_name as URL. Defaults to False.
         @param batch_size: Number of hyperedges to import at a time. Defaults to 5000.
-        @param delimiter: Delimiter used in the CSV file. Defaults to ','.
+        @param concurrency: Number of concurrent writer sessions. Defaults to 4.
+        @param delimiter: Delimiter used in a local CSV file. Defaults to ','.
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              connected nodes before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the committed batches are recorded together with
+                           the imported rows. A failed import run again with the same name and
+                           the same rows and batch size skips the committed batches. Defaults
+                           to None.
+        @return: Import statistics.
+        """
+        return self.import_hyperedges_from_iter(
+            session,
+            iter_rows(data, batch_size, delimiter),
+            node_labels,
+            node_schema,
+            common_schema,
+            hyperedge_labels,
+            hyperedge_schema,
+            batch_size,
+            concurrency,
+            index_lookups=index_lookups,
+            drop_indexes=drop_indexes,
+            checkpoint=checkpoint,
+        )
+
+    def _subgraphs_import_body(
+        self,
+        node_schema: Schema,
+        edge_schema: Schema,
+        common_schema: List[Schema],
+        subgraph_labels: List[Label],
+        subgraph_schema: List[Schema],
+    ) -> str:
         """
-        hyperedge_labels_str = self.format_labels(hyperedge_labels)
-        hyperedge_schema_str = (
+        Build the statements that import a single row of subgraph collections.
+
+        @param node_schema: Property schema for the nodes.
+        @param edge_schema: Property schema for the edges.
+        @param common_schema: List of property schemas common to the nodes.
+        @param subgraph_labels: List of labels to be used for the subgraph collections.
+        @param subgraph_schema: List of property schemas for the subgraph collections.
+        @return: Cypher statements run for each row.
+        """
+        subgraph_labels_str = self.format_labels(subgraph_labels)
+        subgraph_schema_str = (
             "{"
-            + ", ".join([s._field_to_property("row") for s in hyperedge_schema])
+            + ", ".join([s._field_to_property("row") for s in subgraph_schema])
             + "}"
         )
-        node_property_str = (
-            "{" + node_schema.set_field("nodes[node_position]")._field_to_property()
+        node_property_str, edge_property_str1, edge_property_str2 = (
+            "{" + node_schema.set_field("node_value")._field_to_property(),
+            "{" + edge_schema.set_field("edge_nodes[0]")._field_to_property(),
+            "{" + edge_schema.set_field("edge_nodes[1]")._field_to_property(),
         )
         common_schema_str = (
             (
@@ -581,23 +2735,40 @@ class Neo4jDatabase(Database):
             if common_schema != []
             else "}"
         )
-        file_path = file_name if as_url else f"file:///{file_name}"
-        query = f"""
-        LOAD CSV WITH HEADERS FROM '{file_path}'
-       
-        AS row
-        FIELDTERMINATOR '{delimiter}'
-        CALL(row) {{
+        return f"""
           WITH row
-          CREATE (hyperedge_node{hyperedge_labels_str}{hyperedge_schema_str})
-          WITH row, hyperedge_node, split(row.{node_schema.field_name}, ';') as nodes
-        UNWIND RANGE(0, SIZE(nodes) - 1) AS node_position
-        MATCH (n{self.format_labels(node_labels)} {node_property_str}{common_schema_str})
-          CREATE (n)-[:_adjacency]->(hyperedge_node)
-          CREATE (hyperedge_node)-[:_adjacency]->(n)
-        }} IN TRANSACTIONS OF {batch_size} ROWS
+          CREATE (subgraph_node{subgraph_labels_str} {subgraph_schema_str})
+          WITH row, subgraph_node, split(row.{node_schema.field_name}, ';') as nodes
+          UNWIND nodes AS node_value
+          MATCH (n:_node {node_property_str}{common_schema_str})
+          CREATE (n)-[:_node_membership]->(subgraph_node)
+          WITH row, subgraph_node, split(row.{edge_schema.field_name}, ';') as edges
+          UNWIND edges AS edge_value
+          WITH row, subgraph_node, edges, split(edge_value, ':') AS edge_nodes
+          MATCH (start:_node {edge_property_str1}{common_schema_str})-[:_adjacency]->(edge:_edge)-[:_adjacency]->(end:_node {edge_property_str2}{common_schema_str})
+          WITH DISTINCT edge, subgraph_node
+          CREATE (edge)-[:_edge_membership]->(subgraph_node)
         """
-        self._execute_query(session, query)
+
+    def _subgraphs_import_lookups(
+        self,
+        node_schema: Schema,
+        edge_schema: Schema,
+        common_schema: List[Schema],
+    ) -> List[Tuple[List[Label], List[str]]]:
+        """
+        Labels and property keys the subgraph collections import matches for each row.
+
+        @param node_schema: Property schema for the nodes.
+        @param edge_schema: Property schema for the edges.
+        @param common_schema: List of property schemas common to the nodes.
+        @return: List of labels and property keys.
+        """
+        common_keys = [s.property_name for s in common_schema]
+        return [
+            ([Label("_node")], [node_schema.property_name] + common_keys),
+            ([Label("_node")], [edge_schema.property_name] + common_keys),
+        ]
 
     def import_subgraphs_from_csv(
         self,
@@ -611,6 +2782,9 @@ class Neo4jDatabase(Database):
         as_url: bool = False,
         batch_size: int = 1000,
         delimiter: str = ",",
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
     ) -> None:
         """
         Import subgraph collections from a CSV file into Neo4j, which are modeled as nodes in our
@@ -626,17 +2800,178 @@ class Neo4jDatabase(Database):
         @param as_url: Treat file_name as URL. Defaults to False.
         @param batch_size: Number of hyperedges to import at a time. Defaults to 1000.
         @param delimiter: Delimiter used in the CSV file. Defaults to ','.
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              connected nodes before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the progress of the import is committed together
+                           with the imported rows. A failed import run again with the same
+                           name resumes after the last committed row. Defaults to None.
+        """
+        body = self._subgraphs_import_body(
+            node_schema,
+            edge_schema,
+            common_schema,
+            subgraph_labels,
+            subgraph_schema,
+        )
+        query = self._load_csv_query(
+            file_name,
+            body,
+            as_url,
+            batch_size,
+            delimiter,
+            checkpoint=checkpoint,
+        )
+        lookups = self._subgraphs_import_lookups(
+            node_schema,
+            edge_schema,
+            common_schema,
+        )
+        with self._lookup_indexes(session, lookups, index_lookups, drop_indexes):
+            self._run_load_csv(session, query, checkpoint)
+
+    def import_subgraphs_from_iter(
+        self,
+        session: Neo4jSession,
+        rows: Iterable[Dict[str, Any]],
+        node_schema: Schema,
+        edge_schema: Schema,
+        common_schema: List[Schema],
+        subgraph_labels: List[Label],
+        subgraph_schema: List[Schema],
+        batch_size: int = 1000,
+        concurrency: int = 4,
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import subgraph collections from an iterable of rows into Neo4j. The rows are sent in parameterized
+        batches over the connection, so the server does not need access to any file.
+
+        @param session: Database session.
+        @param rows: Dictionaries with the same fields as the columns of the CSV file.
+        @param node_schema: Property schema for the nodes.
+        @param edge_schema: Property schema for the edges.
+        @param common_schema: List of property schemas common to the nodes.
+        @param subgraph_labels: List of labels to be used for the subgraph collections.
+        @param subgraph_schema: List of property schemas for the subgraph collections.
+        @param batch_size: Number of hyperedges to import at a time. Defaults to 1000.
+        @param concurrency: Number of concurrent writer sessions. Defaults to 4.
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              connected nodes before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the committed batches are recorded together with
+                           the imported rows. A failed import run again with the same name and
+                           the same rows and batch size skips the committed batches. Defaults
+                           to None.
+        @return: Import statistics.
+        """
+        body = self._subgraphs_import_body(
+            node_schema,
+            edge_schema,
+            common_schema,
+            subgraph_labels,
+            subgraph_schema,
+        )
+        lookups = self._subgraphs_import_lookups(
+            node_schema,
+            edge_schema,
+            common_schema,
+        )
+        with self._lookup_indexes(session, lookups, index_lookups, drop_indexes):
+            return self._import_rows(
+                session,
+                body,
+                rows,
+                batch_size,
+                concurrency,
+                checkpoint=checkpoint,
+            )
+
+    def import_subgraphs_from_frame(
+        self,
+        session: Neo4jSession,
+        data: Any,
+        node_schema: Schema,
+        edge_schema: Schema,
+        common_schema: List[Schema],
+        subgraph_labels: List[Label],
+        subgraph_schema: List[Schema],
+        batch_size: int = 1000,
+        concurrency: int = 4,
+        delimiter: str = ",",
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
+    ) -> ImportStats:
         """
-        subgraph_labels_str = self.format_labels(subgraph_labels)
-        subgraph_schema_str = (
+        Import subgraph collections from a pandas DataFrame, Arrow data or a local CSV file into Neo4j.
+        The data is read in chunks and sent in parameterized batches over the connection.
+
+        @param session: Database session.
+        @param data: DataFrame, Arrow table or record batches, path of a local CSV (optionally
+                     gzip, bz2 or zstd compressed), Parquet or Arrow IPC file, or an iterable of
+                     DataFrames or dictionaries, with the same columns as the CSV file.
+        @param node_schema: Property schema for the nodes.
+        @param edge_schema: Property schema for the edges.
+        @param common_schema: List of property schemas common to the nodes.
+        @param subgraph_labels: List of labels to be used for the subgraph collections.
+        @param subgraph_schema: List of property schemas for the subgraph collections.
+        @param batch_size: Number of hyperedges to import at a time. Defaults to 1000.
+        @param concurrency: Number of concurrent writer sessions. Defaults to 4.
+        @param delimiter: Delimiter used in a local CSV file. Defaults to ','.
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              connected nodes before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the committed batches are recorded together with
+                           the imported rows. A failed import run again with the same name and
+                           the same rows and batch size skips the committed batches. Defaults
+                           to None.
+        @return: Import statistics.
+        """
+        return self.import_subgraphs_from_iter(
+            session,
+            iter_rows(data, batch_size, delimiter),
+            node_schema,
+            edge_schema,
+            common_schema,
+            subgraph_labels,
+            subgraph_schema,
+            batch_size,
+            concurrency,
+            index_lookups=index_lookups,
+            drop_indexes=drop_indexes,
+            checkpoint=checkpoint,
+        )
+
+    def _node_tuples_import_body(
+        self,
+        node_schema: Schema,
+        common_schema: List[Schema],
+        tuple_labels: List[Label],
+        tuple_properties: List[Schema],
+    ) -> str:
+        """
+        Build the statements that import a single row of node tuples.
+
+        @param node_schema: Property schema for the nodes.
+        @param common_schema: List of property schemas common to the nodes.
+        @param tuple_labels: List of labels to be used for the node-tuples.
+        @param tuple_schema: List of property schemas for the node-tuples.
+        @return: Cypher statements run for each row.
+        """
+        tuple_labels_str = self.format_labels(tuple_labels)
+        tuple_properties_str = (
             "{"
-            + ", ".join([s._field_to_property("row") for s in subgraph_schema])
+            + ", ".join([s._field_to_property("row") for s in tuple_properties])
             + "}"
         )
-        node_property_str, edge_property_str1, edge_property_str2 = (
-            "{" + node_schema.set_field("node_value")._field_to_property(),
-            "{" + edge_schema.set_field("edge_nodes[0]")._field_to_property(),
-            "{" + edge_schema.set_field("edge_nodes[1]")._field_to_property(),
+        node_property_str = (
+            "{" + node_schema.set_field("nodes[node_position]")._field_to_property()
         )
         common_schema_str = (
             (
@@ -647,27 +2982,33 @@ class Neo4jDatabase(Database):
             if common_schema != []
             else "}"
         )
-        file_path = file_name if as_url else f"file:///{file_name}"
-        query = f"""
-        LOAD CSV WITH HEADERS FROM '{file_path}'
-        AS row
-        FIELDTERMINATOR '{delimiter}'
-        CALL(row) {{
+        return f"""
           WITH row
-          CREATE (subgraph_node{subgraph_labels_str} {subgraph_schema_str})
-          WITH row, subgraph_node, split(row.{node_schema.field_name}, ';') as nodes
-          UNWIND nodes AS node_value
+          CREATE (tuple_node:_node_tuple{tuple_labels_str} {tuple_properties_str})
+          WITH row, tuple_node, split(row.{node_schema.field_name}, ';') as nodes
+          UNWIND RANGE(0, SIZE(nodes) - 1) AS node_position
           MATCH (n:_node {node_property_str}{common_schema_str})
-          CREATE (n)-[:_node_membership]->(subgraph_node)
-          WITH row, subgraph_node, split(row.{edge_schema.field_name}, ';') as edges
-          UNWIND edges AS edge_value
-          WITH row, subgraph_node, edges, split(edge_value, ':') AS edge_nodes
-          MATCH (start:_node {edge_property_str1}{common_schema_str})-[:_adjacency]->(edge:_edge)-[:_adjacency]->(end:_node {edge_property_str2}{common_schema_str})
-          WITH DISTINCT edge, subgraph_node
-          CREATE (edge)-[:_edge_membership]->(subgraph_node)
-        }} IN TRANSACTIONS OF {batch_size} ROWS
+          CREATE (n)-[:_node_membership{{position_in_tuple: toInteger(node_position)}}]->(tuple_node)
+        """
+
+    def _node_tuples_import_lookups(
+        self,
+        node_schema: Schema,
+        common_schema: List[Schema],
+    ) -> List[Tuple[List[Label], List[str]]]:
         """
-        self._execute_query(session, query)
+        Labels and property keys the node tuples import matches for each row.
+
+        @param node_schema: Property schema for the nodes.
+        @param common_schema: List of property schemas common to the nodes.
+        @return: List of labels and property keys.
+        """
+        return [
+            (
+                [Label("_node")],
+                [node_schema.property_name] + [s.property_name for s in common_schema],
+            )
+        ]
 
     def import_node_tuples_from_csv(
         self,
@@ -680,6 +3021,9 @@ class Neo4jDatabase(Database):
         as_url: bool = False,
         batch_size: int = 1000,
         delimiter: str = ",",
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
     ) -> None:
         """
         Import node tuples from a CSV file into Neo4j.
@@ -693,40 +3037,206 @@ class Neo4jDatabase(Database):
         @param as_url: Treat file_name as URL. Defaults to False.
         @param batch_size: Number of hyperedges to import at a time. Defaults to 1000.
         @param delimiter: Delimiter used in the CSV file. Defaults to ','.
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              connected nodes before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the progress of the import is committed together
+                           with the imported rows. A failed import run again with the same
+                           name resumes after the last committed row. Defaults to None.
+        """
+        body = self._node_tuples_import_body(
+            node_schema,
+            common_schema,
+            tuple_labels,
+            tuple_properties,
+        )
+        query = self._load_csv_query(
+            file_name,
+            body,
+            as_url,
+            batch_size,
+            delimiter,
+            checkpoint=checkpoint,
+        )
+        lookups = self._node_tuples_import_lookups(node_schema, common_schema)
+        with self._lookup_indexes(session, lookups, index_lookups, drop_indexes):
+            self._run_load_csv(session, query, checkpoint)
+
+    def import_node_tuples_from_iter(
+        self,
+        session: Neo4jSession,
+        rows: Iterable[Dict[str, Any]],
+        node_schema: Schema,
+        common_schema: List[Schema],
+        tuple_labels: List[Label],
+        tuple_properties: List[Schema],
+        batch_size: int = 1000,
+        concurrency: int = 4,
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import node tuples from an iterable of rows into Neo4j. The rows are sent in parameterized
+        batches over the connection, so the server does not need access to any file.
+
+        @param session: Database session.
+        @param rows: Dictionaries with the same fields as the columns of the CSV file.
+        @param node_schema: Property schema for the nodes.
+        @param common_schema: List of property schemas common to the nodes.
+        @param tuple_labels: List of labels to be used for the node-tuples.
+        @param tuple_schema: List of property schemas for the node-tuples.
+        @param batch_size: Number of hyperedges to import at a time. Defaults to 1000.
+        @param concurrency: Number of concurrent writer sessions. Defaults to 4.
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              connected nodes before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the committed batches are recorded together with
+                           the imported rows. A failed import run again with the same name and
+                           the same rows and batch size skips the committed batches. Defaults
+                           to None.
+        @return: Import statistics.
+        """
+        body = self._node_tuples_import_body(
+            node_schema,
+            common_schema,
+            tuple_labels,
+            tuple_properties,
+        )
+        lookups = self._node_tuples_import_lookups(node_schema, common_schema)
+        with self._lookup_indexes(session, lookups, index_lookups, drop_indexes):
+            return self._import_rows(
+                session,
+                body,
+                rows,
+                batch_size,
+                concurrency,
+                checkpoint=checkpoint,
+            )
+
+    def import_node_tuples_from_frame(
+        self,
+        session: Neo4jSession,
+        data: Any,
+        node_schema: Schema,
+        common_schema: List[Schema],
+        tuple_labels: List[Label],
+        tuple_properties: List[Schema],
+        batch_size: int = 1000,
+        concurrency: int = 4,
+        delimiter: str = ",",
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
+    ) -> ImportStats:
         """
-        tuple_labels_str = self.format_labels(tuple_labels)
-        tuple_properties_str = (
+        Import node tuples from a pandas DataFrame, Arrow data or a local CSV file into Neo4j.
+        The data is read in chunks and sent in parameterized batches over the connection.
+
+        @param session: Database session.
+        @param data: DataFrame, Arrow table or record batches, path of a local CSV (optionally
+                     gzip, bz2 or zstd compressed), Parquet or Arrow IPC file, or an iterable of
+                     DataFrames or dictionaries, with the same columns as the CSV file.
+        @param node_schema: Property schema for the nodes.
+        @param common_schema: List of property schemas common to the nodes.
+        @param tuple_labels: List of labels to be used for the node-tuples.
+        @param tuple_schema: List of property schemas for the node-tuples.
+        @param batch_size: Number of hyperedges to import at a time. Defaults to 1000.
+        @param concurrency: Number of concurrent writer sessions. Defaults to 4.
+        @param delimiter: Delimiter used in a local CSV file. Defaults to ','.
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              connected nodes before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the committed batches are recorded together with
+                           the imported rows. A failed import run again with the same name and
+                           the same rows and batch size skips the committed batches. Defaults
+                           to None.
+        @return: Import statistics.
+        """
+        return self.import_node_tuples_from_iter(
+            session,
+            iter_rows(data, batch_size, delimiter),
+            node_schema,
+            common_schema,
+            tuple_labels,
+            tuple_properties,
+            batch_size,
+            concurrency,
+            index_lookups=index_lookups,
+            drop_indexes=drop_indexes,
+            checkpoint=checkpoint,
+        )
+
+    def _subgraph_edges_import_body(
+        self,
+        start_subgraph_label: Label,
+        start_subgraph_schema: List[Schema],
+        end_subgraph_label: Label,
+        end_subgraph_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+    ) -> str:
+        """
+        Build the statements that import a single row of subgraph edges.
+
+        @param start_subgraph_label: Label of the start subgraphs.
+        @param start_subgraph_schema: List of property schemas for the start subgraphs.
+        @param end_subgraph_label: Label of the end subgraphs.
+        @param end_subgraph_schema: List of property schemas for the end subgraphs.
+        @param edge_label: Label of the subgraph edges.
+        @param edge_schema: List of property schemas for the subgraph edges.
+        @return: Cypher statements run for each row.
+        """
+        start_properties_str = (
             "{"
-            + ", ".join([s._field_to_property("row") for s in tuple_properties])
+            + ", ".join([s._field_to_property("row") for s in start_subgraph_schema])
             + "}"
         )
-        node_property_str = (
-            "{" + node_schema.set_field("nodes[node_position]")._field_to_property()
+        end_properties_str = (
+            "{"
+            + ", ".join([s._field_to_property("row") for s in end_subgraph_schema])
+            + "}"
         )
-        common_schema_str = (
-            (
-                ", "
-                + ", ".join([s._field_to_property("row") for s in common_schema])
-                + "}"
-            )
-            if common_schema != []
-            else "}"
+        edge_properties_str = (
+            "{" + ", ".join([s._field_to_property("row") for s in edge_schema]) + "}"
         )
-        file_path = file_name if as_url else f"file:///{file_name}"
-        query = f"""
-        LOAD CSV WITH HEADERS FROM '{file_path}'
-        AS row
-        FIELDTERMINATOR '{delimiter}'
-        CALL(row) {{
+        return f"""
           WITH row
-          CREATE (tuple_node:_node_tuple{tuple_labels_str} {tuple_properties_str})
-          WITH row, tuple_node, split(row.{node_schema.field_name}, ';') as nodes
-          UNWIND RANGE(0, SIZE(nodes) - 1) AS node_position
-          MATCH (n:_node {node_property_str}{common_schema_str})
-          CREATE (n)-[:_node_membership{{position_in_tuple: toInteger(node_position)}}]->(tuple_node)
-        }} IN TRANSACTIONS OF {batch_size} ROWS
+          CREATE (edge_node:_subgraph_edge:{repr(edge_label)} {edge_properties_str})
+          WITH edge_node, row
+          MATCH (start:_subgraph:{repr(start_subgraph_label)} {start_properties_str}), (end:_subgraph:{repr(end_subgraph_label)} {end_properties_str})
+          CREATE (start)-[:_subgraph_adjacency]->(edge_node)-[:_subgraph_adjacency]->(end)
         """
-        self._execute_query(session, query)
+
+    def _subgraph_edges_import_lookups(
+        self,
+        start_subgraph_label: Label,
+        start_subgraph_schema: List[Schema],
+        end_subgraph_label: Label,
+        end_subgraph_schema: List[Schema],
+    ) -> List[Tuple[List[Label], List[str]]]:
+        """
+        Labels and property keys the subgraph edges import matches for each row.
+
+        @param start_subgraph_label: Label of the start subgraphs.
+        @param start_subgraph_schema: List of property schemas for the start subgraphs.
+        @param end_subgraph_label: Label of the end subgraphs.
+        @param end_subgraph_schema: List of property schemas for the end subgraphs.
+        @return: List of labels and property keys.
+        """
+        return [
+            (
+                [Label("_subgraph"), start_subgraph_label],
+                [s.property_name for s in start_subgraph_schema],
+            ),
+            (
+                [Label("_subgraph"), end_subgraph_label],
+                [s.property_name for s in end_subgraph_schema],
+            ),
+        ]
 
     def import_subgraph_edges_from_csv(
         self,
@@ -741,6 +3251,9 @@ class Neo4jDatabase(Database):
         as_url: bool = False,
         batch_size: int = 1000,
         delimiter: str = ",",
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
     ) -> None:
         """
         Import subgraph edges from a CSV file into Neo4j.
@@ -756,34 +3269,162 @@ class Neo4jDatabase(Database):
         @param as_url: Treat file_name as URL. Defaults to False.
         @param batch_size: Number of hyperedges to import at a time. Defaults to 1000.
         @param delimiter: Delimiter used in the CSV file. Defaults to ','.
-        """
-        start_properties_str = (
-            "{"
-            + ", ".join([s._field_to_property("row") for s in start_subgraph_schema])
-            + "}"
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              connected nodes before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the progress of the import is committed together
+                           with the imported rows. A failed import run again with the same
+                           name resumes after the last committed row. Defaults to None.
+        """
+        body = self._subgraph_edges_import_body(
+            start_subgraph_label,
+            start_subgraph_schema,
+            end_subgraph_label,
+            end_subgraph_schema,
+            edge_label,
+            edge_schema,
         )
-        end_properties_str = (
-            "{"
-            + ", ".join([s._field_to_property("row") for s in end_subgraph_schema])
-            + "}"
+        query = self._load_csv_query(
+            file_name,
+            body,
+            as_url,
+            batch_size,
+            delimiter,
+            checkpoint=checkpoint,
         )
-        edge_properties_str = (
-            "{" + ", ".join([s._field_to_property("row") for s in edge_schema]) + "}"
+        lookups = self._subgraph_edges_import_lookups(
+            start_subgraph_label,
+            start_subgraph_schema,
+            end_subgraph_label,
+            end_subgraph_schema,
         )
-        file_path = file_name if as_url else f"file:///{file_name}"
-        query = f"""
-        LOAD CSV WITH HEADERS FROM '{file_path}'
-        AS row
-        FIELDTERMINATOR '{delimiter}'
-        CALL(row) {{
-          WITH row
-          CREATE (edge_node:_subgraph_edge:{repr(edge_label)} {edge_properties_str})
-          WITH edge_node, row
-          MATCH (start:_subgraph:{repr(start_subgraph_label)} {start_properties_str}), (end:_subgraph:{repr(end_subgraph_label)} {end_properties_str})
-          CREATE (start)-[:_subgraph_adjacency]->(edge_node)-[:_subgraph_adjacency]->(end)
-        }} IN TRANSACTIONS OF {batch_size} ROWS
+        with self._lookup_indexes(session, lookups, index_lookups, drop_indexes):
+            self._run_load_csv(session, query, checkpoint)
+
+    def import_subgraph_edges_from_iter(
+        self,
+        session: Neo4jSession,
+        rows: Iterable[Dict[str, Any]],
+        start_subgraph_label: Label,
+        start_subgraph_schema: List[Schema],
+        end_subgraph_label: Label,
+        end_subgraph_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+        batch_size: int = 1000,
+        concurrency: int = 4,
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import subgraph edges from an iterable of rows into Neo4j. The rows are sent in parameterized
+        batches over the connection, so the server does not need access to any file.
+
+        @param session: Database session.
+        @param rows: Dictionaries with the same fields as the columns of the CSV file.
+        @param start_subgraph_label: Label of the start subgraphs.
+        @param start_subgraph_schema: List of property schemas for the start subgraphs.
+        @param end_subgraph_label: Label of the end subgraphs.
+        @param end_subgraph_schema: List of property schemas for the end subgraphs.
+        @param edge_label: Label of the subgraph edges.
+        @param edge_schema: List of property schemas for the subgraph edges.
+        @param batch_size: Number of hyperedges to import at a time. Defaults to 1000.
+        @param concurrency: Number of concurrent writer sessions. Defaults to 4.
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              connected nodes before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the committed batches are recorded together with
+                           the imported rows. A failed import run again with the same name and
+                           the same rows and batch size skips the committed batches. Defaults
+                           to None.
+        @return: Import statistics.
+        """
+        body = self._subgraph_edges_import_body(
+            start_subgraph_label,
+            start_subgraph_schema,
+            end_subgraph_label,
+            end_subgraph_schema,
+            edge_label,
+            edge_schema,
+        )
+        lookups = self._subgraph_edges_import_lookups(
+            start_subgraph_label,
+            start_subgraph_schema,
+            end_subgraph_label,
+            end_subgraph_schema,
+        )
+        with self._lookup_indexes(session, lookups, index_lookups, drop_indexes):
+            return self._import_rows(
+                session,
+                body,
+                rows,
+                batch_size,
+                concurrency,
+                checkpoint=checkpoint,
+            )
+
+    def import_subgraph_edges_from_frame(
+        self,
+        session: Neo4jSession,
+        data: Any,
+        start_subgraph_label: Label,
+        start_subgraph_schema: List[Schema],
+        end_subgraph_label: Label,
+        end_subgraph_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+        batch_size: int = 1000,
+        concurrency: int = 4,
+        delimiter: str = ",",
+        index_lookups: bool = True,
+        drop_indexes: bool = False,
+        checkpoint: str = None,
+    ) -> ImportStats:
         """
-        self._execute_query(session, query)
+        Import subgraph edges from a pandas DataFrame, Arrow data or a local CSV file into Neo4j.
+        The data is read in chunks and sent in parameterized batches over the connection.
+
+        @param session: Database session.
+        @param data: DataFrame, Arrow table or record batches, path of a local CSV (optionally
+                     gzip, bz2 or zstd compressed), Parquet or Arrow IPC file, or an iterable of
+                     DataFrames or dictionaries, with the same columns as the CSV file.
+        @param start_subgraph_label: Label of the start subgraphs.
+        @param start_subgraph_schema: List of property schemas for the start subgraphs.
+        @param end_subgraph_label: Label of the end subgraphs.
+        @param end_subgraph_schema: List of property schemas for the end subgraphs.
+        @param edge_label: Label of the subgraph edges.
+        @param edge_schema: List of property schemas for the subgraph edges.
+        @param batch_size: Number of hyperedges to import at a time. Defaults to 1000.
+        @param concurrency: Number of concurrent writer sessions. Defaults to 4.
+        @param delimiter: Delimiter used in a local CSV file. Defaults to ','.
+        @param index_lookups: Create missing indexes on the properties used to look up the
+                              connected nodes before importing. Defaults to True.
+        @param drop_indexes: Drop the indexes created for the lookups after importing.
+                             Defaults to False.
+        @param checkpoint: Name under which the committed batches are recorded together with
+                           the imported rows. A failed import run again with the same name and
+                           the same rows and batch size skips the committed batches. Defaults
+                           to None.
+        @return: Import statistics.
+        """
+        return self.import_subgraph_edges_from_iter(
+            session,
+            iter_rows(data, batch_size, delimiter),
+            start_subgraph_label,
+            start_subgraph_schema,
+            end_subgraph_label,
+            end_subgraph_schema,
+            edge_label,
+            edge_schema,
+            batch_size,
+            concurrency,
+            index_lookups=index_lookups,
+            drop_indexes=drop_indexes,
+            checkpoint=checkpoint,
+        )
 
     def add_node(
         self,
@@ -791,6 +3432,7 @@ class Neo4jDatabase(Database):
         tx: Neo4jTransaction,
         labels: List[Label],
         properties: List[Property],
+        track_changes: bool = False,
     ) -> None:
         """
         Add a node to the database within a transaction.
@@ -799,13 +3441,15 @@ class Neo4jDatabase(Database):
         @param tx: Current transaction.
         @param labels: List of labels for the node to be added.
         @param properties: List of properties for the node to be added.
+        @param track_changes: Set the change version of the node. Defaults to False.
         """
         labels_str = self.format_labels(labels)
         properties_str = self.format_properties(properties)
-        query = f"""
-        CREATE (n{labels_str} {properties_str})
+        version_str = " SET n._version = version" if track_changes else ""
+        query = f"""{_NEXT_VERSION if track_changes else ""}
+        CREATE (n{labels_str} {properties_str}){version_str}
         """
-        self._execute_in_transaction(session, tx, query)
+        self._write_in_transaction(session, tx, query)
 
     def delete_node(
         self,
@@ -813,6 +3457,7 @@ class Neo4jDatabase(Database):
         tx: Neo4jTransaction,
         labels: List[Label],
         properties: List[Property],
+        track_changes: bool = False,
     ) -> None:
         """
         Delete a node and all its connected edges within a transaction.
@@ -821,14 +3466,16 @@ class Neo4jDatabase(Database):
         @param tx: Current transaction.
         @param labels: List of labels for the node to be deleted.
         @param properties: List of properties for the node to be deleted.
+        @param track_changes: Leave a tombstone for the node. Defaults to False.
         """
         labels_str = self.format_labels(labels)
         properties_str = self.format_properties(properties)
-        query = f"""
-        MATCH (n{labels_str} {properties_str})
+        tombstone_str = self._tombstone_clause("n") if track_changes else ""
+        query = f"""{_NEXT_VERSION if track_changes else ""}
+        MATCH (n{labels_str} {properties_str}){tombstone_str}
         DETACH DELETE n
         """
-        self._execute_in_transaction(session, tx, query)
+        self._write_in_transaction(session, tx, query)
 
     def delete_node_with_node_edges(
         self,
@@ -837,6 +3484,7 @@ class Neo4jDatabase(Database):
         labels: List[Label],
         properties: List[Property],
         edge_label: Label,
+        track_changes: bool = False,
     ) -> None:
         """
         Delete a node and all its connecting HO edges. A HO edge is modeled as a node on the LPG
@@ -847,18 +3495,23 @@ class Neo4jDatabase(Database):
         @param labels: List of labels for the node to be deleted.
         @param properties: List of properties for the node to be deleted.
         @param edge_label: Label of the edges.
+        @param track_changes: Leave tombstones for the node and its HO edges. Defaults to False.
         """
         labels_str = self.format_labels(labels)
         properties_str = self.format_properties(properties)
-        query = f"""
+        edge_tombstone_str = self._tombstone_clause("edge") if track_changes else ""
+        node_tombstone_str = self._tombstone_clause("n") if track_changes else ""
+        carry_str = ", version" if track_changes else ""
+        query = f"""{_NEXT_VERSION if track_changes else ""}
         MATCH (n{labels_str} {properties_str})
-        WITH n OPTIONAL MATCH (n)-[:{repr(edge_label)}]->(edge)
+        WITH n{carry_str} OPTIONAL MATCH (n)-[:{repr(edge_label)}]->(edge){edge_tombstone_str}
         DETACH DELETE edge
-        WITH n OPTIONAL MATCH (edge)-[:{repr(edge_label)}]->(n)
+        WITH DISTINCT n{carry_str} OPTIONAL MATCH (edge)-[:{repr(edge_label)}]->(n){edge_tombstone_str}
         DETACH DELETE edge
+        WITH DISTINCT n{carry_str}{node_tombstone_str}
         DETACH DELETE n
         """
-        self._execute_in_transaction(session, tx, query)
+        self._write_in_transaction(session, tx, query)
 
     def add_edge(
         self,
@@ -870,6 +3523,7 @@ class Neo4jDatabase(Database):
         end_node_properties: List[Property],
         edge_label: Label,
         edge_properties: List[Property],
+        track_changes: bool = False,
     ) -> None:
         """
         Add an edge between two nodes.
@@ -882,6 +3536,7 @@ class Neo4jDatabase(Database):
         @param end_node_properties: List of properties for the end node.
         @param edge_label: Label of the edge.
         @param edge_properties: List of properties of the edge.
+        @param track_changes: Set the change version of the edge. Defaults to False.
         """
         start_labels_str = self.format_labels(start_node_labels)
         end_labels_str = self.format_labels(end_node_labels)
@@ -889,12 +3544,13 @@ class Neo4jDatabase(Database):
         end_properties_str = self.format_properties(end_node_properties)
         edge_label_str = self.format_labels([edge_label])
         edge_properties_str = self.format_properties(edge_properties)
-        query = f"""
+        version_str = " SET r._version = version" if track_changes else ""
+        query = f"""{_NEXT_VERSION if track_changes else ""}
         MATCH (start{start_labels_str} {start_properties_str})
         MATCH (end{end_labels_str} {end_properties_str})
-        CREATE (start)-[r{edge_label_str} {edge_properties_str}]->(end)
+        CREATE (start)-[r{edge_label_str} {edge_properties_str}]->(end){version_str}
         """
-        self._execute_in_transaction(session, tx, query)
+        self._write_in_transaction(session, tx, query)
 
     def delete_edge(
         self,
@@ -905,6 +3561,7 @@ class Neo4jDatabase(Database):
         end_node_labels: List[Label],
         end_node_properties: List[Property],
         edge_label: Label,
+        track_changes: bool = False,
     ) -> None:
         """
         Delete an edge between two nodes.
@@ -916,17 +3573,29 @@ class Neo4jDatabase(Database):
         @param end_node_labels: List of labels for the end node.
         @param end_node_properties: List of properties for the end node.
         @param edge_label: Label of the edge.
+        @param track_changes: Leave a tombstone for the edge, holding the properties the start
+                              and end nodes were matched on. Defaults to False.
         """
         start_labels_str = self.format_labels(start_node_labels)
         end_labels_str = self.format_labels(end_node_labels)
         start_properties_str = self.format_properties(start_node_properties)
         end_properties_str = self.format_properties(end_node_properties)
         edge_label_str = self.format_labels([edge_label])
-        query = f"""
-        MATCH (start{start_labels_str} {start_properties_str})-[r{edge_label_str}]->(end{end_labels_str} {end_properties_str})
+        tombstone_str = (
+            self._tombstone_clause(
+                "r",
+                relationship=True,
+                start_keys=[p.key for p in start_node_properties],
+                end_keys=[p.key for p in end_node_properties],
+            )
+            if track_changes
+            else ""
+        )
+        query = f"""{_NEXT_VERSION if track_changes else ""}
+        MATCH (start{start_labels_str} {start_properties_str})-[r{edge_label_str}]->(end{end_labels_str} {end_properties_str}){tombstone_str}
         DELETE r
         """
-        self._execute_in_transaction(session, tx, query)
+        self._write_in_transaction(session, tx, query)
 
     def update_node(
         self,
@@ -935,6 +3604,7 @@ class Neo4jDatabase(Database):
         node_labels: List[Label],
         node_properties: List[Property],
         update_properties: List[Property],
+        track_changes: bool = False,
     ) -> None:
         """
         Update properties of a node.
@@ -944,15 +3614,22 @@ class Neo4jDatabase(Database):
         @param node_labels: List of labels of the node.
         @param node_properties: List of original properties of the node.
         @param update_properties: List of new properties for the node.
+        @param track_changes: Set the change version of the node and of the HO elements it is
+                              a member of. Defaults to False.
         """
         node_labels_str = self.format_labels(node_labels)
         node_properties_str = self.format_properties(node_properties)
         update_properties_str = self.format_properties(update_properties)
-        query = f"""
+        version_str = (
+            ", n._version = version" + self._touch_clause("n")
+            if track_changes
+            else ""
+        )
+        query = f"""{_NEXT_VERSION if track_changes else ""}
         MATCH (n{node_labels_str} {node_properties_str})
-        SET n += {update_properties_str}
+        SET n += {update_properties_str}{version_str}
         """
-        self._execute_in_transaction(session, tx, query)
+        self._write_in_transaction(session, tx, query)
 
     def update_edge(
         self,
@@ -961,6 +3638,7 @@ class Neo4jDatabase(Database):
         edge_label: Label,
         edge_properties: List[Property],
         update_properties: List[Property],
+        track_changes: bool = False,
     ) -> None:
         """
         Update properties of an edge.
@@ -970,15 +3648,17 @@ class Neo4jDatabase(Database):
         @param edge_label: Label of the edge.
         @param edge_properties: List of original properties of the edge.
         @param update_properties: List of new properties for the edge.
+        @param track_changes: Set the change version of the edge. Defaults to False.
         """
         edge_label_str = self.format_labels([edge_label])
         edge_properties_str = self.format_properties(edge_properties)
         update_properties_str = self.format_properties(update_properties)
-        query = f"""
+        version_str = ", e._version = version" if track_changes else ""
+        query = f"""{_NEXT_VERSION if track_changes else ""}
         MATCH ()-[e{edge_label_str} {edge_properties_str}]->()
-        SET e += {update_properties_str}
+        SET e += {update_properties_str}{version_str}
         """
-        self._execute_in_transaction(session, tx, query)
+        self._write_in_transaction(session, tx, query)
 
     def node_count(self, session: Neo4jSession, node_labels: List[Label] = None) -> int:
         """
@@ -993,7 +3673,7 @@ class Neo4jDatabase(Database):
         MATCH (node{node_label_str})
         RETURN count(node) as count
         """
-        records = self._execute_query(session, query)
+        records = self._execute_query(session, query, read_only=True)
         if (
             type(records) == list
             and len(records) == 1
@@ -1017,7 +3697,7 @@ class Neo4jDatabase(Database):
         MATCH ()-[edge{edge_label_str}]->()
         RETURN count(edge) as count
         """
-        records = self._execute_query(session, query)
+        records = self._execute_query(session, query, read_only=True)
         if (
             type(records) == list
             and len(records) == 1
@@ -1048,7 +3728,7 @@ class Neo4jDatabase(Database):
         MATCH (node{node_label_str}{node_properties_str})
         RETURN labels(node), properties(node)
         """
-        records = self._execute_query(session, query)
+        records = self._execute_query(session, query, read_only=True)
         df = pd.DataFrame(records, columns=["labels", "properties"])
         return df
 
@@ -1084,7 +3764,7 @@ class Neo4jDatabase(Database):
         MATCH (start_node{start_node_label_str}{start_node_properties_str})-[edge{edge_label_str}{edge_properties_str}]->(end_node{end_node_label_str}{end_node_properties_str})
         RETURN labels(start_node), properties(start_node), labels(end_node), properties(end_node), type(edge), properties(edge)
         """
-        records = self._execute_query(session, query)
+        records = self._execute_query(session, query, read_only=True)
         df = pd.DataFrame(
             records,
             columns=[
@@ -1133,7 +3813,7 @@ class Neo4jDatabase(Database):
         MATCH (start_node{start_node_label_str}{start_node_properties_str})-[:{edge_label}]->(edge{edge_label_str}{edge_properties_str})-[:{edge_label}]->(end_node{end_node_label_str}{end_node_properties_str})
         RETURN labels(start_node), properties(start_node), labels(end_node), properties(end_node), labels(edge), properties(edge)
         """
-        records = self._execute_query(session, query)
+        records = self._execute_query(session, query, read_only=True)
         df = pd.DataFrame(
             records,
             columns=[
@@ -1167,19 +3847,19 @@ class Neo4jDatabase(Database):
         MATCH (subgraph{subgraph_labels_str}{subgraph_properties_str})
         RETURN labels(subgraph), properties(subgraph)
         """
-        subgraph_records = self._execute_query(session, query)
+        subgraph_records = self._execute_query(session, query, read_only=True)
         assert len(subgraph_records) <= 1
         query = f"""
         MATCH (node:_node)-[:_node_membership]->(subgraph{subgraph_labels_str}{subgraph_properties_str})
         RETURN labels(node), properties(node)
         """
-        node_records = self._execute_query(session, query)
+        node_records = self._execute_query(session, query, read_only=True)
         query = f"""
         MATCH (edge:_edge)-[:_edge_membership]->(subgraph{subgraph_labels_str}{subgraph_properties_str})
         MATCH (start:_node)-[:_adjacency]->(edge)-[:_adjacency]->(end:_node)
         RETURN labels(start), properties(start), labels(end), properties(end), labels(edge), properties(edge)
         """
-        edge_records = self._execute_query(session, query)
+        edge_records = self._execute_query(session, query, read_only=True)
         subgraph_df = pd.DataFrame(subgraph_records, columns=["labels", "properties"])
         node_df = pd.DataFrame(node_records, columns=["labels", "properties"])
         edge_df = pd.DataFrame(
@@ -1227,7 +3907,7 @@ class Neo4jDatabase(Database):
         MATCH (start_node{start_label_str}{start_properties_str})-[:_subgraph_adjacency]->(edge{edge_label_str}{edge_properties_str})-[:_subgraph_adjacency]->(end_node{end_label_str}{end_properties_str})
         RETURN labels(start_node), properties(start_node), labels(end_node), properties(end_node), labels(edge), properties(edge)
         """
-        records = self._execute_query(session, query)
+        records = self._execute_query(session, query, read_only=True)
         df = pd.DataFrame(
             records,
             columns=[
@@ -1265,13 +3945,13 @@ class Neo4jDatabase(Database):
         MATCH (edge{edge_labels_str}{properties_str})
         RETURN labels(edge), properties(edge)
         """
-        edge_records = self._execute_query(session, query)
+        edge_records = self._execute_query(session, query, read_only=True)
         assert len(edge_records) <= 1
         query = f"""
         MATCH (node{node_labels_str})-[:_adjacency]->(edge{edge_labels_str}{properties_str})
         RETURN labels(node), properties(node)
         """
-        node_records = self._execute_query(session, query)
+        node_records = self._execute_query(session, query, read_only=True)
         node_df = pd.DataFrame(node_records, columns=["labels", "properties"])
         edge_df = pd.DataFrame(edge_records, columns=["labels", "properties"])
         return (node_df, edge_df)
@@ -1297,13 +3977,13 @@ class Neo4jDatabase(Database):
         MATCH (tuple{tuple_labels_str}{tuple_properties_str})
         RETURN labels(tuple), properties(tuple)
         """
-        tuple_records = self._execute_query(session, query)
+        tuple_records = self._execute_query(session, query, read_only=True)
         assert len(tuple_records) <= 1
         query = f"""
         MATCH (node:_node)-[r:_node_membership]->(tuple{tuple_labels_str}{tuple_properties_str})
         RETURN labels(node), properties(node), r.position_in_tuple
         """
-        node_records = self._execute_query(session, query)
+        node_records = self._execute_query(session, query, read_only=True)
         tuple_df = pd.DataFrame(tuple_records, columns=["labels", "properties"])
         node_df = pd.DataFrame(
             node_records, columns=["labels", "properties", "position"]
@@ -1339,6 +4019,84 @@ class Neo4jDatabase(Database):
         """
         self._execute_query(session, query)
 
+    def ensure_indexes(
+        self,
+        session: Neo4jSession,
+        lookups: List[Tuple[List[Label], List[str]]],
+        unique: bool = False,
+        timeout: int = 300,
+    ) -> List[str]:
+        """
+        Create range indexes for node lookups that no existing index serves and wait until
+        they are online. A lookup is served if one of its labels has a range index whose
+        properties are all matched by the lookup. New indexes are created on the last, most
+        specific label of a lookup.
+
+        @param session: Database session.
+        @param lookups: List of labels and the property keys matched on them.
+        @param unique: Create uniqueness constraints instead of plain indexes. Defaults to False.
+        @param timeout: Maximum time in seconds to wait for the indexes. Defaults to 300.
+        @return: Names of the created indexes or constraints.
+        """
+        indexes = [
+            (label, set(properties))
+            for _, label, properties, index_type in self._index_definitions(session)
+            if index_type == "RANGE"
+        ]
+        created = []
+        for labels, properties in lookups:
+            if not properties or any(
+                label == repr(lookup_label) and keys <= set(properties)
+                for label, keys in indexes
+                for lookup_label in labels
+            ):
+                continue
+            label = labels[-1]
+            properties_str = "_".join(properties)
+            property_list = ", ".join([f"n.{p}" for p in properties])
+            if unique:
+                name = f"{label}_{properties_str}_unique"
+                query = f"""
+                CREATE CONSTRAINT {name} IF NOT EXISTS
+                FOR (n:{label}) REQUIRE ({property_list}) IS UNIQUE
+                """
+            else:
+                name = f"{label}_{properties_str}_index"
+                query = f"""
+                CREATE INDEX {name} IF NOT EXISTS FOR (n:{label}) ON ({property_list})
+                """
+            self._execute_query(session, query)
+            indexes.append((repr(label), set(properties)))
+            created.append(name)
+        if created:
+            self._execute_query(session, f"CALL db.awaitIndexes({timeout})")
+        return created
+
+    @contextmanager
+    def _lookup_indexes(
+        self,
+        session: Neo4jSession,
+        lookups: List[Tuple[List[Label], List[str]]],
+        create: bool,
+        drop: bool,
+    ) -> Iterator[List[str]]:
+        """
+        Context manager providing indexes for the node lookups of an import.
+
+        @param session: Database session.
+        @param lookups: List of labels and the property keys matched on them.
+        @param create: Create the missing indexes.
+        @param drop: Drop the created indexes when leaving the context.
+        @return: Names of the created indexes.
+        """
+        created = self.ensure_indexes(session, lookups) if create else []
+        try:
+            yield created
+        finally:
+            if drop:
+                for name in created:
+                    self.drop_index(session, name)
+
     def show_indexes(self, session: Neo4jSession) -> List[Tuple[str, List[str]]]:
         """
         Show all indexes in the database.
@@ -1377,11 +4135,15 @@ class Neo4jDatabase(Database):
         session: Neo4jSession,
         variables_list: List[List[str]],
         elements_list: List[List[Tuple[List[Label], List[Property]]]],
-        conditions_list: List[List[str]],
+        conditions_list: List[List[Union[str, Predicate]]],
         return_values: List[str],
         sort: List[str] = None,
         limit: int = None,
-    ) -> pd.DataFrame:
+        output: str = "pandas",
+        dtypes: Optional[Dict[str, Any]] = None,
+        group_by: List[str] = None,
+        aggregates: List[Aggregate] = None,
+    ) -> Union[pd.DataFrame, Dict[str, Any]]:
         """
         Traverse a path in the database.
 
@@ -1392,8 +4154,15 @@ class Neo4jDatabase(Database):
         @param return_values: TODO.
         @param sort: TODO. Defaults to None.
         @param limit: TODO. Defaults to None.
-        @return: Path information.
-        """
+        @param output: Result format: 'pandas', 'numpy' or 'torch'. Defaults to 'pandas'.
+        @param dtypes: Optional mapping from return value to dtype for the 'numpy' and 'torch'
+                       formats. Defaults to None.
+        @param group_by: Grouping keys returned next to the aggregations. Defaults to None.
+        @param aggregates: Aggregations evaluated by the database. Defaults to None.
+        @return: Path information as a dataframe or as a dictionary of arrays.
+        """
+        if output not in OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output format: {output}")
         element_strs = [
             [
                 f"{var}{self.format_labels(labels)} {self.format_properties(properties)}"
@@ -1414,8 +4183,13 @@ class Neo4jDatabase(Database):
             )
             for element_str in element_strs
         ]
+        parameters = {}
         conditions = [
-            f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            (
+                f"WHERE {' AND '.join(self._compile_condition(c, parameters) for c in conditions)}"
+                if conditions
+                else ""
+            )
             for conditions in conditions_list
         ]
         pattern = "".join(
@@ -1428,36 +4202,159 @@ class Neo4jDatabase(Database):
         )
         limit_str = f"LIMIT {limit}" if limit else ""
         sort_str = f"ORDER BY {', '.join(sort)}" if sort else ""
-        return_str = f"{', '.join(return_values)}" if return_values else "*"
+        group_by = group_by if group_by else []
+        aggregates = aggregates if aggregates else []
+        return_items = return_values + group_by + [repr(a) for a in aggregates]
+        columns = return_values + group_by + [a.alias for a in aggregates]
+        return_str = f"{', '.join(return_items)}" if return_items else "*"
         query = f"""
         {pattern}
         RETURN {return_str}
         {sort_str}
         {limit_str}
         """
-        records = self._execute_query(session, query)
-        df = pd.DataFrame(records, columns=return_values)
+        records = self._execute_query(session, query, parameters, read_only=True)
+        if output != "pandas":
+            return records_to_arrays(records, columns, dtypes, output)
+        df = pd.DataFrame(records, columns=columns)
         return df
 
+    @staticmethod
+    def _compile_condition(
+        condition: Union[str, Predicate], parameters: Dict[str, Any]
+    ) -> str:
+        """
+        Compile a path condition. Raw strings are used verbatim, structured predicates are
+        compiled to parameterized expressions.
+
+        @param condition: Cypher string or structured predicate.
+        @param parameters: Dictionary receiving the query parameters.
+        @return: Cypher expression.
+        """
+        if isinstance(condition, Predicate):
+            return condition.compile(parameters)
+        return condition
+
+    def _index_definitions(self, session: Neo4jSession) -> List[Tuple[str, str, List[str], str]]:
+        """
+        List the property indexes in the database.
+
+        @param session: Database session.
+        @return: List of index names, labels or relationship types, property keys and index types.
+        """
+        query = """
+        SHOW INDEXES
+        YIELD name, labelsOrTypes, properties, type
+        WHERE properties IS NOT NULL
+        RETURN name, labelsOrTypes[0] AS label, properties, type
+        """
+        records = self._execute_query(session, query)
+        return [(r[0], r[1], list(r[2]), r[3]) for r in records]
+
+    def indexed_predicates(
+        self,
+        session: Neo4jSession,
+        variables_list: List[List[str]],
+        elements_list: List[List[Tuple[List[Label], List[Property]]]],
+        conditions_list: List[List[Union[str, Predicate]]],
+    ) -> List[Tuple[Comparison, Optional[str]]]:
+        """
+        Determine which structured predicates of a traversal an existing index can serve. A
+        comparison is served if it accesses a property of a variable whose label carries an
+        index on that property, the operator is supported by the index type and, for composite
+        indexes, all indexed properties are constrained. Raw string conditions are ignored.
+
+        @param session: Database session.
+        @param variables_list: Variables of the paths.
+        @param elements_list: Labels and properties of the path elements.
+        @param conditions_list: Conditions of the paths.
+        @return: List of comparisons and the name of the index serving each of them, or None.
+        """
+        variable_labels = {}
+        for variables, elements in zip(variables_list, elements_list):
+            for variable, (labels, _) in zip(variables, elements):
+                if variable is not None:
+                    variable_labels.setdefault(variable, set()).update(
+                        repr(label) for label in labels
+                    )
+        comparisons = [
+            comparison
+            for conditions in conditions_list
+            for condition in conditions
+            if isinstance(condition, Predicate)
+            for comparison in condition.conjuncts()
+        ]
+        constrained = {c.property_access for c in comparisons if c.sargable}
+        indexes = self._index_definitions(session)
+        served = []
+        for comparison in comparisons:
+            index_name = None
+            if comparison.sargable:
+                variable, key = comparison.property_access
+                index_types = _INDEX_TYPES.get(comparison.operator, ())
+                index_name = next(
+                    (
+                        name
+                        for name, label, properties, index_type in indexes
+                        if index_type in index_types
+                        and label in variable_labels.get(variable, ())
+                        and key in properties
+                        and all((variable, p) in constrained for p in properties)
+                    ),
+                    None,
+                )
+            served.append((comparison, index_name))
+        return served
+
     def clear_data(self, session: Neo4jSession) -> None:
         """
-        Remove all data from the database.
+        Remove all data from the database. The change version counter is kept, so that the
+        versions of later changes stay greater than those returned before.
 
         @param session: Database session.
         """
         query = """
-        MATCH (n)
+        MATCH (n) WHERE NOT n:_version_counter
         DETACH DELETE n
         """
         self._execute_query(session, query)
 
-    def start_session(self) -> Neo4jSession:
+    def start_session(self, bookmarks=None, read_only: bool = False) -> Neo4jSession:
         """
         Start a new database session.
 
+        @param bookmarks: Bookmarks the session has to be causally consistent with. Defaults to None.
+        @param read_only: Whether the session is only used for reads. Defaults to False.
         @return: Database session.
         """
-        return self._driver.session(database=self._db_name)
+        if self._proxy:
+            return self._driver.session(database=self._db_name)
+        return self._driver.session(
+            database=self._db_name,
+            bookmarks=bookmarks,
+            default_access_mode=READ_ACCESS if read_only else WRITE_ACCESS,
+        )
+
+    def last_bookmarks(self, session: Neo4jSession):
+        """
+        Get the bookmarks of the last transaction committed in the given session.
+
+        @param session: Database session.
+        @return: Bookmarks or None when running through the proxy.
+        """
+        if self._proxy:
+            return None
+        return session.last_bookmarks()
+
+    @property
+    def max_concurrent_sessions(self) -> int:
+        """
+        Maximum number of sessions that can be used concurrently, bounded by the connection
+        pool to the database or to the proxy.
+
+        @return: Number of concurrent sessions.
+        """
+        return self._max_connection_pool_size
 
     def end_session(self, session) -> None:
         """
@@ -0,0 +1,385 @@
+# Copyright (c) 2025 ETH Zurich.
+#                    All rights reserved.
+#
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+import re
+
+_PROPERTY_ACCESS = re.compile(r"^\s*(\w+)\.(\w+)\s*$")
+
+
+class Predicate(ABC):
+    """
+    Base class of the structured predicates used as path conditions. Predicates compile to
+    parameterized WHERE clauses, so the values are never inlined into the query text.
+    """
+
+    @abstractmethod
+    def compile(self, parameters: Dict[str, Any]) -> str:
+        """
+        Compile the predicate into a Cypher expression.
+
+        @param parameters: Dictionary receiving the query parameters of the predicate.
+        @return: Cypher expression referencing the parameters.
+        """
+        pass
+
+    def conjuncts(self) -> List["Comparison"]:
+        """
+        Comparisons that must all hold for the predicate to hold. Only these can be served
+        by an index seek.
+
+        @return: List of comparisons.
+        """
+        return []
+
+    def __and__(self, other: "Predicate") -> "Predicate":
+        """
+        Conjunction of two predicates.
+
+        @param other: The other predicate.
+        @return: Predicate holding if both predicates hold.
+        """
+        return And(self, other)
+
+    def __or__(self, other: "Predicate") -> "Predicate":
+        """
+        Disjunction of two predicates.
+
+        @param other: The other predicate.
+        @return: Predicate holding if any of the predicates holds.
+        """
+        return Or(self, other)
+
+    def __invert__(self) -> "Predicate":
+        """
+        Negation of the predicate.
+
+        @return: Predicate holding if this predicate does not hold.
+        """
+        return Not(self)
+
+
+class Comparison(Predicate):
+    """
+    A predicate comparing an expression against a value.
+    """
+
+    # operators that a range index can serve
+    RANGE_OPERATORS = ("=", "<", "<=", ">", ">=", "IN", "STARTS WITH", "IS NOT NULL")
+    # operators that can only be served by a text index
+    TEXT_OPERATORS = ("ENDS WITH", "CONTAINS")
+    UNARY_OPERATORS = ("IS NULL", "IS NOT NULL")
+
+    def __init__(self, expression: str, operator: str, value: Any = None) -> None:
+        """
+        Initialize the Comparison instance.
+
+        @param expression: Left-hand side of the comparison, for example 'a.graph_id'.
+        @param operator: Comparison operator.
+        @param value: Value compared against. Ignored for unary operators. Defaults to None.
+        """
+        if (
+            operator not in self.RANGE_OPERATORS + self.TEXT_OPERATORS
+            and operator not in self.UNARY_OPERATORS
+            and operator != "<>"
+        ):
+            raise ValueError(f"Unsupported comparison operator: {operator}")
+        self.expression = expression
+        self.operator = operator
+        self.value = value
+
+    @property
+    def property_access(self) -> Optional[Tuple[str, str]]:
+        """
+        Variable and property key if the expression is a plain property access.
+
+        @return: Tuple of variable and property key, or None.
+        """
+        match = _PROPERTY_ACCESS.match(self.expression)
+        return (match.group(1), match.group(2)) if match else None
+
+    @property
+    def sargable(self) -> bool:
+        """
+        Whether an index seek on the accessed property can evaluate the comparison.
+
+        @return: True if a range or text index can serve the comparison.
+        """
+        return self.property_access is not None and (
+            self.operator in self.RANGE_OPERATORS + self.TEXT_OPERATORS
+        )
+
+    def compile(self, parameters: Dict[str, Any]) -> str:
+        """
+        Compile the comparison into a Cypher expression.
+
+        @param parameters: Dictionary receiving the query parameters of the comparison.
+        @return: Cypher expression referencing the parameters.
+        """
+        if self.operator in self.UNARY_OPERATORS:
+            return f"{self.expression} {self.operator}"
+        name = f"p{len(parameters)}"
+        parameters[name] = self.value
+        return f"{self.expression} {self.operator} ${name}"
+
+    def conjuncts(self) -> List["Comparison"]:
+        """
+        Comparisons that must all hold for the predicate to hold.
+
+        @return: List containing the comparison itself.
+        """
+        return [self]
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the Comparison instance.
+
+        @return: A string representation of the comparison.
+        """
+        if self.operator in self.UNARY_OPERATORS:
+            return f"{self.expression} {self.operator}"
+        return f"{self.expression} {self.operator} {self.value!r}"
+
+
+class And(Predicate):
+    """
+    A conjunction of predicates.
+    """
+
+    def __init__(self, *predicates: Predicate) -> None:
+        """
+        Initialize the And instance.
+
+        @param predicates: Predicates that must all hold.
+        """
+        self.predicates = list(predicates)
+
+    def compile(self, parameters: Dict[str, Any]) -> str:
+        """
+        Compile the conjunction into a Cypher expression.
+
+        @param parameters: Dictionary receiving the query parameters.
+        @return: Cypher expression referencing the parameters.
+        """
+        return "(" + " AND ".join(p.compile(parameters) for p in self.predicates) + ")"
+
+    def conjuncts(self) -> List[Comparison]:
+        """
+        Comparisons that must all hold for the conjunction to hold.
+
+        @return: List of comparisons.
+        """
+        return [c for predicate in self.predicates for c in predicate.conjuncts()]
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the And instance.
+
+        @return: A string representation of the conjunction.
+        """
+        return "(" + " AND ".join(repr(p) for p in self.predicates) + ")"
+
+
+class Or(Predicate):
+    """
+    A disjunction of predicates.
+    """
+
+    def __init__(self, *predicates: Predicate) -> None:
+        """
+        Initialize the Or instance.
+
+        @param predicates: Predicates of which at least one must hold.
+        """
+        self.predicates = list(predicates)
+
+    def compile(self, parameters: Dict[str, Any]) -> str:
+        """
+        Compile the disjunction into a Cypher expression.
+
+        @param parameters: Dictionary receiving the query parameters.
+        @return: Cypher expression referencing the parameters.
+        """
+        return "(" + " OR ".join(p.compile(parameters) for p in self.predicates) + ")"
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the Or instance.
+
+        @return: A string representation of the disjunction.
+        """
+        return "(" + " OR ".join(repr(p) for p in self.predicates) + ")"
+
+
+class Not(Predicate):
+    """
+    A negated predicate.
+    """
+
+    def __init__(self, predicate: Predicate) -> None:
+        """
+        Initialize the Not instance.
+
+        @param predicate: Predicate that must not hold.
+        """
+        self.predicate = predicate
+
+    def compile(self, parameters: Dict[str, Any]) -> str:
+        """
+        Compile the negation into a Cypher expression.
+
+        @param parameters: Dictionary receiving the query parameters.
+        @return: Cypher expression referencing the parameters.
+        """
+        return f"NOT {self.predicate.compile(parameters)}"
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the Not instance.
+
+        @return: A string representation of the negation.
+        """
+        return f"NOT {self.predicate!r}"
+
+
+class P:
+    """
+    Builder for structured predicates on a property or expression, for example
+    P("a.graph_id") == 5 or P("a.name").starts_with("C").
+    """
+
+    def __init__(self, expression: str) -> None:
+        """
+        Initialize the P instance.
+
+        @param expression: Expression the predicates refer to, usually 'variable.property'.
+        """
+        self.expression = expression
+
+    def __eq__(self, value: Any) -> Comparison:
+        """
+        Equality comparison.
+
+        @param value: Value compared against.
+        @return: Comparison instance.
+        """
+        return Comparison(self.expression, "=", value)
+
+    def __ne__(self, value: Any) -> Comparison:
+        """
+        Inequality comparison.
+
+        @param value: Value compared against.
+        @return: Comparison instance.
+        """
+        return Comparison(self.expression, "<>", value)
+
+    def __lt__(self, value: Any) -> Comparison:
+        """
+        Less than comparison.
+
+        @param value: Value compared against.
+        @return: Comparison instance.
+        """
+        return Comparison(self.expression, "<", value)
+
+    def __le__(self, value: Any) -> Comparison:
+        """
+        Less than or equal comparison.
+
+        @param value: Value compared against.
+        @return: Comparison instance.
+        """
+        return Comparison(self.expression, "<=", value)
+
+    def __gt__(self, value: Any) -> Comparison:
+        """
+        Greater than comparison.
+
+        @param value: Value compared against.
+        @return: Comparison instance.
+        """
+        return Comparison(self.expression, ">", value)
+
+    def __ge__(self, value: Any) -> Comparison:
+        """
+        Greater than or equal comparison.
+
+        @param value: Value compared against.
+        @return: Comparison instance.
+        """
+        return Comparison(self.expression, ">=", value)
+
+    __hash__ = None
+
+    def in_(self, values: List[Any]) -> Comparison:
+        """
+        Membership in a list of values.
+
+        @param values: Allowed values.
+        @return: Comparison instance.
+        """
+        return Comparison(self.expression, "IN", list(values))
+
+    def between(
+        self, low: Any, high: Any, inclusive: Tuple[bool, bool] = (True, True)
+    ) -> Predicate:
+        """
+        Range of values.
+
+        @param low: Lower bound.
+        @param high: Upper bound.
+        @param inclusive: Whether the lower and upper bounds are included. Defaults to (True, True).
+        @return: Predicate instance.
+        """
+        return And(
+            Comparison(self.expression, ">=" if inclusive[0] else ">", low),
+            Comparison(self.expression, "<=" if inclusive[1] else "<", high),
+        )
+
+    def starts_with(self, prefix: str) -> Comparison:
+        """
+        String prefix match.
+
+        @param prefix: Prefix.
+        @return: Comparison instance.
+        """
+        return Comparison(self.expression, "STARTS WITH", prefix)
+
+    def ends_with(self, suffix: str) -> Comparison:
+        """
+        String suffix match.
+
+        @param suffix: Suffix.
+        @return: Comparison instance.
+        """
+        return Comparison(self.expression, "ENDS WITH", suffix)
+
+    def contains(self, substring: str) -> Comparison:
+        """
+        String containment.
+
+        @param substring: Substring.
+        @return: Comparison instance.
+        """
+        return Comparison(self.expression, "CONTAINS", substring)
+
+    def is_null(self) -> Comparison:
+        """
+        The expression is null, for example a missing property.
+
+        @return: Comparison instance.
+        """
+        return Comparison(self.expression, "IS NULL")
+
+    def is_not_null(self) -> Comparison:
+        """
+        The expression is not null, for example an existing property.
+
+        @return: Comparison instance.
+        """
+        return Comparison(self.expression, "IS NOT NULL")
@@ -0,0 +1,194 @@
+# Copyright (c) 2025 ETH Zurich.
+#                    All rights reserved.
+#
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+from typing import Any, Dict, Iterator, List, Optional
+
+# arguments of a profiled operator that are measured while running the query, rather than
+# planned
+EXECUTION_STATISTICS = (
+    "DbHits",
+    "Rows",
+    "Time",
+    "Memory",
+    "GlobalMemory",
+    "PageCacheHits",
+    "PageCacheMisses",
+    "PageCacheHitRatio",
+)
+
+
+class PlanOperator:
+    """
+    A class representing one operator of a query plan.
+    """
+
+    def __init__(
+        self,
+        operator_type: str,
+        identifiers: List[str] = None,
+        arguments: Dict[str, Any] = None,
+        db_hits: int = 0,
+        rows: int = 0,
+        children: List["PlanOperator"] = None,
+    ) -> None:
+        """
+        Initialize the PlanOperator instance.
+
+        @param operator_type: Type of the operator, for example 'NodeIndexSeek'.
+        @param identifiers: Variables introduced or used by the operator. Defaults to None.
+        @param arguments: Operator arguments reported by the planner. Defaults to None.
+        @param db_hits: Number of database hits of the operator. Defaults to 0.
+        @param rows: Number of rows produced by the operator. Defaults to 0.
+        @param children: Child operators. Defaults to None.
+        """
+        self.operator_type = operator_type
+        self.identifiers = identifiers if identifiers is not None else []
+        self.arguments = arguments if arguments is not None else {}
+        self.db_hits = db_hits
+        self.rows = rows
+        self.children = children if children is not None else []
+
+    @staticmethod
+    def from_summary(plan: Dict[str, Any]) -> "PlanOperator":
+        """
+        Build a plan tree from the plan or profile dictionary of a result summary.
+
+        @param plan: Plan dictionary as returned by the driver.
+        @return: Root operator of the plan.
+        """
+        arguments = plan.get("args", plan.get("arguments", {}))
+        return PlanOperator(
+            plan.get("operatorType", plan.get("operator_type", "")),
+            list(plan.get("identifiers", [])),
+            dict(arguments),
+            plan.get("dbHits", plan.get("db_hits", arguments.get("DbHits", 0))) or 0,
+            plan.get("rows", arguments.get("Rows", 0)) or 0,
+            [PlanOperator.from_summary(child) for child in plan.get("children", [])],
+        )
+
+    def walk(self) -> Iterator["PlanOperator"]:
+        """
+        Iterate over the operator and all its descendants in depth-first order.
+
+        @return: Iterator over the operators.
+        """
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def without_statistics(self) -> "PlanOperator":
+        """
+        Copy the plan tree without the rows and database hits of its operators.
+
+        @return: Root operator of the copy.
+        """
+        arguments = {
+            key: value
+            for key, value in self.arguments.items()
+            if key not in EXECUTION_STATISTICS
+        }
+        return PlanOperator(
+            self.operator_type,
+            list(self.identifiers),
+            arguments,
+            children=[child.without_statistics() for child in self.children],
+        )
+
+    def total_db_hits(self) -> int:
+        """
+        Sum of the database hits of the operator and all its descendants.
+
+        @return: Total number of database hits.
+        """
+        return sum(operator.db_hits for operator in self.walk())
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the PlanOperator instance.
+
+        @return: A string representation of the operator.
+        """
+        return f"PlanOperator({self.operator_type}, rows={self.rows}, db_hits={self.db_hits})"
+
+
+class QueryProfile:
+    """
+    A class holding the plan and the execution statistics of a single query.
+    """
+
+    def __init__(
+        self,
+        query: str,
+        parameters: Optional[Dict],
+        mode: str,
+        plan: Optional[PlanOperator],
+        elapsed: float,
+        result_available_after: Optional[int] = None,
+        result_consumed_after: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the QueryProfile instance.
+
+        @param query: Query that was planned.
+        @param parameters: Parameters of the query.
+        @param mode: Either 'PROFILE' or 'EXPLAIN'.
+        @param plan: Root operator of the plan.
+        @param elapsed: Client-side wall-clock time in seconds.
+        @param result_available_after: Server time in milliseconds until the first record was
+                                       available. Defaults to None.
+        @param result_consumed_after: Server time in milliseconds until all records were
+                                      consumed. Defaults to None.
+        """
+        self.query = query
+        self.parameters = parameters
+        self.mode = mode
+        self.plan = plan
+        self.elapsed = elapsed
+        self.result_available_after = result_available_after
+        self.result_consumed_after = result_consumed_after
+
+    @property
+    def db_hits(self) -> int:
+        """
+        Total number of database hits. Always 0 for EXPLAIN, which does not execute the query.
+
+        @return: Number of database hits.
+        """
+        return self.plan.total_db_hits() if self.plan else 0
+
+    @property
+    def rows(self) -> int:
+        """
+        Number of rows produced by the root operator.
+
+        @return: Number of rows.
+        """
+        return self.plan.rows if self.plan else 0
+
+    def operators(self) -> List[Dict[str, Any]]:
+        """
+        Flatten the plan into one entry per operator.
+
+        @return: List of dictionaries with operator type, rows and database hits.
+        """
+        if self.plan is None:
+            return []
+        return [
+            {
+                "operator": operator.operator_type,
+                "rows": operator.rows,
+                "db_hits": operator.db_hits,
+            }
+            for operator in self.plan.walk()
+        ]
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the QueryProfile instance.
+
+        @return: A string representation of the profile.
+        """
+        return f"QueryProfile({self.mode}, db_hits={self.db_hits}, rows={self.rows}, elapsed={self.elapsed:.6f}s)"
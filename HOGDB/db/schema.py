@@ -45,28 +45,37 @@ class Schema:
             and self.property_type == other.property_type
         )
 
-    def _field_to_property(self, var: str = None) -> str:
+    def _field_to_value(self, var: str = None) -> str:
         """
-        Utility method to convert a field to a property string.
+        Utility method to convert a field to the expression of its property value.
 
         @param var: Field string.
+        @return: Value expression.
         """
         var_str = "" if var == None else f"{var}."
         if self.property_type == str:
-            return f"{self.property_name}: {var_str}{self.field_name}"
+            return f"{var_str}{self.field_name}"
         elif self.property_type == int:
-            return f"{self.property_name}: toInteger({var_str}{self.field_name})"
+            return f"toInteger({var_str}{self.field_name})"
         elif self.property_type == float:
-            return f"{self.property_name}: toFloat({var_str}{self.field_name})"
+            return f"toFloat({var_str}{self.field_name})"
         elif self.property_type == bool:
-            return f"{self.property_name}: toBoolean({var_str}{self.field_name})"
+            return f"toBoolean({var_str}{self.field_name})"
         elif self.property_type == datetime:
-            return f"{self.property_name}: datetime({var_str}{self.field_name})"
+            return f"datetime({var_str}{self.field_name})"
         elif self.property_type == date:
-            return f"{self.property_name}: date({var_str}{self.field_name})"
+            return f"date({var_str}{self.field_name})"
         else:
             raise ValueError(f"Unsupported property type: {self.property_type}")
 
+    def _field_to_property(self, var: str = None) -> str:
+        """
+        Utility method to convert a field to a property string.
+
+        @param var: Field string.
+        """
+        return f"{self.property_name}: {self._field_to_value(var)}"
+
     def _property_to_field(self) -> str:
         """
         Utility method to convert a property to a field string.
@@ -0,0 +1,1750 @@
+# Copyright (c) 2025 ETH Zurich.
+#                    All rights reserved.
+#
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# Embedded database in a single SQLite file, for single-node deployments and edge devices
+# that should not run a Neo4j server. It stores the same lowered graph as Neo4jDatabase:
+# the _node, _edge, _hyperedge, ... nodes in a table of nodes, and the _adjacency,
+# membership and user-defined relationships in a table of relationships with covering
+# indexes for both traversal directions. Properties are stored as JSON, property indexes
+# are partial expression indexes over the nodes with a label. The database runs in WAL mode
+# with memory-mapped reads, so readers do not block the single writer. Path traversals are
+# compiled into joins; conditions without a SQL translation, return values, sorting and
+# aggregations are evaluated with the expression module.
+
+from HOGDB.db.arrays import OUTPUT_FORMATS, records_to_arrays
+from HOGDB.db.db import Session, Transaction
+from HOGDB.db.expression import (
+    COMPARISON_OPERATORS,
+    STRING_OPERATORS,
+    condition_expression,
+    conjuncts,
+    expression_variables,
+    hashable,
+    holds,
+    project,
+)
+from HOGDB.db.embedded import (
+    CONTAINER_LABELS,
+    EmbeddedDatabase,
+    StoredNode,
+    StoredRelationship,
+)
+from HOGDB.db.aggregation import Aggregate
+from HOGDB.db.label import Label
+from HOGDB.db.predicate import Predicate
+from HOGDB.db.property import Property
+from HOGDB.db.schema import Schema
+from contextlib import contextmanager
+from datetime import date, datetime
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+import itertools
+import json
+import math
+import os
+import sqlite3
+import tempfile
+import time
+import pandas as pd
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS nodes (
+    id INTEGER PRIMARY KEY,
+    labels TEXT NOT NULL,
+    properties TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS node_labels (
+    label TEXT NOT NULL,
+    node INTEGER NOT NULL,
+    PRIMARY KEY (label, node)
+) WITHOUT ROWID;
+CREATE TRIGGER IF NOT EXISTS nodes_insert AFTER INSERT ON nodes BEGIN
+    INSERT INTO node_labels (label, node) SELECT value, NEW.id FROM json_each(NEW.labels);
+END;
+CREATE TRIGGER IF NOT EXISTS nodes_delete AFTER DELETE ON nodes BEGIN
+    DELETE FROM node_labels
+    WHERE label IN (SELECT value FROM json_each(OLD.labels)) AND node = OLD.id;
+END;
+CREATE TABLE IF NOT EXISTS relationships (
+    id INTEGER PRIMARY KEY,
+    type TEXT NOT NULL,
+    start_id INTEGER NOT NULL,
+    end_id INTEGER NOT NULL,
+    properties TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS relationships_outgoing
+    ON relationships (start_id, type, end_id);
+CREATE INDEX IF NOT EXISTS relationships_incoming
+    ON relationships (end_id, type, start_id);
+CREATE INDEX IF NOT EXISTS relationships_type ON relationships (type);
+CREATE TABLE IF NOT EXISTS property_indexes (
+    name TEXT PRIMARY KEY,
+    label TEXT NOT NULL,
+    keys TEXT NOT NULL,
+    is_unique INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS import_checkpoints (
+    name TEXT NOT NULL,
+    batch INTEGER NOT NULL,
+    PRIMARY KEY (name, batch)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS settings (
+    name TEXT PRIMARY KEY,
+    value
+);
+INSERT OR IGNORE INTO settings (name, value) VALUES ('version', 0);
+"""
+
+_NODE_COLUMNS = "{0}.id, {0}.labels, {0}.properties"
+_RELATIONSHIP_COLUMNS = "{0}.id, {0}.type, {0}.start_id, {0}.end_id, {0}.properties"
+
+# JSON types of the stored values a property value can be equal to
+_NUMBER_TYPES = ("integer", "real")
+_SCHEMA_TYPES = {
+    str: ("text",),
+    int: _NUMBER_TYPES,
+    float: _NUMBER_TYPES,
+    bool: ("true", "false"),
+    datetime: ("text",),
+    date: ("text",),
+}
+_MIRRORED = {"=": "=", "<>": "<>", "<": ">", "<=": ">=", ">": "<", ">=": "<="}
+
+
+def _quote(text: str) -> str:
+    return "'" + text.replace("'", "''") + "'"
+
+
+def _identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _column(alias: Optional[str], name: str) -> str:
+    # index expressions cannot refer to a table, they are written without an alias
+    return f"{alias}.{name}" if alias else name
+
+
+def _has_label(alias: Optional[str], name: str) -> str:
+    # labels are stored as a JSON array, the quoted name only matches whole labels; the
+    # term is inlined so that partial indexes with the same term can serve the query
+    return f"instr({_column(alias, 'labels')}, {_quote(json.dumps(name))}) > 0"
+
+
+def _path(key: str) -> str:
+    return _quote(f'$."{key}"')
+
+
+def _property(alias: Optional[str], key: str) -> str:
+    return f"json_extract({_column(alias, 'properties')}, {_path(key)})"
+
+
+def _property_type(alias: str, key: str) -> str:
+    return f"json_type({alias}.properties, {_path(key)})"
+
+
+def _types(types: Sequence[str]) -> str:
+    return ", ".join(_quote(t) for t in types)
+
+
+def _json_types(value: Any) -> Tuple[str, ...]:
+    """
+    JSON types of the stored values a value can be equal to. Dates are stored as ISO strings.
+
+    @param value: Property value.
+    @return: Tuple of JSON type names.
+    """
+    if isinstance(value, bool):
+        return ("true", "false")
+    if isinstance(value, (int, float)):
+        return _NUMBER_TYPES
+    if isinstance(value, (list, tuple)):
+        return ("array",)
+    if isinstance(value, dict):
+        return ("object",)
+    return ("text",)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"Unsupported property value: {value!r}")
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, default=_json_default, separators=(",", ":"))
+
+
+def _properties_json(properties: Dict[str, Any]) -> str:
+    # properties with null values are not stored
+    return _dumps({k: v for k, v in properties.items() if v is not None})
+
+
+def _sql_value(value: Any) -> Any:
+    """
+    Parameter value of a property value, as it is returned by json_extract.
+
+    @param value: Property value.
+    @return: SQL value.
+    """
+    if isinstance(value, (list, tuple, dict)):
+        return _dumps(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _equals(alias: str, key: str, types: Sequence[str], placeholder: str) -> str:
+    """
+    SQL term testing a property for equality, with the semantics of Cypher: booleans are not
+    equal to numbers and strings are not equal to lists.
+
+    @param alias: Alias of the nodes or relationships table.
+    @param key: Property key.
+    @param types: JSON types of the compared value.
+    @param placeholder: Placeholder of the compared value.
+    @return: SQL term.
+    """
+    if tuple(types) in (("array",), ("object",)):
+        placeholder = f"json({placeholder})"
+    return (
+        f"{_property(alias, key)} = {placeholder}"
+        f" AND {_property_type(alias, key)} IN ({_types(types)})"
+    )
+
+
+def _bind(parameters: Dict[str, Any], value: Any) -> str:
+    name = f"p{len(parameters)}"
+    parameters[name] = value
+    return f":{name}"
+
+
+def _where(terms: List[str]) -> str:
+    return " WHERE " + " AND ".join(terms) if terms else ""
+
+
+def _node(row: Sequence[Any]) -> StoredNode:
+    return StoredNode(row[0], tuple(json.loads(row[1])), json.loads(row[2]))
+
+
+def _relationship(row: Sequence[Any]) -> StoredRelationship:
+    return StoredRelationship(row[0], row[1], row[2], row[3], json.loads(row[4]))
+
+
+def _run(
+    connection: sqlite3.Connection, query: str, parameters: Optional[Dict] = None
+) -> List[Dict]:
+    cursor = connection.execute(query, parameters or {})
+    if cursor.description is None:
+        return []
+    names = [column[0] for column in cursor.description]
+    return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+
+class SQLiteSession(Session):
+    """
+    A session of the SQLite database, holding its own connection. Sessions can be used from
+    different threads, but a session must not be used by two threads at the same time.
+    """
+
+    def __init__(self, db: "SQLiteDatabase", read_only: bool = False):
+        """
+        Initialize the SQLiteSession instance.
+
+        @param db: Database of the session.
+        @param read_only: Whether the session is only used for reads. Defaults to False.
+        """
+        self.db = db
+        self.read_only = read_only
+        self.connection = db._connect(read_only)
+
+    def run(self, query: str, parameters: Optional[Dict] = None) -> List[Dict]:
+        return _run(self.connection, query, parameters)
+
+    def begin_transaction(self) -> "SQLiteTransaction":
+        return SQLiteTransaction(self)
+
+    def close(self):
+        self.connection.close()
+
+
+class SQLiteTransaction(Transaction):
+    """
+    A transaction of the SQLite database. Write transactions take the write lock of the
+    database when they begin, so that they do not fail on a lock upgrade later on; closing a
+    transaction without committing it rolls it back.
+    """
+
+    def __init__(self, session: SQLiteSession):
+        """
+        Initialize the SQLiteTransaction instance and begin the transaction.
+
+        @param session: Session of the transaction.
+        """
+        self.session = session
+        self.connection = session.connection
+        self.connection.execute("BEGIN" if session.read_only else "BEGIN IMMEDIATE")
+
+    def run(self, query: str, parameters: Optional[Dict] = None) -> List[Dict]:
+        return _run(self.connection, query, parameters)
+
+    def commit(self):
+        if self.connection.in_transaction:
+            self.connection.execute("COMMIT")
+
+    def rollback(self):
+        if self.connection.in_transaction:
+            self.connection.execute("ROLLBACK")
+
+    def close(self):
+        self.rollback()
+
+
+class SQLiteDatabase(EmbeddedDatabase):
+    """
+    The SQLiteDatabase class stores the graph in an embedded SQLite database.
+
+    Inherits from the EmbeddedDatabase class and implements its storage primitives in SQL.
+    Every session holds a connection of its own. Readers work on snapshots and run
+    concurrently, writers take turns; imports therefore use a single writer session. This
+    also holds for ':memory:' databases, which are backed by a temporary file in WAL mode.
+    Dates are stored as ISO strings and returned as such.
+    """
+
+    # property indexes are B-trees, which also serve range comparisons
+    _INDEX_OPERATORS = ("=", "IN", "<", "<=", ">", ">=")
+    _ORDERED_INDEXES = True
+
+    def __init__(
+        self,
+        path: str = "hogdb.sqlite",
+        max_concurrent_sessions: int = 4,
+        timeout: float = 30,
+        mmap_size: int = 1 << 30,
+    ) -> None:
+        """
+        Open or create a SQLiteDatabase instance.
+
+        @param path: Path of the database file. ':memory:' creates a database in a temporary
+                     file, shared by the sessions of this instance and deleted by close_driver.
+                     Defaults to 'hogdb.sqlite'.
+        @param max_concurrent_sessions: Number of sessions used concurrently by traverse_many.
+                                        Defaults to 4.
+        @param timeout: Seconds a connection waits for the write lock. Defaults to 30.
+        @param mmap_size: Number of bytes of the database file read through memory mapping.
+                          Defaults to 1 GiB.
+        """
+        # a shared-cache in-memory database locks whole tables and fails instead of waiting,
+        # so a temporary file in WAL mode is used to let readers and the writer overlap
+        self._temporary = None
+        if path == ":memory:":
+            self._temporary = tempfile.TemporaryDirectory(prefix="hogdb-")
+            path = os.path.join(self._temporary.name, "hogdb.sqlite")
+        self._path = path
+        self._max_concurrent_sessions = max(1, max_concurrent_sessions)
+        self._timeout = timeout
+        self._mmap_size = mmap_size
+        self._connection = self._connect()
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.executescript(_SCHEMA)
+
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """
+        Open a connection to the database. Transactions are controlled explicitly.
+
+        @param read_only: Reject writes on the connection. Defaults to False.
+        @return: Connection.
+        """
+        connection = sqlite3.connect(
+            self._path,
+            timeout=self._timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        connection.execute("PRAGMA synchronous = NORMAL")
+        connection.execute(f"PRAGMA mmap_size = {int(self._mmap_size)}")
+        connection.execute("PRAGMA temp_store = MEMORY")
+        if read_only:
+            connection.execute("PRAGMA query_only = ON")
+        return connection
+
+    def close_driver(self) -> None:
+        """
+        Close the database. The statistics of the query planner are updated first. The
+        temporary file of an in-memory database is deleted.
+        """
+        self._connection.execute("PRAGMA optimize")
+        self._connection.close()
+        if self._temporary is not None:
+            self._temporary.cleanup()
+
+    @contextmanager
+    def _read(self, session: SQLiteSession) -> Iterator[sqlite3.Connection]:
+        """
+        Context manager running the statements of a read on a single snapshot. An open
+        transaction of the session is used as it is.
+
+        @param session: Database session.
+        @return: Connection of the session.
+        """
+        connection = session.connection
+        if connection.in_transaction:
+            yield connection
+            return
+        connection.execute("BEGIN")
+        try:
+            yield connection
+        finally:
+            if connection.in_transaction:
+                connection.execute("COMMIT")
+
+    @contextmanager
+    def _write(self, session: SQLiteSession) -> Iterator[sqlite3.Connection]:
+        """
+        Context manager running the statements of a write in a transaction, committed when
+        leaving the context and rolled back on errors. An open transaction of the session is
+        used as it is.
+
+        @param session: Database session.
+        @return: Connection of the session.
+        """
+        connection = session.connection
+        if connection.in_transaction:
+            yield connection
+            return
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    @contextmanager
+    def _transaction(self, tx: SQLiteTransaction) -> Iterator[sqlite3.Connection]:
+        """
+        Context manager running statements in an open transaction.
+
+        @param tx: Transaction.
+        @return: Connection of the transaction.
+        """
+        yield tx.connection
+
+    @staticmethod
+    def _tick(connection: sqlite3.Connection) -> int:
+        """
+        Advance the change version, the time in milliseconds made strictly increasing. The
+        caller holds the write lock.
+
+        @param connection: Connection within a write transaction.
+        @return: New version.
+        """
+        connection.execute(
+            "UPDATE settings SET value = max(value + 1, ?) WHERE name = 'version'",
+            (int(time.time() * 1000),),
+        )
+        return connection.execute(
+            "SELECT value FROM settings WHERE name = 'version'"
+        ).fetchone()[0]
+
+    def current_version(self, session: SQLiteSession) -> int:
+        """
+        Current change version. Note it before an export and pass it as 'since' to the next
+        export to only export the elements changed in between.
+
+        @param session: Database session.
+        @return: Current version.
+        """
+        with self._write(session) as connection:
+            # later changes get a strictly greater version than the one returned here
+            connection.execute(
+                "UPDATE settings SET value = max(value, ?) WHERE name = 'version'",
+                (int(time.time() * 1000),),
+            )
+            return connection.execute(
+                "SELECT value FROM settings WHERE name = 'version'"
+            ).fetchone()[0]
+
+    # Storage. The methods below write within the transaction open on the given connection.
+
+    @staticmethod
+    def _create_node(
+        connection: sqlite3.Connection, names: Iterable[str], properties: Dict[str, Any]
+    ) -> StoredNode:
+        """
+        Create a node. Properties with null values are not stored.
+
+        @param connection: Connection within a write transaction.
+        @param names: Label names of the node.
+        @param properties: Properties of the node.
+        @return: Created node.
+        """
+        names = tuple(dict.fromkeys(names))
+        properties = {k: v for k, v in properties.items() if v is not None}
+        node_id = connection.execute(
+            "INSERT INTO nodes (labels, properties) VALUES (?, ?)",
+            (json.dumps(list(names)), _properties_json(properties)),
+        ).lastrowid
+        return StoredNode(node_id, names, properties)
+
+    @staticmethod
+    def _insert_relationship(
+        connection: sqlite3.Connection,
+        type: str,
+        start: int,
+        end: int,
+        properties: Dict[str, Any],
+    ) -> None:
+        """
+        Create a relationship. Properties with null values are not stored.
+
+        @param connection: Connection within a write transaction.
+        @param type: Type of the relationship.
+        @param start: Identifier of the start node.
+        @param end: Identifier of the end node.
+        @param properties: Properties of the relationship.
+        """
+        connection.execute(
+            "INSERT INTO relationships (type, start_id, end_id, properties) "
+            "VALUES (?, ?, ?, ?)",
+            (type, start, end, _properties_json(properties)),
+        )
+
+    @staticmethod
+    def _delete_node(connection: sqlite3.Connection, node: StoredNode) -> None:
+        """
+        Delete a node together with its relationships.
+
+        @param connection: Connection within a write transaction.
+        @param node: Node to delete.
+        """
+        connection.execute("DELETE FROM relationships WHERE start_id = ?", (node.id,))
+        connection.execute("DELETE FROM relationships WHERE end_id = ?", (node.id,))
+        connection.execute("DELETE FROM nodes WHERE id = ?", (node.id,))
+
+    @staticmethod
+    def _delete_relationship(
+        connection: sqlite3.Connection, relationship: StoredRelationship
+    ) -> None:
+        """
+        Delete a relationship.
+
+        @param connection: Connection within a write transaction.
+        @param relationship: Relationship to delete.
+        """
+        connection.execute(
+            "DELETE FROM relationships WHERE id = ?", (relationship.id,)
+        )
+
+    @staticmethod
+    def _set_properties(
+        connection: sqlite3.Connection,
+        element: Union[StoredNode, StoredRelationship],
+        updates: Dict[str, Any],
+    ) -> None:
+        """
+        Set properties of an element, null values remove the property.
+
+        @param connection: Connection within a write transaction.
+        @param element: Node or relationship.
+        @param updates: Properties to set.
+        """
+        properties = dict(element.properties)
+        for key, value in updates.items():
+            if value is None:
+                properties.pop(key, None)
+            else:
+                properties[key] = value
+        element.properties = properties
+        table = "relationships" if isinstance(element, StoredRelationship) else "nodes"
+        connection.execute(
+            f"UPDATE {table} SET properties = ? WHERE id = ?",
+            (_properties_json(properties), element.id),
+        )
+
+    @staticmethod
+    def _touch(connection: sqlite3.Connection, node: StoredNode, version: int) -> None:
+        """
+        Mark the HO elements a node is a member of as changed.
+
+        @param connection: Connection within a write transaction.
+        @param node: Member node.
+        @param version: Version of the change.
+        """
+        containers = " OR ".join(_has_label("n", label) for label in CONTAINER_LABELS)
+        connection.execute(
+            "UPDATE nodes AS n SET properties = json_set(n.properties, '$._version', ?) "
+            "WHERE n.id IN (SELECT end_id FROM relationships WHERE start_id = ?) "
+            f"AND ({containers})",
+            (version, node.id),
+        )
+
+    # Lookups
+
+    @staticmethod
+    def _node_terms(
+        alias: str,
+        names: List[str],
+        values: Dict[str, Any],
+        parameters: Dict[str, Any],
+    ) -> List[str]:
+        """
+        SQL terms selecting the nodes (or relationships) with the given labels and property
+        values. Elements never match a null value.
+
+        @param alias: Alias of the nodes or relationships table.
+        @param names: Label names the nodes must have.
+        @param values: Property values the elements must have.
+        @param parameters: Query parameters the values are bound to.
+        @return: List of SQL terms.
+        """
+        terms = [_has_label(alias, name) for name in names]
+        for key, value in values.items():
+            if value is None:
+                terms.append("0")
+            else:
+                placeholder = _bind(parameters, _sql_value(value))
+                terms.append(_equals(alias, key, _json_types(value), placeholder))
+        return terms
+
+    @staticmethod
+    def _schema_terms(
+        alias: str, names: List[str], schema: List[Schema], prefix: str
+    ) -> List[str]:
+        """
+        SQL terms selecting the nodes with the given labels and the property values of an
+        input row, for statements executed once per row.
+
+        @param alias: Alias of the nodes table.
+        @param names: Label names the nodes must have.
+        @param schema: List of property schemas of the matched fields.
+        @param prefix: Prefix of the parameter names, see _schema_parameters.
+        @return: List of SQL terms.
+        """
+        return [_has_label(alias, name) for name in names] + [
+            _equals(
+                alias,
+                s.property_name,
+                _SCHEMA_TYPES.get(s.property_type, ("text",)),
+                f":{prefix}{position}",
+            )
+            for position, s in enumerate(schema)
+        ]
+
+    def _schema_parameters(
+        self, schema: List[Schema], row: Dict[str, Any], prefix: str
+    ) -> Dict[str, Any]:
+        """
+        Parameters of the terms built by _schema_terms for an input row.
+
+        @param schema: List of property schemas of the matched fields.
+        @param row: Input row.
+        @param prefix: Prefix of the parameter names.
+        @return: Dictionary of parameters.
+        """
+        return {
+            f"{prefix}{position}": _sql_value(
+                self._field_value(s, row.get(s.field_name))
+            )
+            for position, s in enumerate(schema)
+        }
+
+    @staticmethod
+    def _since_terms(
+        alias: str, since: Optional[int], parameters: Dict[str, Any]
+    ) -> List[str]:
+        """
+        SQL terms selecting the elements changed after a version.
+
+        @param alias: Alias of the nodes or relationships table.
+        @param since: Version, or None to accept all elements.
+        @param parameters: Query parameters the version is bound to.
+        @return: List of SQL terms.
+        """
+        if since is None:
+            return []
+        return [f"{_property(alias, '_version')} > {_bind(parameters, int(since))}"]
+
+    def _lookup(
+        self,
+        connection: sqlite3.Connection,
+        names: List[str],
+        values: Dict[str, Any],
+        since: Optional[int] = None,
+    ) -> List[StoredNode]:
+        """
+        Nodes with the given label names and property values.
+
+        @param connection: Database connection.
+        @param names: Label names the nodes must have.
+        @param values: Property values the nodes must have.
+        @param since: Only return nodes changed after this version. Defaults to None.
+        @return: List of nodes.
+        """
+        parameters = {}
+        terms = self._node_terms("n", names, values, parameters)
+        terms += self._since_terms("n", since, parameters)
+        rows = connection.execute(
+            f"SELECT {_NODE_COLUMNS.format('n')} FROM nodes AS n{_where(terms)}",
+            parameters,
+        )
+        return [_node(row) for row in rows]
+
+    def _neighbors(
+        self,
+        connection: sqlite3.Connection,
+        node_id: int,
+        type: str,
+        outgoing: bool,
+        labels: Union[None, Label, List[Label]] = None,
+        properties: Optional[List[Property]] = None,
+    ) -> List[Tuple[StoredRelationship, StoredNode]]:
+        """
+        Relationships of a type in one direction and the nodes at their other end, if these
+        have the given labels and properties.
+
+        @param connection: Database connection.
+        @param node_id: Identifier of the node to start from.
+        @param type: Relationship type.
+        @param outgoing: Follow the outgoing relationships, otherwise the incoming ones.
+        @param labels: Labels the neighbors must have. Defaults to None.
+        @param properties: Properties the neighbors must have. Defaults to None.
+        @return: List of the relationships and neighbors.
+        """
+        near, far = ("start_id", "end_id") if outgoing else ("end_id", "start_id")
+        parameters = {"node": node_id, "type": type}
+        terms = [f"r.{near} = :node", "r.type = :type"] + self._node_terms(
+            "n",
+            self._label_names(labels),
+            self._property_dict(properties),
+            parameters,
+        )
+        rows = connection.execute(
+            f"SELECT {_RELATIONSHIP_COLUMNS.format('r')}, {_NODE_COLUMNS.format('n')} "
+            f"FROM relationships AS r JOIN nodes AS n ON n.id = r.{far}{_where(terms)}",
+            parameters,
+        )
+        return [(_relationship(row[:5]), _node(row[5:])) for row in rows]
+
+    def _edges(
+        self,
+        connection: sqlite3.Connection,
+        start_labels: List[Label],
+        start_properties: List[Property],
+        end_labels: List[Label],
+        end_properties: List[Property],
+        type: str,
+        properties: List[Property],
+        since: Optional[int] = None,
+    ) -> List[Tuple[StoredNode, StoredNode, StoredRelationship]]:
+        """
+        Relationships of a type with the given properties between nodes with the given
+        labels and properties.
+
+        @param connection: Database connection.
+        @param start_labels: List of labels for the start nodes.
+        @param start_properties: List of properties for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_properties: List of properties for the end nodes.
+        @param type: Type of the relationships.
+        @param properties: List of properties for the relationships.
+        @param since: Only return relationships changed after this version.
+                      Defaults to None.
+        @return: List of start nodes, end nodes and relationships.
+        """
+        parameters = {"type": type}
+        terms = ["r.type = :type"]
+        for alias, labels, values in (
+            ("s", start_labels, start_properties),
+            ("e", end_labels, end_properties),
+            ("r", [], properties),
+        ):
+            terms += self._node_terms(
+                alias, self._label_names(labels), self._property_dict(values), parameters
+            )
+        terms += self._since_terms("r", since, parameters)
+        columns = (
+            f"{_NODE_COLUMNS.format('s')}, {_NODE_COLUMNS.format('e')}, "
+            f"{_RELATIONSHIP_COLUMNS.format('r')}"
+        )
+        rows = connection.execute(
+            f"SELECT {columns} FROM relationships AS r "
+            "JOIN nodes AS s ON s.id = r.start_id "
+            f"JOIN nodes AS e ON e.id = r.end_id{_where(terms)}",
+            parameters,
+        )
+        return [
+            (_node(row[0:3]), _node(row[3:6]), _relationship(row[6:11])) for row in rows
+        ]
+
+    def _find_relationships(
+        self, connection: sqlite3.Connection, type: str, properties: List[Property]
+    ) -> List[StoredRelationship]:
+        """
+        Relationships of a type with the given properties.
+
+        @param connection: Database connection.
+        @param type: Type of the relationships.
+        @param properties: Properties the relationships must have.
+        @return: List of relationships.
+        """
+        parameters = {"type": type}
+        terms = ["r.type = :type"] + self._node_terms(
+            "r", [], self._property_dict(properties), parameters
+        )
+        rows = connection.execute(
+            f"SELECT {_RELATIONSHIP_COLUMNS.format('r')} FROM relationships AS r"
+            f"{_where(terms)}",
+            parameters,
+        ).fetchall()
+        return [_relationship(row) for row in rows]
+
+    def _paths(
+        self,
+        connection: sqlite3.Connection,
+        start_labels: List[Label],
+        start_properties: List[Property],
+        type: str,
+        middle_labels: List[Label],
+        middle_properties: List[Property],
+        end_labels: List[Label],
+        end_properties: List[Property],
+        since: Optional[int] = None,
+    ) -> List[Tuple[StoredNode, StoredNode, StoredNode]]:
+        """
+        Paths (start)-[:type]->(middle)-[:type]->(end) of nodes with the given labels and
+        properties, the pattern of HO edges modeled as nodes.
+
+        @param connection: Database connection.
+        @param start_labels: List of labels for the start nodes.
+        @param start_properties: List of properties for the start nodes.
+        @param type: Type of both relationships.
+        @param middle_labels: List of labels for the middle nodes.
+        @param middle_properties: List of properties for the middle nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_properties: List of properties for the end nodes.
+        @param since: Only return paths whose middle node changed after this version.
+                      Defaults to None.
+        @return: List of start, middle and end nodes.
+        """
+        parameters = {"type": type}
+        terms = ["r1.type = :type", "r2.type = :type"]
+        for alias, labels, properties in (
+            ("s", start_labels, start_properties),
+            ("m", middle_labels, middle_properties),
+            ("e", end_labels, end_properties),
+        ):
+            terms += self._node_terms(
+                alias,
+                self._label_names(labels),
+                self._property_dict(properties),
+                parameters,
+            )
+        terms += self._since_terms("m", since, parameters)
+        columns = ", ".join(_NODE_COLUMNS.format(alias) for alias in ("s", "m", "e"))
+        rows = connection.execute(
+            f"SELECT {columns} FROM nodes AS m "
+            "JOIN relationships AS r1 ON r1.end_id = m.id "
+            "JOIN nodes AS s ON s.id = r1.start_id "
+            "JOIN relationships AS r2 ON r2.start_id = m.id "
+            f"JOIN nodes AS e ON e.id = r2.end_id{_where(terms)}",
+            parameters,
+        )
+        return [(_node(row[0:3]), _node(row[3:6]), _node(row[6:9])) for row in rows]
+
+    @staticmethod
+    def _member_edges(
+        connection: sqlite3.Connection, subgraph: StoredNode
+    ) -> List[Tuple[StoredNode, StoredNode, StoredNode]]:
+        """
+        Member edges of a subgraph collection with their start and end nodes.
+
+        @param connection: Database connection.
+        @param subgraph: Subgraph collection.
+        @return: List of start nodes, end nodes and edges.
+        """
+        columns = ", ".join(_NODE_COLUMNS.format(alias) for alias in ("s", "e", "ed"))
+        terms = [
+            "m.end_id = ?",
+            "m.type = '_edge_membership'",
+            _has_label("ed", "_edge"),
+            _has_label("s", "_node"),
+            _has_label("e", "_node"),
+        ]
+        rows = connection.execute(
+            f"SELECT {columns} FROM relationships AS m "
+            "JOIN nodes AS ed ON ed.id = m.start_id "
+            "JOIN relationships AS r1 ON r1.end_id = ed.id AND r1.type = '_adjacency' "
+            "JOIN nodes AS s ON s.id = r1.start_id "
+            "JOIN relationships AS r2 ON r2.start_id = ed.id AND r2.type = '_adjacency' "
+            f"JOIN nodes AS e ON e.id = r2.end_id{_where(terms)}",
+            (subgraph.id,),
+        )
+        return [(_node(row[0:3]), _node(row[3:6]), _node(row[6:9])) for row in rows]
+
+    # Import
+
+    def delete_import_checkpoint(self, session: SQLiteSession, checkpoint: str) -> None:
+        """
+        Delete the progress recorded for a resumable import, so that it starts over when run
+        again. Completed imports delete their checkpoint themselves.
+
+        @param session: Database session.
+        @param checkpoint: Name of the import checkpoint.
+        """
+        with self._write(session) as connection:
+            connection.execute(
+                "DELETE FROM import_checkpoints WHERE name = ?", (checkpoint,)
+            )
+
+    @staticmethod
+    def _committed_batches(connection: sqlite3.Connection, checkpoint: str) -> Set[int]:
+        """
+        Numbers of the batches an import has committed under a checkpoint.
+
+        @param connection: Database connection.
+        @param checkpoint: Name of the import checkpoint.
+        @return: Set of batch numbers.
+        """
+        rows = connection.execute(
+            "SELECT batch FROM import_checkpoints WHERE name = ?", (checkpoint,)
+        )
+        return {number for (number,) in rows}
+
+    @staticmethod
+    def _record_batch(
+        connection: sqlite3.Connection, checkpoint: str, number: int
+    ) -> None:
+        """
+        Record a batch as committed under a checkpoint, in the transaction writing it.
+
+        @param connection: Connection within a write transaction.
+        @param checkpoint: Name of the import checkpoint.
+        @param number: Number of the batch.
+        """
+        connection.execute(
+            "INSERT OR IGNORE INTO import_checkpoints (name, batch) VALUES (?, ?)",
+            (checkpoint, number),
+        )
+
+    def _nodes_import_writer(
+        self, labels: List[Label], node_schema: List[Schema]
+    ) -> Callable[[List[Dict[str, Any]], sqlite3.Connection], None]:
+        """
+        Build the function that imports a batch of nodes with a single executemany.
+
+        @param labels: List of labels for the nodes.
+        @param node_schema: List of property schemas for the nodes.
+        @return: Function writing a batch.
+        """
+        names = json.dumps(list(dict.fromkeys(self._label_names(labels))))
+
+        def write(batch, connection):
+            connection.executemany(
+                "INSERT INTO nodes (labels, properties) VALUES (?, ?)",
+                (
+                    (names, _properties_json(self._row_properties(node_schema, row)))
+                    for row in batch
+                ),
+            )
+
+        return write
+
+    def _edges_import_writer(
+        self,
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+    ) -> Callable[[List[Dict[str, Any]], sqlite3.Connection], None]:
+        """
+        Build the function that imports a batch of edges. A single statement, executed for
+        all rows with executemany, connects every matching start node with every matching
+        end node of a row.
+
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param edge_label: Label to be used for the edges.
+        @param edge_schema: List of property schemas for the edges.
+        @return: Function writing a batch.
+        """
+        terms = self._schema_terms(
+            "s", self._label_names(start_labels), start_schema, "start"
+        ) + self._schema_terms("e", self._label_names(end_labels), end_schema, "end")
+        statement = (
+            "INSERT INTO relationships (type, start_id, end_id, properties) "
+            f"SELECT :type, s.id, e.id, :properties FROM nodes AS s, nodes AS e"
+            f"{_where(terms)}"
+        )
+        type = str(edge_label)
+
+        def write(batch, connection):
+            connection.executemany(
+                statement,
+                (
+                    {
+                        "type": type,
+                        "properties": _properties_json(
+                            self._row_properties(edge_schema, row)
+                        ),
+                        **self._schema_parameters(start_schema, row, "start"),
+                        **self._schema_parameters(end_schema, row, "end"),
+                    }
+                    for row in batch
+                ),
+            )
+
+        return write
+
+    def _through_batch(
+        self,
+        start_names: List[str],
+        start_schema: List[Schema],
+        end_names: List[str],
+        end_schema: List[Schema],
+        node_names: List[str],
+        node_schema: List[Schema],
+        type: str,
+    ) -> Callable[[List[Dict[str, Any]], sqlite3.Connection], None]:
+        """
+        Build the function that imports a batch of elements modeled as nodes between a start
+        and an end node, such as HO edges and subgraph edges. The node of a row is created and
+        connected from every matching start node and to every matching end node.
+
+        @param start_names: Label names of the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_names: Label names of the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param node_names: Label names of the created nodes.
+        @param node_schema: List of property schemas for the created nodes.
+        @param type: Type of the relationships to and from the created nodes.
+        @return: Function writing a batch.
+        """
+        pairs = "FROM nodes AS s, nodes AS e" + _where(
+            self._schema_terms("s", start_names, start_schema, "start")
+            + self._schema_terms("e", end_names, end_schema, "end")
+        )
+        insert = "INSERT INTO relationships (type, start_id, end_id, properties) "
+
+        def write(batch, connection):
+            for row in batch:
+                node = self._create_node(
+                    connection, node_names, self._row_properties(node_schema, row)
+                ).id
+                parameters = {
+                    "type": type,
+                    "node": node,
+                    **self._schema_parameters(start_schema, row, "start"),
+                    **self._schema_parameters(end_schema, row, "end"),
+                }
+                connection.execute(
+                    f"{insert}SELECT :type, s.id, :node, '{{}}' {pairs}", parameters
+                )
+                connection.execute(
+                    f"{insert}SELECT :type, :node, e.id, '{{}}' {pairs}", parameters
+                )
+
+        return write
+
+    def _node_edges_import_writer(
+        self,
+        start_labels: List[Label],
+        start_schema: List[Schema],
+        end_labels: List[Label],
+        end_schema: List[Schema],
+        node_edge_labels: List[Label],
+        node_edge_schema: List[Schema],
+        edge_label: Label,
+    ) -> Callable[[List[Dict[str, Any]], sqlite3.Connection], None]:
+        """
+        Build the function that imports a batch of HO edges. The HO edge node of a row is
+        created and connected from every matching start node and to every matching end node.
+
+        @param start_labels: List of labels for the start nodes.
+        @param start_schema: List of property schemas for the start nodes.
+        @param end_labels: List of labels for the end nodes.
+        @param end_schema: List of property schemas for the end nodes.
+        @param node_edge_labels: List of labels to be used for the HO edges.
+        @param node_edge_schema: List of property schemas for the HO edges.
+        @param edge_label: Label for the edges to the HO edges.
+        @return: Function writing a batch.
+        """
+        return self._through_batch(
+            self._label_names(start_labels),
+            start_schema,
+            self._label_names(end_labels),
+            end_schema,
+            self._label_names(node_edge_labels),
+            node_edge_schema,
+            str(edge_label),
+        )
+
+    def _hyperedges_import_writer(
+        self,
+        node_labels: List[Label],
+        node_schema: Schema,
+        common_schema: List[Schema],
+        hyperedge_labels: List[Label],
+        hyperedge_schema: List[Schema],
+    ) -> Callable[[List[Dict[str, Any]], sqlite3.Connection], List[Any]]:
+        """
+        Build the function that imports a batch of hyperedges. The distinct member keys of a
+        row are resolved with a single query and each member is connected once. The function
+        returns the member keys that did not match any node.
+
+        @param node_labels: List of labels for the nodes.
+        @param node_schema: Property schema for the nodes.
+        @param common_schema: List of property schemas common to the nodes.
+        @param hyperedge_labels: List of labels to be used for the hyperedges.
+        @param hyperedge_schema: List of property schemas for the hyperedges.
+        @return: Function writing a batch.
+        """
+        hyperedge_names = self._label_names(hyperedge_labels)
+        key = node_schema.property_name
+        types = _types(_SCHEMA_TYPES.get(node_schema.property_type, ("text",)))
+        terms = self._schema_terms(
+            "n", self._label_names(node_labels), common_schema, "common"
+        ) + [
+            f"{_property('n', key)} IN (SELECT value FROM json_each(:keys))",
+            f"{_property_type('n', key)} IN ({types})",
+        ]
+        members = f"SELECT n.id, {_property('n', key)} FROM nodes AS n{_where(terms)}"
+
+        def write(batch, connection):
+            unresolved = []
+            for row in batch:
+                value = row.get(node_schema.field_name)
+                keys = {}
+                if value is not None:
+                    for member in str(value).split(";"):
+                        member = _sql_value(self._field_value(node_schema, member))
+                        if member is not None:
+                            keys.setdefault(hashable(member), member)
+                hyperedge = self._create_node(
+                    connection,
+                    hyperedge_names,
+                    self._row_properties(hyperedge_schema, row),
+                ).id
+                parameters = self._schema_parameters(common_schema, row, "common")
+                parameters["keys"] = _dumps(list(keys.values()))
+                resolved = set()
+                adjacency = []
+                for node, member in connection.execute(members, parameters).fetchall():
+                    adjacency += [(node, hyperedge), (hyperedge, node)]
+                    resolved.add(hashable(member))
+                connection.executemany(
+                    "INSERT INTO relationships (type, start_id, end_id, properties) "
+                    "VALUES ('_adjacency', ?, ?, '{}')",
+                    adjacency,
+                )
+                unresolved += [k for hashed, k in keys.items() if hashed not in resolved]
+            return unresolved
+
+        return write
+
+    def _subgraphs_import_writer(
+        self,
+        node_schema: Schema,
+        edge_schema: Schema,
+        common_schema: List[Schema],
+        subgraph_labels: List[Label],
+        subgraph_schema: List[Schema],
+    ) -> Callable[[List[Dict[str, Any]], sqlite3.Connection], None]:
+        """
+        Build the function that imports a batch of subgraph collections. As in the Cypher
+        import, the member edges are only added if at least one member node matched.
+
+        @param node_schema: Property schema for the nodes.
+        @param edge_schema: Property schema for the edges.
+        @param common_schema: List of property schemas common to the nodes.
+        @param subgraph_labels: List of labels to be used for the subgraph collections.
+        @param subgraph_schema: List of property schemas for the subgraph collections.
+        @return: Function writing a batch.
+        """
+        subgraph_names = self._label_names(subgraph_labels)
+        nodes = "SELECT n.id FROM nodes AS n" + _where(
+            self._schema_terms("n", ["_node"], [node_schema] + common_schema, "node")
+        )
+        edges = (
+            "SELECT DISTINCT ed.id FROM nodes AS s "
+            "JOIN relationships AS r1 ON r1.start_id = s.id AND r1.type = '_adjacency' "
+            "JOIN nodes AS ed ON ed.id = r1.end_id "
+            "JOIN relationships AS r2 ON r2.start_id = ed.id AND r2.type = '_adjacency' "
+            "JOIN nodes AS e ON e.id = r2.end_id"
+            + _where(
+                self._schema_terms("s", ["_node"], [edge_schema] + common_schema, "start")
+                + [_has_label("ed", "_edge")]
+                + self._schema_terms("e", ["_node"], [edge_schema] + common_schema, "end")
+            )
+        )
+        insert = (
+            "INSERT INTO relationships (type, start_id, end_id, properties) "
+            "VALUES (?, ?, ?, '{}')"
+        )
+
+        def write(batch, connection):
+            for row in batch:
+                subgraph = self._create_node(
+                    connection, subgraph_names, self._row_properties(subgraph_schema, row)
+                ).id
+                member_nodes = []
+                value = row.get(node_schema.field_name)
+                for member in [] if value is None else str(value).split(";"):
+                    parameters = self._schema_parameters(
+                        [node_schema] + common_schema,
+                        {**row, node_schema.field_name: member},
+                        "node",
+                    )
+                    member_nodes += [
+                        ("_node_membership", node, subgraph)
+                        for (node,) in connection.execute(nodes, parameters)
+                    ]
+                connection.executemany(insert, member_nodes)
+                value = row.get(edge_schema.field_name)
+                if not member_nodes or value is None:
+                    continue
+                members = {}
+                for member in str(value).split(";"):
+                    edge_nodes = member.split(":")
+                    if len(edge_nodes) < 2:
+                        continue
+                    parameters = {
+                        **self._schema_parameters(
+                            [edge_schema] + common_schema,
+                            {**row, edge_schema.field_name: edge_nodes[0]},
+                            "start",
+                        ),
+                        **self._schema_parameters(
+                            [edge_schema] + common_schema,
+                            {**row, edge_schema.field_name: edge_nodes[1]},
+                            "end",
+                        ),
+                    }
+                    for (edge,) in connection.execute(edges, parameters):
+                        members.setdefault(edge, ("_edge_membership", edge, subgraph))
+                connection.executemany(insert, list(members.values()))
+
+        return write
+
+    def _node_tuples_import_writer(
+        self,
+        node_schema: Schema,
+        common_schema: List[Schema],
+        tuple_labels: List[Label],
+        tuple_properties: List[Schema],
+    ) -> Callable[[List[Dict[str, Any]], sqlite3.Connection], None]:
+        """
+        Build the function that imports a batch of node tuples, recording the position of
+        every member on its membership relationship.
+
+        @param node_schema: Property schema for the nodes.
+        @param common_schema: List of property schemas common to the nodes.
+        @param tuple_labels: List of labels to be used for the node-tuples.
+        @param tuple_properties: List of property schemas for the node-tuples.
+        @return: Function writing a batch.
+        """
+        tuple_names = ["_node_tuple"] + self._label_names(tuple_labels)
+        nodes = "SELECT n.id FROM nodes AS n" + _where(
+            self._schema_terms("n", ["_node"], [node_schema] + common_schema, "node")
+        )
+
+        def write(batch, connection):
+            for row in batch:
+                tuple_node = self._create_node(
+                    connection, tuple_names, self._row_properties(tuple_properties, row)
+                ).id
+                memberships = []
+                value = row.get(node_schema.field_name)
+                for position, member in enumerate(
+                    [] if value is None else str(value).split(";")
+                ):
+                    parameters = self._schema_parameters(
+                        [node_schema] + common_schema,
+                        {**row, node_schema.field_name: member},
+                        "node",
+                    )
+                    memberships += [
+                        (node, tuple_node, _dumps({"position_in_tuple": position}))
+                        for (node,) in connection.execute(nodes, parameters)
+                    ]
+                connection.executemany(
+                    "INSERT INTO relationships (type, start_id, end_id, properties) "
+                    "VALUES ('_node_membership', ?, ?, ?)",
+                    memberships,
+                )
+
+        return write
+
+    def _subgraph_edges_import_writer(
+        self,
+        start_subgraph_label: Label,
+        start_subgraph_schema: List[Schema],
+        end_subgraph_label: Label,
+        end_subgraph_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+    ) -> Callable[[List[Dict[str, Any]], sqlite3.Connection], None]:
+        """
+        Build the function that imports a batch of subgraph edges.
+
+        @param start_subgraph_label: Label of the start subgraphs.
+        @param start_subgraph_schema: List of property schemas for the start subgraphs.
+        @param end_subgraph_label: Label of the end subgraphs.
+        @param end_subgraph_schema: List of property schemas for the end subgraphs.
+        @param edge_label: Label of the subgraph edges.
+        @param edge_schema: List of property schemas for the subgraph edges.
+        @return: Function writing a batch.
+        """
+        return self._through_batch(
+            ["_subgraph"] + self._label_names(start_subgraph_label),
+            start_subgraph_schema,
+            ["_subgraph"] + self._label_names(end_subgraph_label),
+            end_subgraph_schema,
+            ["_subgraph_edge"] + self._label_names(edge_label),
+            edge_schema,
+            "_subgraph_adjacency",
+        )
+
+    def add_edge(
+        self,
+        session: SQLiteSession,
+        tx: SQLiteTransaction,
+        start_node_labels: List[Label],
+        start_node_properties: List[Property],
+        end_node_labels: List[Label],
+        end_node_properties: List[Property],
+        edge_label: Label,
+        edge_properties: List[Property],
+        track_changes: bool = False,
+    ) -> None:
+        """
+        Add an edge between every pair of matching start and end nodes.
+
+        @param session: Database session.
+        @param tx: Current transaction.
+        @param start_node_labels: List of labels for the start node.
+        @param start_node_properties: List of properties for the start node.
+        @param end_node_labels: List of labels for the end node.
+        @param end_node_properties: List of properties for the end node.
+        @param edge_label: Label of the edge.
+        @param edge_properties: List of properties of the edge.
+        @param track_changes: Set the change version of the edge. Defaults to False.
+        """
+        properties = self._property_dict(edge_properties)
+        if track_changes:
+            properties["_version"] = self._tick(tx.connection)
+        parameters = {"type": str(edge_label), "properties": _properties_json(properties)}
+        terms = self._node_terms(
+            "s",
+            self._label_names(start_node_labels),
+            self._property_dict(start_node_properties),
+            parameters,
+        ) + self._node_terms(
+            "e",
+            self._label_names(end_node_labels),
+            self._property_dict(end_node_properties),
+            parameters,
+        )
+        tx.connection.execute(
+            "INSERT INTO relationships (type, start_id, end_id, properties) "
+            "SELECT :type, s.id, e.id, :properties FROM nodes AS s, nodes AS e"
+            f"{_where(terms)}",
+            parameters,
+        )
+
+    def node_count(self, session: SQLiteSession, node_labels: List[Label] = None) -> int:
+        """
+        Get number of nodes in the database that have the given list of labels.
+
+        @param session: Database session.
+        @param node_labels: List of node labels. Defaults to None.
+        @return: Number of nodes with the given labels.
+        """
+        names = self._label_names(node_labels)
+        with self._read(session) as connection:
+            if len(names) == 1:
+                query = "SELECT count(*) FROM node_labels WHERE label = ?"
+                return connection.execute(query, names).fetchone()[0]
+            terms = [_has_label("n", name) for name in names]
+            query = f"SELECT count(*) FROM nodes AS n{_where(terms)}"
+            return connection.execute(query).fetchone()[0]
+
+    def edge_count(self, session: SQLiteSession, edge_label: Label = None) -> int:
+        """
+        Get number of edges in the database that have the given label.
+
+        @param session: Database session.
+        @param edge_label: Edge label. Defaults to None.
+        @return: Number of edges with the given label.
+        """
+        with self._read(session) as connection:
+            if not edge_label:
+                query = "SELECT count(*) FROM relationships"
+                return connection.execute(query).fetchone()[0]
+            query = "SELECT count(*) FROM relationships WHERE type = ?"
+            return connection.execute(query, (str(edge_label),)).fetchone()[0]
+
+    # Indexes
+
+    @staticmethod
+    def _add_index(
+        connection: sqlite3.Connection,
+        name: str,
+        label: str,
+        properties: List[str],
+        unique: bool = False,
+    ) -> None:
+        """
+        Create a partial expression index over the nodes with a label. Nodes lacking one of
+        the indexed properties are not constrained by a unique index.
+
+        @param connection: Connection within a write transaction.
+        @param name: Name of the index.
+        @param label: Name of the indexed label.
+        @param properties: Indexed property keys.
+        @param unique: Reject nodes with the same indexed values. Defaults to False.
+        """
+        keys = ", ".join(_property(None, key) for key in properties)
+        connection.execute(
+            f"CREATE {'UNIQUE ' if unique else ''}INDEX {_identifier(name)} "
+            f"ON nodes ({keys}) WHERE {_has_label(None, label)}"
+        )
+        connection.execute(
+            "INSERT INTO property_indexes (name, label, keys, is_unique) "
+            "VALUES (?, ?, ?, ?)",
+            (name, label, json.dumps(list(properties)), int(unique)),
+        )
+
+    @staticmethod
+    def _drop_index(connection: sqlite3.Connection, name: str) -> None:
+        """
+        Drop a property index and its definition.
+
+        @param connection: Connection within a write transaction.
+        @param name: Name of the index.
+        """
+        cursor = connection.execute("DELETE FROM property_indexes WHERE name = ?", (name,))
+        if cursor.rowcount:
+            connection.execute(f"DROP INDEX IF EXISTS {_identifier(name)}")
+
+    @staticmethod
+    def _index_definitions(
+        connection: sqlite3.Connection,
+    ) -> List[Tuple[str, str, List[str], bool]]:
+        """
+        Definitions of the property indexes.
+
+        @param connection: Database connection.
+        @return: List of the names, labels, property keys and uniqueness of the indexes.
+        """
+        rows = connection.execute(
+            "SELECT name, label, keys, is_unique FROM property_indexes ORDER BY rowid"
+        )
+        return [(name, label, json.loads(keys), bool(u)) for name, label, keys, u in rows]
+
+    # Traversal
+
+    @staticmethod
+    def _sql_condition(
+        expression: Tuple,
+        aliases: Dict[str, str],
+        parameters: Dict[str, Any],
+        top: bool = True,
+    ) -> Optional[str]:
+        """
+        Translate a condition into SQL with the semantics of Cypher. Comparisons of a property
+        with a constant and their combinations are translated, comparisons of values of
+        different types are null as in Cypher. Within the top-level conjunction only true
+        matters, so equality and range comparisons are written in a form that the property
+        indexes can serve.
+
+        @param expression: Expression tree of the condition.
+        @param aliases: Table aliases of the variables.
+        @param parameters: Query parameters the constants are bound to.
+        @param top: Whether the condition is part of the top-level conjunction. Defaults to
+                    True.
+        @return: SQL condition, or None if the condition cannot be translated.
+        """
+        kind = expression[0]
+        if kind == "literal" and isinstance(expression[1], bool):
+            return "1" if expression[1] else "0"
+        if kind in ("and", "or"):
+            operands = [
+                SQLiteDatabase._sql_condition(
+                    operand, aliases, parameters, top and kind == "and"
+                )
+                for operand in expression[1:]
+            ]
+            if None in operands:
+                return None
+            return f"({operands[0]} {kind.upper()} {operands[1]})"
+        if kind == "not":
+            operand = SQLiteDatabase._sql_condition(
+                expression[1], aliases, parameters, False
+            )
+            return None if operand is None else f"(NOT {operand})"
+        if kind not in ("is_null", "binary"):
+            return None
+        operand = expression[1] if kind == "is_null" else expression[2]
+        if (
+            operand[0] != "property"
+            or operand[1][0] != "variable"
+            or operand[1][1] not in aliases
+        ):
+            if kind == "is_null" or expression[1] not in _MIRRORED:
+                return None
+            # constant on the left, compare the property on the right instead
+            _, operator, left, right = expression
+            return SQLiteDatabase._sql_condition(
+                ("binary", _MIRRORED[operator], right, left), aliases, parameters, top
+            ) if right[0] == "property" and left[0] == "literal" else None
+        alias, key = aliases[operand[1][1]], operand[2]
+        value, value_type = _property(alias, key), _property_type(alias, key)
+        if kind == "is_null":
+            return f"{value} IS {'NOT ' if expression[2] else ''}NULL"
+        operator, constant = expression[1], expression[3]
+        if constant[0] != "literal":
+            return None
+        constant = constant[1]
+        if operator == "IN":
+            if not isinstance(constant, list) or None in constant:
+                return None
+            if not constant:
+                return "0"
+            types = {_json_types(item) for item in constant}
+            if len(types) != 1 or types & {("array",), ("object",)}:
+                return None
+            types = types.pop()
+            placeholders = ", ".join(_bind(parameters, _sql_value(c)) for c in constant)
+            test = f"{value} IN ({placeholders})"
+        elif (
+            constant is None
+            or isinstance(constant, (list, dict))
+            or (isinstance(constant, float) and math.isnan(constant))
+        ):
+            return None
+        elif operator in STRING_OPERATORS:
+            if not isinstance(constant, str):
+                return None
+            types = ("text",)
+            placeholder = _bind(parameters, constant)
+            test = {
+                "STARTS WITH": f"substr({value}, 1, length({placeholder})) = {placeholder}",
+                "ENDS WITH": f"({placeholder} = '' OR "
+                f"substr({value}, -length({placeholder})) = {placeholder})",
+                "CONTAINS": f"instr({value}, {placeholder}) > 0",
+            }[operator]
+        elif operator in COMPARISON_OPERATORS:
+            types = _json_types(constant)
+            test = f"{value} {operator} {_bind(parameters, _sql_value(constant))}"
+        else:
+            return None
+        if top and operator != "<>":
+            return f"({test} AND {value_type} IN ({_types(types)}))"
+        if operator in ("=", "<>", "IN"):
+            # values of different types are never equal
+            mismatch = "1" if operator == "<>" else "0"
+            return (
+                f"CASE WHEN {value_type} IS NULL THEN NULL "
+                f"WHEN {value_type} IN ({_types(types)}) THEN {test} "
+                f"ELSE {mismatch} END"
+            )
+        return f"CASE WHEN {value_type} IN ({_types(types)}) THEN {test} END"
+
+    def traverse_path(
+        self,
+        session: SQLiteSession,
+        variables_list: List[List[str]],
+        elements_list: List[List[Tuple[List[Label], List[Property]]]],
+        conditions_list: List[List[Union[str, Predicate]]],
+        return_values: List[str],
+        sort: List[str] = None,
+        limit: int = None,
+        output: str = "pandas",
+        dtypes: Optional[Dict[str, Any]] = None,
+        group_by: List[str] = None,
+        aggregates: List[Aggregate] = None,
+    ) -> Union[pd.DataFrame, Dict[str, Any]]:
+        """
+        Traverse a path in the database. The paths are compiled into a single query joining
+        one table alias per variable, with the labels, properties and the conditions that
+        have a SQL translation as filters. The remaining conditions, return values, sort items
+        and aggregations are evaluated with the expression module on the matched elements;
+        graph elements are returned as their properties.
+
+        @param session: Database session.
+        @param variables_list: Variables of the elements of each path, None for anonymous
+                               elements.
+        @param elements_list: Labels and properties of the elements of each path, alternating
+                              nodes and relationships.
+        @param conditions_list: Conditions of each path, Cypher strings or structured
+                                predicates.
+        @param return_values: Expressions to return, optionally with an alias.
+        @param sort: Sort items, optionally followed by ASC or DESC. Defaults to None.
+        @param limit: Maximum number of returned rows. Defaults to None.
+        @param output: Result format: 'pandas', 'numpy' or 'torch'. Defaults to 'pandas'.
+        @param dtypes: Optional mapping from return value to dtype for the 'numpy' and 'torch'
+                       formats. Defaults to None.
+        @param group_by: Grouping keys returned next to the aggregations. Defaults to None.
+        @param aggregates: Aggregations evaluated by the database. Defaults to None.
+        @return: Path information as a dataframe or as a dictionary of arrays.
+        """
+        if output not in OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output format: {output}")
+        group_by = group_by if group_by else []
+        aggregates = aggregates if aggregates else []
+        items = return_values + group_by
+        columns = items + [a.alias for a in aggregates]
+        parameters: Dict[str, Any] = {}
+        aliases: Dict[str, str] = {}
+        relationships: Dict[str, bool] = {}
+        tables: List[str] = []
+        terms: List[str] = []
+        remaining: List[Tuple] = []
+        visible: List[str] = []
+        anonymous = itertools.count()
+        for variables, elements, conditions in zip(
+            variables_list, elements_list, conditions_list
+        ):
+            names = [
+                f"  anonymous{next(anonymous)}" if v is None else v for v in variables
+            ]
+            visible += [v for v in variables if v is not None and v not in visible]
+            expressions = [
+                expression
+                for condition in conditions
+                for expression in conjuncts(condition_expression(condition))
+            ]
+            for expression in expressions:
+                for variable in expression_variables(expression):
+                    if variable not in visible:
+                        raise ValueError(f"Variable `{variable}` not defined.")
+            path = []
+            for position, (name, (labels, properties)) in enumerate(
+                zip(names, elements)
+            ):
+                relationship = position % 2 == 1
+                if name not in aliases:
+                    aliases[name] = f"v{len(aliases)}"
+                    relationships[name] = relationship
+                    table = "relationships" if relationship else "nodes"
+                    tables.append(f"{table} AS {aliases[name]}")
+                alias = aliases[name]
+                path.append(alias)
+                names_of = self._label_names(labels)
+                if relationship and names_of:
+                    types = ", ".join(_bind(parameters, n) for n in names_of)
+                    terms.append(f"{alias}.type IN ({types})")
+                terms += self._node_terms(
+                    alias,
+                    [] if relationship else names_of,
+                    self._property_dict(properties),
+                    parameters,
+                )
+            for position in range(1, len(path), 2):
+                terms.append(f"{path[position]}.start_id = {path[position - 1]}.id")
+                terms.append(f"{path[position]}.end_id = {path[position + 1]}.id")
+            # a relationship is used at most once per path
+            terms += [
+                f"{a}.id <> {b}.id"
+                for a, b in itertools.combinations(dict.fromkeys(path[1::2]), 2)
+            ]
+            for expression in expressions:
+                condition = self._sql_condition(expression, aliases, parameters)
+                if condition is None:
+                    remaining.append(expression)
+                else:
+                    terms.append(condition)
+        selected = ", ".join(
+            (_RELATIONSHIP_COLUMNS if relationships[v] else _NODE_COLUMNS).format(
+                aliases[v]
+            )
+            for v in visible
+        )
+        query = f"SELECT {selected or 1}"
+        if tables:
+            query += f" FROM {', '.join(tables)}{_where(terms)}"
+        if limit and not remaining and not sort and not aggregates:
+            query += f" LIMIT {_bind(parameters, int(limit))}"
+        # elements are decoded once per query, so that equal elements are the same objects
+        elements: Dict[Tuple[bool, int], Union[StoredNode, StoredRelationship]] = {}
+
+        def element(relationship, values):
+            found = elements.get((relationship, values[0]))
+            if found is None:
+                found = (_relationship if relationship else _node)(values)
+                elements[(relationship, values[0])] = found
+            return found
+
+        bindings = []
+        with self._read(session) as connection:
+            for row in connection.execute(query, parameters):
+                binding = {}
+                offset = 0
+                for variable in visible:
+                    width = 5 if relationships[variable] else 3
+                    binding[variable] = element(
+                        relationships[variable], row[offset : offset + width]
+                    )
+                    offset += width
+                if all(holds(expression, binding) for expression in remaining):
+                    bindings.append(binding)
+        records = project(bindings, visible, items, aggregates, sort)
+        if limit:
+            records = records[:limit]
+        if output != "pandas":
+            return records_to_arrays(records, columns, dtypes, output)
+        if not columns:
+            columns = sorted(visible)
+        return pd.DataFrame(records, columns=columns)
+
+    def clear_data(self, session: SQLiteSession) -> None:
+        """
+        Remove all data from the database. Index definitions are kept.
+
+        @param session: Database session.
+        """
+        with self._write(session) as connection:
+            connection.execute("DELETE FROM relationships")
+            connection.execute("DELETE FROM node_labels")
+            connection.execute("DELETE FROM nodes")
+            connection.execute("DELETE FROM import_checkpoints")
+
+    def start_session(self, bookmarks=None, read_only: bool = False) -> SQLiteSession:
+        """
+        Start a new database session.
+
+        @param bookmarks: Accepted for compatibility, sessions read the latest committed data.
+                          Defaults to None.
+        @param read_only: Whether the session is only used for reads. Defaults to False.
+        @return: Database session.
+        """
+        return SQLiteSession(self, read_only)
+
+    @property
+    def max_concurrent_sessions(self) -> int:
+        """
+        Maximum number of sessions that can be used concurrently, for readers; writers take
+        turns on the write lock.
+
+        @return: Number of concurrent sessions.
+        """
+        return self._max_concurrent_sessions
+
@@ -1,3 +1,4 @@
+from .async_storage import AsyncStorage
 from .edge import Edge
 from .graph_element import GraphElement
 from .graph_storage import GraphStorage
@@ -0,0 +1,115 @@
+# Copyright (c) 2025 ETH Zurich.
+#                    All rights reserved.
+#
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# asyncio interface of the storage classes. The storage methods run on a worker thread
+# of their own, so async services can use any storage and database, including
+# Neo4jDatabase(proxy_url=...), without blocking the event loop:
+#
+#     storage = await AsyncStorage.create(GraphStorage, Neo4jDatabase(proxy_url=url))
+#     await storage.add_node(node)
+#     frame = await storage.traverse_path([path], return_values=["a.name"])
+#     await storage.close()
+#
+# There is no separate asyncio proxy client: with proxy_url, the blocking proxy client runs
+# on the worker thread, and its keep-alive connections are reused across the calls.
+#
+# A storage holds a single database session, which is not safe for concurrent use, so the
+# calls of one AsyncStorage run one at a time in the order they were made. Concurrent
+# work should use several instances, or traverse_many, which opens a session per traversal.
+
+from HOGDB.graph.graph_storage import GraphStorage
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, Type
+import asyncio
+import functools
+
+
+class AsyncStorage:
+    """
+    Wrapper running the methods of a storage on a worker thread. Every method of the wrapped
+    storage is available as a coroutine with the same arguments, other attributes are
+    returned as they are. The profile context manager is not available, since the plans
+    are captured on the thread entering it; use it on the wrapped storage in a thread.
+    """
+
+    def __init__(
+        self, storage: GraphStorage, executor: Optional[ThreadPoolExecutor] = None
+    ) -> None:
+        """
+        Wrap a storage.
+
+        @param storage: Storage whose methods are called.
+        @param executor: Executor with a single worker running the calls. Defaults to a new
+                         executor, shut down by close.
+        """
+        self.storage = storage
+        self._own_executor = executor is None
+        self._executor = executor if executor is not None else _worker()
+
+    @classmethod
+    async def create(
+        cls, storage_class: Type[GraphStorage], *args, **kwargs
+    ) -> "AsyncStorage":
+        """
+        Create a storage on the worker thread, since opening its session may block.
+
+        @param storage_class: Storage class, for example GraphwithSubgraphStorage.
+        @param args: Positional arguments of the storage class.
+        @param kwargs: Keyword arguments of the storage class.
+        @return: The wrapped storage.
+        """
+        executor = _worker()
+        try:
+            storage = await _run(executor, storage_class, *args, **kwargs)
+        except BaseException:
+            executor.shutdown(wait=False)
+            raise
+        wrapper = cls(storage, executor)
+        wrapper._own_executor = True
+        return wrapper
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "profile":
+            raise AttributeError(
+                "profile captures the plans of its own thread, use it on the wrapped storage."
+            )
+        attribute = getattr(self.storage, name)
+        if not callable(attribute):
+            return attribute
+
+        async def call(*args, **kwargs):
+            return await _run(self._executor, attribute, *args, **kwargs)
+
+        call.__name__ = name
+        call.__doc__ = attribute.__doc__
+        return call
+
+    async def close(self) -> None:
+        """
+        Close the connection of the storage and shut the worker thread down.
+        """
+        try:
+            await _run(self._executor, self.storage.close_connection)
+        finally:
+            if self._own_executor:
+                self._executor.shutdown(wait=False)
+
+    async def __aenter__(self) -> "AsyncStorage":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+
+def _worker() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="hogdb-storage")
+
+
+async def _run(executor: ThreadPoolExecutor, function: Callable, *args, **kwargs) -> Any:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor, functools.partial(function, *args, **kwargs)
+    )
@@ -10,11 +10,16 @@
 from HOGDB.graph.node import Node
 from HOGDB.graph.edge import Edge
 from HOGDB.graph.path import Path
-from HOGDB.db.db import Database
+from HOGDB.db.aggregation import Aggregate
+from HOGDB.db.db import Database, UnsupportedOperationError
+from HOGDB.db.exporter import ExportStats
+from HOGDB.db.importer import ImportStats
 from HOGDB.db.label import Label
+from HOGDB.db.predicate import Comparison, Predicate
 from HOGDB.db.property import Property
 from HOGDB.db.schema import Schema
-from typing import List
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 import pandas as pd
@@ -23,14 +28,29 @@ load_dotenv()
 
 
 class GraphStorage:
-    def __init__(self, db: Database) -> None:
+    # labels of the elements carrying a change version when changes are tracked
+    _versioned_labels = ["_node", "_tombstone"]
+
+    def __init__(self, db: Database, track_changes: bool = False) -> None:
         """
         Initialize GraphStorage with a database connection.
 
+        In change-tracking mode, every write sets the '_version' property of the written
+        elements, deletions leave '_tombstone' nodes, and the exports can be restricted to the
+        elements changed since a version. Bulk imports do not set versions, so a full export
+        is required after an import.
+
         @param db: The database connection object.
+        @param track_changes: Maintain change versions and tombstones. Defaults to False.
         """
         self.db = db
+        self.track_changes = track_changes
         self._start_session()
+        if track_changes:
+            self.db.ensure_indexes(
+                self.session,
+                [([Label(label)], ["_version"]) for label in self._versioned_labels],
+            )
 
     def close_connection(self) -> None:
         """
@@ -95,7 +115,11 @@ class GraphStorage:
         """
         return self._with_transaction(
             lambda tx: self.db.add_node(
-                self.session, tx, labels=node.labels, properties=node.properties
+                self.session,
+                tx,
+                labels=node.labels,
+                properties=node.properties,
+                track_changes=self.track_changes,
             ),
             tx,
         )
@@ -118,6 +142,7 @@ class GraphStorage:
                 end_node_properties=edge.end_node.properties,
                 edge_label=edge.label,
                 edge_properties=edge.properties,
+                track_changes=self._tracks_edge(edge),
             ),
             tx,
         )
@@ -132,7 +157,11 @@ class GraphStorage:
         """
         return self._with_transaction(
             lambda tx: self.db.delete_node(
-                self.session, tx, labels=node.labels, properties=node.properties
+                self.session,
+                tx,
+                labels=node.labels,
+                properties=node.properties,
+                track_changes=self.track_changes,
             ),
             tx,
         )
@@ -154,6 +183,7 @@ class GraphStorage:
                 end_node_labels=edge.end_node.labels,
                 end_node_properties=edge.end_node.properties,
                 edge_label=edge.label,
+                track_changes=self._tracks_edge(edge),
             ),
             tx,
         )
@@ -171,7 +201,12 @@ class GraphStorage:
         """
         return self._with_transaction(
             lambda tx: self.db.update_node(
-                self.session, tx, node.labels, node.properties, update_properties
+                self.session,
+                tx,
+                node.labels,
+                node.properties,
+                update_properties,
+                track_changes=self.track_changes,
             ),
             tx,
         )
@@ -189,11 +224,44 @@ class GraphStorage:
         """
         return self._with_transaction(
             lambda tx: self.db.update_edge(
-                self.session, tx, edge.label, edge.properties, update_properties
+                self.session,
+                tx,
+                edge.label,
+                edge.properties,
+                update_properties,
+                track_changes=self._tracks_edge(edge),
             ),
             tx,
         )
 
+    def _tracks_edge(self, edge: Edge) -> bool:
+        """
+        Whether changes of an edge are tracked. The internal relationships of the HO elements
+        are not versioned, the changes are tracked on the HO elements themselves.
+
+        @param edge: The edge.
+        @return: True if the edge carries a change version.
+        """
+        return self.track_changes and not repr(edge.label).startswith("_")
+
+    def current_version(self) -> int:
+        """
+        Get the current change version. Note it before an export and pass it as 'since' to the
+        next export to only export the elements changed in between.
+
+        @return: The current version.
+        """
+        return self.db.current_version(self.session)
+
+    def delete_import_checkpoint(self, checkpoint: str) -> None:
+        """
+        Delete the progress recorded for a resumable import, so that it starts over when run
+        again with the same checkpoint.
+
+        @param checkpoint: Name of the import checkpoint.
+        """
+        self.db.delete_import_checkpoint(self.session, checkpoint)
+
     def _get_nodes_from_database(self, node_pattern: Node) -> pd.DataFrame:
         """
         Get nodes from the database.
@@ -384,6 +452,7 @@ class GraphStorage:
         node_schema: List[Schema],
         as_url: bool = False,
         delimiter: str = ",",
+        checkpoint: str = None,
     ) -> None:
         """
         Import nodes from a CSV file.
@@ -393,6 +462,9 @@ class GraphStorage:
         @param node_schema: Schema of the nodes.
         @param as_url: Whether the file is a URL. Defaults to False.
         @param delimiter: The delimiter used in the CSV file. Defaults to ','.
+        @param checkpoint: Name under which the progress of the import is committed together
+                           with the imported rows. A failed import run again with the same
+                           name resumes after the last committed row. Defaults to None.
         """
         self.db.import_nodes_from_csv(
             self.session,
@@ -401,6 +473,43 @@ class GraphStorage:
             node_schema,
             as_url=as_url,
             delimiter=delimiter,
+            checkpoint=checkpoint,
+        )
+
+    def import_nodes_from_frame(
+        self,
+        data: Any,
+        labels: List[Label],
+        node_schema: List[Schema],
+        concurrency: int = 4,
+        delimiter: str = ",",
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import nodes from a DataFrame, Arrow data or a local CSV file, sent in batches over
+        the connection instead of being loaded by the server.
+
+        @param data: DataFrame, Arrow table, path of a local CSV (optionally gzip, bz2 or zstd
+                     compressed), Parquet or Arrow IPC file, or an iterable of DataFrames or
+                     dictionaries.
+        @param labels: Labels to assign to the imported nodes.
+        @param node_schema: Schema of the nodes.
+        @param concurrency: Number of concurrent writer sessions. Defaults to 4.
+        @param delimiter: The delimiter used in a local CSV file. Defaults to ','.
+        @param checkpoint: Name under which the committed batches are recorded together with
+                           the imported rows. A failed import run again with the same name and
+                           the same rows and batch size skips the committed batches. Defaults
+                           to None.
+        @return: Import statistics.
+        """
+        return self.db.import_nodes_from_frame(
+            self.session,
+            data,
+            [Label("_node")] + labels,
+            node_schema,
+            concurrency=concurrency,
+            delimiter=delimiter,
+            checkpoint=checkpoint,
         )
 
     def import_edges_from_csv(
@@ -414,6 +523,7 @@ class GraphStorage:
         edge_schema: List[Schema],
         as_url: bool = False,
         delimiter: str = ",",
+        checkpoint: str = None,
     ) -> None:
         """
         Import edges from a CSV file.
@@ -427,6 +537,9 @@ class GraphStorage:
         @param edge_schema: Schema of the edge.
         @param as_url: Whether the file is a URL. Defaults to False.
         @param delimiter: The delimiter used in the CSV file. Defaults to ','.
+        @param checkpoint: Name under which the progress of the import is committed together
+                           with the imported rows. A failed import run again with the same
+                           name resumes after the last committed row. Defaults to None.
         """
         self.db.import_edges_from_csv(
             self.session,
@@ -439,19 +552,162 @@ class GraphStorage:
             edge_schema,
             as_url=as_url,
             delimiter=delimiter,
+            checkpoint=checkpoint,
+        )
+
+    def import_edges_from_frame(
+        self,
+        data: Any,
+        start_node_labels: List[Label],
+        start_node_schema: List[Schema],
+        end_node_labels: List[Label],
+        end_node_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+        concurrency: int = 4,
+        partitions: int = None,
+        delimiter: str = ",",
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import edges from a DataFrame, Arrow data or a local CSV file, sent in batches over
+        the connection instead of being loaded by the server.
+
+        @param data: DataFrame, Arrow table, path of a local CSV (optionally gzip, bz2 or zstd
+                     compressed), Parquet or Arrow IPC file, or an iterable of DataFrames or
+                     dictionaries.
+        @param start_node_labels: Labels of the start nodes.
+        @param start_node_schema: Schema of the start nodes.
+        @param end_node_labels: Labels of the end nodes.
+        @param end_node_schema: Schema of the end nodes.
+        @param edge_label: Label of the edge.
+        @param edge_schema: Schema of the edge.
+        @param concurrency: Number of concurrent writer sessions. Defaults to 4.
+        @param partitions: Number of node partitions for a parallel import without lock
+                           contention. Defaults to None (not partitioned).
+        @param delimiter: The delimiter used in a local CSV file. Defaults to ','.
+        @param checkpoint: Name under which the committed batches are recorded together with
+                           the imported rows. A failed import run again with the same name and
+                           the same rows and batch size skips the committed batches. Not
+                           supported for partitioned imports. Defaults to None.
+        @return: Import statistics.
+        """
+        return self.db.import_edges_from_frame(
+            self.session,
+            data,
+            start_node_labels,
+            start_node_schema,
+            end_node_labels,
+            end_node_schema,
+            edge_label,
+            edge_schema,
+            concurrency=concurrency,
+            partitions=partitions,
+            delimiter=delimiter,
+            checkpoint=checkpoint,
         )
 
     def export_nodes_to_csv(
-        self, file_name: str, labels: List[Label], node_schema: List[Schema]
-    ) -> None:
+        self,
+        file_name: str,
+        labels: List[Label],
+        node_schema: List[Schema],
+        batch_size: int = 10000,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
         """
         Export nodes to a CSV file.
 
         @param file_name: The name of the CSV file.
         @param labels: The labels of nodes to export.
         @param node_schema: The schema of the nodes.
+        @param batch_size: Number of rows appended at a time. Defaults to 10000.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        return self.db.export_nodes_to_csv(
+            self.session,
+            file_name,
+            labels,
+            node_schema,
+            batch_size,
+            progress,
+            since,
+        )
+
+    def export_nodes_to_parquet(
+        self,
+        file_name: str,
+        labels: List[Label],
+        node_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export nodes to a Parquet file.
+
+        @param file_name: The name of the output file.
+        @param labels: The labels of nodes to export.
+        @param node_schema: The schema of the nodes.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of elements per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        return self.db.export_nodes_to_parquet(
+            self.session,
+            file_name,
+            labels,
+            node_schema,
+            compression,
+            batch_size,
+            progress,
+            since,
+        )
+
+    def export_nodes_to_arrow(
+        self,
+        file_name: str,
+        labels: List[Label],
+        node_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
         """
-        self.db.export_nodes_to_csv(self.session, file_name, labels, node_schema)
+        Export nodes to an Arrow IPC file.
+
+        @param file_name: The name of the output file.
+        @param labels: The labels of nodes to export.
+        @param node_schema: The schema of the nodes.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of elements per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        return self.db.export_nodes_to_arrow(
+            self.session,
+            file_name,
+            labels,
+            node_schema,
+            compression,
+            batch_size,
+            progress,
+            since,
+        )
 
     def export_edges_to_csv(
         self,
@@ -462,7 +718,10 @@ class GraphStorage:
         end_node_schema: List[Schema],
         edge_label: Label,
         edge_schema: List[Schema],
-    ) -> None:
+        batch_size: int = 10000,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
         """
         Export edges to a CSV file.
 
@@ -473,8 +732,107 @@ class GraphStorage:
         @param end_node_schema: Schema of the end nodes.
         @param edge_label: Label of the edge.
         @param edge_schema: Schema of the edge.
+        @param batch_size: Number of rows appended at a time. Defaults to 10000.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        return self.db.export_edges_to_csv(
+            self.session,
+            file_name,
+            start_node_label,
+            start_node_schema,
+            end_node_label,
+            end_node_schema,
+            edge_label,
+            edge_schema,
+            batch_size,
+            progress,
+            since,
+        )
+
+    def export_edges_to_parquet(
+        self,
+        file_name: str,
+        start_node_label: Label,
+        start_node_schema: List[Schema],
+        end_node_label: Label,
+        end_node_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export edges to a Parquet file.
+
+        @param file_name: The name of the output file.
+        @param start_node_label: Label of the start nodes.
+        @param start_node_schema: Schema of the start nodes.
+        @param end_node_label: Label of the end nodes.
+        @param end_node_schema: Schema of the end nodes.
+        @param edge_label: Label of the edge.
+        @param edge_schema: Schema of the edge.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of elements per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        return self.db.export_edges_to_parquet(
+            self.session,
+            file_name,
+            start_node_label,
+            start_node_schema,
+            end_node_label,
+            end_node_schema,
+            edge_label,
+            edge_schema,
+            compression,
+            batch_size,
+            progress,
+            since,
+        )
+
+    def export_edges_to_arrow(
+        self,
+        file_name: str,
+        start_node_label: Label,
+        start_node_schema: List[Schema],
+        end_node_label: Label,
+        end_node_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
         """
-        self.db.export_edges_to_csv(
+        Export edges to an Arrow IPC file.
+
+        @param file_name: The name of the output file.
+        @param start_node_label: Label of the start nodes.
+        @param start_node_schema: Schema of the start nodes.
+        @param end_node_label: Label of the end nodes.
+        @param end_node_schema: Schema of the end nodes.
+        @param edge_label: Label of the edge.
+        @param edge_schema: Schema of the edge.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of elements per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        return self.db.export_edges_to_arrow(
             self.session,
             file_name,
             start_node_label,
@@ -483,6 +841,112 @@ class GraphStorage:
             end_node_schema,
             edge_label,
             edge_schema,
+            compression,
+            batch_size,
+            progress,
+            since,
+        )
+
+    def export_tombstones_to_csv(
+        self,
+        file_name: str,
+        labels: List[Label],
+        schema: List[Schema],
+        since: Optional[int] = None,
+        batch_size: int = 10000,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+    ) -> ExportStats:
+        """
+        Export the tombstones of deleted elements to a CSV file.
+
+        @param file_name: The name of the CSV file.
+        @param labels: Labels (or the type) of the deleted elements, including the internal
+                       label such as '_hyperedge' to restrict the export to one kind of element.
+        @param schema: The schema of the deleted elements. The tombstones of edges also hold
+                       the properties their start and end nodes were matched on, as
+                       _start_<key> and _end_<key>.
+        @param since: Only export elements deleted after this version. Defaults to None.
+        @param batch_size: Number of rows appended at a time. Defaults to 10000.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @return: Export statistics.
+        """
+        return self.db.export_tombstones_to_csv(
+            self.session, file_name, labels, schema, since, batch_size, progress
+        )
+
+    def export_tombstones_to_parquet(
+        self,
+        file_name: str,
+        labels: List[Label],
+        schema: List[Schema],
+        since: Optional[int] = None,
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+    ) -> ExportStats:
+        """
+        Export the tombstones of deleted elements to a Parquet file.
+
+        @param file_name: The name of the output file.
+        @param labels: Labels (or the type) of the deleted elements, including the internal
+                       label such as '_hyperedge' to restrict the export to one kind of element.
+        @param schema: The schema of the deleted elements. The tombstones of edges also hold
+                       the properties their start and end nodes were matched on, as
+                       _start_<key> and _end_<key>.
+        @param since: Only export elements deleted after this version. Defaults to None.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of elements per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @return: Export statistics.
+        """
+        return self.db.export_tombstones_to_parquet(
+            self.session,
+            file_name,
+            labels,
+            schema,
+            since,
+            compression,
+            batch_size,
+            progress,
+        )
+
+    def export_tombstones_to_arrow(
+        self,
+        file_name: str,
+        labels: List[Label],
+        schema: List[Schema],
+        since: Optional[int] = None,
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+    ) -> ExportStats:
+        """
+        Export the tombstones of deleted elements to an Arrow IPC file.
+
+        @param file_name: The name of the output file.
+        @param labels: Labels (or the type) of the deleted elements, including the internal
+                       label such as '_hyperedge' to restrict the export to one kind of element.
+        @param schema: The schema of the deleted elements. The tombstones of edges also hold
+                       the properties their start and end nodes were matched on, as
+                       _start_<key> and _end_<key>.
+        @param since: Only export elements deleted after this version. Defaults to None.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of elements per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @return: Export statistics.
+        """
+        return self.db.export_tombstones_to_arrow(
+            self.session,
+            file_name,
+            labels,
+            schema,
+            since,
+            compression,
+            batch_size,
+            progress,
         )
 
     def create_index(self, label: Label, property_keys: List[str]) -> None:
@@ -494,6 +958,18 @@ class GraphStorage:
         """
         self.db.create_index(self.session, label, property_keys)
 
+    def ensure_indexes(
+        self, lookups: List[Tuple[List[Label], List[str]]], unique: bool = False
+    ) -> List[str]:
+        """
+        Create the missing indexes for node lookups, for example ahead of an import.
+
+        @param lookups: List of labels and the property keys matched on them.
+        @param unique: Create uniqueness constraints instead of plain indexes. Defaults to False.
+        @return: Names of the created indexes or constraints.
+        """
+        return self.db.ensure_indexes(self.session, lookups, unique)
+
     def show_indexes(self) -> List[str]:
         """
         Show all indexes.
@@ -510,23 +986,133 @@ class GraphStorage:
         """
         self.db.drop_index(self.session, index)
 
+    def profile(self, explain: bool = False):
+        """
+        Context manager that captures the query plan, database hits, rows per operator and
+        elapsed time of every query issued by the storage within its scope. Queries run on
+        other threads, such as the traversals of traverse_many, are not captured.
+
+        Example:
+            with gs.profile() as profiles:
+                gs.get_subgraph(pattern)
+            print(profiles[0].db_hits)
+
+        @param explain: Capture the plans without their execution statistics. Defaults to
+                        False.
+        @return: Context manager yielding a list of QueryProfile objects.
+        @raise UnsupportedOperationError: If the database does not support query plans.
+        """
+        plans = self.db.capture_plans(explain)
+        if plans is None:
+            raise UnsupportedOperationError(
+                f"{type(self.db).__name__} does not support capturing query plans."
+            )
+        return plans
+
     def traverse_path(
         self,
         paths: List[Path],
-        conditions: List[List[str]] = [],
+        conditions: List[List[Union[str, Predicate]]] = [],
         return_values: List[str] = [],
         sort: List[str] = None,
         limit: int = None,
-    ) -> pd.DataFrame:
+        output: str = "pandas",
+        dtypes: Dict[str, Any] = None,
+        group_by: List[str] = None,
+        aggregates: List[Aggregate] = None,
+    ) -> Union[pd.DataFrame, Dict[str, Any]]:
         """
         Traverse a path in the database.
 
         @param paths: A list of paths to traverse.
-        @param conditions: Optional conditions for each path.
+        @param conditions: Optional conditions for each path, either Cypher strings or
+                           structured predicates such as P("a.graph_id") == 5.
+        @param return_values: The values to return from the traversal.
+        @param sort: Optional sorting criteria.
+        @param limit: Optional limit on the number of results.
+        @param output: Result format: 'pandas' for a dataframe, 'numpy' or 'torch' for a
+                       dictionary of arrays keyed by return value. Defaults to 'pandas'.
+        @param dtypes: Optional dtypes of the returned arrays, keyed by return value.
+        @param group_by: Optional grouping keys for the aggregations.
+        @param aggregates: Optional aggregations computed by the database, for example
+                           Aggregate.count("c"). Only the aggregated rows are returned.
+        @return: A dataframe or a dictionary of arrays containing the traversal results.
+        """
+        return self._traverse_path(
+            self.session,
+            paths,
+            conditions,
+            return_values,
+            sort,
+            limit,
+            output,
+            dtypes,
+            group_by,
+            aggregates,
+        )
+
+    def traverse_many(
+        self,
+        traversals: Dict[str, Tuple[List[Path], Dict[str, Any]]],
+        max_workers: int = None,
+    ) -> Dict[str, Union[pd.DataFrame, Dict[str, Any]]]:
+        """
+        Run independent traversals concurrently, each in its own pooled read session. All
+        sessions are started from the bookmarks of the storage session, so every traversal
+        observes at least the writes committed through this storage.
+
+        @param traversals: Dictionary mapping a name to a tuple of paths and the keyword
+                           arguments of traverse_path.
+        @param max_workers: Maximum number of concurrent sessions. Defaults to the session
+                            limit of the database.
+        @return: Dictionary mapping each name to its traversal result.
+        """
+        if not traversals:
+            return {}
+        bookmarks = self.db.last_bookmarks(self.session)
+        limit = self.db.max_concurrent_sessions
+        workers = min(len(traversals), max_workers or limit, limit)
+
+        def run(item):
+            name, (paths, kwargs) = item
+            session = self.db.start_session(bookmarks=bookmarks, read_only=True)
+            try:
+                return name, self._traverse_path(session, paths, **kwargs)
+            finally:
+                self._end_session(session)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(executor.map(run, traversals.items()))
+
+    def _traverse_path(
+        self,
+        session,
+        paths: List[Path],
+        conditions: List[List[Union[str, Predicate]]] = [],
+        return_values: List[str] = [],
+        sort: List[str] = None,
+        limit: int = None,
+        output: str = "pandas",
+        dtypes: Dict[str, Any] = None,
+        group_by: List[str] = None,
+        aggregates: List[Aggregate] = None,
+    ) -> Union[pd.DataFrame, Dict[str, Any]]:
+        """
+        Traverse a path in the database within the given session.
+
+        @param session: The session object used for the traversal.
+        @param paths: A list of paths to traverse.
+        @param conditions: Optional conditions for each path, either Cypher strings or
+                           structured predicates such as P("a.graph_id") == 5.
         @param return_values: The values to return from the traversal.
         @param sort: Optional sorting criteria.
         @param limit: Optional limit on the number of results.
-        @return: A dataframe containing the traversal results.
+        @param output: Result format: 'pandas', 'numpy' or 'torch'. Defaults to 'pandas'.
+        @param dtypes: Optional dtypes of the returned arrays, keyed by return value.
+        @param group_by: Optional grouping keys for the aggregations.
+        @param aggregates: Optional aggregations computed by the database, for example
+                           Aggregate.count("c"). Only the aggregated rows are returned.
+        @return: A dataframe or a dictionary of arrays containing the traversal results.
         """
         vars_elements = [self._read_path(path) for path in paths]
         vars_list = [vars for vars, _ in vars_elements]
@@ -536,16 +1122,48 @@ class GraphStorage:
         )
         assert len(vars_list) == len(elements_list) == len(conditions_list)
         records = self.db.traverse_path(
-            self.session,
+            session,
             vars_list,
             elements_list,
             conditions_list,
             return_values,
             sort,
             limit,
+            output,
+            dtypes,
+            group_by,
+            aggregates,
         )
         return records
 
+    def indexed_conditions(
+        self,
+        paths: List[Path],
+        conditions: List[List[Union[str, Predicate]]],
+    ) -> List[Tuple[Comparison, Optional[str]]]:
+        """
+        Report which structured conditions of a traversal can be served by an existing index.
+        Comparisons without an index are evaluated by scanning, so adding an index on their
+        label and property usually speeds up the traversal.
+
+        @param paths: A list of paths to traverse.
+        @param conditions: Conditions for each path.
+        @return: List of comparisons and the name of the index serving each of them, or None.
+        @raise UnsupportedOperationError: If the database does not report index usage.
+        """
+        vars_elements = [self._read_path(path) for path in paths]
+        vars_list = [vars for vars, _ in vars_elements]
+        elements_list = [elements for _, elements in vars_elements]
+        assert len(vars_list) == len(elements_list) == len(conditions)
+        served = self.db.indexed_predicates(
+            self.session, vars_list, elements_list, conditions
+        )
+        if served is None:
+            raise UnsupportedOperationError(
+                f"{type(self.db).__name__} does not report index usage of conditions."
+            )
+        return served
+
     def _read_path(self, path: Path):
         """
         Read a path variable.
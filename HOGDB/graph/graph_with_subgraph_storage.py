@@ -12,23 +12,28 @@ from HOGDB.graph.graph_storage import GraphStorage
 from HOGDB.graph.node import Node, Label, Property
 from HOGDB.graph.edge import Edge
 from HOGDB.db.db import Database
+from HOGDB.db.exporter import ExportStats
+from HOGDB.db.importer import ImportStats
 from HOGDB.db.schema import Schema
 from HOGDB.graph.path import Path
 from HOGDB.graph.subgraph import Subgraph, SubgraphEdge
-from typing import List
+from typing import Any, Callable, List, Optional
 
 
 # Load environment variables from the .env file
 load_dotenv()
 
 class GraphwithSubgraphStorage(GraphStorage):
-    def __init__(self, db: Database) -> None:
+    _versioned_labels = GraphStorage._versioned_labels + ["_edge", "_subgraph", "_subgraph_edge"]
+
+    def __init__(self, db: Database, track_changes: bool = False) -> None:
         """
         Initialize GraphwithSubgraphStorage with a database connection.
 
         @param db: The database connection object.
+        @param track_changes: Maintain change versions and tombstones. Defaults to False.
         """
-        super().__init__(db)
+        super().__init__(db, track_changes)
 
     def _delete_node_with_node_edges_from_database(
         self, tx, node: Node, edge_label: Label = Label("_adjacency")
@@ -43,7 +48,12 @@ class GraphwithSubgraphStorage(GraphStorage):
         """
         return self._with_transaction(
             lambda tx: self.db.delete_node_with_node_edges(
-                self.session, tx, node.labels, node.properties, edge_label
+                self.session,
+                tx,
+                node.labels,
+                node.properties,
+                edge_label,
+                track_changes=self.track_changes,
             ),
             tx,
         )
@@ -412,17 +422,105 @@ class GraphwithSubgraphStorage(GraphStorage):
         return edge
 
     def export_nodes_to_csv(
-        self, file_name: str, labels: List[Label], node_schema: List[Schema]
-    ) -> None:
+        self,
+        file_name: str,
+        labels: List[Label],
+        node_schema: List[Schema],
+        batch_size: int = 10000,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
         """
         Export nodes to a CSV file.
 
         @param file_name: The name of the CSV file.
         @param labels: The labels of nodes to export.
         @param node_schema: The schema of the nodes.
+        @param batch_size: Number of rows appended at a time. Defaults to 10000.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
         """
-        self.db.export_nodes_to_csv(
-            self.session, file_name, [Label("_node")] + labels, node_schema
+        return self.db.export_nodes_to_csv(
+            self.session,
+            file_name,
+            [Label("_node")] + labels,
+            node_schema,
+            batch_size,
+            progress,
+            since,
+        )
+
+    def export_nodes_to_parquet(
+        self,
+        file_name: str,
+        labels: List[Label],
+        node_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export nodes to a Parquet file.
+
+        @param file_name: The name of the output file.
+        @param labels: The labels of nodes to export.
+        @param node_schema: The schema of the nodes.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of elements per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        return self.db.export_nodes_to_parquet(
+            self.session,
+            file_name,
+            [Label("_node")] + labels,
+            node_schema,
+            compression,
+            batch_size,
+            progress,
+            since,
+        )
+
+    def export_nodes_to_arrow(
+        self,
+        file_name: str,
+        labels: List[Label],
+        node_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export nodes to an Arrow IPC file.
+
+        @param file_name: The name of the output file.
+        @param labels: The labels of nodes to export.
+        @param node_schema: The schema of the nodes.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of elements per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        return self.db.export_nodes_to_arrow(
+            self.session,
+            file_name,
+            [Label("_node")] + labels,
+            node_schema,
+            compression,
+            batch_size,
+            progress,
+            since,
         )
 
     def export_edges_to_csv(
@@ -434,7 +532,10 @@ class GraphwithSubgraphStorage(GraphStorage):
         end_node_schema: List[Schema],
         edge_label: Label,
         edge_schema: List[Schema],
-    ) -> None:
+        batch_size: int = 10000,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
         """
         Export edges to a CSV file.
 
@@ -445,8 +546,109 @@ class GraphwithSubgraphStorage(GraphStorage):
         @param end_node_schema: Schema of the end nodes.
         @param edge_label: Label of the edge.
         @param edge_schema: Schema of the edge.
+        @param batch_size: Number of rows appended at a time. Defaults to 10000.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        return self.db.export_node_edges_to_csv(
+            self.session,
+            file_name,
+            [Label("_node")] + start_node_labels,
+            start_node_schema,
+            [Label("_node")] + end_node_labels,
+            end_node_schema,
+            [Label("_edge"), edge_label],
+            edge_schema,
+            Label("_adjacency"),
+            batch_size,
+            progress,
+            since,
+        )
+
+    def export_edges_to_parquet(
+        self,
+        file_name: str,
+        start_node_labels: List[Label],
+        start_node_schema: List[Schema],
+        end_node_labels: List[Label],
+        end_node_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export edges to a Parquet file.
+
+        @param file_name: The name of the output file.
+        @param start_node_labels: Labels of the start nodes.
+        @param start_node_schema: Schema of the start nodes.
+        @param end_node_labels: Labels of the end nodes.
+        @param end_node_schema: Schema of the end nodes.
+        @param edge_label: Label of the edge.
+        @param edge_schema: Schema of the edge.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of elements per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        return self.db.export_node_edges_to_parquet(
+            self.session,
+            file_name,
+            [Label("_node")] + start_node_labels,
+            start_node_schema,
+            [Label("_node")] + end_node_labels,
+            end_node_schema,
+            [Label("_edge"), edge_label],
+            edge_schema,
+            Label("_adjacency"),
+            compression,
+            batch_size,
+            progress,
+            since,
+        )
+
+    def export_edges_to_arrow(
+        self,
+        file_name: str,
+        start_node_labels: List[Label],
+        start_node_schema: List[Schema],
+        end_node_labels: List[Label],
+        end_node_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export edges to an Arrow IPC file.
+
+        @param file_name: The name of the output file.
+        @param start_node_labels: Labels of the start nodes.
+        @param start_node_schema: Schema of the start nodes.
+        @param end_node_labels: Labels of the end nodes.
+        @param end_node_schema: Schema of the end nodes.
+        @param edge_label: Label of the edge.
+        @param edge_schema: Schema of the edge.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of elements per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
         """
-        self.db.export_node_edges_to_csv(
+        return self.db.export_node_edges_to_arrow(
             self.session,
             file_name,
             [Label("_node")] + start_node_labels,
@@ -456,6 +658,10 @@ class GraphwithSubgraphStorage(GraphStorage):
             [Label("_edge"), edge_label],
             edge_schema,
             Label("_adjacency"),
+            compression,
+            batch_size,
+            progress,
+            since,
         )
 
     def export_subgraphs_to_csv(
@@ -465,7 +671,10 @@ class GraphwithSubgraphStorage(GraphStorage):
         edge_schema: Schema,
         subgraph_labels: List[Label],
         subgraph_schema: List[Schema],
-    ) -> None:
+        batch_size: int = 10000,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
         """
         Export subgraphs to a CSV file.
 
@@ -474,14 +683,105 @@ class GraphwithSubgraphStorage(GraphStorage):
         @param edge_schema: The schema of the nodes in the edge list.
         @param subgraph_labels: Labels of the subgraphs.
         @param subgraph_schema: Schema of the subgraphs.
+        @param batch_size: Number of rows appended at a time. Defaults to 10000.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
         """
-        self.db.export_subgraphs_to_csv(
+        return self.db.export_subgraphs_to_csv(
             self.session,
             file_name,
             node_schema,
             edge_schema,
             [Label("_subgraph")] + subgraph_labels,
             subgraph_schema,
+            batch_size,
+            progress,
+            since,
+        )
+
+    def export_subgraphs_to_parquet(
+        self,
+        file_name: str,
+        node_schema: Schema,
+        edge_schema: Schema,
+        subgraph_labels: List[Label],
+        subgraph_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export subgraphs to a Parquet file.
+
+        @param file_name: The name of the output file.
+        @param node_schema: The schema of the node list.
+        @param edge_schema: The schema of the nodes in the edge list.
+        @param subgraph_labels: Labels of the subgraphs.
+        @param subgraph_schema: Schema of the subgraphs.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of elements per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        return self.db.export_subgraphs_to_parquet(
+            self.session,
+            file_name,
+            node_schema,
+            edge_schema,
+            [Label("_subgraph")] + subgraph_labels,
+            subgraph_schema,
+            compression,
+            batch_size,
+            progress,
+            since,
+        )
+
+    def export_subgraphs_to_arrow(
+        self,
+        file_name: str,
+        node_schema: Schema,
+        edge_schema: Schema,
+        subgraph_labels: List[Label],
+        subgraph_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export subgraphs to an Arrow IPC file.
+
+        @param file_name: The name of the output file.
+        @param node_schema: The schema of the node list.
+        @param edge_schema: The schema of the nodes in the edge list.
+        @param subgraph_labels: Labels of the subgraphs.
+        @param subgraph_schema: Schema of the subgraphs.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of elements per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        return self.db.export_subgraphs_to_arrow(
+            self.session,
+            file_name,
+            node_schema,
+            edge_schema,
+            [Label("_subgraph")] + subgraph_labels,
+            subgraph_schema,
+            compression,
+            batch_size,
+            progress,
+            since,
         )
 
     def export_subgraph_edges_to_csv(
@@ -493,7 +793,10 @@ class GraphwithSubgraphStorage(GraphStorage):
         end_subgraph_schema: List[Schema],
         edge_label: Label,
         edge_schema: List[Schema],
-    ) -> None:
+        batch_size: int = 10000,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
         """
         Export subgraph edges to a CSV file.
 
@@ -504,8 +807,61 @@ class GraphwithSubgraphStorage(GraphStorage):
         @param end_subgraph_schema: Schema of the end subgraphs.
         @param edge_label: Label of the edge.
         @param edge_schema: Schema of the edge.
+        @param batch_size: Number of rows appended at a time. Defaults to 10000.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        return self.db.export_node_edges_to_csv(
+            self.session,
+            file_name,
+            [Label("_subgraph")] + start_subgraph_labels,
+            start_subgraph_schema,
+            [Label("_subgraph")] + end_subgraph_labels,
+            end_subgraph_schema,
+            [Label("_subgraph_edge"), edge_label],
+            edge_schema,
+            Label("_subgraph_adjacency"),
+            batch_size,
+            progress,
+            since,
+        )
+
+    def export_subgraph_edges_to_parquet(
+        self,
+        file_name: str,
+        start_subgraph_labels: List[Label],
+        start_subgraph_schema: List[Schema],
+        end_subgraph_labels: List[Label],
+        end_subgraph_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export subgraph edges to a Parquet file.
+
+        @param file_name: The name of the output file.
+        @param start_subgraph_labels: Labels of the start subgraphs.
+        @param start_subgraph_schema: Schema of the start subgraphs.
+        @param end_subgraph_labels: Labels of the end subgraphs.
+        @param end_subgraph_schema: Schema of the end subgraphs.
+        @param edge_label: Label of the edge.
+        @param edge_schema: Schema of the edge.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of elements per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
         """
-        self.db.export_node_edges_to_csv(
+        return self.db.export_node_edges_to_parquet(
             self.session,
             file_name,
             [Label("_subgraph")] + start_subgraph_labels,
@@ -515,6 +871,58 @@ class GraphwithSubgraphStorage(GraphStorage):
             [Label("_subgraph_edge"), edge_label],
             edge_schema,
             Label("_subgraph_adjacency"),
+            compression,
+            batch_size,
+            progress,
+            since,
+        )
+
+    def export_subgraph_edges_to_arrow(
+        self,
+        file_name: str,
+        start_subgraph_labels: List[Label],
+        start_subgraph_schema: List[Schema],
+        end_subgraph_labels: List[Label],
+        end_subgraph_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export subgraph edges to an Arrow IPC file.
+
+        @param file_name: The name of the output file.
+        @param start_subgraph_labels: Labels of the start subgraphs.
+        @param start_subgraph_schema: Schema of the start subgraphs.
+        @param end_subgraph_labels: Labels of the end subgraphs.
+        @param end_subgraph_schema: Schema of the end subgraphs.
+        @param edge_label: Label of the edge.
+        @param edge_schema: Schema of the edge.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of elements per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        return self.db.export_node_edges_to_arrow(
+            self.session,
+            file_name,
+            [Label("_subgraph")] + start_subgraph_labels,
+            start_subgraph_schema,
+            [Label("_subgraph")] + end_subgraph_labels,
+            end_subgraph_schema,
+            [Label("_subgraph_edge"), edge_label],
+            edge_schema,
+            Label("_subgraph_adjacency"),
+            compression,
+            batch_size,
+            progress,
+            since,
         )
 
     def import_nodes_from_csv(
@@ -524,6 +932,7 @@ class GraphwithSubgraphStorage(GraphStorage):
         node_schema: List[Schema],
         as_url: bool = False,
         delimiter: str = ",",
+        checkpoint: str = None,
     ) -> None:
         """
         Import nodes from a CSV file.
@@ -533,6 +942,9 @@ class GraphwithSubgraphStorage(GraphStorage):
         @param node_schema: Schema of the nodes.
         @param as_url: Whether the file is a URL. Defaults to False.
         @param delimiter: The delimiter used in the CSV file. Defaults to ','.
+        @param checkpoint: Name under which the progress of the import is committed together
+                           with the imported rows. A failed import run again with the same
+                           name resumes after the last committed row. Defaults to None.
         """
         self.db.import_nodes_from_csv(
             self.session,
@@ -541,6 +953,43 @@ class GraphwithSubgraphStorage(GraphStorage):
             node_schema,
             as_url=as_url,
             delimiter=delimiter,
+            checkpoint=checkpoint,
+        )
+
+    def import_nodes_from_frame(
+        self,
+        data: Any,
+        labels: List[Label],
+        node_schema: List[Schema],
+        concurrency: int = 4,
+        delimiter: str = ",",
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import nodes from a DataFrame, Arrow data or a local CSV file, sent in batches over
+        the connection instead of being loaded by the server.
+
+        @param data: DataFrame, Arrow table, path of a local CSV (optionally gzip, bz2 or zstd
+                     compressed), Parquet or Arrow IPC file, or an iterable of DataFrames or
+                     dictionaries.
+        @param labels: Labels to assign to the imported nodes.
+        @param node_schema: Schema of the nodes.
+        @param concurrency: Number of concurrent writer sessions. Defaults to 4.
+        @param delimiter: The delimiter used in a local CSV file. Defaults to ','.
+        @param checkpoint: Name under which the committed batches are recorded together with
+                           the imported rows. A failed import run again with the same name and
+                           the same rows and batch size skips the committed batches. Defaults
+                           to None.
+        @return: Import statistics.
+        """
+        return self.db.import_nodes_from_frame(
+            self.session,
+            data,
+            [Label("_node")] + labels,
+            node_schema,
+            concurrency=concurrency,
+            delimiter=delimiter,
+            checkpoint=checkpoint,
         )
 
     def import_edges_from_csv(
@@ -554,6 +1003,7 @@ class GraphwithSubgraphStorage(GraphStorage):
         edge_schema: List[Schema],
         as_url: bool = False,
         delimiter: str = ",",
+        checkpoint: str = None,
     ) -> None:
         """
         Import edges from a CSV file.
@@ -567,6 +1017,9 @@ class GraphwithSubgraphStorage(GraphStorage):
         @param edge_schema: Schema of the edge.
         @param as_url: Whether the file is a URL. Defaults to False.
         @param delimiter: The delimiter used in the CSV file. Defaults to ','.
+        @param checkpoint: Name under which the progress of the import is committed together
+                           with the imported rows. A failed import run again with the same
+                           name resumes after the last committed row. Defaults to None.
         """
         self.db.import_node_edges_from_csv(
             self.session,
@@ -580,6 +1033,60 @@ class GraphwithSubgraphStorage(GraphStorage):
             Label("_adjacency"),
             as_url=as_url,
             delimiter=delimiter,
+            checkpoint=checkpoint,
+        )
+
+    def import_edges_from_frame(
+        self,
+        data: Any,
+        start_node_labels: List[Label],
+        start_node_schema: List[Schema],
+        end_node_labels: List[Label],
+        end_node_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+        concurrency: int = 4,
+        partitions: int = None,
+        delimiter: str = ",",
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import edges from a DataFrame, Arrow data or a local CSV file, sent in batches over
+        the connection instead of being loaded by the server.
+
+        @param data: DataFrame, Arrow table, path of a local CSV (optionally gzip, bz2 or zstd
+                     compressed), Parquet or Arrow IPC file, or an iterable of DataFrames or
+                     dictionaries.
+        @param start_node_labels: Labels of the start nodes.
+        @param start_node_schema: Schema of the start nodes.
+        @param end_node_labels: Labels of the end nodes.
+        @param end_node_schema: Schema of the end nodes.
+        @param edge_label: Label of the edge.
+        @param edge_schema: Schema of the edge.
+        @param concurrency: Number of concurrent writer sessions. Defaults to 4.
+        @param partitions: Number of node partitions for a parallel import without lock
+                           contention. Defaults to None (not partitioned).
+        @param delimiter: The delimiter used in a local CSV file. Defaults to ','.
+        @param checkpoint: Name under which the committed batches are recorded together with
+                           the imported rows. A failed import run again with the same name and
+                           the same rows and batch size skips the committed batches. Not
+                           supported for partitioned imports. Defaults to None.
+        @return: Import statistics.
+        """
+        return self.db.import_node_edges_from_frame(
+            self.session,
+            data,
+            [Label("_node")] + start_node_labels,
+            start_node_schema,
+            [Label("_node")] + end_node_labels,
+            end_node_schema,
+            [Label("_edge"), edge_label],
+            edge_schema,
+            Label("_adjacency"),
+            concurrency=concurrency,
+            partitions=partitions,
+            delimiter=delimiter,
+            checkpoint=checkpoint,
         )
 
     def import_subgraphs_from_csv(
@@ -592,6 +1099,7 @@ class GraphwithSubgraphStorage(GraphStorage):
         subgraph_schema: List[Schema],
         as_url: bool = False,
         delimiter: str = ",",
+        checkpoint: str = None,
     ) -> None:
         """
         Import subgraphs from a CSV file.
@@ -604,6 +1112,9 @@ class GraphwithSubgraphStorage(GraphStorage):
         @param subgraph_schema: Schema of the subgraphs.
         @param as_url: Whether the file is a URL. Defaults to False.
         @param delimiter: The delimiter used in the CSV file. Defaults to ','.
+        @param checkpoint: Name under which the progress of the import is committed together
+                           with the imported rows. A failed import run again with the same
+                           name resumes after the last committed row. Defaults to None.
         """
         self.db.import_subgraphs_from_csv(
             self.session,
@@ -615,6 +1126,52 @@ class GraphwithSubgraphStorage(GraphStorage):
             subgraph_schema,
             as_url=as_url,
             delimiter=delimiter,
+            checkpoint=checkpoint,
+        )
+
+    def import_subgraphs_from_frame(
+        self,
+        data: Any,
+        node_schema: Schema,
+        node_schema_in_edge: Schema,
+        common_schema: List[Schema],
+        subgraph_labels: List[Label],
+        subgraph_schema: List[Schema],
+        concurrency: int = 4,
+        delimiter: str = ",",
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import subgraphs from a DataFrame, Arrow data or a local CSV file, sent in batches over
+        the connection instead of being loaded by the server.
+
+        @param data: DataFrame, Arrow table, path of a local CSV (optionally gzip, bz2 or zstd
+                     compressed), Parquet or Arrow IPC file, or an iterable of DataFrames or
+                     dictionaries.
+        @param node_schema: Schema of the node list.
+        @param node_schema_in_edge: Schema of the nodes in the edge list.
+        @param common_schema: Common schema for all nodes with subgraph.
+        @param subgraph_labels: Labels of the subgraphs.
+        @param subgraph_schema: Schema of the subgraphs.
+        @param concurrency: Number of concurrent writer sessions. Defaults to 4.
+        @param delimiter: The delimiter used in a local CSV file. Defaults to ','.
+        @param checkpoint: Name under which the committed batches are recorded together with
+                           the imported rows. A failed import run again with the same name and
+                           the same rows and batch size skips the committed batches. Defaults
+                           to None.
+        @return: Import statistics.
+        """
+        return self.db.import_subgraphs_from_frame(
+            self.session,
+            data,
+            node_schema,
+            node_schema_in_edge,
+            common_schema,
+            [Label("_subgraph")] + subgraph_labels,
+            subgraph_schema,
+            concurrency=concurrency,
+            delimiter=delimiter,
+            checkpoint=checkpoint,
         )
 
     def import_subgraph_edges_from_csv(
@@ -628,6 +1185,7 @@ class GraphwithSubgraphStorage(GraphStorage):
         edge_schema: List[Schema],
         as_url: bool = False,
         delimiter: str = ",",
+        checkpoint: str = None,
     ) -> None:
         """
         Import subgraph edges from a CSV file.
@@ -641,6 +1199,9 @@ class GraphwithSubgraphStorage(GraphStorage):
         @param edge_schema: Schema of the edge.
         @param as_url: Whether the file is a URL. Defaults to False.
         @param delimiter: The delimiter used in the CSV file. Defaults to ','.
+        @param checkpoint: Name under which the progress of the import is committed together
+                           with the imported rows. A failed import run again with the same
+                           name resumes after the last committed row. Defaults to None.
         """
         self.db.import_node_edges_from_csv(
             self.session,
@@ -654,6 +1215,60 @@ class GraphwithSubgraphStorage(GraphStorage):
             Label("_subgraph_adjacency"),
             as_url=as_url,
             delimiter=delimiter,
+            checkpoint=checkpoint,
+        )
+
+    def import_subgraph_edges_from_frame(
+        self,
+        data: Any,
+        start_subgraph_labels: List[Label],
+        start_subgraph_schema: List[Schema],
+        end_subgraph_labels: List[Label],
+        end_subgraph_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+        concurrency: int = 4,
+        partitions: int = None,
+        delimiter: str = ",",
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import subgraph edges from a DataFrame, Arrow data or a local CSV file, sent in batches over
+        the connection instead of being loaded by the server.
+
+        @param data: DataFrame, Arrow table, path of a local CSV (optionally gzip, bz2 or zstd
+                     compressed), Parquet or Arrow IPC file, or an iterable of DataFrames or
+                     dictionaries.
+        @param start_subgraph_labels: Labels of the start subgraphs.
+        @param start_subgraph_schema: Schema of the start subgraphs.
+        @param end_subgraph_labels: Labels of the end subgraphs.
+        @param end_subgraph_schema: Schema of the end subgraphs.
+        @param edge_label: Label of the edge.
+        @param edge_schema: Schema of the edge.
+        @param concurrency: Number of concurrent writer sessions. Defaults to 4.
+        @param partitions: Number of node partitions for a parallel import without lock
+                           contention. Defaults to None (not partitioned).
+        @param delimiter: The delimiter used in a local CSV file. Defaults to ','.
+        @param checkpoint: Name under which the committed batches are recorded together with
+                           the imported rows. A failed import run again with the same name and
+                           the same rows and batch size skips the committed batches. Not
+                           supported for partitioned imports. Defaults to None.
+        @return: Import statistics.
+        """
+        return self.db.import_node_edges_from_frame(
+            self.session,
+            data,
+            [Label("_subgraph")] + start_subgraph_labels,
+            start_subgraph_schema,
+            [Label("_subgraph")] + end_subgraph_labels,
+            end_subgraph_schema,
+            [Label("_subgraph_edge"), edge_label],
+            edge_schema,
+            Label("_subgraph_adjacency"),
+            concurrency=concurrency,
+            partitions=partitions,
+            delimiter=delimiter,
+            checkpoint=checkpoint,
         )
 
     def _read_path(self, path: Path):
@@ -12,23 +12,28 @@ from HOGDB.graph.graph_storage import GraphStorage
 from HOGDB.graph.node import Node, Label, Property
 from HOGDB.graph.edge import Edge
 from HOGDB.db.db import Database
+from HOGDB.db.exporter import ExportStats
+from HOGDB.db.importer import ImportStats
 from HOGDB.db.schema import Schema
 from HOGDB.graph.path import Path
 from HOGDB.graph.node_tuple import NodeTuple
-from typing import List
+from typing import Any, Callable, List, Optional
 
 
 # Load environment variables from the .env file
 load_dotenv()
 
 class GraphwithTupleStorage(GraphStorage):
-    def __init__(self, db: Database) -> None:
+    _versioned_labels = GraphStorage._versioned_labels + ["_edge", "_node_tuple"]
+
+    def __init__(self, db: Database, track_changes: bool = False) -> None:
         """
         Initialize GraphwithTupleStorage with a database connection.
 
         @param db: The database connection object.
+        @param track_changes: Maintain change versions and tombstones. Defaults to False.
         """
-        super().__init__(db)
+        super().__init__(db, track_changes)
 
     def _delete_node_with_node_edges_from_database(self, tx, node: Node):
         """
@@ -40,7 +45,12 @@ class GraphwithTupleStorage(GraphStorage):
         """
         return self._with_transaction(
             lambda tx: self.db.delete_node_with_node_edges(
-                self.session, tx, node.labels, node.properties, Label("_adjacency")
+                self.session,
+                tx,
+                node.labels,
+                node.properties,
+                Label("_adjacency"),
+                track_changes=self.track_changes,
             ),
             tx,
         )
@@ -255,17 +265,105 @@ class GraphwithTupleStorage(GraphStorage):
         return node_tuple
 
     def export_nodes_to_csv(
-        self, file_name: str, labels: List[Label], node_schema: List[Schema]
-    ) -> None:
+        self,
+        file_name: str,
+        labels: List[Label],
+        node_schema: List[Schema],
+        batch_size: int = 10000,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
         """
         Export nodes to a CSV file.
 
         @param file_name: The name of the CSV file.
         @param labels: The labels of nodes to export.
         @param node_schema: The schema of the nodes.
+        @param batch_size: Number of rows appended at a time. Defaults to 10000.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        return self.db.export_nodes_to_csv(
+            self.session,
+            file_name,
+            [Label("_node")] + labels,
+            node_schema,
+            batch_size,
+            progress,
+            since,
+        )
+
+    def export_nodes_to_parquet(
+        self,
+        file_name: str,
+        labels: List[Label],
+        node_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export nodes to a Parquet file.
+
+        @param file_name: The name of the output file.
+        @param labels: The labels of nodes to export.
+        @param node_schema: The schema of the nodes.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of elements per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        return self.db.export_nodes_to_parquet(
+            self.session,
+            file_name,
+            [Label("_node")] + labels,
+            node_schema,
+            compression,
+            batch_size,
+            progress,
+            since,
+        )
+
+    def export_nodes_to_arrow(
+        self,
+        file_name: str,
+        labels: List[Label],
+        node_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
         """
-        self.db.export_nodes_to_csv(
-            self.session, file_name, [Label("_node")] + labels, node_schema
+        Export nodes to an Arrow IPC file.
+
+        @param file_name: The name of the output file.
+        @param labels: The labels of nodes to export.
+        @param node_schema: The schema of the nodes.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of elements per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        return self.db.export_nodes_to_arrow(
+            self.session,
+            file_name,
+            [Label("_node")] + labels,
+            node_schema,
+            compression,
+            batch_size,
+            progress,
+            since,
         )
 
     def export_edges_to_csv(
@@ -277,7 +375,10 @@ class GraphwithTupleStorage(GraphStorage):
         end_node_schema: List[Schema],
         edge_label: Label,
         edge_schema: List[Schema],
-    ) -> None:
+        batch_size: int = 10000,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
         """
         Export edges to a CSV file.
 
@@ -288,8 +389,109 @@ class GraphwithTupleStorage(GraphStorage):
         @param end_node_schema: Schema of the end nodes.
         @param edge_label: Label of the edge.
         @param edge_schema: Schema of the edge.
+        @param batch_size: Number of rows appended at a time. Defaults to 10000.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        return self.db.export_node_edges_to_csv(
+            self.session,
+            file_name,
+            [Label("_node")] + start_node_labels,
+            start_node_schema,
+            [Label("_node")] + end_node_labels,
+            end_node_schema,
+            [Label("_edge"), edge_label],
+            edge_schema,
+            Label("_adjacency"),
+            batch_size,
+            progress,
+            since,
+        )
+
+    def export_edges_to_parquet(
+        self,
+        file_name: str,
+        start_node_labels: List[Label],
+        start_node_schema: List[Schema],
+        end_node_labels: List[Label],
+        end_node_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export edges to a Parquet file.
+
+        @param file_name: The name of the output file.
+        @param start_node_labels: Labels of the start nodes.
+        @param start_node_schema: Schema of the start nodes.
+        @param end_node_labels: Labels of the end nodes.
+        @param end_node_schema: Schema of the end nodes.
+        @param edge_label: Label of the edge.
+        @param edge_schema: Schema of the edge.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of elements per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        return self.db.export_node_edges_to_parquet(
+            self.session,
+            file_name,
+            [Label("_node")] + start_node_labels,
+            start_node_schema,
+            [Label("_node")] + end_node_labels,
+            end_node_schema,
+            [Label("_edge"), edge_label],
+            edge_schema,
+            Label("_adjacency"),
+            compression,
+            batch_size,
+            progress,
+            since,
+        )
+
+    def export_edges_to_arrow(
+        self,
+        file_name: str,
+        start_node_labels: List[Label],
+        start_node_schema: List[Schema],
+        end_node_labels: List[Label],
+        end_node_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
         """
-        self.db.export_node_edges_to_csv(
+        Export edges to an Arrow IPC file.
+
+        @param file_name: The name of the output file.
+        @param start_node_labels: Labels of the start nodes.
+        @param start_node_schema: Schema of the start nodes.
+        @param end_node_labels: Labels of the end nodes.
+        @param end_node_schema: Schema of the end nodes.
+        @param edge_label: Label of the edge.
+        @param edge_schema: Schema of the edge.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of elements per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        return self.db.export_node_edges_to_arrow(
             self.session,
             file_name,
             [Label("_node")] + start_node_labels,
@@ -299,6 +501,10 @@ class GraphwithTupleStorage(GraphStorage):
             [Label("_edge"), edge_label],
             edge_schema,
             Label("_adjacency"),
+            compression,
+            batch_size,
+            progress,
+            since,
         )
 
     def export_node_tuples_to_csv(
@@ -307,7 +513,10 @@ class GraphwithTupleStorage(GraphStorage):
         node_schema: Schema,
         node_tuple_labels: List[Label],
         node_tuple_schema: List[Schema],
-    ) -> None:
+        batch_size: int = 10000,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
         """
         Export node-tuples to a CSV file.
 
@@ -315,13 +524,98 @@ class GraphwithTupleStorage(GraphStorage):
         @param node_schema: The schema of the node list.
         @param node_tuple_labels: Labels of the node-tuples.
         @param node_tuple_schema: Schema of the node-tuples.
+        @param batch_size: Number of rows appended at a time. Defaults to 10000.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        return self.db.export_node_tuples_to_csv(
+            self.session,
+            file_name,
+            node_schema,
+            node_tuple_labels,
+            node_tuple_schema,
+            batch_size,
+            progress,
+            since,
+        )
+
+    def export_node_tuples_to_parquet(
+        self,
+        file_name: str,
+        node_schema: Schema,
+        node_tuple_labels: List[Label],
+        node_tuple_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export node-tuples to a Parquet file.
+
+        @param file_name: The name of the output file.
+        @param node_schema: The schema of the node list.
+        @param node_tuple_labels: Labels of the node-tuples.
+        @param node_tuple_schema: Schema of the node-tuples.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of elements per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        return self.db.export_node_tuples_to_parquet(
+            self.session,
+            file_name,
+            node_schema,
+            node_tuple_labels,
+            node_tuple_schema,
+            compression,
+            batch_size,
+            progress,
+            since,
+        )
+
+    def export_node_tuples_to_arrow(
+        self,
+        file_name: str,
+        node_schema: Schema,
+        node_tuple_labels: List[Label],
+        node_tuple_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
         """
-        self.db.export_node_tuples_to_csv(
+        Export node-tuples to an Arrow IPC file.
+
+        @param file_name: The name of the output file.
+        @param node_schema: The schema of the node list.
+        @param node_tuple_labels: Labels of the node-tuples.
+        @param node_tuple_schema: Schema of the node-tuples.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of elements per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        return self.db.export_node_tuples_to_arrow(
             self.session,
             file_name,
             node_schema,
             node_tuple_labels,
             node_tuple_schema,
+            compression,
+            batch_size,
+            progress,
+            since,
         )
 
     def import_nodes_from_csv(
@@ -331,6 +625,7 @@ class GraphwithTupleStorage(GraphStorage):
         node_schema: List[Schema],
         as_url: bool = False,
         delimiter: str = ",",
+        checkpoint: str = None,
     ) -> None:
         """
         Import nodes from a CSV file.
@@ -340,6 +635,9 @@ class GraphwithTupleStorage(GraphStorage):
         @param node_schema: Schema of the nodes.
         @param as_url: Whether the file is a URL. Defaults to False.
         @param delimiter: The delimiter used in the CSV file. Defaults to ','.
+        @param checkpoint: Name under which the progress of the import is committed together
+                           with the imported rows. A failed import run again with the same
+                           name resumes after the last committed row. Defaults to None.
         """
         self.db.import_nodes_from_csv(
             self.session,
@@ -348,6 +646,43 @@ class GraphwithTupleStorage(GraphStorage):
             node_schema,
             as_url=as_url,
             delimiter=delimiter,
+            checkpoint=checkpoint,
+        )
+
+    def import_nodes_from_frame(
+        self,
+        data: Any,
+        labels: Label,
+        node_schema: List[Schema],
+        concurrency: int = 4,
+        delimiter: str = ",",
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import nodes from a DataFrame, Arrow data or a local CSV file, sent in batches over
+        the connection instead of being loaded by the server.
+
+        @param data: DataFrame, Arrow table, path of a local CSV (optionally gzip, bz2 or zstd
+                     compressed), Parquet or Arrow IPC file, or an iterable of DataFrames or
+                     dictionaries.
+        @param labels: Labels to assign to the imported nodes.
+        @param node_schema: Schema of the nodes.
+        @param concurrency: Number of concurrent writer sessions. Defaults to 4.
+        @param delimiter: The delimiter used in a local CSV file. Defaults to ','.
+        @param checkpoint: Name under which the committed batches are recorded together with
+                           the imported rows. A failed import run again with the same name and
+                           the same rows and batch size skips the committed batches. Defaults
+                           to None.
+        @return: Import statistics.
+        """
+        return self.db.import_nodes_from_frame(
+            self.session,
+            data,
+            [Label("_node")] + labels,
+            node_schema,
+            concurrency=concurrency,
+            delimiter=delimiter,
+            checkpoint=checkpoint,
         )
 
     def import_edges_from_csv(
@@ -361,6 +696,7 @@ class GraphwithTupleStorage(GraphStorage):
         edge_schema: List[Schema],
         as_url: bool = False,
         delimiter: str = ",",
+        checkpoint: str = None,
     ) -> None:
         """
         Import edges from a CSV file.
@@ -374,6 +710,9 @@ class GraphwithTupleStorage(GraphStorage):
         @param edge_schema: Schema of the edge.
         @param as_url: Whether the file is a URL. Defaults to False.
         @param delimiter: The delimiter used in the CSV file. Defaults to ','.
+        @param checkpoint: Name under which the progress of the import is committed together
+                           with the imported rows. A failed import run again with the same
+                           name resumes after the last committed row. Defaults to None.
         """
         self.db.import_node_edges_from_csv(
             self.session,
@@ -387,6 +726,60 @@ class GraphwithTupleStorage(GraphStorage):
             Label("_adjacency"),
             as_url=as_url,
             delimiter=delimiter,
+            checkpoint=checkpoint,
+        )
+
+    def import_edges_from_frame(
+        self,
+        data: Any,
+        start_node_labels: List[Label],
+        start_node_schema: List[Schema],
+        end_node_labels: List[Label],
+        end_node_schema: List[Schema],
+        edge_label: Label,
+        edge_schema: List[Schema],
+        concurrency: int = 4,
+        partitions: int = None,
+        delimiter: str = ",",
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import edges from a DataFrame, Arrow data or a local CSV file, sent in batches over
+        the connection instead of being loaded by the server.
+
+        @param data: DataFrame, Arrow table, path of a local CSV (optionally gzip, bz2 or zstd
+                     compressed), Parquet or Arrow IPC file, or an iterable of DataFrames or
+                     dictionaries.
+        @param start_node_labels: Labels of the start nodes.
+        @param start_node_schema: Schema of the start nodes.
+        @param end_node_labels: Labels of the end nodes.
+        @param end_node_schema: Schema of the end nodes.
+        @param edge_label: Label of the edge.
+        @param edge_schema: Schema of the edge.
+        @param concurrency: Number of concurrent writer sessions. Defaults to 4.
+        @param partitions: Number of node partitions for a parallel import without lock
+                           contention. Defaults to None (not partitioned).
+        @param delimiter: The delimiter used in a local CSV file. Defaults to ','.
+        @param checkpoint: Name under which the committed batches are recorded together with
+                           the imported rows. A failed import run again with the same name and
+                           the same rows and batch size skips the committed batches. Not
+                           supported for partitioned imports. Defaults to None.
+        @return: Import statistics.
+        """
+        return self.db.import_node_edges_from_frame(
+            self.session,
+            data,
+            [Label("_node")] + start_node_labels,
+            start_node_schema,
+            [Label("_node")] + end_node_labels,
+            end_node_schema,
+            [Label("_edge"), edge_label],
+            edge_schema,
+            Label("_adjacency"),
+            concurrency=concurrency,
+            partitions=partitions,
+            delimiter=delimiter,
+            checkpoint=checkpoint,
         )
 
     def import_node_tuples_from_csv(
@@ -398,6 +791,7 @@ class GraphwithTupleStorage(GraphStorage):
         node_tuple_schema: List[Schema],
         as_url: bool = False,
         delimiter: str = ",",
+        checkpoint: str = None,
     ) -> None:
         """
         Import node-tuples from a CSV file.
@@ -409,6 +803,9 @@ class GraphwithTupleStorage(GraphStorage):
         @param node_tuple_schema: Schema of the node-tuples.
         @param as_url: Whether the file is a URL. Defaults to False.
         @param delimiter: The delimiter used in the CSV file. Defaults to ','.
+        @param checkpoint: Name under which the progress of the import is committed together
+                           with the imported rows. A failed import run again with the same
+                           name resumes after the last committed row. Defaults to None.
         """
         self.db.import_node_tuples_from_csv(
             self.session,
@@ -419,6 +816,49 @@ class GraphwithTupleStorage(GraphStorage):
             node_tuple_schema,
             as_url=as_url,
             delimiter=delimiter,
+            checkpoint=checkpoint,
+        )
+
+    def import_node_tuples_from_frame(
+        self,
+        data: Any,
+        node_schema: Schema,
+        common_schema: List[Schema],
+        node_tuple_labels: List[Label],
+        node_tuple_schema: List[Schema],
+        concurrency: int = 4,
+        delimiter: str = ",",
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import node-tuples from a DataFrame, Arrow data or a local CSV file, sent in batches over
+        the connection instead of being loaded by the server.
+
+        @param data: DataFrame, Arrow table, path of a local CSV (optionally gzip, bz2 or zstd
+                     compressed), Parquet or Arrow IPC file, or an iterable of DataFrames or
+                     dictionaries.
+        @param node_schema: Schema of the node list.
+        @param common_schema: Common schema for all nodes with tuple.
+        @param node_tuple_labels: Labels of the node-tuples.
+        @param node_tuple_schema: Schema of the node-tuples.
+        @param concurrency: Number of concurrent writer sessions. Defaults to 4.
+        @param delimiter: The delimiter used in a local CSV file. Defaults to ','.
+        @param checkpoint: Name under which the committed batches are recorded together with
+                           the imported rows. A failed import run again with the same name and
+                           the same rows and batch size skips the committed batches. Defaults
+                           to None.
+        @return: Import statistics.
+        """
+        return self.db.import_node_tuples_from_frame(
+            self.session,
+            data,
+            node_schema,
+            common_schema,
+            [Label("_node_tuple")] + node_tuple_labels,
+            node_tuple_schema,
+            concurrency=concurrency,
+            delimiter=delimiter,
+            checkpoint=checkpoint,
         )
 
     def _read_path(self, path: Path):
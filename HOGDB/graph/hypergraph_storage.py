@@ -12,23 +12,28 @@ from HOGDB.graph.edge import Edge
 from HOGDB.graph.hyperedge import HyperEdge
 from HOGDB.graph.path import Path
 from HOGDB.db.db import Database
+from HOGDB.db.exporter import ExportStats
+from HOGDB.db.importer import ImportStats
 from HOGDB.db.label import Label
 from HOGDB.db.schema import Schema
 from HOGDB.db.property import Property
-from typing import List
+from typing import Any, Callable, List, Optional
 from dotenv import load_dotenv
 
 
 load_dotenv()
 
 class HyperGraphStorage(GraphStorage):
-    def __init__(self, db: Database) -> None:
+    _versioned_labels = GraphStorage._versioned_labels + ["_hyperedge"]
+
+    def __init__(self, db: Database, track_changes: bool = False) -> None:
         """
         Initialize HyperGraphStorage with a database connection.
 
         @param db: The database connection object.
+        @param track_changes: Maintain change versions and tombstones. Defaults to False.
         """
-        super().__init__(db)
+        super().__init__(db, track_changes)
 
     def add_hyperedge(self, edge: HyperEdge) -> None:
         """
@@ -119,7 +124,10 @@ class HyperGraphStorage(GraphStorage):
         node_schema: Schema,
         hyperedge_label: Label,
         hyperedge_schema: List[Schema],
-    ) -> None:
+        batch_size: int = 10000,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
         """
         Export hyperedges to a CSV file.
 
@@ -128,18 +136,113 @@ class HyperGraphStorage(GraphStorage):
         @param node_schema: Schema of the nodes.
         @param hyperedge_label: Label of the hyperedge.
         @param hyperedge_schema: Schema of the hyperedge.
+        @param batch_size: Number of rows appended at a time. Defaults to 10000.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        return self.db.export_hyperedges_to_csv(
+            self.session,
+            file_name,
+            [Label("_node")] + node_labels,
+            node_schema,
+            [Label("_hyperedge"), hyperedge_label],
+            hyperedge_schema,
+            batch_size,
+            progress,
+            since,
+        )
+
+    def export_hyperedges_to_parquet(
+        self,
+        file_name: str,
+        node_labels: List[Label],
+        node_schema: Schema,
+        hyperedge_label: Label,
+        hyperedge_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export hyperedges to a Parquet file.
+
+        @param file_name: The name of the output file.
+        @param node_labels: Labels of the nodes in the hyperedge.
+        @param node_schema: Schema of the nodes.
+        @param hyperedge_label: Label of the hyperedge.
+        @param hyperedge_schema: Schema of the hyperedge.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of elements per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
+        """
+        return self.db.export_hyperedges_to_parquet(
+            self.session,
+            file_name,
+            [Label("_node")] + node_labels,
+            node_schema,
+            [Label("_hyperedge"), hyperedge_label],
+            hyperedge_schema,
+            compression,
+            batch_size,
+            progress,
+            since,
+        )
+
+    def export_hyperedges_to_arrow(
+        self,
+        file_name: str,
+        node_labels: List[Label],
+        node_schema: Schema,
+        hyperedge_label: Label,
+        hyperedge_schema: List[Schema],
+        compression: str = "zstd",
+        batch_size: int = 65536,
+        progress: Optional[Callable[[ExportStats], None]] = None,
+        since: Optional[int] = None,
+    ) -> ExportStats:
+        """
+        Export hyperedges to an Arrow IPC file.
+
+        @param file_name: The name of the output file.
+        @param node_labels: Labels of the nodes in the hyperedge.
+        @param node_schema: Schema of the nodes.
+        @param hyperedge_label: Label of the hyperedge.
+        @param hyperedge_schema: Schema of the hyperedge.
+        @param compression: Compression codec. Defaults to 'zstd'.
+        @param batch_size: Number of elements per record batch. Defaults to 65536.
+        @param progress: Function called with the export statistics after every batch.
+                         Defaults to None.
+        @param since: Only export elements changed after this version, see current_version.
+                      Defaults to None.
+        @return: Export statistics.
         """
-        self.db.export_hyperedges_to_csv(
+        return self.db.export_hyperedges_to_arrow(
             self.session,
             file_name,
             [Label("_node")] + node_labels,
             node_schema,
             [Label("_hyperedge"), hyperedge_label],
             hyperedge_schema,
+            compression,
+            batch_size,
+            progress,
+            since,
         )
 
     def import_nodes_from_csv(
-        self, file_name: str, labels: Label, node_schema: List[Schema]
+        self,
+        file_name: str,
+        labels: Label,
+        node_schema: List[Schema],
+        checkpoint: str = None,
     ) -> None:
         """
         Import nodes from a CSV file.
@@ -147,9 +250,52 @@ class HyperGraphStorage(GraphStorage):
         @param file_name: The name of the CSV file.
         @param labels: Labels to assign to the imported nodes.
         @param node_schema: Schema of the nodes.
+        @param checkpoint: Name under which the progress of the import is committed together
+                           with the imported rows. A failed import run again with the same
+                           name resumes after the last committed row. Defaults to None.
         """
         self.db.import_nodes_from_csv(
-            self.session, file_name, [Label("_node")] + labels, node_schema
+            self.session,
+            file_name,
+            [Label("_node")] + labels,
+            node_schema,
+            checkpoint=checkpoint,
+        )
+
+    def import_nodes_from_frame(
+        self,
+        data: Any,
+        labels: List[Label],
+        node_schema: List[Schema],
+        concurrency: int = 4,
+        delimiter: str = ",",
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import nodes from a DataFrame, Arrow data or a local CSV file, sent in batches over
+        the connection instead of being loaded by the server.
+
+        @param data: DataFrame, Arrow table, path of a local CSV (optionally gzip, bz2 or zstd
+                     compressed), Parquet or Arrow IPC file, or an iterable of DataFrames or
+                     dictionaries.
+        @param labels: Labels to assign to the imported nodes.
+        @param node_schema: Schema of the nodes.
+        @param concurrency: Number of concurrent writer sessions. Defaults to 4.
+        @param delimiter: The delimiter used in a local CSV file. Defaults to ','.
+        @param checkpoint: Name under which the committed batches are recorded together with
+                           the imported rows. A failed import run again with the same name and
+                           the same rows and batch size skips the committed batches. Defaults
+                           to None.
+        @return: Import statistics.
+        """
+        return self.db.import_nodes_from_frame(
+            self.session,
+            data,
+            [Label("_node")] + labels,
+            node_schema,
+            concurrency=concurrency,
+            delimiter=delimiter,
+            checkpoint=checkpoint,
         )
 
     def import_hyperedges_from_csv(
@@ -162,7 +308,8 @@ class HyperGraphStorage(GraphStorage):
         hyperedge_schema: List[Schema],
         as_url: bool = False,
         delimiter: str = ",",
-    ) -> None:
+        checkpoint: str = None,
+    ) -> List[Any]:
         """
         Import hyperedges from a CSV file.
 
@@ -174,8 +321,12 @@ class HyperGraphStorage(GraphStorage):
         @param hyperedge_schema: Schema of the hyperedge.
         @param as_url: Whether the file is a URL. Defaults to False.
         @param delimiter: The delimiter used in the CSV file. Defaults to ','.
+        @param checkpoint: Name under which the progress of the import is committed together
+                           with the imported rows. A failed import run again with the same
+                           name resumes after the last committed row. Defaults to None.
+        @return: Member keys that did not match any node.
         """
-        self.db.import_hyperedges_from_csv(
+        return self.db.import_hyperedges_from_csv(
             self.session,
             file_name,
             [Label("_node")] + node_labels,
@@ -185,6 +336,52 @@ class HyperGraphStorage(GraphStorage):
             hyperedge_schema,
             as_url=as_url,
             delimiter=delimiter,
+            checkpoint=checkpoint,
+        )
+
+    def import_hyperedges_from_frame(
+        self,
+        data: Any,
+        node_labels: List[Label],
+        node_schema: Schema,
+        common_schema: List[Schema],
+        hyperedge_label: Label,
+        hyperedge_schema: List[Schema],
+        concurrency: int = 4,
+        delimiter: str = ",",
+        checkpoint: str = None,
+    ) -> ImportStats:
+        """
+        Import hyperedges from a DataFrame, Arrow data or a local CSV file, sent in batches over
+        the connection instead of being loaded by the server.
+
+        @param data: DataFrame, Arrow table, path of a local CSV (optionally gzip, bz2 or zstd
+                     compressed), Parquet or Arrow IPC file, or an iterable of DataFrames or
+                     dictionaries.
+        @param node_labels: Labels of the nodes in the hyperedge.
+        @param node_schema: Schema of the nodes.
+        @param common_schema: Common schema for all nodes in the hyperedge.
+        @param hyperedge_label: Label of the hyperedge.
+        @param hyperedge_schema: Schema of the hyperedge.
+        @param concurrency: Number of concurrent writer sessions. Defaults to 4.
+        @param delimiter: The delimiter used in a local CSV file. Defaults to ','.
+        @param checkpoint: Name under which the committed batches are recorded together with
+                           the imported rows. A failed import run again with the same name and
+                           the same rows and batch size skips the committed batches. Defaults
+                           to None.
+        @return: Import statistics.
+        """
+        return self.db.import_hyperedges_from_frame(
+            self.session,
+            data,
+            [Label("_node")] + node_labels,
+            node_schema,
+            common_schema,
+            [Label("_hyperedge"), hyperedge_label],
+            hyperedge_schema,
+            concurrency=concurrency,
+            delimiter=delimiter,
+            checkpoint=checkpoint,
         )
 
     def get_hyperedge_count(self, labels: List[Label] = []) -> int:
@@ -0,0 +1,617 @@
+# Copyright (c) 2025 ETH Zurich.
+#                    All rights reserved.
+#
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# ASGI version of the proxy server. It serves the same routes as neo4j-server.py, but
+# handles all requests concurrently on one event loop with the async Neo4j driver.
+# Clients connecting with the same URI and user share one driver and therefore one
+# bounded connection pool. Run it with any ASGI server, for example
+#
+#     uvicorn HOGDB.proxy.async_server:app --host 0.0.0.0 --port 5000
+#
+# or directly with 'python -m HOGDB.proxy.async_server' if uvicorn is installed. Like the
+# Flask server, it caches the results of queries marked read_only if PROXY_CACHE_SIZE is
+# positive.
+
+from neo4j import AsyncGraphDatabase
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs
+from HOGDB.proxy import codec
+from HOGDB.proxy.cache import ResultCache
+import asyncio
+import os
+import time
+import uuid
+
+# sessions and transactions unused for this many seconds are closed
+IDLE_TIMEOUT = float(os.getenv("PROXY_IDLE_TIMEOUT", "600"))
+# responses smaller than this many bytes are not compressed
+COMPRESS_MIN_SIZE = int(os.getenv("PROXY_COMPRESS_MIN_SIZE", "1024"))
+# number of records written at a time by the streaming endpoint
+STREAM_CHUNK_SIZE = int(os.getenv("PROXY_STREAM_CHUNK_SIZE", "100"))
+# maximum number of connections of each shared driver
+POOL_SIZE = int(os.getenv("PROXY_POOL_SIZE", "100"))
+NDJSON = "application/x-ndjson"
+# results of read-only queries are cached if the cache size is positive
+CACHE_SIZE = int(os.getenv("PROXY_CACHE_SIZE", "0"))
+CACHE_TTL = float(os.getenv("PROXY_CACHE_TTL", "60"))
+CACHE_MAX_RECORDS = int(os.getenv("PROXY_CACHE_MAX_RECORDS", "10000"))
+
+
+class Request:
+    """
+    HTTP request of an ASGI scope, with the parsed query arguments and the decoded body.
+    """
+
+    def __init__(self, scope: Dict, body: bytes) -> None:
+        self.method = scope["method"]
+        self.path = scope["path"]
+        self.headers = {
+            name.decode("latin-1").lower(): value.decode("latin-1")
+            for name, value in scope.get("headers", [])
+        }
+        self.args = {
+            name: values[-1]
+            for name, values in parse_qs(scope.get("query_string", b"").decode()).items()
+        }
+        self.body = body
+
+    def data(self) -> Any:
+        data = codec.decompress(self.body, self.headers.get("content-encoding"))
+        return codec.decode(data, self.headers.get("content-type"))
+
+
+class Stream:
+    """
+    Handler result whose records are written as NDJSON while they are fetched.
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        self.chunks = chunks
+
+
+class AsyncSessionLock:
+    """
+    Lock held while a session, or one of its transactions, runs a query or stream. Releasing
+    it counts as a use of the session, so the idle time is measured from the end of the last
+    request rather than from its start.
+    """
+
+    def __init__(self, entry: list) -> None:
+        self.entry = entry
+        self.lock = asyncio.Lock()
+
+    def locked(self) -> bool:
+        return self.lock.locked()
+
+    async def __aenter__(self):
+        await self.lock.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.entry[3] = time.monotonic()
+        self.lock.release()
+
+
+class AsyncRegistry:
+    """
+    Shared drivers, client handles, sessions and transactions of the async proxy. Drivers
+    are keyed by (URI, user) and reference counted by the handles returned to the clients,
+    so all clients of a database share one connection pool. All bookkeeping runs on the
+    event loop without awaiting, so it needs no lock; a Neo4j session is not safe for
+    concurrent use, so each session has an asyncio lock held while it runs a query.
+    """
+
+    def __init__(self, idle_timeout: float, pool_size: int) -> None:
+        self.idle_timeout = idle_timeout
+        self.pool_size = pool_size
+        # (uri, user) -> [driver, password, number of handles]
+        self.drivers = {}
+        # handle id -> (uri, user)
+        self.handles = {}
+        # id -> [handle id, session, session lock, last use, (uri, database), user]
+        self.sessions = {}
+        # id -> [session id, transaction, last use, queries run]
+        self.txs = {}
+
+    def add_handle(self, uri: str, user: str, password: str) -> Optional[str]:
+        key = (uri, user)
+        entry = self.drivers.get(key)
+        if entry is None:
+            driver = AsyncGraphDatabase.driver(
+                uri, auth=(user, password), max_connection_pool_size=self.pool_size
+            )
+            entry = self.drivers[key] = [driver, password, 0]
+        elif entry[1] != password:
+            return None
+        entry[2] += 1
+        handle_id = uuid.uuid4().hex
+        self.handles[handle_id] = key
+        return handle_id
+
+    def driver(self, handle_id: str):
+        key = self.handles.get(handle_id)
+        return None if key is None else self.drivers[key][0]
+
+    async def remove_handle(self, handle_id: str) -> bool:
+        key = self.handles.pop(handle_id, None)
+        if key is None:
+            return False
+        session_ids = [
+            session_id
+            for session_id, entry in self.sessions.items()
+            if entry[0] == handle_id
+        ]
+        closed = [self._pop_session(session_id) for session_id in session_ids]
+        entry = self.drivers[key]
+        entry[2] -= 1
+        if entry[2] == 0:
+            del self.drivers[key]
+        for session, txs in closed:
+            await _close_session(session, txs)
+        if entry[2] == 0:
+            await entry[0].close()
+        return True
+
+    def add_session(self, handle_id: str, session, database: str) -> str:
+        session_id = uuid.uuid4().hex
+        uri, user = self.handles[handle_id]
+        entry = [handle_id, session, None, time.monotonic(), (uri, database), user]
+        entry[2] = AsyncSessionLock(entry)
+        self.sessions[session_id] = entry
+        return session_id
+
+    def session(self, session_id: str):
+        entry = self.sessions.get(session_id)
+        if entry is None:
+            return None, None
+        entry[3] = time.monotonic()
+        return entry[1], entry[2]
+
+    def scope(self, session_id: str):
+        # database of a session, under which its read results are cached
+        entry = self.sessions.get(session_id)
+        return None if entry is None else entry[4]
+
+    def user(self, session_id: str):
+        # user a session runs as, whose read results only it can see
+        entry = self.sessions.get(session_id)
+        return None if entry is None else entry[5]
+
+    def remove_session(self, session_id: str):
+        if session_id not in self.sessions:
+            return None, []
+        return self._pop_session(session_id)
+
+    def _pop_session(self, session_id: str):
+        session = self.sessions.pop(session_id)[1]
+        tx_ids = [
+            tx_id for tx_id, entry in self.txs.items() if entry[0] == session_id
+        ]
+        return session, [self.txs.pop(tx_id)[1] for tx_id in tx_ids]
+
+    def add_transaction(self, session_id: str, tx) -> str:
+        tx_id = uuid.uuid4().hex
+        self.txs[tx_id] = [session_id, tx, time.monotonic(), []]
+        return tx_id
+
+    def transaction(self, tx_id: str):
+        entry = self.txs.get(tx_id)
+        if entry is None or entry[0] not in self.sessions:
+            return None, None
+        now = time.monotonic()
+        entry[2] = now
+        # a transaction in use keeps its session alive
+        self.sessions[entry[0]][3] = now
+        return entry[1], self.sessions[entry[0]][2]
+
+    def record_queries(self, tx_id: str, queries) -> None:
+        entry = self.txs.get(tx_id)
+        if entry is not None:
+            entry[3].extend(queries)
+
+    def pop_queries(self, tx_id: str):
+        # scope and queries run by a transaction since its last commit
+        entry = self.txs.get(tx_id)
+        if entry is None or entry[0] not in self.sessions:
+            return None, []
+        queries, entry[3] = entry[3], []
+        return self.sessions[entry[0]][4], queries
+
+    def remove_transaction(self, tx_id: str):
+        entry = self.txs.pop(tx_id, None)
+        return None if entry is None else entry[1]
+
+    async def evict_idle(self) -> None:
+        # a session running a long query or stream holds its lock and is never closed
+        # from under it
+        deadline = time.monotonic() - self.idle_timeout
+        session_ids = [
+            session_id
+            for session_id, entry in self.sessions.items()
+            if entry[3] < deadline and not entry[2].locked()
+        ]
+        closed = [self._pop_session(session_id) for session_id in session_ids]
+        for session, txs in closed:
+            await _close_session(session, txs)
+
+    async def evict_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(max(1.0, self.idle_timeout / 10))
+            await self.evict_idle()
+
+    async def close(self) -> None:
+        closed = [self._pop_session(session_id) for session_id in list(self.sessions)]
+        for session, txs in closed:
+            await _close_session(session, txs)
+        drivers = [entry[0] for entry in self.drivers.values()]
+        self.drivers.clear()
+        self.handles.clear()
+        for driver in drivers:
+            await driver.close()
+
+
+async def _close_session(session, txs) -> None:
+    for tx in txs:
+        try:
+            await tx.close()
+        except Exception:
+            pass
+    try:
+        await session.close()
+    except Exception:
+        pass
+
+
+async def _records(runner, query: str, parameters: Dict) -> List:
+    result = await runner.run(query, parameters)
+    return [record async for record in result]
+
+
+Handler = Callable[[Request], Awaitable[Tuple[int, Any]]]
+
+
+class ProxyApp:
+    """
+    ASGI application of the async proxy.
+    """
+
+    def __init__(
+        self,
+        idle_timeout: float = IDLE_TIMEOUT,
+        pool_size: int = POOL_SIZE,
+        cache: Optional[ResultCache] = None,
+    ) -> None:
+        self.registry = AsyncRegistry(idle_timeout, pool_size)
+        self.cache = cache
+        self.evictor = None
+        self.routes: Dict[Tuple[str, str], Handler] = {
+            ("POST", "/initialize"): self.initialize_driver,
+            ("GET", "/ping"): self.ping,
+            ("GET", "/close"): self.close_driver,
+            ("POST", "/session/init"): self.initialize_session,
+            ("POST", "/session/run"): self.run_session_query,
+            ("POST", "/session/stream"): self.stream_session_query,
+            ("GET", "/session/close"): self.close_session,
+            ("GET", "/transaction/init"): self.initialize_transaction,
+            ("POST", "/transaction/run"): self.run_transaction_query,
+            ("GET", "/transaction/commit"): self.commit_transaction,
+            ("GET", "/transaction/close"): self.close_transaction,
+            ("POST", "/batch"): self.run_batch,
+            ("GET", "/cache/stats"): self.cache_stats,
+        }
+
+    async def __call__(self, scope: Dict, receive, send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+        self._start()
+        body, more_body = b"", True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+        request = Request(scope, body)
+        handler = self.routes.get((request.method, request.path))
+        if handler is None:
+            await self._respond(send, request, 404, {"error": "Not found"})
+            return
+        try:
+            status, payload = await handler(request)
+        except Exception as e:
+            status, payload = 500, {"error": str(e)}
+        if isinstance(payload, Stream):
+            await self._stream(send, receive, payload.chunks)
+        else:
+            await self._respond(send, request, status, payload)
+
+    def _invalidate(self, scope, queries) -> None:
+        # written queries drop the cached results they may have changed
+        if self.cache is not None and queries:
+            self.cache.invalidate(scope, queries)
+
+    def _start(self) -> None:
+        if self.evictor is None:
+            self.evictor = asyncio.ensure_future(self.registry.evict_periodically())
+
+    async def _lifespan(self, receive, send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                self._start()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                if self.evictor is not None:
+                    self.evictor.cancel()
+                await self.registry.close()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _respond(self, send, request: Request, status: int, payload) -> None:
+        # encode as requested by the Accept and Accept-Encoding headers, JSON by default
+        content_type, compression = codec.negotiate(
+            request.headers.get("accept"),
+            request.headers.get("accept-encoding"),
+            codec.COMPRESSIONS,
+        )
+        data = codec.encode(payload, content_type)
+        headers = [
+            (b"content-type", content_type.encode()),
+            (b"vary", b"Accept, Accept-Encoding"),
+        ]
+        if compression is not None and len(data) >= COMPRESS_MIN_SIZE:
+            data = codec.compress(data, compression)
+            headers.append((b"content-encoding", compression.encode()))
+        headers.append((b"content-length", str(len(data)).encode()))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": data})
+
+    async def _stream(self, send, receive, chunks: AsyncIterator[bytes]) -> None:
+        # stop fetching records once the client disconnects, which releases the session
+        disconnected = asyncio.Event()
+
+        async def watch():
+            while (await receive())["type"] != "http.disconnect":
+                pass
+            disconnected.set()
+
+        watcher = asyncio.ensure_future(watch())
+        try:
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [(b"content-type", NDJSON.encode())],
+                }
+            )
+            async for chunk in chunks:
+                if disconnected.is_set():
+                    return
+                await send(
+                    {"type": "http.response.body", "body": chunk, "more_body": True}
+                )
+            await send({"type": "http.response.body", "body": b""})
+        finally:
+            watcher.cancel()
+            await chunks.aclose()
+
+    async def initialize_driver(self, request: Request):
+        data = request.data()
+        db_uri = data.get("db_uri")
+        db_username = data.get("db_username")
+        db_password = data.get("db_password")
+        if not db_uri or not db_username or not db_password:
+            return 400, {"error": "Missing required parameters"}
+        handle_id = self.registry.add_handle(db_uri, db_username, db_password)
+        if handle_id is None:
+            return 401, {"error": "Credentials do not match the shared driver"}
+        return 200, {"status": "initialized", "id": handle_id}
+
+    async def ping(self, request: Request):
+        driver = self.registry.driver(request.args.get("id"))
+        if driver is None:
+            return 400, {"error": "Invalid driver ID"}
+        try:
+            await driver.verify_connectivity()
+            return 200, {"status": "connected"}
+        except Exception as e:
+            return 500, {"error": str(e)}
+
+    async def close_driver(self, request: Request):
+        if not await self.registry.remove_handle(request.args.get("id")):
+            return 400, {"error": "Invalid driver ID"}
+        return 200, {"status": "closed"}
+
+    async def initialize_session(self, request: Request):
+        data = request.data()
+        handle_id = data.get("id")
+        driver = self.registry.driver(handle_id)
+        if driver is None:
+            return 400, {"error": "Invalid driver ID"}
+        name = data.get("database", "neo4j")
+        session_id = self.registry.add_session(
+            handle_id, driver.session(database=name), name
+        )
+        return 200, {
+            "status": "session initialized",
+            "database": name,
+            "session_id": session_id,
+        }
+
+    async def run_session_query(self, request: Request):
+        # queries marked read_only are answered from the cache, if it is enabled; any
+        # other query is treated as a write and invalidates the cache
+        data = request.data()
+        session_id = data.get("session_id")
+        session, lock = self.registry.session(session_id)
+        if session is None:
+            return 404, {"error": "Invalid session ID"}
+        query = data.get("query")
+        parameters = data.get("parameters", {})
+        scope, user = self.registry.scope(session_id), self.registry.user(session_id)
+        cached = self.cache is not None and data.get("read_only", False)
+        if cached:
+            results = self.cache.get(scope, user, query, parameters)
+            if results is not None:
+                return 200, {"results": results}
+            generation = self.cache.generation(scope)
+        async with lock:
+            results = await _records(session, query, parameters)
+        if cached:
+            self.cache.put(scope, user, query, parameters, results, generation)
+        else:
+            self._invalidate(scope, [query])
+        return 200, {"results": results}
+
+    async def stream_session_query(self, request: Request):
+        # records are written as NDJSON lines in chunks that double up to
+        # STREAM_CHUNK_SIZE records; an error after the response started is sent as a
+        # final {"error": ...} line
+        data = request.data()
+        session, lock = self.registry.session(data.get("session_id"))
+        if session is None:
+            return 404, {"error": "Invalid session ID"}
+        query = data.get("query")
+        parameters = data.get("parameters", {})
+
+        async def generate():
+            # the session stays locked until the stream ends or the client disconnects
+            async with lock:
+                chunk, limit = [], 1
+                try:
+                    result = await session.run(query, parameters)
+                    async for record in result:
+                        chunk.append(codec.encode(record) + b"\n")
+                        if len(chunk) >= limit:
+                            yield b"".join(chunk)
+                            chunk, limit = [], min(2 * limit, STREAM_CHUNK_SIZE)
+                except Exception as e:
+                    chunk.append(codec.encode({"error": str(e)}) + b"\n")
+                if chunk:
+                    yield b"".join(chunk)
+
+        return 200, Stream(generate())
+
+    async def close_session(self, request: Request):
+        session, txs = self.registry.remove_session(request.args.get("session_id"))
+        if session is None:
+            return 404, {"error": "Invalid session ID"}
+        await _close_session(session, txs)
+        return 200, {"status": "session closed"}
+
+    async def initialize_transaction(self, request: Request):
+        session_id = request.args.get("session_id")
+        session, lock = self.registry.session(session_id)
+        if session is None:
+            return 404, {"error": "Invalid session ID"}
+        async with lock:
+            tx = await session.begin_transaction()
+        tx_id = self.registry.add_transaction(session_id, tx)
+        return 200, {"status": "transaction initialized", "tx_id": tx_id}
+
+    async def run_transaction_query(self, request: Request):
+        data = request.data()
+        tx, lock = self.registry.transaction(data.get("tx_id"))
+        if tx is None:
+            return 404, {"error": "Invalid transaction ID"}
+        query = data.get("query")
+        async with lock:
+            results = await _records(tx, query, data.get("parameters", {}))
+        self.registry.record_queries(data.get("tx_id"), [query])
+        return 200, {"results": results}
+
+    async def commit_transaction(self, request: Request):
+        tx, lock = self.registry.transaction(request.args.get("tx_id"))
+        if tx is None:
+            return 404, {"error": "Invalid transaction ID"}
+        async with lock:
+            await tx.commit()
+        self._invalidate(*self.registry.pop_queries(request.args.get("tx_id")))
+        return 200, {"status": "transaction committed"}
+
+    async def close_transaction(self, request: Request):
+        tx_id = request.args.get("tx_id")
+        tx, lock = self.registry.transaction(tx_id)
+        if tx is None:
+            return 404, {"error": "Invalid transaction ID"}
+        async with lock:
+            await tx.close()
+        self.registry.remove_transaction(tx_id)
+        return 200, {"status": "transaction closed"}
+
+    async def run_batch(self, request: Request):
+        # run an ordered list of queries in one request, either in an open transaction
+        # (tx_id), optionally committing and closing it, in a new transaction that is
+        # committed at the end, or each in its own auto-commit transaction
+        data = request.data()
+        queries = [
+            (item.get("query"), item.get("parameters", {}))
+            for item in data.get("queries", [])
+        ]
+        commit = data.get("commit", False)
+        tx_id = data.get("tx_id")
+        if tx_id is not None:
+            tx, lock = self.registry.transaction(tx_id)
+            if tx is None:
+                return 404, {"error": "Invalid transaction ID"}
+            async with lock:
+                results = [await _records(tx, *query) for query in queries]
+                if commit:
+                    await tx.commit()
+                    await tx.close()
+            self.registry.record_queries(tx_id, [query for query, _ in queries])
+            if commit:
+                self._invalidate(*self.registry.pop_queries(tx_id))
+                self.registry.remove_transaction(tx_id)
+            return 200, {"results": results}
+        session_id = data.get("session_id")
+        session, lock = self.registry.session(session_id)
+        if session is None:
+            return 404, {"error": "Invalid session ID"}
+        try:
+            async with lock:
+                if data.get("transaction", False):
+                    tx = await session.begin_transaction()
+                    try:
+                        results = [await _records(tx, *query) for query in queries]
+                        await tx.commit()
+                    finally:
+                        await tx.close()
+                else:
+                    results = [await _records(session, *query) for query in queries]
+        finally:
+            # auto-commit queries before a failing one are already written
+            self._invalidate(
+                self.registry.scope(session_id), [query for query, _ in queries]
+            )
+        return 200, {"results": results}
+
+    async def cache_stats(self, request: Request):
+        if self.cache is None:
+            return 200, {"enabled": False}
+        return 200, self.cache.stats()
+
+
+app = ProxyApp(
+    cache=(
+        ResultCache(CACHE_SIZE, CACHE_TTL, CACHE_MAX_RECORDS)
+        if CACHE_SIZE > 0
+        else None
+    )
+)
+
+
+if __name__ == "__main__":
+    try:
+        import uvicorn
+    except ImportError as e:
+        raise ImportError(
+            "Running the async proxy server requires an ASGI server, install it with 'pip install uvicorn'."
+        ) from e
+    uvicorn.run(app, host="0.0.0.0", port=int(os.getenv("PROXY_PORT", "5000")))
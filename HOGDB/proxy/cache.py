@@ -0,0 +1,213 @@
+# Copyright (c) 2025 ETH Zurich.
+#                    All rights reserved.
+#
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Hashable, List, Optional, Tuple
+import json
+import re
+import threading
+import time
+
+# string literals are kept verbatim by the normalization and ignored by the label scan
+_STRING_OR_SPACE = re.compile(r"('(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\")|\s+")
+_STRING = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+_LABEL = re.compile(r":\s*(`[^`]+`|[A-Za-z_]\w*)")
+# node or relationship patterns without a label or type, which match any element
+_UNLABELED_NODE = re.compile(r"(?<![\w`])\(\s*\w*\s*(\{[^}]*\})?\s*\)")
+_UNTYPED_RELATIONSHIP = re.compile(r"-\[\s*\w*\s*(\*[\d.]*)?\s*(\{[^}]*\})?\s*\]")
+# labels computed at runtime, for example SET n:$(label) or APOC procedures
+_DYNAMIC_LABEL = re.compile(r"\$\(|\bapoc\.", re.IGNORECASE)
+
+
+def normalize_query(query: str) -> str:
+    """
+    Collapse the whitespace of a query outside of string literals, so queries differing only
+    in their formatting share a cache entry.
+
+    @param query: Cypher query.
+    @return: Normalized query.
+    """
+    return _STRING_OR_SPACE.sub(lambda m: m.group(1) or " ", query).strip()
+
+
+def query_labels(query: str) -> Tuple[FrozenSet[str], bool]:
+    """
+    Find the labels and relationship types a query refers to. The scan over-approximates,
+    any name following a colon is taken as a label.
+
+    @param query: Cypher query.
+    @return: Tuple of the labels and whether the query can touch elements of any label,
+             because it has an unlabeled pattern or computes labels at runtime.
+    """
+    query = _STRING.sub("''", query)
+    labels = frozenset(label.strip("`") for label in _LABEL.findall(query))
+    unscoped = bool(
+        _UNLABELED_NODE.search(query)
+        or _UNTYPED_RELATIONSHIP.search(query)
+        or _DYNAMIC_LABEL.search(query)
+    )
+    return labels, unscoped
+
+
+class ResultCache:
+    """
+    LRU cache of the results of read-only queries, keyed by a scope (database), the user
+    the query ran as, the normalized query text and the parameters. Users never share an
+    entry, since what a query returns can depend on their privileges. Entries expire after
+    a TTL, results with too many records are not cached, and writes invalidate the entries
+    of every user sharing a label with them. Every write also advances the generation of its scope, so a read that started
+    before the write cannot store its (possibly outdated) results afterwards.
+    """
+
+    def __init__(
+        self, max_entries: int = 1024, ttl: float = 60.0, max_records: int = 10000
+    ) -> None:
+        """
+        Initialize the cache.
+
+        @param max_entries: Maximum number of cached results. Defaults to 1024.
+        @param ttl: Seconds a result stays valid. Defaults to 60.
+        @param max_records: Results with more records are not cached. Defaults to 10000.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_records = max_records
+        self.lock = threading.Lock()
+        # key -> (expiry, labels, unscoped, results)
+        self.entries = OrderedDict()
+        self.generations: Dict[Hashable, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _key(
+        scope: Hashable, user: Hashable, query: str, parameters: Optional[Dict]
+    ) -> Tuple:
+        return (
+            scope,
+            user,
+            normalize_query(query),
+            json.dumps(parameters or {}, sort_keys=True, default=str),
+        )
+
+    def generation(self, scope: Hashable) -> int:
+        """
+        Current generation of a scope, to be passed to put() by a read started now.
+
+        @param scope: Cache scope.
+        @return: Generation.
+        """
+        with self.lock:
+            return self.generations.get(scope, 0)
+
+    def get(
+        self, scope: Hashable, user: Hashable, query: str, parameters: Optional[Dict]
+    ) -> Optional[List[Any]]:
+        """
+        Look up the results of a query.
+
+        @param scope: Cache scope.
+        @param user: User running the query.
+        @param query: Cypher query.
+        @param parameters: Parameters of the query.
+        @return: Cached results, or None.
+        """
+        key = self._key(scope, user, query, parameters)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] < time.monotonic():
+                del self.entries[key]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[3]
+
+    def put(
+        self,
+        scope: Hashable,
+        user: Hashable,
+        query: str,
+        parameters: Optional[Dict],
+        results: List[Any],
+        generation: int,
+    ) -> None:
+        """
+        Store the results of a query, unless a write happened in its scope since the read
+        started or the results are too large.
+
+        @param scope: Cache scope.
+        @param user: User the query ran as.
+        @param query: Cypher query.
+        @param parameters: Parameters of the query.
+        @param results: Results of the query.
+        @param generation: Generation of the scope when the read started.
+        """
+        if len(results) > self.max_records:
+            return
+        key = self._key(scope, user, query, parameters)
+        labels, unscoped = query_labels(query)
+        with self.lock:
+            if self.generations.get(scope, 0) != generation:
+                return
+            self.entries[key] = (time.monotonic() + self.ttl, labels, unscoped, results)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, scope: Hashable, queries: List[str]) -> None:
+        """
+        Drop the entries of a scope that written queries may have changed, whichever user
+        they belong to: entries sharing a label with them and entries of unlabeled reads. An
+        unlabeled write drops the whole scope.
+
+        @param scope: Cache scope.
+        @param queries: Written queries.
+        """
+        labels, unscoped = set(), False
+        for query in queries:
+            query_label_set, query_unscoped = query_labels(query)
+            labels |= query_label_set
+            unscoped = unscoped or query_unscoped
+        with self.lock:
+            self.generations[scope] = self.generations.get(scope, 0) + 1
+            stale = [
+                key
+                for key, entry in self.entries.items()
+                if key[0] == scope and (unscoped or entry[2] or entry[1] & labels)
+            ]
+            for key in stale:
+                del self.entries[key]
+            self.invalidations += len(stale)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache statistics.
+
+        @return: Dictionary of the limits, the number of entries and the counters.
+        """
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": True,
+                "entries": len(self.entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "max_records": self.max_records,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
@@ -0,0 +1,186 @@
+# Copyright (c) 2025 ETH Zurich.
+#                    All rights reserved.
+#
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+from datetime import date, datetime, time
+from typing import Any, Iterable, Optional, Tuple
+import gzip
+import json
+
+JSON = "application/json"
+MSGPACK = "application/msgpack"
+ENCODINGS = {"json": JSON, "msgpack": MSGPACK}
+COMPRESSIONS = ("gzip", "zstd")
+
+
+def _msgpack() -> Any:
+    """
+    Import msgpack, which is only required for the binary encoding.
+
+    @return: The msgpack module.
+    """
+    try:
+        import msgpack
+    except ImportError as e:
+        raise ImportError(
+            "The msgpack encoding requires msgpack, install it with 'pip install msgpack'."
+        ) from e
+    return msgpack
+
+
+def _zstandard() -> Any:
+    """
+    Import zstandard, which is only required for the zstd compression.
+
+    @return: The zstandard module.
+    """
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "The zstd compression requires zstandard, install it with 'pip install zstandard'."
+        ) from e
+    return zstandard
+
+
+def available(content_type: str) -> bool:
+    """
+    Check whether a content type can be encoded in this environment.
+
+    @param content_type: Content type.
+    @return: True if the content type is supported and its dependency is installed.
+    """
+    if content_type == JSON:
+        return True
+    if content_type == MSGPACK:
+        try:
+            _msgpack()
+        except ImportError:
+            return False
+        return True
+    return False
+
+
+def _default(value: Any) -> Any:
+    """
+    Convert values JSON cannot encode, for example driver temporal values and records.
+
+    @param value: Value to convert.
+    @return: Encodable value.
+    """
+    if hasattr(value, "to_native"):
+        value = value.to_native()
+    if isinstance(value, (date, datetime, time)):
+        return value.isoformat()
+    if isinstance(value, (tuple, set)) or hasattr(value, "values"):
+        # neo4j.Record
+        return list(value.values() if hasattr(value, "values") else value)
+    raise TypeError(f"Cannot encode value of type {type(value).__name__}")
+
+
+def _msgpack_default(value: Any) -> Any:
+    """
+    Convert values msgpack cannot pack. Timezone-aware datetimes are packed as msgpack
+    timestamps and decoded as UTC datetimes, everything else as for JSON.
+
+    @param value: Value to convert.
+    @return: Packable value.
+    """
+    if hasattr(value, "to_native"):
+        value = value.to_native()
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return _msgpack().Timestamp.from_datetime(value)
+    return _default(value)
+
+
+def encode(payload: Any, content_type: str = JSON) -> bytes:
+    """
+    Encode a payload. msgpack keeps integers, floats and booleans typed and packs binary
+    numbers, instead of writing them as text.
+
+    @param payload: JSON-like payload.
+    @param content_type: Content type of the encoding. Defaults to JSON.
+    @return: Encoded payload.
+    """
+    if content_type == MSGPACK:
+        return _msgpack().packb(
+            payload, default=_msgpack_default, datetime=False, use_bin_type=True
+        )
+    if content_type == JSON:
+        return json.dumps(payload, default=_default).encode()
+    raise ValueError(f"Unsupported content type '{content_type}'.")
+
+
+def decode(data: bytes, content_type: Optional[str] = JSON) -> Any:
+    """
+    Decode a payload.
+
+    @param data: Encoded payload.
+    @param content_type: Content type of the encoding. Defaults to JSON.
+    @return: Decoded payload.
+    """
+    content_type = (content_type or JSON).split(";")[0].strip()
+    if content_type == MSGPACK:
+        return _msgpack().unpackb(data, raw=False, timestamp=3)
+    if not data:
+        return {}
+    return json.loads(data)
+
+
+def compress(data: bytes, compression: str) -> bytes:
+    """
+    Compress an encoded payload.
+
+    @param data: Encoded payload.
+    @param compression: Either 'gzip' or 'zstd'.
+    @return: Compressed payload.
+    """
+    if compression == "gzip":
+        return gzip.compress(data, compresslevel=5)
+    if compression == "zstd":
+        return _zstandard().ZstdCompressor(level=3).compress(data)
+    raise ValueError(f"Unsupported compression '{compression}'.")
+
+
+def decompress(data: bytes, compression: Optional[str]) -> bytes:
+    """
+    Decompress an encoded payload.
+
+    @param data: Compressed payload.
+    @param compression: Either 'gzip', 'zstd' or None.
+    @return: Encoded payload.
+    """
+    if not compression or compression == "identity":
+        return data
+    if compression == "gzip":
+        return gzip.decompress(data)
+    if compression == "zstd":
+        return _zstandard().ZstdDecompressor().decompress(data)
+    raise ValueError(f"Unsupported compression '{compression}'.")
+
+
+def negotiate(
+    accept: Optional[str], accept_encoding: Optional[str], offered: Iterable[str]
+) -> Tuple[str, Optional[str]]:
+    """
+    Choose the content type and compression of a response from the request headers.
+
+    @param accept: Accept header of the request.
+    @param accept_encoding: Accept-Encoding header of the request.
+    @param offered: Compressions the server offers, in order of preference.
+    @return: Tuple of the content type and the compression (or None).
+    """
+    accepted = [t.split(";")[0].strip() for t in (accept or "").split(",")]
+    content_type = MSGPACK if MSGPACK in accepted and available(MSGPACK) else JSON
+    encodings = [e.split(";")[0].strip() for e in (accept_encoding or "").split(",")]
+    for compression in offered:
+        if compression in encodings:
+            if compression == "zstd":
+                try:
+                    _zstandard()
+                except ImportError:
+                    continue
+            return content_type, compression
+    return content_type, None
@@ -6,140 +6,491 @@
 #
 # main author: Shriram Chandran
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request
 from neo4j import GraphDatabase
+import os
+import threading
+import time
+import uuid
+
+try:
+    from HOGDB.proxy import codec
+    from HOGDB.proxy.cache import ResultCache
+except ImportError:
+    # started as a script from within HOGDB/proxy
+    import codec
+    from cache import ResultCache
 
 
 app = Flask(__name__)
 
-drivers = []
-sessions = []
-txs = []
-active = 0
+# sessions and transactions unused for this many seconds are closed
+IDLE_TIMEOUT = float(os.getenv("PROXY_IDLE_TIMEOUT", "600"))
+# responses smaller than this many bytes are not compressed
+COMPRESS_MIN_SIZE = int(os.getenv("PROXY_COMPRESS_MIN_SIZE", "1024"))
+# number of records written at a time by the streaming endpoint
+STREAM_CHUNK_SIZE = int(os.getenv("PROXY_STREAM_CHUNK_SIZE", "100"))
+NDJSON = "application/x-ndjson"
+# results of read-only queries are cached if the cache size is positive
+CACHE_SIZE = int(os.getenv("PROXY_CACHE_SIZE", "0"))
+CACHE_TTL = float(os.getenv("PROXY_CACHE_TTL", "60"))
+CACHE_MAX_RECORDS = int(os.getenv("PROXY_CACHE_MAX_RECORDS", "10000"))
+
+
+def _request_data():
+    data = codec.decompress(request.get_data(), request.headers.get("Content-Encoding"))
+    return codec.decode(data, request.headers.get("Content-Type"))
+
+
+def respond(payload) -> Response:
+    # encode as requested by the Accept and Accept-Encoding headers, JSON by default
+    content_type, compression = codec.negotiate(
+        request.headers.get("Accept"),
+        request.headers.get("Accept-Encoding"),
+        codec.COMPRESSIONS,
+    )
+    data = codec.encode(payload, content_type)
+    response = Response(content_type=content_type)
+    if compression is not None and len(data) >= COMPRESS_MIN_SIZE:
+        data = codec.compress(data, compression)
+        response.headers["Content-Encoding"] = compression
+    response.set_data(data)
+    response.headers["Vary"] = "Accept, Accept-Encoding"
+    return response
+
+
+class SessionLock:
+    """
+    Lock held while a session, or one of its transactions, runs a query or stream. Releasing
+    it counts as a use of the session, so the idle time is measured from the end of the last
+    request rather than from its start.
+    """
+
+    def __init__(self, registry: "Registry", entry: list) -> None:
+        self.registry = registry
+        self.entry = entry
+        self.lock = threading.Lock()
+
+    def locked(self) -> bool:
+        return self.lock.locked()
+
+    def __enter__(self):
+        self.lock.acquire()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        with self.registry.lock:
+            self.entry[3] = time.monotonic()
+        self.lock.release()
+
+
+class Registry:
+    """
+    Drivers, sessions and transactions of the proxy. Every session and transaction has its
+    own id, so any number of clients can share a driver. All access is serialized by a lock;
+    a Neo4j session is not thread-safe, so each session additionally has its own lock that
+    is held while it (or one of its transactions) runs a query.
+    """
+
+    def __init__(self, idle_timeout: float) -> None:
+        self.idle_timeout = idle_timeout
+        self.lock = threading.Lock()
+        self.drivers = {}
+        # driver id -> (uri, user)
+        self.owners = {}
+        self.next_driver_id = 0
+        # id -> [driver id, session, session lock, last use, (uri, database), user]
+        self.sessions = {}
+        # id -> [session id, transaction, last use, queries run]
+        self.txs = {}
+
+    def add_driver(self, driver, uri: str, user: str) -> int:
+        with self.lock:
+            driver_id = self.next_driver_id
+            self.next_driver_id += 1
+            self.drivers[driver_id] = driver
+            self.owners[driver_id] = (uri, user)
+            return driver_id
+
+    def driver(self, driver_id):
+        with self.lock:
+            return self.drivers.get(driver_id)
+
+    def remove_driver(self, driver_id):
+        with self.lock:
+            driver = self.drivers.pop(driver_id, None)
+            self.owners.pop(driver_id, None)
+            session_ids = [
+                session_id
+                for session_id, entry in self.sessions.items()
+                if entry[0] == driver_id
+            ]
+            closed = [self._pop_session(session_id) for session_id in session_ids]
+        for session, txs in closed:
+            _close_session(session, txs)
+        return driver
+
+    def add_session(self, driver_id: int, session, database: str) -> str:
+        session_id = uuid.uuid4().hex
+        uri, user = self.owners.get(driver_id, (None, None))
+        entry = [driver_id, session, None, time.monotonic(), (uri, database), user]
+        entry[2] = SessionLock(self, entry)
+        with self.lock:
+            self.sessions[session_id] = entry
+        return session_id
+
+    def session(self, session_id: str):
+        with self.lock:
+            entry = self.sessions.get(session_id)
+            if entry is None:
+                return None, None
+            entry[3] = time.monotonic()
+            return entry[1], entry[2]
+
+    def scope(self, session_id: str):
+        # database of a session, under which its read results are cached
+        with self.lock:
+            entry = self.sessions.get(session_id)
+            return None if entry is None else entry[4]
+
+    def user(self, session_id: str):
+        # user a session runs as, whose read results only it can see
+        with self.lock:
+            entry = self.sessions.get(session_id)
+            return None if entry is None else entry[5]
+
+    def remove_session(self, session_id: str):
+        with self.lock:
+            if session_id not in self.sessions:
+                return None, []
+            return self._pop_session(session_id)
+
+    def _pop_session(self, session_id: str):
+        # the caller holds the registry lock
+        session = self.sessions.pop(session_id)[1]
+        tx_ids = [
+            tx_id for tx_id, entry in self.txs.items() if entry[0] == session_id
+        ]
+        return session, [self.txs.pop(tx_id)[1] for tx_id in tx_ids]
+
+    def add_transaction(self, session_id: str, tx) -> str:
+        tx_id = uuid.uuid4().hex
+        with self.lock:
+            self.txs[tx_id] = [session_id, tx, time.monotonic(), []]
+        return tx_id
+
+    def transaction(self, tx_id: str):
+        with self.lock:
+            entry = self.txs.get(tx_id)
+            if entry is None or entry[0] not in self.sessions:
+                return None, None
+            now = time.monotonic()
+            entry[2] = now
+            # a transaction in use keeps its session alive
+            self.sessions[entry[0]][3] = now
+            return entry[1], self.sessions[entry[0]][2]
+
+    def record_queries(self, tx_id: str, queries) -> None:
+        with self.lock:
+            entry = self.txs.get(tx_id)
+            if entry is not None:
+                entry[3].extend(queries)
+
+    def pop_queries(self, tx_id: str):
+        # scope and queries run by a transaction since its last commit
+        with self.lock:
+            entry = self.txs.get(tx_id)
+            if entry is None or entry[0] not in self.sessions:
+                return None, []
+            queries, entry[3] = entry[3], []
+            return self.sessions[entry[0]][4], queries
+
+    def remove_transaction(self, tx_id: str):
+        with self.lock:
+            entry = self.txs.pop(tx_id, None)
+            return None if entry is None else entry[1]
+
+    def evict_idle(self) -> None:
+        # a session running a long query or stream holds its lock and is never closed
+        # from under it
+        deadline = time.monotonic() - self.idle_timeout
+        with self.lock:
+            session_ids = [
+                session_id
+                for session_id, entry in self.sessions.items()
+                if entry[3] < deadline and not entry[2].locked()
+            ]
+            closed = [self._pop_session(session_id) for session_id in session_ids]
+        for session, txs in closed:
+            _close_session(session, txs)
+
+    def evict_periodically(self) -> None:
+        while True:
+            time.sleep(max(1.0, self.idle_timeout / 10))
+            self.evict_idle()
+
+
+def _close_session(session, txs) -> None:
+    for tx in txs:
+        try:
+            tx.close()
+        except Exception:
+            pass
+    try:
+        session.close()
+    except Exception:
+        pass
+
+
+registry = Registry(IDLE_TIMEOUT)
+threading.Thread(target=registry.evict_periodically, daemon=True).start()
+cache = (
+    ResultCache(CACHE_SIZE, CACHE_TTL, CACHE_MAX_RECORDS) if CACHE_SIZE > 0 else None
+)
+
+
+def _invalidate(scope, queries) -> None:
+    # written queries drop the cached results they may have changed
+    if cache is not None and queries:
+        cache.invalidate(scope, queries)
 
 
 @app.route("/initialize", methods=["POST"])
 def initialize_driver():
-    global drivers, sessions, txs, active
-    data = request.get_json()
+    data = _request_data()
     db_uri = data.get("db_uri")
     db_username = data.get("db_username")
     db_password = data.get("db_password")
     if not db_uri or not db_username or not db_password:
-        return jsonify({"error": "Missing required parameters"}), 400
-    drivers.append(GraphDatabase.driver(db_uri, auth=(db_username, db_password)))
-    sessions.append(None)
-    txs.append(None)
-    active += 1
-    return jsonify({"status": "initialized", "id": len(drivers) - 1}), 200
+        return respond({"error": "Missing required parameters"}), 400
+    driver_id = registry.add_driver(
+        GraphDatabase.driver(db_uri, auth=(db_username, db_password)),
+        db_uri,
+        db_username,
+    )
+    return respond({"status": "initialized", "id": driver_id}), 200
 
 
 @app.route("/ping", methods=["GET"])
 def ping():
-    global drivers
-    driver_id = request.args.get("id", type=int)
-    if driver_id is None or driver_id >= len(drivers):
-        return jsonify({"error": "Invalid driver ID"}), 400
+    driver = registry.driver(request.args.get("id", type=int))
+    if driver is None:
+        return respond({"error": "Invalid driver ID"}), 400
     try:
-        drivers[driver_id].verify_connectivity()
-        return jsonify({"status": "connected"}), 200
+        driver.verify_connectivity()
+        return respond({"status": "connected"}), 200
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return respond({"error": str(e)}), 500
 
 
 @app.route("/close", methods=["GET"])
 def close_driver():
-    global drivers, sessions, txs, active
-    driver_id = request.args.get("id", type=int)
-    if driver_id is None or driver_id >= len(drivers):
-        return jsonify({"error": "Invalid driver ID"}), 400
-    drivers[driver_id].close()
-    drivers[driver_id] = None
-    active -= 1
-    if active == 0:
-        drivers, sessions, txs = [], [], []
-    return jsonify({"status": "closed"}), 200
+    driver = registry.remove_driver(request.args.get("id", type=int))
+    if driver is None:
+        return respond({"error": "Invalid driver ID"}), 400
+    driver.close()
+    return respond({"status": "closed"}), 200
 
 
 @app.route("/session/init", methods=["POST"])
 def initialize_session():
-    global session, driver
-    data = request.get_json()
+    data = _request_data()
     driver_id = data.get("id")
-    if driver_id is None or driver_id >= len(drivers):
-        return jsonify({"error": "Invalid driver ID"}), 400
+    driver = registry.driver(driver_id)
+    if driver is None:
+        return respond({"error": "Invalid driver ID"}), 400
     name = data.get("database", "neo4j")
-    sessions[driver_id] = drivers[driver_id].session(database=name)
-    return jsonify({"status": "session initialized", "database": name}), 200
+    session_id = registry.add_session(
+        driver_id, driver.session(database=name), name
+    )
+    return (
+        respond(
+            {
+                "status": "session initialized",
+                "database": name,
+                "session_id": session_id,
+            }
+        ),
+        200,
+    )
 
 
 @app.route("/session/run", methods=["POST"])
 def run_session_query():
-    global session
-    data = request.get_json()
-    driver_id = data.get("id")
-    if driver_id is None or driver_id >= len(drivers):
-        return jsonify({"error": "Invalid driver ID"}), 400
+    # queries marked read_only are answered from the cache, if it is enabled; any other
+    # query is treated as a write and invalidates the cache
+    data = _request_data()
+    session_id = data.get("session_id")
+    session, lock = registry.session(session_id)
+    if session is None:
+        return respond({"error": "Invalid session ID"}), 404
     query = data.get("query")
     parameters = data.get("parameters", {})
-    results = [record for record in sessions[driver_id].run(query, parameters)]
-    return jsonify({"results": results}), 200
+    scope, user = registry.scope(session_id), registry.user(session_id)
+    cached = cache is not None and data.get("read_only", False)
+    if cached:
+        results = cache.get(scope, user, query, parameters)
+        if results is not None:
+            return respond({"results": results}), 200
+        generation = cache.generation(scope)
+    with lock:
+        results = [record for record in session.run(query, parameters)]
+    if cached:
+        cache.put(scope, user, query, parameters, results, generation)
+    else:
+        _invalidate(scope, [query])
+    return respond({"results": results}), 200
+
+
+@app.route("/session/stream", methods=["POST"])
+def stream_session_query():
+    # write the records as NDJSON lines while they are fetched from the driver, in chunks
+    # that double up to STREAM_CHUNK_SIZE records so the first rows are sent right away;
+    # an error after the response started is sent as a final {"error": ...} line
+    data = _request_data()
+    session, lock = registry.session(data.get("session_id"))
+    if session is None:
+        return respond({"error": "Invalid session ID"}), 404
+    query = data.get("query")
+    parameters = data.get("parameters", {})
+
+    def generate():
+        # the session stays locked until the stream ends or the client disconnects
+        with lock:
+            chunk, limit = [], 1
+            try:
+                for record in session.run(query, parameters):
+                    chunk.append(codec.encode(record) + b"\n")
+                    if len(chunk) >= limit:
+                        yield b"".join(chunk)
+                        chunk, limit = [], min(2 * limit, STREAM_CHUNK_SIZE)
+            except Exception as e:
+                chunk.append(codec.encode({"error": str(e)}) + b"\n")
+            if chunk:
+                yield b"".join(chunk)
+
+    return Response(generate(), content_type=NDJSON), 200
 
 
 @app.route("/session/close", methods=["GET"])
 def close_session():
-    global session
-    driver_id = request.args.get("id", type=int)
-    if driver_id is None or driver_id >= len(drivers):
-        return jsonify({"error": "Invalid driver ID"}), 400
-    sessions[driver_id].close()
-    sessions[driver_id] = None
-    return jsonify({"status": "session closed"}), 200
+    session, txs = registry.remove_session(request.args.get("session_id"))
+    if session is None:
+        return respond({"error": "Invalid session ID"}), 404
+    _close_session(session, txs)
+    return respond({"status": "session closed"}), 200
 
 
 @app.route("/transaction/init", methods=["GET"])
 def initialize_transaction():
-    global sessions, txs
-    driver_id = request.args.get("id", type=int)
-    if driver_id is None or driver_id >= len(drivers):
-        return jsonify({"error": "Invalid driver ID"}), 400
-    txs[driver_id] = sessions[driver_id].begin_transaction()
-    return jsonify({"status": "transaction initialized"}), 200
+    session_id = request.args.get("session_id")
+    session, lock = registry.session(session_id)
+    if session is None:
+        return respond({"error": "Invalid session ID"}), 404
+    with lock:
+        tx = session.begin_transaction()
+    tx_id = registry.add_transaction(session_id, tx)
+    return respond({"status": "transaction initialized", "tx_id": tx_id}), 200
 
 
 @app.route("/transaction/run", methods=["POST"])
 def run_transaction_query():
-    global txs
-    data = request.get_json()
-    driver_id = data.get("id")
-    if driver_id is None or driver_id >= len(drivers):
-        return jsonify({"error": "Invalid driver ID"}), 400
+    data = _request_data()
+    tx, lock = registry.transaction(data.get("tx_id"))
+    if tx is None:
+        return respond({"error": "Invalid transaction ID"}), 404
     query = data.get("query")
     parameters = data.get("parameters", {})
-    results = [record for record in txs[driver_id].run(query, parameters)]
-    return jsonify({"results": results}), 200
+    with lock:
+        results = [record for record in tx.run(query, parameters)]
+    registry.record_queries(data.get("tx_id"), [query])
+    return respond({"results": results}), 200
 
 
 @app.route("/transaction/commit", methods=["GET"])
 def commit_transaction():
-    global txs
-    driver_id = request.args.get("id", type=int)
-    if driver_id is None or driver_id >= len(drivers):
-        return jsonify({"error": "Invalid driver ID"}), 400
-    txs[driver_id].commit()
-    return jsonify({"status": "transaction committed"}), 200
+    tx, lock = registry.transaction(request.args.get("tx_id"))
+    if tx is None:
+        return respond({"error": "Invalid transaction ID"}), 404
+    with lock:
+        tx.commit()
+    _invalidate(*registry.pop_queries(request.args.get("tx_id")))
+    return respond({"status": "transaction committed"}), 200
 
 
 @app.route("/transaction/close", methods=["GET"])
 def close_transaction():
-    global txs
-    driver_id = request.args.get("id", type=int)
-    if driver_id is None or driver_id >= len(drivers):
-        return jsonify({"error": "Invalid driver ID"}), 400
-    txs[driver_id].close()
-    txs[driver_id] = None
-    return jsonify({"status": "transaction closed"}), 200
+    tx_id = request.args.get("tx_id")
+    tx, lock = registry.transaction(tx_id)
+    if tx is None:
+        return respond({"error": "Invalid transaction ID"}), 404
+    with lock:
+        tx.close()
+    registry.remove_transaction(tx_id)
+    return respond({"status": "transaction closed"}), 200
+
+
+@app.route("/batch", methods=["POST"])
+def run_batch():
+    # run an ordered list of queries in one request, either in an open transaction (tx_id),
+    # optionally committing and closing it, in a new transaction that is committed at the
+    # end, or each in its own auto-commit transaction
+    data = _request_data()
+    queries = [
+        (item.get("query"), item.get("parameters", {}))
+        for item in data.get("queries", [])
+    ]
+    tx_id = data.get("tx_id")
+    if tx_id is not None:
+        tx, lock = registry.transaction(tx_id)
+        if tx is None:
+            return respond({"error": "Invalid transaction ID"}), 404
+        with lock:
+            results = [
+                [record for record in tx.run(query, parameters)]
+                for query, parameters in queries
+            ]
+            if data.get("commit", False):
+                tx.commit()
+                tx.close()
+        registry.record_queries(tx_id, [query for query, _ in queries])
+        if data.get("commit", False):
+            _invalidate(*registry.pop_queries(tx_id))
+            registry.remove_transaction(tx_id)
+        return respond({"results": results}), 200
+    session_id = data.get("session_id")
+    session, lock = registry.session(session_id)
+    if session is None:
+        return respond({"error": "Invalid session ID"}), 404
+    try:
+        with lock:
+            if data.get("transaction", False):
+                tx = session.begin_transaction()
+                try:
+                    results = [
+                        [record for record in tx.run(query, parameters)]
+                        for query, parameters in queries
+                    ]
+                    tx.commit()
+                finally:
+                    tx.close()
+            else:
+                results = [
+                    [record for record in session.run(query, parameters)]
+                    for query, parameters in queries
+                ]
+    finally:
+        # auto-commit queries before a failing one are already written
+        _invalidate(registry.scope(session_id), [query for query, _ in queries])
+    return respond({"results": results}), 200
+
+
+@app.route("/cache/stats", methods=["GET"])
+def cache_stats():
+    if cache is None:
+        return respond({"enabled": False}), 200
+    return respond(cache.stats()), 200
 
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5000)
+    app.run(host="0.0.0.0", port=5000, threaded=True)
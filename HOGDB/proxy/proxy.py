@@ -7,89 +7,317 @@
 # main author: Shriram Chandran
 
 import requests
-from typing import Dict, Optional, List
+from requests.adapters import HTTPAdapter
+from typing import Any, Dict, Iterator, Optional, List, Tuple, Union
+from HOGDB.proxy import codec
+import json
+
+Timeout = Optional[Union[float, Tuple[float, Optional[float]]]]
+
+# request bodies smaller than this many bytes are not compressed
+COMPRESS_MIN_SIZE = 1024
+# bytes read at a time from a streamed response
+STREAM_READ_SIZE = 64 * 1024
+
+
+def _http_session(pool_size: int) -> requests.Session:
+    # keep-alive connections to the proxy, reused by all requests of a driver
+    http = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    http.mount("http://", adapter)
+    http.mount("https://", adapter)
+    return http
+
+
+def _content_type(encoding: str, compression: Optional[str]) -> str:
+    # content type of an encoding, checking that it and the compression are supported
+    if encoding not in codec.ENCODINGS:
+        raise ValueError(
+            f"Unsupported encoding '{encoding}', expected one of {tuple(codec.ENCODINGS)}."
+        )
+    if compression is not None and compression not in codec.COMPRESSIONS:
+        raise ValueError(
+            f"Unsupported compression '{compression}', expected one of {codec.COMPRESSIONS}."
+        )
+    content_type = codec.ENCODINGS[encoding]
+    if not codec.available(content_type):
+        # raises the ImportError naming the missing package
+        codec.encode({}, content_type)
+    return content_type
+
+
+def _stream_value(line: bytes) -> Any:
+    # value of an NDJSON line, the server reports errors after the response started as
+    # a final {"error": ...} line
+    value = json.loads(line)
+    if isinstance(value, dict) and "error" in value:
+        raise RuntimeError(f"Proxy stream failed: {value['error']}")
+    return value
+
+
+def _batch_queries(queries: List[Tuple[str, Optional[Dict]]]) -> List[Dict]:
+    return [
+        {"query": query, "parameters": parameters or {}}
+        for query, parameters in queries
+    ]
+
+
+class ProxyClient:
+    # HTTP connection to the proxy, shared by a driver and its sessions and transactions.
+    # Payloads are sent and accepted in the given encoding ('json' or 'msgpack'), and
+    # compressed with gzip or zstd if a compression is given.
+    def __init__(
+        self,
+        proxy_url: str,
+        pool_size: int = 10,
+        timeout: Timeout = None,
+        encoding: str = "json",
+        compression: Optional[str] = None,
+    ):
+        self.url = proxy_url
+        self.http = _http_session(pool_size)
+        self.timeout = timeout
+        self.content_type = _content_type(encoding, compression)
+        self.compression = compression
+        self.http.headers.update(
+            {
+                "Accept": self.content_type,
+                "Accept-Encoding": compression or "identity",
+            }
+        )
+
+    def _decode(self, response: requests.Response) -> Any:
+        # responses are streamed so the body can be decompressed here instead of by
+        # urllib3, whose zstd support depends on the installed packages. Reading the whole
+        # body returns the connection to the pool.
+        data = response.raw.read(decode_content=False)
+        response.raise_for_status()
+        data = codec.decompress(data, response.headers.get("Content-Encoding"))
+        return codec.decode(data, response.headers.get("Content-Type"))
+
+    def get(self, path: str, params: Dict) -> Any:
+        return self._decode(
+            self.http.get(
+                f"{self.url}{path}", params=params, timeout=self.timeout, stream=True
+            )
+        )
+
+    def post(self, path: str, payload: Dict) -> Any:
+        data = codec.encode(payload, self.content_type)
+        headers = {"Content-Type": self.content_type}
+        if self.compression is not None and len(data) >= COMPRESS_MIN_SIZE:
+            data = codec.compress(data, self.compression)
+            headers["Content-Encoding"] = self.compression
+        return self._decode(
+            self.http.post(
+                f"{self.url}{path}",
+                data=data,
+                headers=headers,
+                timeout=self.timeout,
+                stream=True,
+            )
+        )
+
+    def stream(self, path: str, payload: Dict) -> Iterator[Any]:
+        # iterate over the values of an NDJSON response while it is received
+        data = codec.encode(payload, self.content_type)
+        headers = {"Content-Type": self.content_type, "Accept": "application/x-ndjson"}
+        response = self.http.post(
+            f"{self.url}{path}",
+            data=data,
+            headers=headers,
+            timeout=self.timeout,
+            stream=True,
+        )
+        # closing the response early drops the connection instead of reading the rest
+        with response:
+            response.raise_for_status()
+            for line in response.iter_lines(chunk_size=STREAM_READ_SIZE):
+                if line:
+                    yield _stream_value(line)
+
+    def close(self):
+        self.http.close()
 
 
 class ProxyDriver:
-    def __init__(self, db_uri: str, db_username: str, db_password: str, proxy_url: str):
+    def __init__(
+        self,
+        db_uri: str,
+        db_username: str,
+        db_password: str,
+        proxy_url: str,
+        pool_size: int = 10,
+        connect_timeout: float = 30,
+        read_timeout: Optional[float] = None,
+        encoding: str = "json",
+        compression: Optional[str] = None,
+    ):
         self.url = proxy_url
-        response = requests.post(
-            f"{self.url}/initialize",
-            json={
+        self.client = ProxyClient(
+            proxy_url,
+            pool_size,
+            (connect_timeout, read_timeout),
+            encoding,
+            compression,
+        )
+        response = self.client.post(
+            "/initialize",
+            {
                 "db_uri": db_uri,
                 "db_username": db_username,
                 "db_password": db_password,
             },
         )
-        response.raise_for_status()
-        self.driver_id = response.json().get("id")
+        self.driver_id = response.get("id")
 
     def verify_connectivity(self):
-        response = requests.get(f"{self.url}/ping", params={"id": self.driver_id})
-        response.raise_for_status()
+        self.client.get("/ping", {"id": self.driver_id})
 
     def close(self):
-        response = requests.get(f"{self.url}/close", params={"id": self.driver_id})
-        response.raise_for_status()
+        try:
+            self.client.get("/close", {"id": self.driver_id})
+        finally:
+            self.client.close()
 
     def session(self, database: str = "neo4j"):
-        return ProxySession(self.driver_id, self.url, database)
+        return ProxySession(self.driver_id, self.url, database, client=self.client)
 
 
 class ProxySession:
-    def __init__(self, driver_id: int, proxy_url: str, db_name: str = "neo4j"):
+    def __init__(
+        self,
+        driver_id: int,
+        proxy_url: str,
+        db_name: str = "neo4j",
+        client: Optional[ProxyClient] = None,
+    ):
         self.proxy_url = proxy_url
         self.db_name = db_name
         self.driver_id = driver_id
-        response = requests.post(
-            f"{self.proxy_url}/session/init",
-            json={"database": self.db_name, "id": self.driver_id},
+        self.client = client if client is not None else ProxyClient(proxy_url, 1)
+        response = self.client.post(
+            "/session/init", {"database": self.db_name, "id": self.driver_id}
         )
-        response.raise_for_status()
+        self.session_id = response.get("session_id")
 
-    def run(self, query: str, parameters: Optional[Dict] = None) -> List[Dict]:
+    def run(
+        self, query: str, parameters: Optional[Dict] = None, read_only: bool = False
+    ) -> List[Dict]:
+        # read-only queries may be answered from the proxy's result cache
         payload = {
-            "id": self.driver_id,
+            "session_id": self.session_id,
             "query": query,
             "parameters": parameters or {},
         }
-        response = requests.post(f"{self.proxy_url}/session/run", json=payload)
-        response.raise_for_status()
-        return response.json().get("results", [])
+        if read_only:
+            payload["read_only"] = True
+        return self.client.post("/session/run", payload).get("results", [])
+
+    def stream(self, query: str, parameters: Optional[Dict] = None) -> Iterator[List]:
+        # records are yielded while the proxy fetches them; the session cannot run other
+        # queries until the iteration finishes or is abandoned
+        payload = {
+            "session_id": self.session_id,
+            "query": query,
+            "parameters": parameters or {},
+        }
+        yield from self.client.stream("/session/stream", payload)
 
-    def begin_transaction(self):
-        return ProxyTransaction(self.driver_id, self.proxy_url)
+    def run_batch(
+        self, queries: List[Tuple[str, Optional[Dict]]], transaction: bool = False
+    ) -> List[List[Dict]]:
+        # run all queries in one request, in a single transaction if requested
+        payload = {
+            "session_id": self.session_id,
+            "queries": _batch_queries(queries),
+            "transaction": transaction,
+        }
+        return self.client.post("/batch", payload).get("results", [])
 
-    def close(self):
-        response = requests.get(
-            f"{self.proxy_url}/session/close", params={"id": self.driver_id}
+    def begin_transaction(self, lazy: bool = False):
+        return ProxyTransaction(
+            self.driver_id,
+            self.proxy_url,
+            self.session_id,
+            client=self.client,
+            lazy=lazy,
         )
-        response.raise_for_status()
+
+    def close(self):
+        self.client.get("/session/close", {"session_id": self.session_id})
 
 
 class ProxyTransaction:
-    def __init__(self, driver_id: int, proxy_url: str):
+    # A lazy transaction is only opened on the server when a query needs its results.
+    # Queued queries are sent together with the next query or the commit, so a
+    # transaction of queued writes costs a single request.
+    def __init__(
+        self,
+        driver_id: int,
+        proxy_url: str,
+        session_id: str,
+        client: Optional[ProxyClient] = None,
+        lazy: bool = False,
+    ):
         self.proxy_url = proxy_url
-        response = requests.get(
-            f"{self.proxy_url}/transaction/init", params={"id": driver_id}
-        )
+        self.client = client if client is not None else ProxyClient(proxy_url, 1)
         self.driver_id = driver_id
-        response.raise_for_status()
+        self.session_id = session_id
+        self.tx_id = None
+        self.pending: List[Tuple[str, Optional[Dict]]] = []
+        if not lazy:
+            self._begin()
+
+    def _begin(self):
+        response = self.client.get(
+            "/transaction/init", {"session_id": self.session_id}
+        )
+        self.tx_id = response.get("tx_id")
+
+    def _flush(self, commit: bool = False) -> List[List[Dict]]:
+        if self.tx_id is None:
+            self._begin()
+        payload = {
+            "tx_id": self.tx_id,
+            "queries": _batch_queries(self.pending),
+            "commit": commit,
+        }
+        self.pending = []
+        return self.client.post("/batch", payload).get("results", [])
+
+    def queue(self, query: str, parameters: Optional[Dict] = None) -> None:
+        self.pending.append((query, parameters))
 
     def run(self, query: str, parameters: Optional[Dict] = None) -> List[Dict]:
-        payload = {"id": self.driver_id, "query": query, "parameters": parameters or {}}
-        response = requests.post(f"{self.proxy_url}/transaction/run", json=payload)
-        response.raise_for_status()
-        return response.json().get("results", [])
+        if self.pending or self.tx_id is None:
+            self.queue(query, parameters)
+            return self._flush()[-1]
+        payload = {"tx_id": self.tx_id, "query": query, "parameters": parameters or {}}
+        return self.client.post("/transaction/run", payload).get("results", [])
 
     def commit(self):
-        response = requests.get(
-            f"{self.proxy_url}/transaction/commit", params={"id": self.driver_id}
-        )
-        response.raise_for_status()
+        if self.tx_id is None:
+            # nothing ran yet, run the queued queries in a transaction of their own
+            if not self.pending:
+                return
+            payload = {
+                "session_id": self.session_id,
+                "queries": _batch_queries(self.pending),
+                "transaction": True,
+            }
+            self.pending = []
+            self.client.post("/batch", payload)
+            return
+        if self.pending:
+            # the server closes the transaction after committing it
+            self._flush(commit=True)
+            self.tx_id = None
+            return
+        self.client.get("/transaction/commit", {"tx_id": self.tx_id})
 
     def close(self):
-        response = requests.get(
-            f"{self.proxy_url}/transaction/close", params={"id": self.driver_id}
-        )
-        response.raise_for_status()
+        self.pending = []
+        if self.tx_id is None:
+            return
+        self.client.get("/transaction/close", {"tx_id": self.tx_id})
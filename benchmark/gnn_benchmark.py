@@ -12,7 +12,10 @@ from torch_geometric.data import Data, Dataset, DataLoader
 
 from rdkit.Chem.rdchem import BondType
 
+from HOGDB.db.db import Database
 from HOGDB.db.neo4j import Neo4jDatabase
+from HOGDB.db.in_memory import InMemoryDatabase
+from HOGDB.db.aggregation import Aggregate
 from HOGDB.db.label import Label
 from HOGDB.db.schema import Schema
 from HOGDB.graph.graph_with_subgraph_storage import GraphwithSubgraphStorage
@@ -76,13 +79,52 @@ parser.add_argument(
 parser.add_argument(
     "--csv_url", type=str, default="", help="Base URL for online CSV directory."
 )
+parser.add_argument(
+    "--import_dir",
+    type=str,
+    default=".",
+    help="Directory containing CSV files for import with the memory backend.",
+)
+parser.add_argument(
+    "--backend",
+    type=str,
+    default="neo4j",
+    choices=["neo4j", "memory"],
+    help="Database backend: 'neo4j' or the in-process 'memory' database.",
+)
 args = parser.parse_args()
 print(args)
 
+# the in-memory database is shared by all connections of a process; worker processes
+# forked after the import work on their own copy of the imported graph
+memory_db = InMemoryDatabase() if args.backend == "memory" else None
+
+
+def connect() -> Database:
+    """
+    Connect to the database selected with --backend.
+
+    @return: Database instance.
+    """
+    if memory_db is not None:
+        return memory_db
+    return Neo4jDatabase(**db_params)
+
+
+def csv_prefix() -> str:
+    """
+    Prefix of the imported CSV files. Neo4j reads them from its import directory, the
+    in-memory database from the local import directory.
+
+    @return: Path prefix.
+    """
+    return f"{args.import_dir}/" if args.backend == "memory" else ""
+
+
 bonds = [BondType.SINGLE, BondType.DOUBLE, BondType.TRIPLE, BondType.AROMATIC]
 
 
-db = Neo4jDatabase(**db_params)
+db = connect()
 gs = GraphwithSubgraphStorage(db)
 gs.clear_graph()
 gs.close_connection()
@@ -100,14 +142,14 @@ val_data = ZINC(root=args.root, subset=True, split="val", pre_transform=transfor
 test_data = ZINC(root=args.root, subset=True, split="test", pre_transform=transform)
 test_y = test_data[0:N].y
 
-db = Neo4jDatabase(**db_params)
+db = connect()
 session = db.start_session()
 start = time.perf_counter()
 db.create_index(session, Label("Atom"), ["graph_id", "atom_id"])
 db.create_index(session, Label("Bond"), ["graph_id", "bond_id"])
 db.create_index(session, Label("Clique"), ["graph_id", "clique_id"])
 db.create_index(session, Label("TreeEdge"), ["graph_id", "tree_edge_id"])
-pref = f"{args.csv_url}/" if args.online else ""
+pref = f"{args.csv_url}/" if args.online else csv_prefix()
 db.import_nodes_from_csv(
     session,
     f"{pref}zinc_atoms.csv",
@@ -190,67 +232,94 @@ def query_data(gs: GraphwithSubgraphStorage) -> Data:
     # x
     path_x = Path()
     path_x.add(Node([Label("Atom")]), "a")
-    data = JunctionTreeData()
-    df = gs.traverse_path(
-        [path_x], return_values=["a.atom_features"], sort=["a.graph_id", "a.atom_id"]
-    )
-    data.x = torch.tensor(df["a.atom_features"].tolist()).unsqueeze(1)
 
     # edge_index, edge_attr
     path_ei = Path()
     path_ei.add(Node([Label("Atom")]), "st")
     path_ei.add(Edge(label=Label("Bond")), "e")
     path_ei.add(Node([Label("Atom")]), "en")
-    df = gs.traverse_path(
-        [path_ei],
-        return_values=["st.atom_id", "en.atom_id", "e.bond_features"],
-        sort=["st.graph_id", "st.atom_id", "en.atom_id"],
-    )
-    data.edge_index = torch.tensor(df[["st.atom_id", "en.atom_id"]].T.values)
-    data.edge_attr = torch.tensor(df["e.bond_features"].tolist())
 
     # tree_edge_index
     path_te = Path()
     path_te.add(Subgraph(labels=[Label("Clique")]), "st")
     path_te.add(SubgraphEdge(label=Label("TreeEdge")), "e")
     path_te.add(Subgraph(labels=[Label("Clique")]), "en")
-    df = gs.traverse_path(
-        [path_te],
-        return_values=["st.clique_id", "en.clique_id"],
-        sort=["st.graph_id", "st.clique_id", "en.clique_id"],
-    )
-    data.tree_edge_index = torch.tensor(df[["st.clique_id", "en.clique_id"]].T.values)
-
-    # x_clique
-    path_x_clique = Path()
-    path_x_clique.add(Subgraph(labels=[Label("Clique")]), "c")
-    df = gs.traverse_path(
-        [path_x_clique],
-        return_values=["c.clique_features"],
-        sort=["c.graph_id", "c.clique_id"],
-    )
-    data.x_clique = torch.tensor(df["c.clique_features"].tolist())
-
-    # num_cliques
-    path_num_cliques = Path()
-    path_num_cliques.add(Subgraph(labels=[Label("Clique")]), "c")
-    df = gs.traverse_path(
-        [path_num_cliques],
-        return_values=["c.graph_id", "count(c)"],
-        sort=["c.graph_id"],
-    )
-    data.num_cliques = torch.tensor(df["count(c)"].tolist())
+
+    # x_clique, num_cliques
+    path_c = Path()
+    path_c.add(Subgraph(labels=[Label("Clique")]), "c")
 
     # atom2clique_index
     path_ac = Path()
     path_ac.add(Node([Label("Atom")]), "a")
     path_ac.add(Subgraph(labels=[Label("Clique")]), "c")
-    df = gs.traverse_path(
-        [path_ac],
-        return_values=["a.atom_id", "c.clique_id"],
-        sort=["a.graph_id", "a.atom_id", "c.clique_id"],
+
+    # the traversals are independent and run concurrently
+    out = gs.traverse_many(
+        {
+            "x": (
+                [path_x],
+                {
+                    "return_values": ["a.atom_features"],
+                    "sort": ["a.graph_id", "a.atom_id"],
+                    "output": "torch",
+                },
+            ),
+            "edge_index": (
+                [path_ei],
+                {
+                    "return_values": ["st.atom_id", "en.atom_id", "e.bond_features"],
+                    "sort": ["st.graph_id", "st.atom_id", "en.atom_id"],
+                    "output": "torch",
+                },
+            ),
+            "tree_edge_index": (
+                [path_te],
+                {
+                    "return_values": ["st.clique_id", "en.clique_id"],
+                    "sort": ["st.graph_id", "st.clique_id", "en.clique_id"],
+                    "output": "torch",
+                },
+            ),
+            "x_clique": (
+                [path_c],
+                {
+                    "return_values": ["c.clique_features"],
+                    "sort": ["c.graph_id", "c.clique_id"],
+                    "output": "torch",
+                },
+            ),
+            "num_cliques": (
+                [path_c],
+                {
+                    "group_by": ["c.graph_id"],
+                    "aggregates": [Aggregate.count("c", alias="num_cliques")],
+                    "sort": ["c.graph_id"],
+                    "output": "torch",
+                },
+            ),
+            "atom2clique_index": (
+                [path_ac],
+                {
+                    "return_values": ["a.atom_id", "c.clique_id"],
+                    "sort": ["a.graph_id", "a.atom_id", "c.clique_id"],
+                    "output": "torch",
+                },
+            ),
+        }
     )
-    data.atom2clique_index = torch.tensor(df[["a.atom_id", "c.clique_id"]].T.values)
+
+    data = JunctionTreeData()
+    data.x = out["x"]["a.atom_features"].unsqueeze(1)
+    ei = out["edge_index"]
+    data.edge_index = torch.stack((ei["st.atom_id"], ei["en.atom_id"]))
+    data.edge_attr = ei["e.bond_features"]
+    te = out["tree_edge_index"]
+    data.tree_edge_index = torch.stack((te["st.clique_id"], te["en.clique_id"]))
+    data.x_clique = out["x_clique"]["c.clique_features"]
+    data.num_cliques = out["num_cliques"]["num_cliques"]
+    ac = out["atom2clique_index"]
+    data.atom2clique_index = torch.stack((ac["a.atom_id"], ac["c.clique_id"]))
     return data
 
 
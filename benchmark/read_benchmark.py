@@ -11,6 +11,7 @@ from HOGDB.graph.graph_with_subgraph_storage import GraphwithSubgraphStorage
 from HOGDB.graph.hypergraph_storage import HyperGraphStorage
 from HOGDB.db.db import Database
 from HOGDB.db.neo4j import Neo4jDatabase
+from HOGDB.db.in_memory import InMemoryDatabase
 from HOGDB.db.label import Label
 from HOGDB.db.schema import Schema
 from HOGDB.db.property import Property
@@ -51,6 +52,13 @@ parser.add_argument(
 parser.add_argument(
     "--csv_url", type=str, default="", help="Base URL for online CSV directory."
 )
+parser.add_argument(
+    "--backend",
+    type=str,
+    default="neo4j",
+    choices=["neo4j", "memory"],
+    help="Database backend: 'neo4j' or the in-process 'memory' database.",
+)
 args = parser.parse_args()
 
 db_params = {
@@ -59,6 +67,32 @@ db_params = {
     "db_password": "password",
 }
 
+# the in-memory database is shared by all connections of a process; worker processes
+# forked after the import work on their own copy of the imported graph
+memory_db = InMemoryDatabase() if args.backend == "memory" else None
+
+
+def connect() -> Database:
+    """
+    Connect to the database selected with --backend.
+
+    @return: Database instance.
+    """
+    if memory_db is not None:
+        return memory_db
+    return Neo4jDatabase(**db_params)
+
+
+def csv_prefix() -> str:
+    """
+    Prefix of the imported CSV files. Neo4j reads them from its import directory, the
+    in-memory database from the local import directory.
+
+    @return: Path prefix.
+    """
+    return f"{args.import_dir}/" if args.backend == "memory" else ""
+
+
 nodes, edges, subgraphs, subgraph_edges = {}, {}, {}, {}
 
 import_times = []
@@ -146,7 +180,7 @@ def get_subgraphs(db: Database) -> None:
 
     start = time.perf_counter()
 
-    pref = f"{args.csv_url}/" if args.online else ""
+    pref = f"{args.csv_url}/" if args.online else csv_prefix()
     db.import_nodes_from_csv(
         session,
         f"{pref}zinc_atoms.csv",
@@ -247,7 +281,7 @@ def get_hypergraphs(db: Database) -> None:
         db.create_index(session, Label(label), ["id"])
 
     start = time.perf_counter()
-    pref = f"{args.csv_url}/" if args.online else ""
+    pref = f"{args.csv_url}/" if args.online else csv_prefix()
     db.import_nodes_from_csv(
         session,
         f"{pref}/mag10_nodes.csv",
@@ -333,7 +367,7 @@ def run_read_node_query_with_checks(i: int, queries: List[Tuple[int, int]]) -> N
     @param queries: List of atom IDs and graph IDs.
     """
     global read_times
-    db = Neo4jDatabase(**db_params)
+    db = connect()
     gs = GraphwithSubgraphStorage(db)
     for atom_id, graph_id in queries:
         start = time.perf_counter()
@@ -365,7 +399,7 @@ def run_read_edge_query_with_checks(
     @param queries: List of atom IDs (origin and target) and graph IDs.
     """
     global read_times
-    db = Neo4jDatabase(**db_params)
+    db = connect()
     gs = GraphwithSubgraphStorage(db)
     for start_atom, end_atom, graph_id in queries:
         start = time.perf_counter()
@@ -405,7 +439,7 @@ def run_read_subgraph_query_with_checks(i: int, queries: List[Tuple[int, int]])
     @param queries: List of subgraph collection IDs and graph IDs.
     """
     global read_times
-    db = Neo4jDatabase(**db_params)
+    db = connect()
     gs = GraphwithSubgraphStorage(db)
     for clique_id, graph_id in queries:
         start = time.perf_counter()
@@ -437,7 +471,7 @@ def run_read_subgraph_edge_query_with_checks(
     @param queries: List of subgraph collection IDs (origin and target) and graph IDs.
     """
     global read_times
-    db = Neo4jDatabase(**db_params)
+    db = connect()
     gs = GraphwithSubgraphStorage(db)
     for start_clique, end_clique, graph_id in queries:
         start = time.perf_counter()
@@ -480,7 +514,7 @@ def run_read_node_query_hypergraph_with_checks(i: int, queries: List[int]) -> No
     @param queries: List of node IDs.
     """
     global read_times
-    db = Neo4jDatabase(**db_params)
+    db = connect()
     gs = HyperGraphStorage(db)
     for person_id in queries:
         start = time.perf_counter()
@@ -497,7 +531,7 @@ def run_read_node_query_hypergraph(queries: List[int]) -> None:
 
     @param queries: List of node IDs.
     """
-    db = Neo4jDatabase(**db_params)
+    db = connect()
     gs = HyperGraphStorage(db)
     for person_id in queries:
         node = gs.get_node(Node([Label("Person")], [Property("id", int, person_id)]))
@@ -516,7 +550,7 @@ def run_read_edge_query_hypergraph_with_checks(
     @param queries: List of labels and hyperedge IDs.
     """
     global read_times
-    db = Neo4jDatabase(**db_params)
+    db = connect()
     gs = HyperGraphStorage(db)
     for label, id in queries:
         start = time.perf_counter()
@@ -533,7 +567,7 @@ def run_read_edge_query_hypergraph(queries: List[Tuple[str, int]]) -> None:
 
     @param queries: List of labels and hyperedge IDs.
     """
-    db = Neo4jDatabase(**db_params)
+    db = connect()
     gs = HyperGraphStorage(db)
     for label, id in queries:
         edge = gs.get_hyperedge(HyperEdge([], Label(label), [Property("id", int, id)]))
@@ -611,7 +645,7 @@ def run_read_node_query(queries: List[Tuple[int, int]]) -> None:
 
     @param queries: List of atom IDs and graph IDs.
     """
-    db = Neo4jDatabase(**db_params)
+    db = connect()
     gs = GraphwithSubgraphStorage(db)
     for atom_id, graph_id in queries:
         node = gs.get_node(
@@ -632,7 +666,7 @@ def run_read_edge_query(queries: List[Tuple[int, int, int]]) -> None:
 
     @param queries: List of atom IDs (origin and target) and graph IDs.
     """
-    db = Neo4jDatabase(**db_params)
+    db = connect()
     gs = GraphwithSubgraphStorage(db)
     for start_atom, end_atom, graph_id in queries:
         edge = gs.get_edge(
@@ -664,7 +698,7 @@ def run_read_subgraph_query(queries: List[Tuple[int, int]]) -> None:
 
     @param queries: List of subgraph collection IDs and graph IDs.
     """
-    db = Neo4jDatabase(**db_params)
+    db = connect()
     gs = GraphwithSubgraphStorage(db)
     for clique_id, graph_id in queries:
         sg = gs.get_subgraph(
@@ -685,7 +719,7 @@ def run_read_subgraph_edge_query(queries: List[Tuple[int, int, int]]) -> None:
 
     @param queries: List of subgraph collection IDs (origin and target) and graph IDs.
     """
-    db = Neo4jDatabase(**db_params)
+    db = connect()
     gs = GraphwithSubgraphStorage(db)
     for start_clique, end_clique, graph_id in queries:
         sg_edge = gs.get_subgraph_edge(
@@ -715,11 +749,11 @@ if __name__ == "__main__":
     global read_times
     results = {}
     if args.subgraph:
-        db = Neo4jDatabase(**db_params)
+        db = connect()
         gs = GraphwithSubgraphStorage(db)
         gs.clear_graph()
         gs.close_connection()
-        db = Neo4jDatabase(**db_params)
+        db = connect()
         get_subgraphs(db)
 
         num_queries = 64 if args.mode == "debug" else 4096
@@ -825,11 +859,11 @@ if __name__ == "__main__":
         print(results)
 
     elif args.hypergraph:
-        db = Neo4jDatabase(**db_params)
+        db = connect()
         gs = HyperGraphStorage(db)
         gs.clear_graph()
         gs.close_connection()
-        db = Neo4jDatabase(**db_params)
+        db = connect()
         get_hypergraphs(db)
 
         num_queries = 64 if args.mode == "debug" else 4096
@@ -9,6 +9,7 @@
 from HOGDB.graph.graph_with_subgraph_storage import GraphwithSubgraphStorage
 from HOGDB.db.db import Database
 from HOGDB.db.neo4j import Neo4jDatabase
+from HOGDB.db.in_memory import InMemoryDatabase
 from HOGDB.db.label import Label
 from HOGDB.db.schema import Schema
 from HOGDB.db.property import Property
@@ -44,6 +45,13 @@ parser.add_argument(
 parser.add_argument(
     "--csv_url", type=str, default="", help="Base URL for online CSV directory."
 )
+parser.add_argument(
+    "--backend",
+    type=str,
+    default="neo4j",
+    choices=["neo4j", "memory"],
+    help="Database backend: 'neo4j' or the in-process 'memory' database.",
+)
 args = parser.parse_args()
 
 db_params = {
@@ -52,6 +60,32 @@ db_params = {
     "db_password": "password",
 }
 
+# the in-memory database is shared by all connections of a process; worker processes
+# forked after the import work on their own copy of the imported graph
+memory_db = InMemoryDatabase() if args.backend == "memory" else None
+
+
+def connect() -> Database:
+    """
+    Connect to the database selected with --backend.
+
+    @return: Database instance.
+    """
+    if memory_db is not None:
+        return memory_db
+    return Neo4jDatabase(**db_params)
+
+
+def csv_prefix() -> str:
+    """
+    Prefix of the imported CSV files. Neo4j reads them from its import directory, the
+    in-memory database from the local import directory.
+
+    @return: Path prefix.
+    """
+    return f"{args.import_dir}/" if args.backend == "memory" else ""
+
+
 nodes, edges, subgraphs, subgraph_edges = {}, {}, {}, {}
 
 
@@ -110,7 +144,7 @@ def get_subgraphs(db: Database, N: int) -> None:
     db.create_index(session, Label("Clique"), ["clique_id", "graph_id"])
     db.create_index(session, Label("TreeEdge"), ["tree_edge_id", "graph_id"])
 
-    prefix = ""
+    prefix = csv_prefix()
     db.import_nodes_from_csv(
         session,
         f"{prefix}zinc_atoms_{N}.csv",
@@ -186,7 +220,7 @@ def clear_graph() -> None:
     """
     Remove all graphs and their elements from the graph database.
     """
-    db = Neo4jDatabase(**db_params)
+    db = connect()
     gs = GraphwithSubgraphStorage(db)
     gs.clear_graph()
     gs.close_connection()
@@ -263,7 +297,7 @@ def run_read_node_query(queries: List[Tuple[int, int]]) -> None:
 
     @param queries: List of atom IDs and graph IDs.
     """
-    db = Neo4jDatabase(**db_params)
+    db = connect()
     gs = GraphwithSubgraphStorage(db)
     for atom_id, graph_id in queries:
         node = gs.get_node(
@@ -284,7 +318,7 @@ def run_read_edge_query(queries: List[Tuple[int, int, int]]) -> None:
 
     @param queries: List of atom IDs (origin and target) and graph IDs.
     """
-    db = Neo4jDatabase(**db_params)
+    db = connect()
     gs = GraphwithSubgraphStorage(db)
     for start_atom, end_atom, graph_id in queries:
         edge = gs.get_edge(
@@ -316,7 +350,7 @@ def run_read_subgraph_query(queries: List[Tuple[int, int]]) -> None:
 
     @param queries: List of subgraph collection IDs and graph IDs.
     """
-    db = Neo4jDatabase(**db_params)
+    db = connect()
     gs = GraphwithSubgraphStorage(db)
     for clique_id, graph_id in queries:
         sg = gs.get_subgraph(
@@ -337,7 +371,7 @@ def run_read_subgraph_edge_query(queries: List[Tuple[int, int, int]]) -> None:
 
     @param queries: List of subgraph collection IDs (origin and target) and graph IDs.
     """
-    db = Neo4jDatabase(**db_params)
+    db = connect()
     gs = GraphwithSubgraphStorage(db)
     for start_clique, end_clique, graph_id in queries:
         sg_edge = gs.get_subgraph_edge(
@@ -370,11 +404,11 @@ if __name__ == "__main__":
 
     for N in [20, 40, 80, 160, 320]:
         print(f"Processing dataset with N={N}...")
-        db = Neo4jDatabase(**db_params)
+        db = connect()
         gs = GraphwithSubgraphStorage(db)
         gs.clear_graph()
         gs.close_connection()
-        db = Neo4jDatabase(**db_params)
+        db = connect()
         get_subgraphs(db, N)
         read_subgraph_csvs(N)
 
@@ -12,6 +12,7 @@ from HOGDB.graph.hypergraph_storage import HyperGraphStorage
 from HOGDB.graph.graph_with_tuple_storage import GraphwithTupleStorage
 from HOGDB.db.db import Database
 from HOGDB.db.neo4j import Neo4jDatabase
+from HOGDB.db.in_memory import InMemoryDatabase
 from HOGDB.db.label import Label
 from HOGDB.db.schema import Schema
 from HOGDB.db.property import Property
@@ -57,6 +58,13 @@ parser.add_argument(
 parser.add_argument(
     "--csv_url", type=str, default="", help="Base URL for online CSV files."
 )
+parser.add_argument(
+    "--backend",
+    type=str,
+    default="neo4j",
+    choices=["neo4j", "memory"],
+    help="Database backend: 'neo4j' or the in-process 'memory' database.",
+)
 args = parser.parse_args()
 
 db_params = {
@@ -65,6 +73,32 @@ db_params = {
     "db_password": "password",
 }
 
+# the in-memory database is shared by all connections of a process; worker processes
+# forked after the import work on their own copy of the imported graph
+memory_db = InMemoryDatabase() if args.backend == "memory" else None
+
+
+def connect() -> Database:
+    """
+    Connect to the database selected with --backend.
+
+    @return: Database instance.
+    """
+    if memory_db is not None:
+        return memory_db
+    return Neo4jDatabase(**db_params)
+
+
+def csv_prefix() -> str:
+    """
+    Prefix of the imported CSV files. Neo4j reads them from its import directory, the
+    in-memory database from the local import directory.
+
+    @return: Path prefix.
+    """
+    return f"{args.import_dir}/" if args.backend == "memory" else ""
+
+
 import_times = []
 nodes_count = 20000
 nodes, edges, tuples, hedges = {}, {}, {}, {}
@@ -141,7 +175,7 @@ def get_tuples(db: Database) -> None:
     db.create_index(session, Label("Tuple"), ["id"])
 
     start = time.perf_counter()
-    pref = f"{args.csv_url}/" if args.online else ""
+    pref = f"{args.csv_url}/" if args.online else csv_prefix()
     db.import_nodes_from_csv(
         session,
         f"{pref}rgt_nodes.csv",
@@ -203,7 +237,7 @@ def get_hypergraphs(db: Database) -> None:
     db.create_index(session, Label("Node"), ["id"])
     db.create_index(session, Label("Hyperedge"), ["id"])
     start = time.perf_counter()
-    pref = f"{args.csv_url}/" if args.online else ""
+    pref = f"{args.csv_url}/" if args.online else csv_prefix()
     db.import_nodes_from_csv(
         session,
         f"{pref}rhg_nodes.csv",
@@ -361,7 +395,7 @@ def run_tuple_queries(queries: List[Tuple[int, any]]) -> None:
 
     @param queries: Queries to be run.
     """
-    db = Neo4jDatabase(**db_params)
+    db = connect()
     gs = GraphwithTupleStorage(db)
     query_map = {
         1: gs.get_node,
@@ -468,7 +502,7 @@ def run_hypergraph_queries(queries: List[Tuple[int, any]]) -> None:
 
     @param queries: Queries to be run.
     """
-    db = Neo4jDatabase(**db_params)
+    db = connect()
     gs = HyperGraphStorage(db)
     query_map = {
         1: gs.get_node,
@@ -523,7 +557,7 @@ if __name__ == "__main__":
                     "write-heavy": [1024, 1024, 1024, 7680, 1536],
                 }
             ]
-        db = Neo4jDatabase(**db_params)
+        db = connect()
         gs = GraphwithTupleStorage(db)
         read_tuple_csvs()
         for scale, splits in enumerate(splits_list):
@@ -539,11 +573,11 @@ if __name__ == "__main__":
             for num_processes in num_processes_list:
                 print(f"Running with {num_processes} processes...")
                 process_split = len(qs) // num_processes
-                db = Neo4jDatabase(**db_params)
+                db = connect()
                 gs = GraphwithTupleStorage(db)
                 gs.clear_graph()
                 gs.close_connection()
-                db = Neo4jDatabase(**db_params)
+                db = connect()
                 get_tuples(db)
 
                 processes = []
@@ -590,11 +624,11 @@ if __name__ == "__main__":
 
         num_processes_list = [2] if args.mode == "debug" else [8, 16, 32, 64, 128]
         for num_processes in num_processes_list:
-            db = Neo4jDatabase(**db_params)
+            db = connect()
             hs = HyperGraphStorage(db)
             hs.clear_graph()
             hs.close_connection()
-            db = Neo4jDatabase(**db_params)
+            db = connect()
             get_hypergraphs(db)
             print(f"Running with {num_processes} processes...")
             process_split = len(qs) // num_processes
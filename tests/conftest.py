@@ -0,0 +1,129 @@
+# Copyright (c) 2025 ETH Zurich.
+#                    All rights reserved.
+#
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# The tests run the storage classes against the in-process backends, so they need no
+# Neo4j server. Every test using the db fixture runs once per backend. The proxy tests
+# run the proxy servers on a fake neo4j driver, and connect the proxy client to the Flask
+# server in process.
+
+from pathlib import Path
+from urllib.parse import urlsplit
+import importlib.util
+import io
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.response import HTTPResponse
+
+from HOGDB.proxy import proxy
+
+from HOGDB.db.in_memory import InMemoryDatabase
+from HOGDB.db.sqlite import SQLiteDatabase
+
+BACKENDS = ["memory", "sqlite"]
+
+
+def open_database(backend: str, tmp_path):
+    """
+    Open an empty database of the given backend.
+
+    @param backend: 'memory' or 'sqlite'.
+    @param tmp_path: Directory for the database file.
+    @return: Database instance.
+    """
+    if backend == "memory":
+        return InMemoryDatabase()
+    return SQLiteDatabase(str(tmp_path / "hogdb.sqlite"))
+
+
+@pytest.fixture(params=BACKENDS)
+def db(request, tmp_path):
+    database = open_database(request.param, tmp_path)
+    yield database
+    database.close_driver()
+
+
+@pytest.fixture
+def backends(tmp_path):
+    # one database of every backend, for tests comparing their results
+    databases = []
+    for backend in BACKENDS:
+        (tmp_path / backend).mkdir()
+        databases.append(open_database(backend, tmp_path / backend))
+    yield databases
+    for database in databases:
+        database.close_driver()
+
+
+def load_proxy_server(monkeypatch, graph, **settings):
+    """
+    Load a fresh instance of the Flask proxy server module, whose drivers are created by
+    a fake GraphDatabase.
+
+    @param monkeypatch: Pytest monkeypatch fixture.
+    @param graph: fake_neo4j.FakeGraphDatabase the server creates its drivers with.
+    @param settings: Module globals to override, for example cache.
+    @return: Server module.
+    """
+    path = Path(__file__).parent.parent / "HOGDB" / "proxy" / "neo4j-server.py"
+    spec = importlib.util.spec_from_file_location("neo4j_server", path)
+    server = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(server)
+    monkeypatch.setattr(server, "GraphDatabase", graph)
+    for name, value in settings.items():
+        monkeypatch.setattr(server, name, value)
+    return server
+
+
+class ProxyTransport(HTTPAdapter):
+    """
+    Transport adapter sending the requests of the proxy client to the Flask proxy server
+    through its test client. The method and path of every request are appended to requests.
+    """
+
+    def __init__(self, server) -> None:
+        super().__init__()
+        self.client = server.app.test_client()
+        self.requests = []
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        url = urlsplit(request.url)
+        self.requests.append((request.method, url.path))
+        response = self.client.open(
+            url.path,
+            method=request.method,
+            query_string=url.query,
+            headers=dict(request.headers),
+            data=request.body,
+        )
+        raw = HTTPResponse(
+            body=io.BytesIO(response.get_data()),
+            headers=dict(response.headers),
+            status=response.status_code,
+            preload_content=False,
+            decode_content=False,
+        )
+        return self.build_response(request, raw)
+
+
+def connect_proxy(monkeypatch, server) -> ProxyTransport:
+    """
+    Route the requests of every proxy client created afterwards to a Flask proxy server.
+
+    @param monkeypatch: Pytest monkeypatch fixture.
+    @param server: Server module returned by load_proxy_server.
+    @return: Transport recording the requests.
+    """
+    transport = ProxyTransport(server)
+
+    def http_session(pool_size):
+        http = requests.Session()
+        http.mount("http://", transport)
+        return http
+
+    monkeypatch.setattr(proxy, "_http_session", http_session)
+    return transport
@@ -0,0 +1,206 @@
+# Copyright (c) 2025 ETH Zurich.
+#                    All rights reserved.
+#
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+# Stand-in for the neo4j driver, used to test the proxy servers without a Neo4j server.
+# It understands three kinds of queries:
+#   CREATE ...  stores the parameters as a row (in a transaction, visible after commit)
+#   COUNT ...   returns [{"count": number of visible rows}]
+#   FAIL ...    raises FakeError
+# Any other query returns the records {"user": ..., "row": i} for i < parameters["rows"]
+# (1 by default). Every query run is appended to the log of its GraphDatabase. The summary
+# of a query prefixed with PROFILE or EXPLAIN holds the plan of FakeGraphDatabase.plan.
+# FakeAsyncGraphDatabase replaces neo4j.AsyncGraphDatabase with the same semantics.
+
+import threading
+
+
+class FakeError(Exception):
+    pass
+
+
+class FakeGraphDatabase:
+    """
+    Replacement of neo4j.GraphDatabase. The drivers of a URI share its stores; passwords
+    maps users to the password their drivers must use.
+    """
+
+    def __init__(self, passwords=None) -> None:
+        self.passwords = passwords or {}
+        self.stores = {}
+        self.drivers = []
+        self.log = []
+        self.lock = threading.Lock()
+        self.plan = {"operatorType": "ProduceResults", "children": []}
+
+    def driver(self, uri, auth, **options):
+        user, password = auth
+        if user in self.passwords and self.passwords[user] != password:
+            raise FakeError("The client is unauthorized due to authentication failure.")
+        driver = FakeDriver(self, uri, user)
+        self.drivers.append(driver)
+        return driver
+
+    def execute(self, user, query, parameters, rows):
+        # run a query against a list of visible rows, which is extended by CREATE
+        with self.lock:
+            self.log.append((user, query))
+        parameters = parameters or {}
+        if query.startswith("FAIL"):
+            raise FakeError(query)
+        if query.startswith("CREATE"):
+            rows.append(parameters)
+            return []
+        if query.startswith("COUNT"):
+            return [{"count": len(rows)}]
+        return [{"user": user, "row": i} for i in range(parameters.get("rows", 1))]
+
+
+class FakeResult:
+    def __init__(self, graph, query, records) -> None:
+        self.graph = graph
+        self.query = query
+        self.records = records
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def consume(self):
+        return FakeSummary(self.graph.plan, self.query.split(" ", 1)[0])
+
+
+class FakeSummary:
+    def __init__(self, plan, mode) -> None:
+        self.profile = plan if mode == "PROFILE" else None
+        self.plan = plan if mode in ("PROFILE", "EXPLAIN") else None
+        self.result_available_after = 1
+        self.result_consumed_after = 2
+
+
+class FakeDriver:
+    def __init__(self, graph, uri, user) -> None:
+        self.graph = graph
+        self.uri = uri
+        self.user = user
+        self.closed = False
+        self.sessions = []
+
+    def verify_connectivity(self) -> None:
+        pass
+
+    def session(self, database="neo4j", **options):
+        session = FakeSession(self, database)
+        self.sessions.append(session)
+        return session
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeSession:
+    def __init__(self, driver, database) -> None:
+        self.driver = driver
+        self.rows = driver.graph.stores.setdefault((driver.uri, database), [])
+        self.closed = False
+
+    def run(self, query, parameters=None):
+        graph = self.driver.graph
+        return FakeResult(
+            graph, query, graph.execute(self.driver.user, query, parameters, self.rows)
+        )
+
+    def begin_transaction(self):
+        return FakeTransaction(self)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeTransaction:
+    def __init__(self, session) -> None:
+        self.session = session
+        self.rows = list(session.rows)
+        self.committed = False
+        self.closed = False
+
+    def run(self, query, parameters=None):
+        graph = self.session.driver.graph
+        user = self.session.driver.user
+        return FakeResult(graph, query, graph.execute(user, query, parameters, self.rows))
+
+    def commit(self) -> None:
+        self.session.rows[:] = self.rows
+        self.committed = True
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeAsyncGraphDatabase(FakeGraphDatabase):
+    """
+    Replacement of neo4j.AsyncGraphDatabase.
+    """
+
+    def driver(self, uri, auth, **options):
+        return FakeAsyncDriver(super().driver(uri, auth))
+
+
+class FakeAsyncDriver:
+    def __init__(self, driver) -> None:
+        self.driver = driver
+
+    @property
+    def closed(self):
+        return self.driver.closed
+
+    async def verify_connectivity(self) -> None:
+        pass
+
+    def session(self, database="neo4j", **options):
+        return FakeAsyncSession(self.driver.session(database))
+
+    async def close(self) -> None:
+        self.driver.close()
+
+
+class FakeAsyncResult:
+    def __init__(self, records) -> None:
+        self.records = records
+
+    async def __aiter__(self):
+        for record in self.records:
+            yield record
+
+
+class FakeAsyncSession:
+    def __init__(self, session) -> None:
+        self.session = session
+
+    @property
+    def closed(self):
+        return self.session.closed
+
+    async def run(self, query, parameters=None):
+        return FakeAsyncResult(self.session.run(query, parameters))
+
+    async def begin_transaction(self):
+        return FakeAsyncTransaction(self.session.begin_transaction())
+
+    async def close(self) -> None:
+        self.session.close()
+
+
+class FakeAsyncTransaction:
+    def __init__(self, tx) -> None:
+        self.tx = tx
+
+    async def run(self, query, parameters=None):
+        return FakeAsyncResult(self.tx.run(query, parameters))
+
+    async def commit(self) -> None:
+        self.tx.commit()
+
+    async def close(self) -> None:
+        self.tx.close()
@@ -0,0 +1,81 @@
+# Copyright (c) 2025 ETH Zurich.
+#                    All rights reserved.
+#
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+import numpy as np
+import pytest
+
+from HOGDB.db.aggregation import Aggregate
+from HOGDB.db.label import Label
+from HOGDB.db.predicate import P
+from HOGDB.db.property import Property
+from HOGDB.graph.graph_storage import GraphStorage
+from HOGDB.graph.node import Node
+from HOGDB.graph.path import Path
+
+
+def fill(gs: GraphStorage) -> None:
+    # nodes 0..9, the odd ones with a weight
+    for i in range(10):
+        properties = [Property("i", int, i)]
+        if i % 2:
+            properties.append(Property("w", float, i / 2))
+        gs.add_node(Node([Label("T")], properties))
+
+
+def nodes() -> Path:
+    path = Path()
+    path.add(Node([Label("T")]), "a")
+    return path
+
+
+def test_cypher_representation():
+    assert repr(Aggregate.count()) == "count(*) AS `count(*)`"
+    assert repr(Aggregate.sum("a.x", distinct=True)) == "sum(DISTINCT a.x) AS `sum(a.x)`"
+    assert (
+        repr(Aggregate.percentile("a.x", 0.5, continuous=False))
+        == "percentileDisc(a.x, 0.5) AS `percentileDisc(a.x, 0.5)`"
+    )
+    assert Aggregate.min("a.x", alias="m") == Aggregate("min", "a.x", "m")
+    with pytest.raises(ValueError):
+        Aggregate("median", "a.x")
+    with pytest.raises(ValueError):
+        Aggregate.percentile("a.x", 2)
+
+
+def test_aggregates(db):
+    gs = GraphStorage(db)
+    fill(gs)
+    result = gs.traverse_path(
+        [nodes()],
+        [[P("a.i") < 10]],
+        group_by=["a.i % 2 AS parity"],
+        aggregates=[Aggregate.count("a", alias="n"), Aggregate.sum("a.i", alias="total")],
+        sort=["parity"],
+        output="numpy",
+    )
+    assert result["a.i % 2 AS parity"].tolist() == [0, 1]
+    assert result["n"].tolist() == [5, 5]
+    assert np.array_equal(result["total"], np.array([20, 25]))
+
+
+def test_aggregates_skip_missing_values(db):
+    gs = GraphStorage(db)
+    fill(gs)
+    result = gs.traverse_path(
+        [nodes()],
+        aggregates=[
+            Aggregate.count("*", alias="rows"),
+            Aggregate.count("a.w", alias="weights"),
+            Aggregate.avg("a.w", alias="avg"),
+            Aggregate.min("a.w", alias="min"),
+            Aggregate.max("a.w", alias="max"),
+            Aggregate.collect("a.i % 3", alias="residues", distinct=True),
+        ],
+    )
+    row = result.iloc[0]
+    assert (row["rows"], row["weights"]) == (10, 5)
+    assert (row["avg"], row["min"], row["max"]) == (2.5, 0.5, 4.5)
+    assert sorted(row["residues"]) == [0, 1, 2]
@@ -0,0 +1,52 @@
+# Copyright (c) 2025 ETH Zurich.
+#                    All rights reserved.
+#
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+import numpy as np
+import pytest
+
+from HOGDB.db.arrays import records_to_arrays
+
+
+def test_scalar_columns():
+    records = [(1, 0.5, True, "a"), (2, 1.5, False, "b")]
+    arrays = records_to_arrays(records, ["i", "f", "b", "s"])
+    assert arrays["i"].dtype == np.int64 and arrays["i"].tolist() == [1, 2]
+    assert arrays["f"].dtype == np.float64
+    assert arrays["b"].dtype == np.bool_
+    assert arrays["s"].dtype == object and arrays["s"].tolist() == ["a", "b"]
+
+
+def test_mixed_numbers_are_promoted():
+    arrays = records_to_arrays([(1,), (0.5,), (2.7,)], ["x"])
+    assert arrays["x"].dtype == np.float64
+    assert arrays["x"].tolist() == [1.0, 0.5, 2.7]
+    # missing values cannot be held by a numeric array
+    assert records_to_arrays([(1,), (None,)], ["x"])["x"].dtype == object
+
+
+def test_list_columns():
+    arrays = records_to_arrays([([1, 2],), ([3, 4.5],)], ["v"])
+    assert arrays["v"].shape == (2, 2)
+    assert arrays["v"].dtype == np.float64
+    assert arrays["v"][1].tolist() == [3.0, 4.5]
+    with pytest.raises(ValueError, match="different lengths"):
+        records_to_arrays([([1, 2],), ([3],)], ["v"])
+
+
+def test_requested_dtypes():
+    arrays = records_to_arrays([(1, [1, 2])], ["x", "v"], {"x": "float32", "v": np.int8})
+    assert arrays["x"].dtype == np.float32
+    assert arrays["v"].dtype == np.int8
+    assert records_to_arrays([], ["x"])["x"].shape == (0,)
+
+
+def test_torch_output():
+    torch = pytest.importorskip("torch")
+    tensors = records_to_arrays([(1, [0.5, 1.0])], ["x", "v"], output="torch")
+    assert tensors["x"].dtype == torch.int64
+    assert tensors["v"].shape == (1, 2)
+    with pytest.raises(ValueError, match="cannot be converted to a tensor"):
+        records_to_arrays([("a",)], ["s"], output="torch")
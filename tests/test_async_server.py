@@ -0,0 +1,189 @@
+# Copyright (c) 2025 ETH Zurich.
+#                    All rights reserved.
+#
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+import asyncio
+import json
+
+from HOGDB.proxy import async_server
+from HOGDB.proxy.async_server import ProxyApp
+from HOGDB.proxy.cache import ResultCache
+from fake_neo4j import FakeAsyncGraphDatabase
+
+
+class Client:
+    """
+    Sends requests straight to the ASGI application, without an ASGI server.
+    """
+
+    def __init__(self, app: ProxyApp) -> None:
+        self.app = app
+
+    async def request(self, method, path, data=None, **args):
+        body = b"" if data is None else json.dumps(data).encode()
+        scope = {
+            "type": "http",
+            "method": method,
+            "path": path,
+            "headers": [(b"content-type", b"application/json")],
+            "query_string": "&".join(f"{k}={v}" for k, v in args.items()).encode(),
+        }
+        messages = [{"type": "http.request", "body": body}]
+
+        async def receive():
+            if messages:
+                return messages.pop()
+            # the client stays connected
+            await asyncio.Event().wait()
+
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        await self.app(scope, receive, send)
+        status = sent[0]["status"]
+        return status, b"".join(message.get("body", b"") for message in sent[1:])
+
+    async def post(self, path, data):
+        status, body = await self.request("POST", path, data)
+        return status, json.loads(body)
+
+    async def get(self, path, **args):
+        status, body = await self.request("GET", path, **args)
+        return status, json.loads(body)
+
+    async def session(self, user, password="pw"):
+        status, body = await self.post(
+            "/initialize",
+            {"db_uri": "bolt://db", "db_username": user, "db_password": password},
+        )
+        assert status == 200
+        _, body = await self.post("/session/init", {"id": body["id"]})
+        return body["session_id"]
+
+
+def run(monkeypatch, test, cache=None, passwords=None):
+    graph = FakeAsyncGraphDatabase(passwords)
+    monkeypatch.setattr(async_server, "AsyncGraphDatabase", graph)
+    app = ProxyApp(cache=cache)
+
+    async def main():
+        try:
+            await test(Client(app), graph)
+        finally:
+            if app.evictor is not None:
+                app.evictor.cancel()
+            await app.registry.close()
+
+    asyncio.run(main())
+    return graph
+
+
+def test_session_and_transaction_lifecycle(monkeypatch):
+    async def test(client, graph):
+        session_id = await client.session("alice")
+        status, body = await client.post(
+            "/session/run", {"session_id": session_id, "query": "MATCH (n) RETURN n"}
+        )
+        assert (status, body["results"]) == (200, [{"user": "alice", "row": 0}])
+
+        _, body = await client.get("/transaction/init", session_id=session_id)
+        tx_id = body["tx_id"]
+        await client.post(
+            "/transaction/run", {"tx_id": tx_id, "query": "CREATE (n)", "parameters": {}}
+        )
+        count = {"session_id": session_id, "query": "COUNT"}
+        # the write is not visible outside the transaction before the commit
+        assert (await client.post("/session/run", count))[1]["results"] == [{"count": 0}]
+        assert (await client.get("/transaction/commit", tx_id=tx_id))[0] == 200
+        assert (await client.get("/transaction/close", tx_id=tx_id))[0] == 200
+        assert (await client.post("/session/run", count))[1]["results"] == [{"count": 1}]
+        assert (await client.get("/transaction/commit", tx_id=tx_id))[0] == 404
+
+        status, body = await client.request(
+            "POST",
+            "/session/stream",
+            {"session_id": session_id, "query": "MATCH (n) RETURN n", "parameters": {"rows": 3}},
+        )
+        rows = [json.loads(line) for line in body.splitlines()]
+        assert (status, [row["row"] for row in rows]) == (200, [0, 1, 2])
+
+        assert (await client.get("/session/close", session_id=session_id))[0] == 200
+        assert (await client.post("/session/run", count))[0] == 404
+        assert graph.drivers[0].sessions[0].closed
+
+    run(monkeypatch, test)
+
+
+def test_clients_share_a_driver_per_uri_and_user(monkeypatch):
+    async def test(client, graph):
+        handles = []
+        for user in ["alice", "alice", "bob"]:
+            _, body = await client.post(
+                "/initialize",
+                {"db_uri": "bolt://db", "db_username": user, "db_password": "pw"},
+            )
+            handles.append(body["id"])
+        assert len(set(handles)) == 3
+        assert [driver.user for driver in graph.drivers] == ["alice", "bob"]
+        # the shared driver is closed with the last handle using it
+        await client.get("/close", id=handles[0])
+        assert not graph.drivers[0].closed
+        await client.get("/close", id=handles[1])
+        assert graph.drivers[0].closed
+        assert (await client.get("/ping", id=handles[1]))[0] == 400
+
+    run(monkeypatch, test)
+
+
+def test_wrong_password_is_rejected(monkeypatch):
+    async def test(client, graph):
+        await client.session("alice", "pw")
+        status, body = await client.post(
+            "/initialize",
+            {"db_uri": "bolt://db", "db_username": "alice", "db_password": "other"},
+        )
+        assert status == 401
+        assert "error" in body
+        assert len(graph.drivers) == 1
+
+    run(monkeypatch, test)
+
+
+def test_reads_are_cached(monkeypatch):
+    query = "MATCH (n:A) RETURN n"
+
+    async def read(client, session_id):
+        _, body = await client.post(
+            "/session/run", {"session_id": session_id, "query": query, "read_only": True}
+        )
+        return body["results"]
+
+    async def test(client, graph):
+        alice, bob = await client.session("alice"), await client.session("bob")
+        assert await read(client, alice) == [{"user": "alice", "row": 0}]
+        assert await read(client, alice) == [{"user": "alice", "row": 0}]
+        assert await read(client, bob) == [{"user": "bob", "row": 0}]
+        assert graph.log == [("alice", query), ("bob", query)]
+        # a committed write by one user invalidates the entries of both
+        await client.post(
+            "/batch",
+            {"session_id": bob, "queries": [{"query": "CREATE (n:A)"}], "transaction": True},
+        )
+        await read(client, alice)
+        await read(client, bob)
+        assert len(graph.log) == 5
+        _, stats = await client.get("/cache/stats")
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 4, 2)
+
+    run(monkeypatch, test, cache=ResultCache())
+
+
+def test_cache_is_disabled_by_default(monkeypatch):
+    async def test(client, graph):
+        assert await client.get("/cache/stats") == (200, {"enabled": False})
+
+    run(monkeypatch, test)
@@ -0,0 +1,55 @@
+# Copyright (c) 2025 ETH Zurich.
+#                    All rights reserved.
+#
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+import asyncio
+import threading
+
+import pytest
+
+from HOGDB.db.label import Label
+from HOGDB.db.property import Property
+from HOGDB.graph.async_storage import AsyncStorage
+from HOGDB.graph.graph_storage import GraphStorage
+from HOGDB.graph.node import Node
+from HOGDB.graph.path import Path
+from conftest import BACKENDS, open_database
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_storage_methods_run_off_the_event_loop(backend, tmp_path):
+    db = open_database(backend, tmp_path)
+
+    async def main():
+        storage = await AsyncStorage.create(GraphStorage, db)
+        loop_thread = threading.get_ident()
+        threads = set()
+        original = db.add_node
+
+        def add_node(*args, **kwargs):
+            threads.add(threading.get_ident())
+            return original(*args, **kwargs)
+
+        db.add_node = add_node
+        # calls made concurrently run one at a time on the worker thread
+        await asyncio.gather(
+            *(
+                storage.add_node(Node([Label("Item")], [Property("id", int, i)]))
+                for i in range(5)
+            )
+        )
+        assert threads and loop_thread not in threads
+        assert await storage.get_node_count([Label("Item")]) == 5
+        path = Path()
+        path.add(Node([Label("Item")]), "a")
+        result = await storage.traverse_path([path], return_values=["a.id"], sort=["a.id"])
+        assert result["a.id"].tolist() == [0, 1, 2, 3, 4]
+        assert storage.track_changes is False
+        with pytest.raises(AttributeError):
+            storage.profile()
+        await storage.close()
+        assert storage._executor._shutdown
+
+    asyncio.run(main())
@@ -0,0 +1,134 @@
+# Copyright (c) 2025 ETH Zurich.
+#                    All rights reserved.
+#
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+import csv
+import json
+
+import pandas as pd
+
+from HOGDB.db.bulk_import import ID_SPACE, BulkImportGenerator, _normalize, verify
+from HOGDB.db.label import Label
+from HOGDB.db.schema import Schema
+from HOGDB.graph.hypergraph_storage import HyperGraphStorage
+
+PERSON_SCHEMA = [Schema("id", int), Schema("name", str), Schema("active", bool)]
+
+
+def write_fixtures(tmp_path):
+    pd.DataFrame(
+        {
+            "id": ["0", "1", "2", "1e3"],
+            "name": ["Ann", "Ben", "Cid", "Kay"],
+            "active": ["true", "FALSE", "yes", "True"],
+        }
+    ).to_csv(tmp_path / "people.csv", index=False)
+    # the first group lists a member twice and references 1000 as '1e3'
+    pd.DataFrame({"hid": [0, 1], "members": ["0;1;1", "2;1e3;9"]}).to_csv(
+        tmp_path / "groups.csv", index=False
+    )
+
+
+def generate(tmp_path):
+    write_fixtures(tmp_path)
+    generator = BulkImportGenerator(str(tmp_path / "out"), workers=1)
+    generator.add_nodes(str(tmp_path / "people.csv"), [Label("Person")], PERSON_SCHEMA)
+    generator.add_hyperedges(
+        str(tmp_path / "groups.csv"),
+        [Label("Person")],
+        Schema("id", int, "members"),
+        [],
+        Label("Group"),
+        [Schema("hid", int)],
+    )
+    return generator.generate()
+
+
+def read_csv(path):
+    with open(path, newline="") as f:
+        return list(csv.reader(f))
+
+
+def test_normalize():
+    assert _normalize("1e3", int) == 1000
+    assert _normalize("1.5", int) == 1
+    assert _normalize("7", int) == 7
+    assert _normalize("x", int) is None
+    assert _normalize("", str) is None
+    assert _normalize(" True ", bool) is True
+    assert _normalize("false", bool) is False
+    assert _normalize("yes", bool) is None
+    assert _normalize("2.5", float) == 2.5
+
+
+def test_headers_share_the_id_space(tmp_path):
+    manifest = generate(tmp_path)
+    assert manifest["id_space"] == ID_SPACE
+    nodes, hyperedges = manifest["nodes"]
+    assert nodes["labels"] == ["_node", "Person"]
+    assert read_csv(nodes["header"]) == [
+        [f":ID({ID_SPACE})", "id:long", "name:string", "active:boolean"]
+    ]
+    assert hyperedges["labels"] == ["_hyperedge", "Group"]
+    assert read_csv(hyperedges["header"]) == [[f":ID({ID_SPACE})", "hid:long"]]
+    (adjacency,) = manifest["relationships"]
+    assert adjacency["type"] == "_adjacency"
+    assert read_csv(adjacency["header"]) == [
+        [f":START_ID({ID_SPACE})", f":END_ID({ID_SPACE})"]
+    ]
+    with open(tmp_path / "out" / "manifest.json") as f:
+        assert json.load(f) == manifest
+
+
+def test_typed_columns_are_normalized(tmp_path):
+    manifest = generate(tmp_path)
+    rows = [row for path in manifest["nodes"][0]["files"] for row in read_csv(path)]
+    assert rows == [
+        ["0", "0", "Ann", "true"],
+        ["1", "1", "Ben", "false"],
+        ["2", "2", "Cid", ""],
+        ["3", "1000", "Kay", "true"],
+    ]
+
+
+def test_hyperedge_members_are_deduplicated(tmp_path):
+    manifest = generate(tmp_path)
+    (adjacency,) = manifest["relationships"]
+    lines = [tuple(row) for path in adjacency["files"] for row in read_csv(path)]
+    # the group IDs follow the node IDs, each member is incident once in both directions
+    assert sorted(lines) == sorted(
+        [("0", "4"), ("4", "0"), ("1", "4"), ("4", "1")]
+        + [("2", "5"), ("5", "2"), ("3", "5"), ("5", "3")]
+    )
+    assert adjacency["count"] == 8
+    assert manifest["unresolved"] == {str(tmp_path / "groups.csv"): 1}
+    assert manifest["counts"] == {
+        "labels": {"_node": 4, "Person": 4, "_hyperedge": 2, "Group": 2},
+        "relationships": {"_adjacency": 8},
+    }
+
+
+def test_verify_against_the_storage_import(db, tmp_path):
+    manifest = generate(tmp_path)
+    gs = HyperGraphStorage(db)
+    gs.import_nodes_from_csv(str(tmp_path / "people.csv"), [Label("Person")], PERSON_SCHEMA)
+    gs.import_hyperedges_from_csv(
+        str(tmp_path / "groups.csv"),
+        [Label("Person")],
+        Schema("id", int, "members"),
+        [],
+        Label("Group"),
+        [Schema("hid", int)],
+    )
+    session = db.start_session()
+    counts = verify(db, session, manifest)
+    db.end_session(session)
+    assert counts == {
+        "_node": (4, 4),
+        "Person": (4, 4),
+        "_hyperedge": (2, 2),
+        "Group": (2, 2),
+        "[_adjacency]": (8, 8),
+    }
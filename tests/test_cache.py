@@ -0,0 +1,159 @@
+# Copyright (c) 2025 ETH Zurich.
+#                    All rights reserved.
+#
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+from HOGDB.proxy import cache as cache_module
+from HOGDB.proxy.cache import ResultCache, normalize_query, query_labels
+from conftest import load_proxy_server
+from fake_neo4j import FakeGraphDatabase
+
+SCOPE = ("bolt://localhost:7687", "neo4j")
+
+
+def test_normalization_keeps_string_literals():
+    assert normalize_query("MATCH  (n:A)\n RETURN  n") == "MATCH (n:A) RETURN n"
+    assert normalize_query("RETURN 'a   b'") == "RETURN 'a   b'"
+
+
+def test_query_labels():
+    assert query_labels("MATCH (n:A)-[:R]->(m:`B c`) RETURN n") == (
+        frozenset({"A", "R", "B c"}),
+        False,
+    )
+    # names inside string literals are not labels
+    assert query_labels("MATCH (n:A {name: ':B'}) RETURN n")[0] == frozenset({"A"})
+    assert query_labels("MATCH (n) RETURN n")[1]
+    assert query_labels("MATCH (n:A)-[r]->(m:B) RETURN n")[1]
+    assert query_labels("MATCH (n:A) SET n:$(label)")[1]
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = ResultCache(max_entries=2)
+    for query in ["MATCH (n:A) RETURN n", "MATCH (n:B) RETURN n"]:
+        cache.put(SCOPE, "alice", query, {}, [query], cache.generation(SCOPE))
+    assert cache.get(SCOPE, "alice", "MATCH (n:A) RETURN n", {}) is not None
+    cache.put(SCOPE, "alice", "MATCH (n:C) RETURN n", {}, [], cache.generation(SCOPE))
+    assert cache.get(SCOPE, "alice", "MATCH (n:B) RETURN n", {}) is None
+    assert cache.get(SCOPE, "alice", "MATCH (n:A) RETURN n", {}) is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_entries_expire(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = ResultCache(ttl=10)
+    cache.put(SCOPE, "alice", "MATCH (n:A) RETURN n", {}, [1], 0)
+    now[0] += 5
+    assert cache.get(SCOPE, "alice", "MATCH (n:A) RETURN n", {}) == [1]
+    now[0] += 10
+    assert cache.get(SCOPE, "alice", "MATCH (n:A) RETURN n", {}) is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_parameters_and_formatting():
+    cache = ResultCache()
+    query = "MATCH (n:A {id: $id}) RETURN n"
+    cache.put(SCOPE, "alice", query, {"id": 1}, [1], 0)
+    reformatted = "MATCH (n:A {id: $id})\n RETURN n"
+    assert cache.get(SCOPE, "alice", reformatted, {"id": 1}) == [1]
+    assert cache.get(SCOPE, "alice", query, {"id": 2}) is None
+
+
+def test_large_results_are_not_cached():
+    cache = ResultCache(max_records=2)
+    cache.put(SCOPE, "alice", "MATCH (n:A) RETURN n", {}, [1, 2, 3], 0)
+    assert cache.stats()["entries"] == 0
+
+
+def test_users_do_not_share_entries():
+    cache = ResultCache()
+    cache.put(SCOPE, "alice", "MATCH (n:A) RETURN n", {}, ["alice"], 0)
+    assert cache.get(SCOPE, "bob", "MATCH (n:A) RETURN n", {}) is None
+    other = ("bolt://other:7687", "neo4j")
+    assert cache.get(other, "alice", "MATCH (n:A) RETURN n", {}) is None
+
+
+def test_read_started_before_a_write_is_not_stored():
+    cache = ResultCache()
+    generation = cache.generation(SCOPE)
+    cache.invalidate(SCOPE, ["CREATE (n:B)"])
+    cache.put(SCOPE, "alice", "MATCH (n:A) RETURN n", {}, [1], generation)
+    assert cache.get(SCOPE, "alice", "MATCH (n:A) RETURN n", {}) is None
+    # a write elsewhere does not affect the scope
+    generation = cache.generation(SCOPE)
+    cache.invalidate(("bolt://other:7687", "neo4j"), ["CREATE (n:A)"])
+    cache.put(SCOPE, "alice", "MATCH (n:A) RETURN n", {}, [1], generation)
+    assert cache.get(SCOPE, "alice", "MATCH (n:A) RETURN n", {}) == [1]
+
+
+def test_writes_invalidate_entries_sharing_a_label():
+    cache = ResultCache()
+    reads = {
+        "MATCH (n:A) RETURN n": "alice",
+        "MATCH (n:A) RETURN count(n)": "bob",
+        "MATCH (n:B) RETURN n": "alice",
+        "MATCH (n) RETURN n": "alice",
+    }
+    for query, user in reads.items():
+        cache.put(SCOPE, user, query, {}, [query], cache.generation(SCOPE))
+    cache.invalidate(SCOPE, ["CREATE (n:A {id: 1})"])
+    # the entries of every user reading A go, as does the unlabeled read
+    assert cache.get(SCOPE, "alice", "MATCH (n:A) RETURN n", {}) is None
+    assert cache.get(SCOPE, "bob", "MATCH (n:A) RETURN count(n)", {}) is None
+    assert cache.get(SCOPE, "alice", "MATCH (n) RETURN n", {}) is None
+    assert cache.get(SCOPE, "alice", "MATCH (n:B) RETURN n", {}) is not None
+    assert cache.stats()["invalidations"] == 3
+    # an unlabeled write drops the whole scope
+    cache.invalidate(SCOPE, ["MATCH (n) DETACH DELETE n"])
+    assert cache.stats()["entries"] == 0
+
+
+def _session(client, user):
+    driver = client.post(
+        "/initialize",
+        json={"db_uri": "bolt://db", "db_username": user, "db_password": "pw"},
+    ).get_json()["id"]
+    return client.post("/session/init", json={"id": driver}).get_json()["session_id"]
+
+
+def _read(client, session_id, query):
+    response = client.post(
+        "/session/run",
+        json={"session_id": session_id, "query": query, "read_only": True},
+    )
+    return response.get_json()["results"]
+
+
+def test_server_caches_reads_per_user(monkeypatch):
+    graph = FakeGraphDatabase()
+    server = load_proxy_server(monkeypatch, graph, cache=ResultCache())
+    client = server.app.test_client()
+    alice, bob = _session(client, "alice"), _session(client, "bob")
+    query = "MATCH (n:A) RETURN n"
+    assert _read(client, alice, query) == [{"user": "alice", "row": 0}]
+    assert _read(client, alice, query) == [{"user": "alice", "row": 0}]
+    assert _read(client, bob, query) == [{"user": "bob", "row": 0}]
+    assert graph.log == [("alice", query), ("bob", query)]
+    # a write by one user invalidates the entries of both
+    client.post(
+        "/session/run",
+        json={"session_id": bob, "query": "CREATE (n:A)", "parameters": {"id": 1}},
+    )
+    _read(client, alice, query)
+    _read(client, bob, query)
+    assert len(graph.log) == 5
+    stats = client.get("/cache/stats").get_json()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 4, 2)
+
+
+def test_server_without_cache(monkeypatch):
+    graph = FakeGraphDatabase()
+    server = load_proxy_server(monkeypatch, graph, cache=None)
+    client = server.app.test_client()
+    alice = _session(client, "alice")
+    _read(client, alice, "MATCH (n:A) RETURN n")
+    _read(client, alice, "MATCH (n:A) RETURN n")
+    assert len(graph.log) == 2
+    assert client.get("/cache/stats").get_json() == {"enabled": False}
@@ -0,0 +1,115 @@
+# Copyright (c) 2025 ETH Zurich.
+#                    All rights reserved.
+#
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+import pandas as pd
+
+from HOGDB.db import neo4j as neo4j_module
+from HOGDB.db.label import Label
+from HOGDB.db.neo4j import Neo4jDatabase
+from HOGDB.db.property import Property
+from HOGDB.db.schema import Schema
+from HOGDB.graph.edge import Edge
+from HOGDB.graph.graph_storage import GraphStorage
+from HOGDB.graph.graph_with_subgraph_storage import GraphwithSubgraphStorage
+from HOGDB.graph.node import Node
+from fake_neo4j import FakeGraphDatabase
+
+
+def item(i: int) -> Node:
+    return Node([Label("Item")], [Property("id", int, i)])
+
+
+def test_versions_increase(db):
+    gs = GraphwithSubgraphStorage(db, track_changes=True)
+    first = gs.current_version()
+    gs.add_node(item(0))
+    assert gs.current_version() > first
+
+
+def test_export_since_version(db, tmp_path):
+    gs = GraphwithSubgraphStorage(db, track_changes=True)
+    for i in range(3):
+        gs.add_node(item(i))
+    gs.add_edge(Edge(item(0), item(1), Label("Next"), [Property("w", int, 1)]))
+    version = gs.current_version()
+    gs.update_node(item(1), [Property("name", str, "changed")])
+    gs.add_node(item(3))
+    gs.delete_node(item(2))
+
+    schema = [Schema("id", int), Schema("name", str)]
+    gs.export_nodes_to_csv(str(tmp_path / "nodes.csv"), [Label("Item")], schema, since=version)
+    changed = pd.read_csv(tmp_path / "nodes.csv").sort_values("id")
+    assert changed["id"].tolist() == [1, 3]
+    assert changed["name"].tolist()[0] == "changed"
+
+    gs.export_tombstones_to_csv(
+        str(tmp_path / "tombstones.csv"),
+        [Label("_node"), Label("Item")],
+        [Schema("id", int)],
+        since=version,
+    )
+    assert pd.read_csv(tmp_path / "tombstones.csv")["id"].tolist() == [2]
+
+    # a full export still contains every remaining node
+    gs.export_nodes_to_csv(str(tmp_path / "all.csv"), [Label("Item")], schema)
+    assert sorted(pd.read_csv(tmp_path / "all.csv")["id"]) == [0, 1, 3]
+
+
+def test_deleting_an_edge_leaves_a_tombstone(db, tmp_path):
+    gs = GraphwithSubgraphStorage(db, track_changes=True)
+    gs.add_node(item(0))
+    gs.add_node(item(1))
+    gs.add_edge(Edge(item(0), item(1), Label("Next"), [Property("w", int, 7)]))
+    version = gs.current_version()
+    gs.delete_edge(Edge(item(0), item(1), Label("Next"), [Property("w", int, 7)]))
+    assert gs.get_edge_count(Label("Next")) == 0
+    gs.export_tombstones_to_csv(
+        str(tmp_path / "tombstones.csv"),
+        [Label("_edge"), Label("Next")],
+        [Schema("w", int)],
+        since=version,
+    )
+    assert pd.read_csv(tmp_path / "tombstones.csv")["w"].tolist() == [7]
+
+
+def test_edge_tombstones_keep_their_endpoints(db, tmp_path):
+    gs = GraphStorage(db, track_changes=True)
+    gs.add_node(item(0))
+    gs.add_node(item(1))
+    gs.add_edge(Edge(item(0), item(1), Label("Next"), [Property("w", int, 7)]))
+    version = gs.current_version()
+    gs.delete_edge(Edge(item(0), item(1), Label("Next"), []))
+    gs.export_tombstones_to_csv(
+        str(tmp_path / "tombstones.csv"),
+        [Label("Next")],
+        [Schema("w", int), Schema("_start_id", int), Schema("_end_id", int)],
+        since=version,
+    )
+    tombstones = pd.read_csv(tmp_path / "tombstones.csv")
+    columns = ["w", "_start_id", "_end_id"]
+    assert tombstones[columns].to_dict("records") == [{"w": 7, "_start_id": 0, "_end_id": 1}]
+
+
+def test_neo4j_changes_are_versioned_by_a_counter(monkeypatch):
+    graph = FakeGraphDatabase()
+    monkeypatch.setattr(neo4j_module, "GraphDatabase", graph)
+    db = Neo4jDatabase(db_uri="bolt://db", db_username="neo4j", db_password="pw")
+    session = db.start_session()
+    db.delete_edge(
+        session,
+        session.begin_transaction(),
+        start_node_labels=[Label("Item")],
+        start_node_properties=[Property("id", int, 0)],
+        end_node_labels=[Label("Item")],
+        end_node_properties=[Property("id", int, 1)],
+        edge_label=Label("Next"),
+        track_changes=True,
+    )
+    query = graph.log[-1][1]
+    assert query.lstrip().startswith("MERGE (version_counter:_version_counter)")
+    assert "timestamp()" not in query
+    assert "t.`_start_id` = startNode(" in query
+    assert "t.`_end_id` = endNode(" in query
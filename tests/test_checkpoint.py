@@ -0,0 +1,28 @@
+# Copyright (c) 2025 ETH Zurich.
+#                    All rights reserved.
+#
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+import pytest
+
+from HOGDB.db.label import Label
+from HOGDB.db.schema import Schema
+
+
+def test_import_resumes_from_checkpoint(db):
+    def rows(fail_at=None):
+        for i in range(10):
+            if i == fail_at:
+                raise RuntimeError("input failed")
+            yield {"id": i}
+
+    session = db.start_session()
+    labels, schema = [Label("_node"), Label("Item")], [Schema("id", int)]
+    with pytest.raises(RuntimeError):
+        db.import_nodes_from_iter(session, rows(fail_at=7), labels, schema, 3, checkpoint="items")
+    # the batches written before the failure are kept
+    assert db.node_count(session, [Label("Item")]) == 6
+    db.import_nodes_from_iter(session, rows(), labels, schema, 3, checkpoint="items")
+    assert db.node_count(session, [Label("Item")]) == 10
+    db.end_session(session)
@@ -0,0 +1,45 @@
+# Copyright (c) 2025 ETH Zurich.
+#                    All rights reserved.
+#
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+import pandas as pd
+
+from HOGDB.db.label import Label
+from HOGDB.db.property import Property
+from HOGDB.db.schema import Schema
+from HOGDB.graph.hyperedge import HyperEdge
+from HOGDB.graph.hypergraph_storage import HyperGraphStorage
+
+PEOPLE = pd.DataFrame({"id": [0, 1, 2, 3], "name": ["Ann", "Ben", "Cid", "Dee"]})
+PERSON_SCHEMA = [Schema("id", int), Schema("name", str)]
+
+
+def test_hyperedge_import_reports_unresolved_members(db, tmp_path):
+    gs = HyperGraphStorage(db)
+    gs.import_nodes_from_frame(PEOPLE, [Label("Person")], PERSON_SCHEMA)
+    pd.DataFrame({"hid": [0, 1], "members": ["0;1;2", "2;9"]}).to_csv(
+        tmp_path / "groups.csv", index=False
+    )
+    unresolved = gs.import_hyperedges_from_csv(
+        str(tmp_path / "groups.csv"),
+        [Label("Person")],
+        Schema("id", int, "members"),
+        [],
+        Label("Group"),
+        [Schema("hid", int)],
+    )
+    assert unresolved == [9]
+    group = gs.get_hyperedge(HyperEdge([], Label("Group"), [Property("hid", int, 0)]))
+    assert sorted(node["id"] for node in group.nodes) == [0, 1, 2]
+
+    gs.export_hyperedges_to_csv(
+        str(tmp_path / "out.csv"),
+        [Label("Person")],
+        Schema("id", int, "members"),
+        Label("Group"),
+        [Schema("hid", int)],
+    )
+    exported = pd.read_csv(tmp_path / "out.csv").sort_values("hid")
+    assert [sorted(m.split(";")) for m in exported["members"]] == [["0", "1", "2"], ["2"]]
@@ -0,0 +1,87 @@
+# Copyright (c) 2025 ETH Zurich.
+#                    All rights reserved.
+#
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+import pandas as pd
+import pytest
+
+from HOGDB.db.label import Label
+from HOGDB.db.property import Property
+from HOGDB.db.schema import Schema
+from HOGDB.graph.edge import Edge
+from HOGDB.graph.graph_storage import GraphStorage
+from HOGDB.graph.graph_with_tuple_storage import GraphwithTupleStorage
+from HOGDB.graph.node import Node
+from HOGDB.graph.node_tuple import NodeTuple
+
+PEOPLE = pd.DataFrame({"id": [0, 1, 2, 3], "name": ["Ann", "Ben", "Cid", "Dee"]})
+PERSON_SCHEMA = [Schema("id", int), Schema("name", str)]
+
+
+def test_nodes_and_edges_round_trip(db, tmp_path):
+    gs = GraphStorage(db)
+    stats = gs.import_nodes_from_frame(PEOPLE, [Label("Person")], PERSON_SCHEMA)
+    assert stats.rows == 4
+    pd.DataFrame({"a": [0, 1, 2], "b": [1, 2, 3], "w": [5, 6, 7]}).to_csv(
+        tmp_path / "knows.csv", index=False
+    )
+    gs.import_edges_from_csv(
+        str(tmp_path / "knows.csv"),
+        [Label("Person")],
+        [Schema("id", int, "a")],
+        [Label("Person")],
+        [Schema("id", int, "b")],
+        Label("Knows"),
+        [Schema("weight", int, "w")],
+    )
+    assert gs.get_node_count([Label("Person")]) == 4
+    edge = gs.get_edge(
+        Edge(
+            Node([Label("Person")], [Property("id", int, 1)]),
+            Node([Label("Person")], [Property("id", int, 2)]),
+            Label("Knows"),
+        )
+    )
+    assert edge.properties == [Property("weight", int, 6)]
+
+    gs.export_nodes_to_csv(str(tmp_path / "nodes.csv"), [Label("Person")], PERSON_SCHEMA)
+    exported = pd.read_csv(tmp_path / "nodes.csv").sort_values("id")
+    assert exported.values.tolist() == PEOPLE.values.tolist()
+    gs.export_edges_to_csv(
+        str(tmp_path / "edges.csv"),
+        [Label("Person")],
+        [Schema("id", int, "a")],
+        [Label("Person")],
+        [Schema("id", int, "b")],
+        Label("Knows"),
+        [Schema("weight", int, "w")],
+    )
+    exported = pd.read_csv(tmp_path / "edges.csv").sort_values("a")
+    assert exported.values.tolist() == [[0, 1, 5], [1, 2, 6], [2, 3, 7]]
+
+
+def test_parquet_export(db, tmp_path):
+    pytest.importorskip("pyarrow")
+    gs = GraphStorage(db)
+    gs.import_nodes_from_frame(PEOPLE, [Label("Person")], PERSON_SCHEMA)
+    gs.export_nodes_to_parquet(str(tmp_path / "nodes.parquet"), [Label("Person")], PERSON_SCHEMA)
+    exported = pd.read_parquet(tmp_path / "nodes.parquet").sort_values("id")
+    assert str(exported["id"].dtype) == "int64"
+    assert exported["name"].tolist() == PEOPLE["name"].tolist()
+
+
+def test_node_tuple_import_keeps_member_order(db, tmp_path):
+    gs = GraphwithTupleStorage(db)
+    gs.import_nodes_from_frame(PEOPLE, [Label("Person")], PERSON_SCHEMA)
+    tuples = pd.DataFrame({"tid": [0], "members": ["3;1;2"]})
+    gs.import_node_tuples_from_frame(
+        tuples, Schema("id", int, "members"), [], [Label("Route")], [Schema("tid", int)]
+    )
+    route = gs.get_node_tuple(NodeTuple([], [Label("Route")], [Property("tid", int, 0)]))
+    assert [node["id"] for node in route.nodes] == [3, 1, 2]
+    gs.export_node_tuples_to_csv(
+        str(tmp_path / "out.csv"), Schema("id", int, "members"), [Label("Route")], [Schema("tid", int)]
+    )
+    assert pd.read_csv(tmp_path / "out.csv")["members"].tolist() == ["3;1;2"]
@@ -0,0 +1,43 @@
+# Copyright (c) 2025 ETH Zurich.
+#                    All rights reserved.
+#
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+import itertools
+
+import pytest
+
+from HOGDB.db.importer import partition_chunks, partition_rounds, partition_rows
+from HOGDB.db.schema import Schema
+
+START = [Schema("id", int, "start_id")]
+END = [Schema("id", int, "end_id")]
+
+
+@pytest.mark.parametrize("partitions", range(1, 8))
+def test_rounds_never_share_a_partition(partitions):
+    cells = []
+    for groups in partition_rounds(partitions):
+        touched = [{p for cell in group for p in cell} for group in groups]
+        # the groups of a round run concurrently, so they must touch disjoint partitions
+        for a, b in itertools.combinations(touched, 2):
+            assert not a & b
+        cells.extend(cell for group in groups for cell in group)
+    # every cell is written exactly once
+    assert sorted(cells) == list(itertools.product(range(partitions), repeat=2))
+
+
+def test_nodes_keep_their_partition_at_both_ends():
+    rows = [{"start_id": i, "end_id": (i * 7) % 50} for i in range(50)]
+    partitions = {}
+    for (start, end), cell in partition_rows(rows, START, END, 4).items():
+        for row in cell:
+            assert partitions.setdefault(row["start_id"], start) == start
+            assert partitions.setdefault(row["end_id"], end) == end
+
+
+def test_endpoints_identified_by_different_properties_are_rejected():
+    rows = iter([{"start_id": 1, "end_name": "a"}])
+    with pytest.raises(ValueError, match="same properties"):
+        partition_chunks(rows, START, [Schema("name", str, "end_name")], 2, 10)
@@ -0,0 +1,106 @@
+# Copyright (c) 2025 ETH Zurich.
+#                    All rights reserved.
+#
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+import pytest
+
+from HOGDB.db import UnsupportedOperationError
+from HOGDB.db import neo4j as neo4j_module
+from HOGDB.db.db import Database
+from HOGDB.db.in_memory import InMemoryDatabase
+from HOGDB.db.label import Label
+from HOGDB.db.neo4j import Neo4jDatabase, _INDEX_TYPES
+from HOGDB.db.predicate import Comparison, P, Predicate
+from HOGDB.graph.graph_storage import GraphStorage
+from HOGDB.graph.node import Node
+from HOGDB.graph.path import Path
+from fake_neo4j import FakeGraphDatabase
+
+
+def test_predicate_is_abstract():
+    with pytest.raises(TypeError):
+        Predicate()
+    with pytest.raises(ValueError):
+        Comparison("a.x", "LIKE", 1)
+
+
+def test_compiled_conditions_are_parameterized():
+    parameters = {"p0": "taken"}
+    condition = (P("a.x") == 1) & ~((P("a.y") < 2.5) | P("a.z").is_null())
+    compiled = Neo4jDatabase._compile_condition(condition, parameters)
+    assert compiled == "(a.x = $p1 AND NOT (a.y < $p2 OR a.z IS NULL))"
+    assert parameters == {"p0": "taken", "p1": 1, "p2": 2.5}
+    # parameters are named after the number of parameters so far, across conditions
+    compiled = Neo4jDatabase._compile_condition(P("a.name").in_(["x", "'y'"]), parameters)
+    assert compiled == "a.name IN $p3"
+    assert parameters["p3"] == ["x", "'y'"]
+    # raw strings are used verbatim
+    assert Neo4jDatabase._compile_condition("a.x = 1", parameters) == "a.x = 1"
+    assert len(parameters) == 4
+
+
+def test_conjuncts():
+    x, y = P("a.x") == 1, P("a.y") > 2
+    assert (x & y).conjuncts() == [x, y]
+    assert ((x & y) & P("a.z").starts_with("c")).conjuncts()[2].operator == "STARTS WITH"
+    # disjunctions and negations do not constrain their comparisons
+    assert (x | y).conjuncts() == []
+    assert (~x).conjuncts() == []
+
+
+def test_index_types_of_operators():
+    assert _INDEX_TYPES["="] == ("RANGE",)
+    assert _INDEX_TYPES["STARTS WITH"] == ("RANGE", "TEXT")
+    assert _INDEX_TYPES["CONTAINS"] == ("TEXT",)
+    # no index serves IS NULL or <>, and they are not sargable
+    assert "IS NULL" not in _INDEX_TYPES and "<>" not in _INDEX_TYPES
+    assert not P("a.x").is_null().sargable
+    assert not (P("a.x") != 1).sargable
+    assert P("a.x").is_not_null().sargable
+    assert not Comparison("toLower(a.x)", "=", "a").sargable
+
+
+def test_neo4j_indexed_predicates(monkeypatch):
+    monkeypatch.setattr(neo4j_module, "GraphDatabase", FakeGraphDatabase())
+    db = Neo4jDatabase(db_uri="bolt://db", db_username="neo4j", db_password="pw")
+    indexes = [
+        ("item_id", "Item", ["id"], "RANGE"),
+        ("item_name", "Item", ["name"], "TEXT"),
+        ("item_pair", "Item", ["a", "b"], "RANGE"),
+    ]
+    monkeypatch.setattr(db, "_index_definitions", lambda session: indexes)
+    conditions = [
+        P("n.id") == 1,
+        P("n.name").ends_with("x"),
+        P("n.id").is_null(),
+        P("n.a") == 1,
+        P("m.id") == 1,
+        P("n.id") != 1,
+    ]
+    served = db.indexed_predicates(
+        None, [["n", "m"]], [[([Label("Item")], []), ([Label("Other")], [])]], [conditions]
+    )
+    # the composite index needs both of its properties constrained
+    assert [name for _, name in served] == ["item_id", "item_name", None, None, None, None]
+    served = db.indexed_predicates(
+        None,
+        [["n"]],
+        [[([Label("Item")], [])]],
+        [[(P("n.a") == 1) & (P("n.b") > 2)]],
+    )
+    assert [name for _, name in served] == ["item_pair", "item_pair"]
+
+
+def test_indexed_conditions_of_an_unsupported_database():
+    class NoIndexUsage(InMemoryDatabase):
+        indexed_predicates = Database.indexed_predicates
+
+    path = Path()
+    path.add(Node([Label("Item")]), "n")
+    gs = GraphStorage(NoIndexUsage())
+    with pytest.raises(UnsupportedOperationError):
+        gs.indexed_conditions([path], [[P("n.id") == 1]])
+    gs = GraphStorage(InMemoryDatabase())
+    assert gs.indexed_conditions([path], [[P("n.id") == 1]])[0][1] is None
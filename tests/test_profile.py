@@ -0,0 +1,93 @@
+# Copyright (c) 2025 ETH Zurich.
+#                    All rights reserved.
+#
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+import pytest
+
+from HOGDB.db import UnsupportedOperationError
+from HOGDB.db import neo4j as neo4j_module
+from HOGDB.db.neo4j import Neo4jDatabase
+from HOGDB.db.profile import PlanOperator, QueryProfile
+from HOGDB.graph.graph_storage import GraphStorage
+from fake_neo4j import FakeGraphDatabase
+
+# profile of 'MATCH (n:Item) WHERE n.id = 1 RETURN n' in the form returned by the driver
+PLAN = {
+    "operatorType": "ProduceResults@neo4j",
+    "identifiers": ["n"],
+    "args": {"EstimatedRows": 1.0, "Rows": 1, "DbHits": 0, "Time": 10},
+    "dbHits": 0,
+    "rows": 1,
+    "children": [
+        {
+            "operatorType": "Filter@neo4j",
+            "identifiers": ["n"],
+            "args": {"Details": "n.id = 1", "Rows": 1, "DbHits": 20},
+            "dbHits": 20,
+            "rows": 1,
+            "children": [
+                {
+                    "operatorType": "NodeByLabelScan@neo4j",
+                    "identifiers": ["n"],
+                    "args": {"Details": "n:Item", "Rows": 10, "DbHits": 11},
+                    "dbHits": 11,
+                    "rows": 10,
+                    "children": [],
+                }
+            ],
+        }
+    ],
+}
+
+
+def test_plan_from_summary():
+    plan = PlanOperator.from_summary(PLAN)
+    assert [operator.operator_type for operator in plan.walk()] == [
+        "ProduceResults@neo4j",
+        "Filter@neo4j",
+        "NodeByLabelScan@neo4j",
+    ]
+    assert plan.total_db_hits() == 31
+    assert plan.children[0].arguments["Details"] == "n.id = 1"
+    profile = QueryProfile("MATCH (n) RETURN n", {}, "PROFILE", plan, 0.5, 1, 2)
+    assert (profile.db_hits, profile.rows) == (31, 1)
+    assert profile.operators()[2] == {
+        "operator": "NodeByLabelScan@neo4j",
+        "rows": 10,
+        "db_hits": 11,
+    }
+
+
+def test_plan_without_statistics():
+    plan = PlanOperator.from_summary(PLAN).without_statistics()
+    assert plan.total_db_hits() == 0
+    assert [operator.rows for operator in plan.walk()] == [0, 0, 0]
+    assert plan.arguments == {"EstimatedRows": 1.0}
+    assert plan.children[0].arguments == {"Details": "n.id = 1"}
+    # plans of EXPLAIN have no statistics at all
+    explained = PlanOperator.from_summary({"operatorType": "ProduceResults", "args": {}})
+    assert (explained.db_hits, explained.rows) == (0, 0)
+
+
+@pytest.mark.parametrize("explain", [False, True])
+def test_captured_queries_run_once(monkeypatch, explain):
+    graph = FakeGraphDatabase()
+    graph.plan = PLAN
+    monkeypatch.setattr(neo4j_module, "GraphDatabase", graph)
+    db = Neo4jDatabase(db_uri="bolt://db", db_username="neo4j", db_password="pw")
+    session = db.start_session()
+    with db.capture_plans(explain) as profiles:
+        records = db._execute_query(session, "MATCH (n) RETURN n", {"rows": 2})
+    assert len(records) == 2
+    assert [query for _, query in graph.log] == ["PROFILE MATCH (n) RETURN n"]
+    assert profiles[0].mode == ("EXPLAIN" if explain else "PROFILE")
+    assert profiles[0].db_hits == (0 if explain else 31)
+    assert len(list(profiles[0].plan.walk())) == 3
+
+
+def test_profiling_is_unsupported_without_query_plans(db):
+    with pytest.raises(UnsupportedOperationError):
+        GraphStorage(db).profile()
+    assert db.capture_plans() is None
@@ -0,0 +1,343 @@
+# Copyright (c) 2025 ETH Zurich.
+#                    All rights reserved.
+#
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+
+import pytest
+import requests
+from flask import request
+
+from HOGDB.db.label import Label
+from HOGDB.db.neo4j import Neo4jDatabase
+from HOGDB.db.property import Property
+from HOGDB.graph.hyperedge import HyperEdge
+from HOGDB.graph.hypergraph_storage import HyperGraphStorage
+from HOGDB.graph.node import Node
+from HOGDB.proxy import codec
+from HOGDB.proxy.proxy import ProxyDriver
+from conftest import connect_proxy, load_proxy_server
+from fake_neo4j import FakeGraphDatabase
+
+URL = "http://proxy"
+
+
+def open_proxy(monkeypatch, **settings):
+    # fake graph, transport recording the requests, and a session of a proxy driver
+    graph = FakeGraphDatabase()
+    server = load_proxy_server(monkeypatch, graph, **settings)
+    transport = connect_proxy(monkeypatch, server)
+    driver = ProxyDriver("bolt://db", "alice", "pw", URL)
+    return graph, transport, driver.session()
+
+
+def test_lazy_transaction_sends_queued_writes_with_the_commit(monkeypatch):
+    graph, transport, session = open_proxy(monkeypatch)
+    del transport.requests[:]
+    tx = session.begin_transaction(lazy=True)
+    for i in range(3):
+        tx.queue("CREATE (n)", {"id": i})
+    assert transport.requests == [] and graph.log == []
+    tx.commit()
+    tx.close()
+    assert transport.requests == [("POST", "/batch")]
+    assert [query for _, query in graph.log] == ["CREATE (n)"] * 3
+    assert session.run("COUNT") == [{"count": 3}]
+
+
+def test_lazy_transaction_reads_its_own_writes(monkeypatch):
+    graph, transport, session = open_proxy(monkeypatch)
+    del transport.requests[:]
+    tx = session.begin_transaction(lazy=True)
+    tx.queue("CREATE (n)", {"id": 0})
+    # the read opens the transaction and is sent after the queued write
+    assert tx.run("COUNT") == [{"count": 1}]
+    assert transport.requests == [("GET", "/transaction/init"), ("POST", "/batch")]
+    assert session.run("COUNT") == [{"count": 0}]
+    tx.queue("CREATE (n)", {"id": 1})
+    tx.commit()
+    tx.close()
+    assert session.run("COUNT") == [{"count": 2}]
+    assert [query for _, query in graph.log] == [
+        "CREATE (n)",
+        "COUNT",
+        "COUNT",
+        "CREATE (n)",
+        "COUNT",
+    ]
+
+
+def test_failing_queued_write_raises_when_it_is_sent(monkeypatch):
+    graph, transport, session = open_proxy(monkeypatch)
+    tx = session.begin_transaction(lazy=True)
+    tx.queue("CREATE (n)", {"id": 0})
+    tx.queue("FAIL")
+    tx.queue("CREATE (n)", {"id": 1})
+    with pytest.raises(requests.HTTPError):
+        tx.commit()
+    tx.close()
+    # the batch stops at the failing write and nothing is committed
+    assert [query for _, query in graph.log] == ["CREATE (n)", "FAIL"]
+    assert session.run("COUNT") == [{"count": 0}]
+
+
+def test_storage_operation_is_one_request(monkeypatch):
+    graph = FakeGraphDatabase()
+    transport = connect_proxy(monkeypatch, load_proxy_server(monkeypatch, graph))
+    storage = HyperGraphStorage(
+        Neo4jDatabase(
+            db_uri="bolt://db", db_username="alice", db_password="pw", proxy_url=URL
+        )
+    )
+    del transport.requests[:], graph.log[:]
+    nodes = [Node([Label("Item")], [Property("id", int, i)]) for i in range(3)]
+    storage.add_hyperedge(HyperEdge(nodes, Label("Group"), [Property("id", int, 0)]))
+    assert transport.requests == [("POST", "/batch")]
+    # the hyperedge node and two adjacencies per member
+    assert len(graph.log) == 7
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 server passing the requests to the Flask app of the server, which records
+    # the client port of every request. The Werkzeug development server closes every
+    # connection, so it cannot show whether the client reuses them.
+    protocol_version = "HTTP/1.1"
+
+    def handle_one_request(self):
+        self.raw_requestline = self.rfile.readline(65537)
+        if not self.raw_requestline or not self.parse_request():
+            self.close_connection = True
+            return
+        self.server.ports.append(self.client_address[1])
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        path, _, query = self.path.partition("?")
+        response = self.server.client.open(
+            path,
+            method=self.command,
+            query_string=query,
+            headers=dict(self.headers),
+            data=body,
+        )
+        data = response.get_data()
+        self.send_response(response.status_code)
+        for name, value in response.headers.items():
+            if name != "Content-Length":
+                self.send_header(name, value)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_driver_reuses_keep_alive_connections(monkeypatch):
+    server = load_proxy_server(monkeypatch, FakeGraphDatabase())
+    http = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    http.client, http.ports = server.app.test_client(), []
+    threading.Thread(target=http.serve_forever, daemon=True).start()
+    try:
+        url = f"http://127.0.0.1:{http.server_address[1]}"
+        driver = ProxyDriver("bolt://db", "alice", "pw", url)
+        session = driver.session()
+        for _ in range(3):
+            session.run("MATCH (n) RETURN n")
+        tx = session.begin_transaction()
+        tx.run("CREATE (n)")
+        tx.commit()
+        tx.close()
+        session.close()
+        driver.close()
+    finally:
+        http.shutdown()
+        http.server_close()
+    # the sessions and transactions of a driver send all requests over one connection
+    assert len(http.ports) == 11
+    assert len(set(http.ports)) == 1
+
+
+def _init_session(client):
+    driver = client.post(
+        "/initialize",
+        json={"db_uri": "bolt://db", "db_username": "alice", "db_password": "pw"},
+    ).get_json()["id"]
+    return client.post("/session/init", json={"id": driver}).get_json()["session_id"]
+
+
+def _init_transaction(client, session_id):
+    response = client.get("/transaction/init", query_string={"session_id": session_id})
+    return response.get_json()["tx_id"]
+
+
+def test_sessions_and_transactions_have_unique_ids(monkeypatch):
+    server = load_proxy_server(monkeypatch, FakeGraphDatabase())
+    client = server.app.test_client()
+    session_ids = [_init_session(client) for _ in range(2)]
+    tx_ids = [_init_transaction(client, session_id) for session_id in session_ids]
+    ids = session_ids + tx_ids
+    assert len(set(ids)) == 4
+    assert all(len(id) == 32 and int(id, 16) >= 0 for id in ids)
+    # closing one session leaves the other and its transaction usable
+    client.get("/session/close", query_string={"session_id": session_ids[0]})
+    response = client.post("/transaction/run", json={"tx_id": tx_ids[0], "query": "COUNT"})
+    assert response.status_code == 404
+    response = client.post("/transaction/run", json={"tx_id": tx_ids[1], "query": "COUNT"})
+    assert response.get_json()["results"] == [{"count": 0}]
+
+
+def test_session_lock_marks_the_end_of_a_request(monkeypatch):
+    server = load_proxy_server(monkeypatch, FakeGraphDatabase())
+    now = [100.0]
+    monkeypatch.setattr(server.time, "monotonic", lambda: now[0])
+    session_id = _init_session(server.app.test_client())
+    _, lock = server.registry.session(session_id)
+    with lock:
+        assert lock.locked()
+        now[0] = 200.0
+    assert not lock.locked()
+    assert server.registry.sessions[session_id][3] == 200.0
+
+
+def test_idle_sessions_are_evicted_unless_locked(monkeypatch):
+    graph = FakeGraphDatabase()
+    server = load_proxy_server(monkeypatch, graph)
+    now = [100.0]
+    monkeypatch.setattr(server.time, "monotonic", lambda: now[0])
+    client = server.app.test_client()
+    idle, busy, recent = (_init_session(client) for _ in range(3))
+    tx_id = _init_transaction(client, idle)
+    now[0] += server.IDLE_TIMEOUT + 1
+    server.registry.session(recent)
+    _, lock = server.registry.session(busy)
+    now[0] += 1
+    with lock:
+        # the busy session has been running a query since before the deadline
+        now[0] += server.IDLE_TIMEOUT
+        server.registry.session(recent)
+        server.registry.evict_idle()
+    assert set(server.registry.sessions) == {busy, recent}
+    assert tx_id not in server.registry.txs
+    idle_session, busy_session = (driver.sessions[0] for driver in graph.drivers[:2])
+    assert idle_session.closed and not busy_session.closed
+    response = client.post("/session/run", json={"session_id": idle, "query": "COUNT"})
+    assert response.status_code == 404
+
+
+def test_negotiation():
+    pytest.importorskip("msgpack")
+    pytest.importorskip("zstandard")
+    assert codec.negotiate(None, None, codec.COMPRESSIONS) == (codec.JSON, None)
+    assert codec.negotiate(
+        "application/msgpack", "gzip, zstd", codec.COMPRESSIONS
+    ) == (codec.MSGPACK, "gzip")
+    assert codec.negotiate("text/html", "br;q=1, zstd;q=0.5", ("zstd",)) == (
+        codec.JSON,
+        "zstd",
+    )
+    with pytest.raises(ValueError):
+        ProxyDriver("bolt://db", "alice", "pw", URL, encoding="xml")
+
+
+@pytest.mark.parametrize("compression", ["gzip", "zstd"])
+def test_server_compresses_large_msgpack_responses(monkeypatch, compression):
+    msgpack = pytest.importorskip("msgpack")
+    pytest.importorskip("zstandard")
+    server = load_proxy_server(monkeypatch, FakeGraphDatabase())
+    client = server.app.test_client()
+    session_id = _init_session(client)
+    headers = {"Accept": codec.MSGPACK, "Accept-Encoding": compression}
+    payload = {"session_id": session_id, "query": "MATCH (n) RETURN n"}
+    small = client.post("/session/run", json=payload, headers=headers)
+    assert small.content_type == codec.MSGPACK
+    assert "Content-Encoding" not in small.headers
+    large = client.post(
+        "/session/run",
+        data=codec.compress(
+            msgpack.packb(dict(payload, parameters={"rows": 100})), compression
+        ),
+        headers=dict(
+            headers, **{"Content-Type": codec.MSGPACK, "Content-Encoding": compression}
+        ),
+    )
+    assert large.headers["Content-Encoding"] == compression
+    data = codec.decompress(large.get_data(), compression)
+    assert len(msgpack.unpackb(data)["results"]) == 100
+
+
+@pytest.mark.parametrize("encoding", ["json", "msgpack"])
+@pytest.mark.parametrize("compression", [None, "gzip", "zstd"])
+def test_client_encodings(monkeypatch, encoding, compression):
+    pytest.importorskip("msgpack")
+    pytest.importorskip("zstandard")
+    server = load_proxy_server(monkeypatch, FakeGraphDatabase())
+    sent = []
+    server.app.before_request(
+        lambda: sent.append(
+            (request.content_type, request.headers.get("Content-Encoding"))
+        )
+    )
+    connect_proxy(monkeypatch, server)
+    driver = ProxyDriver(
+        "bolt://db", "alice", "pw", URL, encoding=encoding, compression=compression
+    )
+    session = driver.session()
+    results = session.run("MATCH (n) RETURN n", {"rows": 200, "name": "x" * 2000})
+    assert results == [{"user": "alice", "row": i} for i in range(200)]
+    # only the large request body is compressed
+    assert sent[-1] == (codec.ENCODINGS[encoding], compression)
+    assert sent[0] == (codec.ENCODINGS[encoding], None)
+
+
+def test_stream_chunks_double_up_to_the_chunk_size(monkeypatch):
+    server = load_proxy_server(monkeypatch, FakeGraphDatabase(), STREAM_CHUNK_SIZE=8)
+    client = server.app.test_client()
+    session_id = _init_session(client)
+    response = client.post(
+        "/session/stream",
+        json={
+            "session_id": session_id,
+            "query": "MATCH (n) RETURN n",
+            "parameters": {"rows": 30},
+        },
+        buffered=False,
+    )
+    assert response.content_type == server.NDJSON
+    chunks = list(response.response)
+    assert [chunk.count(b"\n") for chunk in chunks] == [1, 2, 4, 8, 8, 7]
+    rows = [json.loads(line) for line in b"".join(chunks).splitlines()]
+    assert [row["row"] for row in rows] == list(range(30))
+
+
+def test_stream_holds_the_session_lock(monkeypatch):
+    server = load_proxy_server(monkeypatch, FakeGraphDatabase())
+    client = server.app.test_client()
+    session_id = _init_session(client)
+    response = client.post(
+        "/session/stream",
+        json={
+            "session_id": session_id,
+            "query": "MATCH (n) RETURN n",
+            "parameters": {"rows": 5},
+        },
+        buffered=False,
+    )
+    _, lock = server.registry.session(session_id)
+    chunks = iter(response.response)
+    next(chunks)
+    assert lock.locked()
+    response.close()
+    assert not lock.locked()
+
+
+def test_client_streams_records(monkeypatch):
+    graph, _, session = open_proxy(monkeypatch)
+    records = session.stream("MATCH (n) RETURN n", {"rows": 250})
+    assert next(records) == {"user": "alice", "row": 0}
+    assert [record["row"] for record in records] == list(range(1, 250))
+    # an error while streaming is sent as the last line and raised by the client
+    with pytest.raises(RuntimeError, match="Proxy stream failed"):
+        list(session.stream("FAIL"))
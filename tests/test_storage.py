@@ -0,0 +1,192 @@
+# Copyright (c) 2025 ETH Zurich.
+#                    All rights reserved.
+#
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+import pytest
+
+from HOGDB.db.db import UnsupportedOperationError
+from HOGDB.db.in_memory import InMemoryDatabase
+from HOGDB.db.label import Label
+from HOGDB.db.property import Property
+from HOGDB.db.schema import Schema
+from HOGDB.graph.edge import Edge
+from HOGDB.graph.graph_storage import GraphStorage
+from HOGDB.graph.graph_with_subgraph_storage import GraphwithSubgraphStorage
+from HOGDB.graph.graph_with_tuple_storage import GraphwithTupleStorage
+from HOGDB.graph.hyperedge import HyperEdge
+from HOGDB.graph.hypergraph_storage import HyperGraphStorage
+from HOGDB.graph.node import Node
+from HOGDB.graph.node_tuple import NodeTuple
+from HOGDB.graph.subgraph import Subgraph, SubgraphEdge
+
+
+def person(name: str, born: int) -> Node:
+    return Node(
+        [Label("Person")],
+        [Property("name", str, name), Property("born", int, born)],
+    )
+
+
+def test_nodes_and_edges(db):
+    gs = GraphStorage(db)
+    alice, bob = person("Alice", 1990), person("Bob", 1992)
+    gs.add_node(alice)
+    gs.add_node(bob)
+    gs.add_edge(Edge(alice, bob, Label("Knows"), [Property("since", int, 2010)]))
+    assert gs.get_node_count([Label("Person")]) == 2
+    assert gs.get_edge_count(Label("Knows")) == 1
+    assert gs.get_node(Node([Label("Person")], [Property("name", str, "Alice")])) == alice
+    assert gs.get_node(Node([Label("Person")], [Property("name", str, "Eve")])) is None
+    edge = gs.get_edge(Edge(alice, bob, Label("Knows")))
+    assert edge.start_node == alice and edge.end_node == bob
+    assert edge.properties == [Property("since", int, 2010)]
+
+    gs.update_node(alice, [Property("born", int, 1991)])
+    updated = gs.get_node(Node([Label("Person")], [Property("name", str, "Alice")]))
+    assert updated["born"] == 1991
+    gs.update_edge(
+        Edge(label=Label("Knows"), properties=[Property("since", int, 2010)]),
+        [Property("since", int, 2011)],
+    )
+    edge = gs.get_edge(Edge(updated, bob, Label("Knows")))
+    assert edge.properties == [Property("since", int, 2011)]
+
+    gs.delete_edge(Edge(updated, bob, Label("Knows")))
+    assert gs.get_edge_count(Label("Knows")) == 0
+    gs.delete_node(bob)
+    assert gs.get_node_count([Label("Person")]) == 1
+
+
+def test_deleting_a_node_deletes_its_edges(db):
+    gs = GraphStorage(db)
+    alice, bob = person("Alice", 1990), person("Bob", 1992)
+    gs.add_node(alice)
+    gs.add_node(bob)
+    gs.add_edge(Edge(alice, bob, Label("Knows")))
+    gs.delete_node(alice)
+    assert gs.get_edge_count(Label("Knows")) == 0
+    assert gs.get_node_count() == 1
+
+
+def test_subgraphs(db):
+    gs = GraphwithSubgraphStorage(db)
+    alice, bob, carol = person("Alice", 1990), person("Bob", 1992), person("Carol", 1994)
+    for node in (alice, bob, carol):
+        gs.add_node(node)
+    knows = Edge(alice, bob, Label("Knows"), [Property("since", int, 2010)])
+    gs.add_edge(knows)
+    assert gs.get_edge(Edge(alice, bob, Label("Knows"))) == knows
+
+    team = Subgraph([alice, bob], [knows], [Label("Team")], [Property("name", str, "A")])
+    other = Subgraph([carol], [], [Label("Team")], [Property("name", str, "B")])
+    gs.add_subgraph(team)
+    gs.add_subgraph(other)
+    assert gs.get_subgraph_count([Label("Team")]) == 2
+    found = gs.get_subgraph(Subgraph(labels=[Label("Team")], properties=[Property("name", str, "A")]))
+    assert found.labels == [Label("Team")]
+    assert sorted(n["name"] for n in found.subgraph_nodes) == ["Alice", "Bob"]
+    assert found.subgraph_edges == [knows]
+
+    reports = SubgraphEdge(
+        Subgraph(labels=[Label("Team")], properties=[Property("name", str, "A")]),
+        Subgraph(labels=[Label("Team")], properties=[Property("name", str, "B")]),
+        Label("ReportsTo"),
+        [Property("weight", int, 1)],
+    )
+    gs.add_subgraph_edge(reports)
+    assert gs.get_subgraph_edge_count(Label("ReportsTo")) == 1
+    found = gs.get_subgraph_edge(SubgraphEdge(label=Label("ReportsTo")))
+    assert found.start_subgraph["name"] == "A" and found.end_subgraph["name"] == "B"
+
+    gs.delete_subgraph(Subgraph(labels=[Label("Team")], properties=[Property("name", str, "A")]))
+    assert gs.get_subgraph_count([Label("Team")]) == 1
+    assert gs.get_subgraph_edge_count(Label("ReportsTo")) == 0
+    # the member nodes are not part of the deleted subgraph node
+    assert gs.get_node_count([Label("Person")]) == 3
+    gs.delete_node(alice)
+    assert gs.get_edge(Edge(alice, bob, Label("Knows"))) is None
+
+
+def test_hyperedges(db):
+    gs = HyperGraphStorage(db)
+    members = [person("Alice", 1990), person("Bob", 1992), person("Carol", 1994)]
+    for node in members:
+        gs.add_node(node)
+    family = HyperEdge(members, Label("Family"), [Property("last_name", str, "Smith")])
+    gs.add_hyperedge(family)
+    assert gs.get_hyperedge_count([Label("Family")]) == 1
+    found = gs.get_hyperedge(HyperEdge([], Label("Family"), [Property("last_name", str, "Smith")]))
+    assert sorted(n["name"] for n in found.nodes) == ["Alice", "Bob", "Carol"]
+
+    gs.update_hyperedge(
+        HyperEdge([], Label("Family"), [Property("last_name", str, "Smith")]),
+        [Property("last_name", str, "Jones")],
+    )
+    assert gs.get_hyperedge(HyperEdge([], Label("Family"), [Property("last_name", str, "Smith")])) is None
+    gs.delete_hyperedge(HyperEdge([], Label("Family"), [Property("last_name", str, "Jones")]))
+    assert gs.get_hyperedge_count([Label("Family")]) == 0
+    assert gs.get_node_count([Label("Person")]) == 3
+
+
+def test_node_tuples_keep_their_order(db):
+    gs = GraphwithTupleStorage(db)
+    members = [person("Carol", 1994), person("Alice", 1990), person("Bob", 1992)]
+    for node in members:
+        gs.add_node(node)
+    collaboration = NodeTuple(members, [Label("Collaboration")], [Property("year", int, 2023)])
+    gs.add_node_tuple(collaboration)
+    assert gs.get_node_tuple_count() == 1
+    found = gs.get_node_tuple(NodeTuple([], [], [Property("year", int, 2023)]))
+    assert found == collaboration
+
+    gs.update_node_tuple(
+        NodeTuple([], [], [Property("year", int, 2023)]), [Property("year", int, 2024)]
+    )
+    assert gs.get_node_tuple(NodeTuple([], [], [Property("year", int, 2024)])).nodes == members
+    gs.delete_node_tuple(NodeTuple([], [], [Property("year", int, 2024)]))
+    assert gs.get_node_tuple_count() == 0
+
+
+def test_clear_graph(db):
+    gs = GraphStorage(db)
+    gs.add_node(person("Alice", 1990))
+    gs.create_index(Label("Person"), ["name"])
+    gs.clear_graph()
+    assert gs.get_node_count() == 0
+    assert gs.show_indexes() == []
+
+
+def test_closing_a_transaction_rolls_it_back(db):
+    session = db.start_session()
+    tx = db._begin_transaction(session)
+    db.add_node(session, tx, [Label("_node"), Label("Item")], [Property("id", int, 0)])
+    db.add_edge(
+        session, tx, [Label("Item")], [], [Label("Item")], [], Label("Self"), []
+    )
+    tx.close()
+    assert db.node_count(session, [Label("Item")]) == 0
+    assert db.edge_count(session, Label("Self")) == 0
+    db.end_session(session)
+
+
+def test_failed_batch_is_rolled_back(db):
+    session = db.start_session()
+    db.ensure_indexes(session, [([Label("Item")], ["id"])], unique=True)
+    labels, schema = [Label("_node"), Label("Item")], [Schema("id", int)]
+    db.import_nodes_from_iter(session, [{"id": 0}], labels, schema, 10)
+    with pytest.raises(Exception):
+        db.import_nodes_from_iter(session, [{"id": 1}, {"id": 0}], labels, schema, 10)
+    # the batch failed as a whole, including the row before the duplicate
+    assert db.node_count(session, [Label("Item")]) == 1
+    db.end_session(session)
+
+
+def test_in_memory_database_does_not_run_query_strings():
+    db = InMemoryDatabase()
+    session = db.start_session()
+    with pytest.raises(UnsupportedOperationError):
+        session.run("MATCH (n) RETURN n")
+    with pytest.raises(UnsupportedOperationError):
+        session.begin_transaction().run("MATCH (n) RETURN n")
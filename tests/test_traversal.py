@@ -0,0 +1,158 @@
+# Copyright (c) 2025 ETH Zurich.
+#                    All rights reserved.
+#
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+
+import random
+
+import pytest
+
+from HOGDB.db.label import Label
+from HOGDB.db.predicate import P
+from HOGDB.db.property import Property
+from HOGDB.graph.edge import Edge
+from HOGDB.graph.graph_storage import GraphStorage
+from HOGDB.graph.node import Node
+from HOGDB.graph.path import Path
+
+# values of different types, compared with each other by the conditions below
+VALUES = [1, 2, 2.5, 0, -1, "a", "ab", "ba", "", True, False, None, [1, 2]]
+
+CONDITIONS = [
+    "a.x = 1",
+    "a.x <> 1",
+    "a.x < 2",
+    "a.x >= 'a'",
+    "a.x IN [1, 2]",
+    "a.x IN ['a', 'ab']",
+    "a.x IN []",
+    "a.x IN [1, 'a']",
+    "a.x STARTS WITH 'a'",
+    "a.x ENDS WITH 'a'",
+    "a.x ENDS WITH ''",
+    "a.x CONTAINS 'b'",
+    "a.x IS NULL",
+    "a.x IS NOT NULL",
+    "NOT a.x = 1",
+    "NOT a.x < 2",
+    "NOT a.x <> 'a'",
+    "NOT a.x IN [1, 2]",
+    "NOT a.x STARTS WITH 'a'",
+    "a.x = 1 OR a.y = 'a'",
+    "NOT (a.x = 1 OR a.y < 1)",
+    "1 < a.x",
+    "'a' = a.x",
+    "a.x = true",
+    "NOT a.x = true",
+    "a.x = 2.5",
+    "a.x = [1, 2]",
+    "a.x = a.y",
+    "a.x > 0 AND b.y <> 1",
+    "NOT (a.x = 'a' AND b.x IS NULL)",
+    P("a.x") == 1,
+    P("a.x").in_([1, 2]),
+    P("a.x").between(0, 2),
+    P("a.x").ends_with("a") | P("a.y").is_null(),
+    ~(P("a.x") == 1),
+]
+
+
+def fill(gs: GraphStorage) -> None:
+    """
+    Add nodes with properties of mixed types, connected in a ring of 'Next' edges.
+    """
+    values = random.Random(1)
+    nodes = []
+    for i in range(40):
+        properties = [Property("i", int, i)]
+        for key in ("x", "y"):
+            value = values.choice(VALUES)
+            if value is not None:
+                properties.append(Property(key, type(value), value))
+        nodes.append(Node([Label("T")], properties))
+        gs.add_node(nodes[-1])
+    for i in range(40):
+        start = Node([Label("T")], [Property("i", int, i)])
+        end = Node([Label("T")], [Property("i", int, (i * 7 + 1) % 40)])
+        gs.add_edge(Edge(start, end, Label("Next")))
+
+
+def step() -> Path:
+    path = Path()
+    path.add(Node([Label("T")]), "a")
+    path.add(Edge(label=Label("Next")), "r")
+    path.add(Node([Label("T")]), "b")
+    return path
+
+
+@pytest.mark.parametrize("condition", CONDITIONS, ids=str)
+def test_backends_agree_on_conditions(backends, condition):
+    results = []
+    for db in backends:
+        gs = GraphStorage(db)
+        fill(gs)
+        result = gs.traverse_path(
+            [step()], [[condition]], ["a.i", "b.i"], sort=["a.i", "b.i"]
+        )
+        results.append(result.values.tolist())
+    assert results[0] == results[1]
+
+
+def test_comparisons_of_different_types_are_null(db):
+    gs = GraphStorage(db)
+    for i, value in enumerate([1, "1", True, 1.0, None]):
+        properties = [Property("i", int, i)]
+        if value is not None:
+            properties.append(Property("x", type(value), value))
+        gs.add_node(Node([Label("T")], properties))
+    path = Path()
+    path.add(Node([Label("T")]), "a")
+
+    def matches(condition):
+        result = gs.traverse_path([path], [[condition]], ["a.i"], sort=["a.i"])
+        return result["a.i"].tolist()
+
+    assert matches("a.x = 1") == [0, 3]
+    assert matches("a.x = '1'") == [1]
+    assert matches("a.x = true") == [2]
+    # null and mismatching types are neither equal nor unequal
+    assert matches("a.x <> 1") == [1, 2]
+    assert matches("NOT a.x = 1") == [1, 2]
+    assert matches("a.x < 2") == [0, 3]
+    assert matches("a.x IS NULL") == [4]
+
+
+def test_sort_limit_and_projection(db):
+    gs = GraphStorage(db)
+    fill(gs)
+    path = Path()
+    path.add(Node([Label("T")]), "a")
+    result = gs.traverse_path(
+        [path], [[P("a.i") >= 10]], ["a.i AS i", "a"], sort=["a.i DESC"], limit=3
+    )
+    # columns are named after the returned expressions, as in Neo4jDatabase
+    assert list(result.columns) == ["a.i AS i", "a"]
+    assert result["a.i AS i"].tolist() == [39, 38, 37]
+    assert result["a"][0]["i"] == 39
+
+
+def test_paths_sharing_a_variable(db):
+    gs = GraphStorage(db)
+    fill(gs)
+    first, second = step(), Path()
+    second.add(Node([Label("T")]), "b")
+    second.add(Edge(label=Label("Next")))
+    second.add(Node([Label("T")]), "c")
+    result = gs.traverse_path(
+        [first, second], [[P("a.i") == 0], []], ["a.i", "b.i", "c.i"]
+    )
+    assert result.values.tolist() == [[0, 1, 8]]
+
+
+def test_undefined_variable(db):
+    gs = GraphStorage(db)
+    path = Path()
+    path.add(Node([Label("T")]), "a")
+    with pytest.raises(ValueError):
+        gs.traverse_path([path], [["z.x = 1"]], ["a"])